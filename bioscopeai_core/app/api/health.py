@@ -1,7 +1,13 @@
 """Health check endpoints."""
 
+from typing import Any
+
 from fastapi import APIRouter
 
+from bioscopeai_core.app.services.image_location_cache import get_image_location_cache
+from bioscopeai_core.app.services.presigned_url_cache import get_presigned_url_cache
+from bioscopeai_core.app.services.tile_cache import get_tile_cache
+
 
 health_router = APIRouter()
 
@@ -10,3 +16,13 @@ health_router = APIRouter()
 async def health_check() -> dict[str, str]:
     """Health check endpoint to verify that the API is running."""
     return {"status": "ok"}
+
+
+@health_router.get("/caches", tags=["Health"])
+async def cache_stats() -> dict[str, Any]:
+    """Hit/miss counters of the in-process caches."""
+    return {
+        "image_locations": get_image_location_cache().stats(),
+        "presigned_urls": get_presigned_url_cache().stats(),
+        "tiles": get_tile_cache().stats(),
+    }
@@ -6,13 +6,15 @@ if TYPE_CHECKING:
     from bioscopeai_core.app.models.classification.classification import Classification
 
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from bioscopeai_core.app.auth.permissions import require_role
+from bioscopeai_core.app.core.config import settings
 from bioscopeai_core.app.crud.classification import (
     ClassificationCRUD,
     get_classification_crud,
 )
+from bioscopeai_core.app.crud.classification.classification import LIST_ORDER_BY
 from bioscopeai_core.app.models import User, UserRole
 from bioscopeai_core.app.schemas.classification import (
     ClassificationCreate,
@@ -23,6 +25,7 @@ from bioscopeai_core.app.serializers.classification import (
     ClassificationSerializer,
     get_classification_serializer,
 )
+from bioscopeai_core.app.utils.pagination import set_next_cursor
 
 
 classification_router = APIRouter()
@@ -52,7 +55,7 @@ async def run_classification(
             detail="Provide exactly one of dataset_id or image_id.",
         )
 
-    # Create job + emit event to Kafka
+    # Create job + queue its Kafka event in the outbox
     job: Classification = await crud.create_job(
         created_by_id=user.id,
         create_in=create_in,
@@ -64,6 +67,7 @@ async def run_classification(
     "/", response_model=list[ClassificationOut], status_code=status.HTTP_200_OK
 )
 async def list_classifications(
+    response: Response,
     user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
     crud: Annotated[ClassificationCRUD, Depends(get_classification_crud)],
     serializer: Annotated[
@@ -76,14 +80,26 @@ async def list_classifications(
     dataset_id: Annotated[UUID | None, Query()] = None,
     image_id: Annotated[UUID | None, Query()] = None,
     created_by: Annotated[UUID | None, Query()] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.app.MAX_PAGE_SIZE, description="Items per page")
+    ] = settings.app.DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Opaque cursor from the X-Next-Cursor header")
+    ] = None,
 ) -> list[ClassificationOut]:
-    """Return classifications filtered by dataset, image, user or status."""
+    """Return classifications filtered by dataset, image, user or status.
+
+    Results are paged newest first; follow `X-Next-Cursor` for the next page.
+    """
     items = await crud.get_filtered(
         status=status_filter,
         dataset_id=dataset_id,
         image_id=image_id,
         created_by=created_by,
+        limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, items, LIST_ORDER_BY, limit)
     return serializer.to_out_list(items)
 
 
@@ -1,21 +1,40 @@
+from datetime import datetime, timedelta, UTC
 from typing import Annotated, Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 
 from bioscopeai_core.app.auth.permissions import require_role
+from bioscopeai_core.app.core.config import settings
 from bioscopeai_core.app.crud.classification import (
     ClassificationResultCRUD,
+    ClassificationStatsCRUD,
     get_classification_result_crud,
+    get_classification_stats_crud,
+)
+from bioscopeai_core.app.crud.classification.classification_result import (
+    LIST_ORDER_BY,
+)
+from bioscopeai_core.app.crud.classification.classification_stats import (
+    Dimension,
+    Granularity,
 )
 from bioscopeai_core.app.models import User, UserRole
 from bioscopeai_core.app.schemas.classification import (
     ClassificationResultOut,
+    ClassificationStatsBucketOut,
+    DeadLetterReplayOut,
 )
 from bioscopeai_core.app.serializers.classification import (
     ClassificationResultSerializer,
     get_classification_result_serializer,
 )
+from bioscopeai_core.app.services.dead_letter import (
+    DeadLetterService,
+    MAX_REPLAY_LIMIT,
+    get_dead_letter_service,
+)
+from bioscopeai_core.app.utils.pagination import set_next_cursor
 
 
 classification_result_router = APIRouter()
@@ -25,6 +44,7 @@ classification_result_router = APIRouter()
     "/", response_model=list[ClassificationResultOut], status_code=status.HTTP_200_OK
 )
 async def list_results(
+    response: Response,
     user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
     crud: Annotated[ClassificationResultCRUD, Depends(get_classification_result_crud)],
     serializer: Annotated[
@@ -33,15 +53,85 @@ async def list_results(
     ],
     classification_id: Annotated[UUID | None, Query()] = None,
     image_id: Annotated[UUID | None, Query()] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.app.MAX_PAGE_SIZE, description="Items per page")
+    ] = settings.app.DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Opaque cursor from the X-Next-Cursor header")
+    ] = None,
 ) -> list[ClassificationResultOut]:
     """List classification results filtered by image or classification job."""
     results = await crud.get_filtered(
         classification_id=classification_id,
         image_id=image_id,
+        limit=limit,
+        cursor=cursor,
     )
+    set_next_cursor(response, results, LIST_ORDER_BY, limit)
     return serializer.to_out_list(results)
 
 
+@classification_result_router.get(
+    "/statistics",
+    response_model=list[ClassificationStatsBucketOut],
+    status_code=status.HTTP_200_OK,
+)
+async def get_statistics(
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    crud: Annotated[ClassificationStatsCRUD, Depends(get_classification_stats_crud)],
+    start: Annotated[
+        datetime | None, Query(description="Window start, defaults to 24 hours ago")
+    ] = None,
+    end: Annotated[datetime | None, Query(description="Window end, defaults to now")] = None,
+    granularity: Annotated[Granularity, Query(description="Bucket size")] = "hour",
+    group_by: Annotated[
+        Dimension | None, Query(description="Split every bucket by this dimension")
+    ] = None,
+    label: Annotated[str | None, Query()] = None,
+    model_name: Annotated[str | None, Query()] = None,
+    device_id: Annotated[UUID | None, Query()] = None,
+    dataset_id: Annotated[UUID | None, Query()] = None,
+) -> list[ClassificationStatsBucketOut]:
+    """Result counts and average confidence per hour, day or week.
+
+    Served from the hourly rollups, so the cost depends on the number of buckets
+    rather than the number of results in the window.
+    """
+    end = end or datetime.now(UTC)
+    start = start or end - timedelta(days=1)
+    filters = {
+        "label": label,
+        "model_name": model_name,
+        "device_id": str(device_id) if device_id else None,
+        "dataset_id": str(dataset_id) if dataset_id else None,
+    }
+    series = await crud.get_series(
+        start,
+        end,
+        granularity=granularity,
+        group_by=group_by,
+        filters={k: v for k, v in filters.items() if v is not None},
+    )
+    return [ClassificationStatsBucketOut.model_validate(bucket) for bucket in series]
+
+
+@classification_result_router.post(
+    "/dead-letters/replay",
+    response_model=DeadLetterReplayOut,
+    status_code=status.HTTP_200_OK,
+)
+async def replay_dead_letters(
+    user: Annotated[User, Depends(require_role(UserRole.ADMIN.value))],
+    service: Annotated[DeadLetterService, Depends(get_dead_letter_service)],
+    limit: Annotated[
+        int, Query(ge=1, le=MAX_REPLAY_LIMIT, description="Most messages to replay")
+    ] = 100,
+) -> DeadLetterReplayOut:
+    """Re-publish dead-lettered results to the results topic for another attempt."""
+    replayed = await service.replay(limit)
+    return DeadLetterReplayOut(replayed=replayed)
+
+
 @classification_result_router.get(
     "/{result_id}",
     response_model=ClassificationResultOut,
@@ -70,15 +160,25 @@ async def get_result(
 )
 async def get_results_for_classification(
     classification_id: UUID,
+    response: Response,
     user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
     crud: Annotated[ClassificationResultCRUD, Depends(get_classification_result_crud)],
     serializer: Annotated[
         ClassificationResultSerializer,
         Depends(get_classification_result_serializer),
     ],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.app.MAX_PAGE_SIZE, description="Items per page")
+    ] = settings.app.DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Opaque cursor from the X-Next-Cursor header")
+    ] = None,
 ) -> list[ClassificationResultOut]:
-    """Return all results for a specific classification job."""
-    results = await crud.get_by_classification(classification_id)
+    """Return one page of results for a specific classification job."""
+    results = await crud.get_by_classification(
+        classification_id, limit=limit, cursor=cursor
+    )
+    set_next_cursor(response, results, LIST_ORDER_BY, limit)
     return serializer.to_out_list(results)
 
 
@@ -89,15 +189,23 @@ async def get_results_for_classification(
 )
 async def get_results_for_image(
     image_id: UUID,
+    response: Response,
     user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
     crud: Annotated[ClassificationResultCRUD, Depends(get_classification_result_crud)],
     serializer: Annotated[
         ClassificationResultSerializer,
         Depends(get_classification_result_serializer),
     ],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.app.MAX_PAGE_SIZE, description="Items per page")
+    ] = settings.app.DEFAULT_PAGE_SIZE,
+    cursor: Annotated[
+        str | None, Query(description="Opaque cursor from the X-Next-Cursor header")
+    ] = None,
 ) -> list[ClassificationResultOut]:
-    """Return all results for a specific image."""
-    results = await crud.get_by_image(image_id)
+    """Return one page of results for a specific image."""
+    results = await crud.get_by_image(image_id, limit=limit, cursor=cursor)
+    set_next_cursor(response, results, LIST_ORDER_BY, limit)
     return serializer.to_out_list(results)
 
 
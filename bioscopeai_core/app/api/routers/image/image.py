@@ -4,42 +4,92 @@ from uuid import UUID
 
 from fastapi import (
     APIRouter,
+    BackgroundTasks,
     Depends,
     File,
     Form,
     HTTPException,
     Query,
+    Request,
+    Response,
     status,
     UploadFile,
 )
 
 from bioscopeai_core.app.auth.permissions import require_role
-from bioscopeai_core.app.crud.image import get_image_crud, ImageCRUD
-from bioscopeai_core.app.models import User, UserRole
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.crud.image import (
+    get_image_crud,
+    get_upload_session_crud,
+    ImageCRUD,
+    SearchScope,
+    UploadSessionCRUD,
+)
+from bioscopeai_core.app.models import Image, User, UserRole
 from bioscopeai_core.app.schemas.image import (
+    ImageBatchUploadOut,
     ImageCreate,
+    ImageFinalizeIn,
     ImageMinimalOut,
     ImageOut,
+    ImagePresignedUploadOut,
+    ImagePresignIn,
+    ImagePresignOut,
+    ImagePreviewOut,
+    ImagePreviewQueryIn,
     ImageUpdate,
+    UploadSessionCreate,
+    UploadSessionOut,
 )
 from bioscopeai_core.app.serializers.image import (
     get_image_serializer,
     ImageSerializer,
 )
+from bioscopeai_core.app.services.derivative_service import (
+    DerivativeService,
+    get_derivative_service,
+)
+from bioscopeai_core.app.services.presigned_url_cache import PresignedUrl
 from bioscopeai_core.app.services.storage_service import (
     get_storage_service,
     StorageService,
 )
+from bioscopeai_core.app.services.tile_service import get_tile_service, TileService
+from bioscopeai_core.app.utils.pagination import NEXT_CURSOR_HEADER
+from bioscopeai_core.app.utils.search import SearchMode
 
 
 image_router = APIRouter()
 
 
+async def _get_preview_urls(
+    images: list[Image],
+    storage_service: StorageService,
+    size: int | None = None,
+    expires_in: int = 3600,  # 1 hour
+) -> dict[UUID, PresignedUrl]:
+    """Sign inline preview URLs for a page of images in one batch.
+
+    With ``size`` set, each URL points at the smallest derivative that fits.
+    """
+    object_keys = {
+        image.id: DerivativeService.select_object_key(image, size) for image in images
+    }
+    presigned = await storage_service.generate_presigned_gets(
+        list(set(object_keys.values())),
+        expires_in=expires_in,
+        response_content_disposition="inline",
+    )
+    return {image_id: presigned[key] for image_id, key in object_keys.items()}
+
+
 @image_router.get("/", response_model=list[ImageOut], status_code=status.HTTP_200_OK)
 async def list_images(
+    response: Response,
     user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
     image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
     image_serializer: Annotated[ImageSerializer, Depends(get_image_serializer)],
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
     dataset_id: Annotated[
         UUID | None, Query(description="Filter by dataset ID")
     ] = None,
@@ -57,6 +107,13 @@ async def list_images(
         datetime | None, Query(description="Uploaded before this date")
     ] = None,
     q: Annotated[str | None, Query(description="Search in filenames")] = None,
+    search_mode: Annotated[
+        SearchMode, Query(description="Match q anywhere ('contains') or as a 'prefix'")
+    ] = "contains",
+    search_scope: Annotated[
+        SearchScope,
+        Query(description="Also match dataset name and description with 'all'"),
+    ] = "filename",
     page: Annotated[int, Query(ge=1, description="Page number (1-indexed)")] = 1,
     page_size: Annotated[int, Query(ge=1, le=200, description="Items per page")] = 25,
     order_by: Annotated[
@@ -65,9 +122,23 @@ async def list_images(
             description="Sort by field (e.g. 'uploaded_at', '-uploaded_at', 'filename')",
         ),
     ] = "-uploaded_at",
+    cursor: Annotated[
+        str | None,
+        Query(description="Opaque cursor from X-Next-Cursor; replaces page for deep paging"),
+    ] = None,
+    include_preview_url: Annotated[
+        bool, Query(description="Embed a presigned inline preview URL in each item")
+    ] = False,
+    preview_size: Annotated[
+        int | None, Query(ge=1, description="Minimum edge length of embedded previews")
+    ] = None,
 ) -> list[ImageOut]:
     """List images with optional filters (dataset, device, uploader, analyzed state),
-    date range, full-text search, pagination, and sorting."""
+    date range, full-text search, pagination, and sorting.
+
+    When more results may follow, the `X-Next-Cursor` response header holds the
+    cursor of the next page.
+    """
 
     images = await image_crud.get_filtered_images(
         dataset_id=dataset_id,
@@ -80,8 +151,58 @@ async def list_images(
         order_by=order_by,
         page=page,
         page_size=page_size,
+        cursor=cursor,
+        search_mode=search_mode,
+        search_scope=search_scope,
     )
-    return image_serializer.to_out_list(images)
+    if next_cursor := image_crud.next_cursor(images, order_by, page_size):
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if not include_preview_url:
+        return image_serializer.to_out_list(images)
+
+    presigned = await _get_preview_urls(images, storage_service, size=preview_size)
+    preview_urls = {
+        image_id: storage_service.fix_presigned_url(url.url)
+        for image_id, url in presigned.items()
+    }
+    return image_serializer.to_out_list(images, preview_urls)
+
+
+@image_router.post(
+    "/previews",
+    response_model=list[ImagePreviewOut],
+    status_code=status.HTTP_200_OK,
+)
+async def get_image_preview_urls(
+    query_in: ImagePreviewQueryIn,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
+) -> list[ImagePreviewOut]:
+    """Get inline preview URLs for many images in one request.
+
+    Images are selected by `image_ids` or, when no IDs are given, by the same
+    filters and paging as the image listing.
+    """
+    if query_in.image_ids is not None:
+        images = await image_crud.get_by_ids(query_in.image_ids)
+    else:
+        images = await image_crud.get_filtered_images(
+            **query_in.model_dump(exclude={"image_ids", "size", "expires_in"})
+        )
+
+    presigned = await _get_preview_urls(
+        images, storage_service, size=query_in.size, expires_in=query_in.expires_in
+    )
+    return [
+        ImagePreviewOut(
+            image_id=image.id,
+            filename=image.filename,
+            url=storage_service.fix_presigned_url(presigned[image.id].url),
+            expires_in=presigned[image.id].expires_in,
+        )
+        for image in images
+    ]
 
 
 @image_router.get(
@@ -112,6 +233,9 @@ async def upload_image(
     user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
     image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
     image_serializer: Annotated[ImageSerializer, Depends(get_image_serializer)],
+    derivative_service: Annotated[DerivativeService, Depends(get_derivative_service)],
+    tile_service: Annotated[TileService, Depends(get_tile_service)],
+    background_tasks: BackgroundTasks,
     dataset_id: Annotated[UUID, Form()],
     device_id: Annotated[UUID | None, Form()] = None,
     file: UploadFile = File(...),  # noqa: B008
@@ -122,9 +246,204 @@ async def upload_image(
         dataset_id=dataset_id, device_id=device_id, filename=file.filename
     )
     image = await image_crud.create_image(image_in, user.id, file)
+    # A reused duplicate was already processed when it was first uploaded
+    if image.derivatives is None:
+        background_tasks.add_task(derivative_service.generate, image)
+        background_tasks.add_task(tile_service.generate, image)
     return image_serializer.to_minimal(image)
 
 
+@image_router.post(
+    "/upload/batch",
+    response_model=ImageBatchUploadOut,
+    status_code=status.HTTP_200_OK,
+)
+async def upload_images(
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
+    image_serializer: Annotated[ImageSerializer, Depends(get_image_serializer)],
+    derivative_service: Annotated[DerivativeService, Depends(get_derivative_service)],
+    tile_service: Annotated[TileService, Depends(get_tile_service)],
+    background_tasks: BackgroundTasks,
+    dataset_id: Annotated[UUID, Form()],
+    device_id: Annotated[UUID | None, Form()] = None,
+    files: list[UploadFile] = File(...),  # noqa: B008
+) -> ImageBatchUploadOut:
+    """Upload many image files to one dataset in a single request.
+
+    Files are uploaded concurrently and all records are inserted at once.
+    The response reports success or the failure reason for every file.
+    """
+    if len(files) > settings.image.MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files, at most {settings.image.MAX_BATCH_FILES} allowed",
+        )
+
+    image_in = ImageCreate(dataset_id=dataset_id, device_id=device_id)
+    outcomes = await image_crud.create_images(image_in, user.id, files)
+    images = [
+        outcome.image for outcome in outcomes if outcome.image and not outcome.duplicate
+    ]
+    background_tasks.add_task(derivative_service.generate_many, images)
+    background_tasks.add_task(tile_service.generate_many, images)
+    return image_serializer.to_batch_upload_out(outcomes)
+
+
+@image_router.post(
+    "/upload/presign",
+    response_model=ImagePresignOut,
+    status_code=status.HTTP_200_OK,
+)
+async def presign_image_uploads(
+    presign_in: ImagePresignIn,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
+    storage_service: Annotated[StorageService, Depends(get_storage_service)],
+) -> ImagePresignOut:
+    """Issue presigned POST policies so clients can upload files straight to storage.
+
+    After uploading, the client registers the files with `/upload/finalize`.
+    """
+    if len(presign_in.files) > settings.image.MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files, at most {settings.image.MAX_BATCH_FILES} allowed",
+        )
+
+    policies = await image_crud.create_upload_policies(
+        presign_in.dataset_id, presign_in.files
+    )
+    if user.role != UserRole.SERVICE:
+        for policy in policies:
+            policy["url"] = storage_service.fix_presigned_url(policy["url"])
+
+    return ImagePresignOut(
+        expires_in=settings.image.PRESIGNED_UPLOAD_EXPIRES_IN,
+        uploads=[ImagePresignedUploadOut(**policy) for policy in policies],
+    )
+
+
+@image_router.post(
+    "/upload/finalize",
+    response_model=ImageBatchUploadOut,
+    status_code=status.HTTP_200_OK,
+)
+async def finalize_image_uploads(
+    finalize_in: ImageFinalizeIn,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
+    image_serializer: Annotated[ImageSerializer, Depends(get_image_serializer)],
+    derivative_service: Annotated[DerivativeService, Depends(get_derivative_service)],
+    tile_service: Annotated[TileService, Depends(get_tile_service)],
+    background_tasks: BackgroundTasks,
+) -> ImageBatchUploadOut:
+    """Verify files uploaded with presigned policies and create their Image records."""
+    if len(finalize_in.files) > settings.image.MAX_BATCH_FILES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Too many files, at most {settings.image.MAX_BATCH_FILES} allowed",
+        )
+
+    image_in = ImageCreate(
+        dataset_id=finalize_in.dataset_id, device_id=finalize_in.device_id
+    )
+    outcomes = await image_crud.finalize_uploads(image_in, user.id, finalize_in.files)
+    images = [
+        outcome.image for outcome in outcomes if outcome.image and not outcome.duplicate
+    ]
+    background_tasks.add_task(derivative_service.generate_many, images)
+    background_tasks.add_task(tile_service.generate_many, images)
+    return image_serializer.to_batch_upload_out(outcomes)
+
+
+@image_router.post(
+    "/upload/sessions",
+    response_model=UploadSessionOut,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_upload_session(
+    session_in: UploadSessionCreate,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    upload_session_crud: Annotated[UploadSessionCRUD, Depends(get_upload_session_crud)],
+) -> UploadSessionOut:
+    """Start a resumable upload for a large file.
+
+    Send the file with `PUT /upload/sessions/{session_id}?offset=...`, one
+    `part_size` chunk at a time, then call `/complete`.
+    """
+    session = await upload_session_crud.create_session(session_in, user.id)
+    return UploadSessionOut.model_validate(session)
+
+
+@image_router.get(
+    "/upload/sessions/{session_id}",
+    response_model=UploadSessionOut,
+    status_code=status.HTTP_200_OK,
+)
+async def get_upload_session(
+    session_id: UUID,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    upload_session_crud: Annotated[UploadSessionCRUD, Depends(get_upload_session_crud)],
+) -> UploadSessionOut:
+    """Get the progress of an upload session; resume from `received_bytes`."""
+    session = await upload_session_crud.get_for_user(session_id, user.id)
+    return UploadSessionOut.model_validate(session)
+
+
+@image_router.put(
+    "/upload/sessions/{session_id}",
+    response_model=UploadSessionOut,
+    status_code=status.HTTP_200_OK,
+)
+async def upload_session_chunk(
+    session_id: UUID,
+    request: Request,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    upload_session_crud: Annotated[UploadSessionCRUD, Depends(get_upload_session_crud)],
+    offset: Annotated[int, Query(ge=0, description="Byte offset of this chunk")],
+) -> UploadSessionOut:
+    """Upload the raw bytes of the chunk starting at `offset`."""
+    session = await upload_session_crud.get_for_user(session_id, user.id)
+    session = await upload_session_crud.upload_chunk(session, offset, request.stream())
+    return UploadSessionOut.model_validate(session)
+
+
+@image_router.post(
+    "/upload/sessions/{session_id}/complete",
+    response_model=ImageMinimalOut,
+    status_code=status.HTTP_201_CREATED,
+)
+async def complete_upload_session(
+    session_id: UUID,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    upload_session_crud: Annotated[UploadSessionCRUD, Depends(get_upload_session_crud)],
+    image_serializer: Annotated[ImageSerializer, Depends(get_image_serializer)],
+    derivative_service: Annotated[DerivativeService, Depends(get_derivative_service)],
+    tile_service: Annotated[TileService, Depends(get_tile_service)],
+    background_tasks: BackgroundTasks,
+) -> ImageMinimalOut:
+    """Assemble all uploaded chunks and create the Image record."""
+    session = await upload_session_crud.get_for_user(session_id, user.id)
+    image = await upload_session_crud.complete_session(session)
+    background_tasks.add_task(derivative_service.generate, image)
+    background_tasks.add_task(tile_service.generate, image)
+    return image_serializer.to_minimal(image)
+
+
+@image_router.delete(
+    "/upload/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT
+)
+async def abort_upload_session(
+    session_id: UUID,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    upload_session_crud: Annotated[UploadSessionCRUD, Depends(get_upload_session_crud)],
+) -> None:
+    """Abort an upload session and discard the chunks uploaded so far."""
+    session = await upload_session_crud.get_for_user(session_id, user.id)
+    await upload_session_crud.abort_session(session)
+
+
 @image_router.patch(
     "/{image_id}",
     response_model=ImageOut,
@@ -171,25 +490,25 @@ async def get_image_preview_url(
     expires_in: Annotated[
         int, Query(ge=60, le=604800, description="URL expiry time in seconds")
     ] = 3600,  # 1 hour
+    size: Annotated[
+        int | None,
+        Query(ge=1, description="Minimum edge length; serves the smallest fitting rendition"),
+    ] = None,
 ) -> dict[str, Any]:
     """Get a presigned URL to preview/display the image file inline."""
-    image = await image_crud.get_by_id(image_id)
+    image = await image_crud.get_location(image_id)
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Generate presigned URL with inline disposition
-    url = storage_service.s3_client.generate_presigned_url(
-        "get_object",
-        Params={
-            "Bucket": storage_service.default_bucket,
-            "Key": image.filepath,
-            "ResponseContentDisposition": "inline",
-        },
-        ExpiresIn=expires_in,
+    presigned = await storage_service.generate_presigned_get(
+        DerivativeService.select_object_key(image, size),
+        expires_in=expires_in,
+        response_content_disposition="inline",
     )
-    url = storage_service.fix_presigned_url(url)
+    url = storage_service.fix_presigned_url(presigned.url)
 
-    return {"url": url, "expires_in": expires_in, "filename": image.filename}
+    return {"url": url, "expires_in": presigned.expires_in, "filename": image.filename}
 
 
 @image_router.get(
@@ -207,21 +526,68 @@ async def get_image_download_url(
     ] = 300,  # 5 minutes
 ) -> dict[str, Any]:
     """Get a presigned URL to download the image file."""
-    image = await image_crud.get_by_id(image_id)
+    image = await image_crud.get_location(image_id)
     if not image:
         raise HTTPException(status_code=404, detail="Image not found")
 
     # Generate presigned URL with attachment disposition
-    url = storage_service.s3_client.generate_presigned_url(
-        "get_object",
-        Params={
-            "Bucket": storage_service.default_bucket,
-            "Key": image.filepath,
-            "ResponseContentDisposition": f'attachment; filename="{image.filename}"',
-        },
-        ExpiresIn=expires_in,
+    presigned = await storage_service.generate_presigned_get(
+        image.filepath,
+        expires_in=expires_in,
+        response_content_disposition=f'attachment; filename="{image.filename}"',
     )
+    url = presigned.url
     if user.role != UserRole.SERVICE:
         url = storage_service.fix_presigned_url(url)
 
-    return {"url": url, "expires_in": expires_in, "filename": image.filename}
+    return {"url": url, "expires_in": presigned.expires_in, "filename": image.filename}
+
+
+@image_router.get(
+    "/{image_id}/tiles",
+    status_code=status.HTTP_200_OK,
+    response_model=dict[str, Any],
+)
+async def get_image_tiles_descriptor(
+    image_id: UUID,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
+) -> dict[str, Any]:
+    """Describe the image's deep-zoom tile pyramid (size, tile size, levels)."""
+    image = await image_crud.get_by_id(image_id)
+    if not image:
+        raise HTTPException(status_code=404, detail="Image not found")
+    if not image.tiles:
+        raise HTTPException(status_code=404, detail="Tiles not available")
+
+    return {key: value for key, value in image.tiles.items() if key != "prefix"}
+
+
+@image_router.get(
+    "/{image_id}/tiles/{level}/{col}_{row}",
+    status_code=status.HTTP_200_OK,
+    response_class=Response,
+)
+async def get_image_tile(
+    image_id: UUID,
+    level: int,
+    col: int,
+    row: int,
+    user: Annotated[User, Depends(require_role(UserRole.ANALYST.value))],
+    image_crud: Annotated[ImageCRUD, Depends(get_image_crud)],
+    tile_service: Annotated[TileService, Depends(get_tile_service)],
+) -> Response:
+    """Get a single deep-zoom tile; tiles are immutable and cached by clients."""
+    image = await image_crud.get_by_id(image_id)
+    if not image:
+        raise HTTPException(status_code=404, detail="Image not found")
+
+    tile = await tile_service.get_tile(image, level, col, row)
+    if tile is None:
+        raise HTTPException(status_code=404, detail="Tile not found")
+
+    return Response(
+        content=tile,
+        media_type=f"image/{image.tiles['format']}",
+        headers={"Cache-Control": "private, max-age=31536000, immutable"},
+    )
@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import field_validator, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict, YamlConfigSettingsSource
@@ -32,6 +32,13 @@ class AppSettings(BaseSettings):
     BACKEND_CORS_ORIGINS: str | list[str]
     UVICORN_ADDRESS: str
     UVICORN_PORT: int
+    # ---- Kafka consumers ---- #
+    RUN_CONSUMERS_IN_API: bool = True  # off when results are consumed by worker processes
+    # ---- List endpoints ---- #
+    DEFAULT_PAGE_SIZE: int = 100
+    MAX_PAGE_SIZE: int = 1000  # hard cap, larger limits are clamped
+    # ---- Statistics ---- #
+    STATISTICS_MAX_BUCKETS: int = 2000  # largest series served by one request
 
     @field_validator("BACKEND_CORS_ORIGINS", mode="before")
     @staticmethod
@@ -70,6 +77,33 @@ class ImageSettings(BaseSettings):
     ALLOWED_MIME: set[str]
     ALLOWED_EXT: set[str] = {".jpg", ".jpeg", ".png"}
     MAX_FILE_SIZE: int = 10 * 1024 * 1024
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # bytes read from the request per iteration
+    MAX_BATCH_FILES: int = 200
+    BATCH_UPLOAD_CONCURRENCY: int = 8
+    PRESIGNED_UPLOAD_EXPIRES_IN: int = 15 * 60  # 15 minutes
+    # Re-uploads of content already in the dataset: return the existing image or 409
+    DUPLICATE_POLICY: Literal["reuse", "reject"] = "reuse"
+    # ---- Resumable uploads ---- #
+    MAX_RESUMABLE_FILE_SIZE: int = 20 * 1024 * 1024 * 1024
+    UPLOAD_SESSION_TTL: int = 24 * 60 * 60  # idle seconds before a session is aborted
+    UPLOAD_SESSION_GC_INTERVAL: int = 15 * 60
+    # ---- Derivatives ---- #
+    DERIVATIVE_SIZES: dict[str, int] = {"thumbnail": 256, "preview": 1024}  # longest edge
+    DERIVATIVE_FORMAT: str = "WEBP"
+    DERIVATIVE_QUALITY: int = 85
+    DERIVATIVE_WORKERS: int = 2  # processes decoding and resizing images
+    # ---- Deep-zoom tiles ---- #
+    TILE_SIZE: int = 256
+    TILE_OVERLAP: int = 1
+    TILE_FORMAT: str = "JPEG"
+    TILE_QUALITY: int = 85
+    TILE_MIN_DIMENSION: int = 2048  # smaller images are served by their derivatives
+    TILE_MAX_PIXELS: int = 1_000_000_000  # decompression bomb guard for huge frames
+    TILE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    # ---- Image location cache ---- #
+    LOCATION_CACHE_SIZE: int = 10000
+    # Seconds a change made by another process may go unnoticed
+    LOCATION_CACHE_TTL: int = 5 * 60
 
 
 class MinIOSettings(BaseSettings):
@@ -79,6 +113,15 @@ class MinIOSettings(BaseSettings):
     SECRET_KEY: SecretStr
     USE_SSL: bool = False
     DEFAULT_BUCKET: str
+    MULTIPART_PART_SIZE: int = 8 * 1024 * 1024  # S3 requires at least 5 MiB per part
+    # ---- Client pool ---- #
+    MAX_CONCURRENCY: int = 16  # worker threads and pooled connections for S3 calls
+    CONNECT_TIMEOUT: float = 5.0
+    READ_TIMEOUT: float = 60.0
+    # ---- Presigned URL cache ---- #
+    PRESIGNED_URL_CACHE_SIZE: int = 10000
+    # Reuse a cached URL only while this share of its requested validity remains
+    PRESIGNED_URL_MIN_REMAINING_RATIO: float = 0.5
 
 
 class KafkaSettings(BaseSettings):
@@ -89,6 +132,43 @@ class KafkaSettings(BaseSettings):
     CLASSIFICATION_RESULTS_TOPIC: str = "classification-result"
     CLASSIFICATION_CONSUMER_GROUP: str = "classification-result-group"
 
+    # ---- Job outbox ---- #
+    OUTBOX_BATCH_SIZE: int = 100  # jobs published per relay round
+    OUTBOX_POLL_INTERVAL: float = 0.5  # seconds between rounds once the outbox is drained
+    OUTBOX_MAX_ATTEMPTS: int = 20  # publish attempts before a job is marked failed
+    OUTBOX_RETRY_BACKOFF: float = 1.0  # seconds before the first retry, doubled after each
+    OUTBOX_RETRY_BACKOFF_MAX: float = 300.0
+
+    # ---- Consumer batching ---- #
+    CONSUMER_BATCH_ENABLED: bool = True  # poll with getmany and process whole batches
+    CONSUMER_BATCH_MAX_RECORDS: int = 500
+    CONSUMER_BATCH_MAX_WAIT_MS: int = 500  # longest wait for a batch to fill up
+    # ---- Partition workers ---- #
+    CONSUMER_PARTITION_WORKERS_ENABLED: bool = False  # one ordered worker per partition
+    CONSUMER_MAX_IN_FLIGHT_PER_PARTITION: int = 2000  # pause the partition above this
+    CONSUMER_DRAIN_TIMEOUT: float = 30.0  # seconds to finish a revoked partition's work
+    # ---- Offset commits ---- #
+    CONSUMER_COMMIT_EVERY_MESSAGES: int = 1000  # commit after this many processed messages
+    CONSUMER_COMMIT_INTERVAL_MS: int = 5000  # and at least this often
+    # ---- Retries and dead letters ---- #
+    CLASSIFICATION_RESULTS_RETRY_TOPIC: str = "classification-result-retry"
+    CLASSIFICATION_RESULTS_DLQ_TOPIC: str = "classification-result-dlq"
+    CONSUMER_MAX_ATTEMPTS: int = 5  # processing attempts before dead-lettering
+    CONSUMER_RETRY_BACKOFF_MS: int = 1000  # delay before the first retry, doubled after each
+    CONSUMER_RETRY_BACKOFF_MAX_MS: int = 60000  # keep below the consumer max.poll.interval.ms
+
+    # ---- Consumer fetching ---- #
+    CONSUMER_FETCH_MAX_BYTES: int = 52428800  # most data returned by one fetch request
+    CONSUMER_MAX_PARTITION_FETCH_BYTES: int = 1048576  # most data per partition per fetch
+    CONSUMER_FETCH_MIN_BYTES: int = 1  # broker waits for this much data ...
+    CONSUMER_FETCH_MAX_WAIT_MS: int = 500  # ... or this long before answering a fetch
+    CONSUMER_MAX_POLL_RECORDS: int | None = None  # cap of records per poll, None for no cap
+    # ---- Producer batching ---- #
+    PRODUCER_ACKS: Literal[0, 1, "all"] = 1
+    PRODUCER_LINGER_MS: int = 0  # wait this long for more messages to fill a batch
+    PRODUCER_MAX_BATCH_SIZE: int = 16384  # bytes per partition batch
+    PRODUCER_COMPRESSION_TYPE: Literal["gzip", "snappy", "lz4", "zstd"] | None = None
+
     # ---- SSL ---- #
     SSL_ENABLED: bool = False
     SSL_CAFILE: str | None = None
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Any
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from typing import Any, TYPE_CHECKING
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from loguru import logger
 
 from bioscopeai_core.app.core.config import settings
 
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
 @lru_cache(maxsize=1)
 def get_s3_client() -> Any:
     """Get a cached S3 client instance configured for MinIO."""
@@ -23,16 +30,49 @@ def get_s3_client() -> Any:
         endpoint_url=endpoint_url,
         aws_access_key_id=settings.minio.ACCESS_KEY,
         aws_secret_access_key=settings.minio.SECRET_KEY.get_secret_value(),
+        config=Config(
+            max_pool_connections=settings.minio.MAX_CONCURRENCY,
+            connect_timeout=settings.minio.CONNECT_TIMEOUT,
+            read_timeout=settings.minio.READ_TIMEOUT,
+            retries={"max_attempts": 3, "mode": "standard"},
+        ),
     )
 
 
-def ensure_bucket_exists(bucket: str | None = None) -> None:
+@lru_cache(maxsize=1)
+def get_s3_executor() -> ThreadPoolExecutor:
+    """Get the dedicated thread pool that runs blocking boto3 calls.
+
+    The pool size matches the client's connection pool, so at most
+    ``MAX_CONCURRENCY`` S3 requests are in flight per process and further calls
+    queue up without blocking the event loop.
+    """
+    return ThreadPoolExecutor(
+        max_workers=settings.minio.MAX_CONCURRENCY,
+        thread_name_prefix="s3",
+    )
+
+
+async def run_s3_call[T](func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Run a blocking boto3 call in the S3 executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_s3_executor(), partial(func, *args, **kwargs))
+
+
+def shutdown_s3_executor() -> None:
+    """Shut down the S3 executor, cancelling calls that have not started yet."""
+    if get_s3_executor.cache_info().currsize:
+        get_s3_executor().shutdown(wait=False, cancel_futures=True)
+        get_s3_executor.cache_clear()
+
+
+async def ensure_bucket_exists(bucket: str | None = None) -> None:
     """Ensure that the specified S3 bucket exists; create it if it does not."""
-    s3 = get_s3_client()
+    s3 = await run_s3_call(get_s3_client)
     bucket_name = bucket or settings.minio.DEFAULT_BUCKET
 
     try:
-        s3.head_bucket(Bucket=bucket_name)
+        await run_s3_call(s3.head_bucket, Bucket=bucket_name)
     except ClientError as exc:
         code = (exc.response.get("Error") or {}).get("Code", "")
         if code in {"404", "NoSuchBucket", "NotFound"}:
@@ -43,7 +83,7 @@ def ensure_bucket_exists(bucket: str | None = None) -> None:
     else:
         return
     try:
-        s3.create_bucket(Bucket=bucket_name)
+        await run_s3_call(s3.create_bucket, Bucket=bucket_name)
         logger.info("Bucket '{}' created.", bucket_name)
     except ClientError as exc:
         code = (exc.response.get("Error") or {}).get("Code", "")
@@ -13,6 +13,9 @@ class BaseCRUD[T: Model]:
     async def get_by_id(self, obj_id: UUID) -> T | None:
         return cast("T | None", await self.model.get_or_none(id=obj_id))
 
+    async def get_by_ids(self, obj_ids: list[UUID]) -> list[T]:
+        return cast("list[T]", await self.model.filter(id__in=obj_ids))
+
     async def delete_by_id(self, obj_id: UUID) -> bool:
         obj: T | None = await self.model.get_or_none(id=obj_id)
         if obj:
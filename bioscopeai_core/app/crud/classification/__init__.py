@@ -1,13 +1,25 @@
 from .classification import ClassificationCRUD, get_classification_crud
+from .classification_outbox import (
+    ClassificationOutboxCRUD,
+    get_classification_outbox_crud,
+)
 from .classification_result import (
     ClassificationResultCRUD,
     get_classification_result_crud,
 )
+from .classification_stats import (
+    ClassificationStatsCRUD,
+    get_classification_stats_crud,
+)
 
 
 __all__ = [
     "ClassificationCRUD",
+    "ClassificationOutboxCRUD",
     "ClassificationResultCRUD",
+    "ClassificationStatsCRUD",
     "get_classification_crud",
+    "get_classification_outbox_crud",
     "get_classification_result_crud",
+    "get_classification_stats_crud",
 ]
@@ -1,18 +1,23 @@
+from datetime import datetime, UTC
 from typing import Any
 from uuid import UUID
 
-from loguru import logger
+from tortoise.transactions import in_transaction
 
+from bioscopeai_core.app.core.config import settings
 from bioscopeai_core.app.crud.base import BaseCRUD
-from bioscopeai_core.app.kafka.producers.classification_producer import (
-    ClassificationJobProducer,
-    get_classification_producer,
+from bioscopeai_core.app.crud.classification.classification_outbox import (
+    get_classification_outbox_crud,
 )
 from bioscopeai_core.app.models.classification import (
     Classification,
     ClassificationStatus,
 )
 from bioscopeai_core.app.schemas.classification import ClassificationCreate
+from bioscopeai_core.app.utils.pagination import paginate
+
+
+LIST_ORDER_BY = "-created_at"
 
 
 class ClassificationCRUD(BaseCRUD[Classification]):
@@ -23,37 +28,28 @@ class ClassificationCRUD(BaseCRUD[Classification]):
         created_by_id: UUID,
         create_in: ClassificationCreate,
     ) -> Classification:
-        obj: Classification = await self.model.create(
-            dataset_id=create_in.dataset_id,
-            image_id=create_in.image_id,
-            model_name=create_in.model_name,
-            created_by_id=created_by_id,
-            status=ClassificationStatus.PENDING,
-        )
-        classification_job_producer: ClassificationJobProducer = (
-            get_classification_producer()
-        )
-        try:
-            await classification_job_producer.send_event(
-                device_id=None,
-                message={
-                    "classification_id": str(obj.id),
-                    "dataset_id": str(create_in.dataset_id)
-                    if create_in.dataset_id
-                    else None,
-                    "image_id": str(create_in.image_id) if create_in.image_id else None,
-                    "model_name": create_in.model_name or None,
-                },
-            )
-        except Exception:
-            await self.set_status(
-                status=ClassificationStatus.FAILED,
-                classification_id=obj.id,
+        """Create a pending classification and queue its job message.
+
+        The message goes to the outbox in the same transaction and is published
+        to Kafka by the outbox relay, so no request waits on the broker.
+        """
+        async with in_transaction():
+            obj: Classification = await self.model.create(
+                dataset_id=create_in.dataset_id,
+                image_id=create_in.image_id,
+                model_name=create_in.model_name,
+                created_by_id=created_by_id,
+                status=ClassificationStatus.PENDING,
             )
-            logger.exception(
-                f"Failed to send classification job to Kafka for classification ID {obj.id}"
+            message = {
+                "classification_id": str(obj.id),
+                "dataset_id": str(create_in.dataset_id) if create_in.dataset_id else None,
+                "image_id": str(create_in.image_id) if create_in.image_id else None,
+                "model_name": create_in.model_name or None,
+            }
+            await get_classification_outbox_crud().enqueue(
+                classification_id=obj.id, message=message
             )
-            raise
 
         return obj
 
@@ -70,13 +66,33 @@ class ClassificationCRUD(BaseCRUD[Classification]):
 
         return obj
 
+    async def set_status_many(
+        self,
+        status: ClassificationStatus,
+        classification_ids: list[UUID],
+    ) -> int:
+        """Set the status of many classifications in one UPDATE.
+
+        Returns the number of classifications updated.
+        """
+        if not classification_ids:
+            return 0
+        # A queryset update skips auto_now, so updated_at is set explicitly
+        updated: int = await self.model.filter(id__in=classification_ids).update(
+            status=status, updated_at=datetime.now(UTC)
+        )
+        return updated
+
     async def get_filtered(
         self,
         status: str | None = None,
         dataset_id: UUID | None = None,
         image_id: UUID | None = None,
         created_by: UUID | None = None,
+        limit: int = settings.app.DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
     ) -> list[Classification]:
+        """Return one page of matching classifications, newest first."""
         filters: dict[str, Any] = {
             "status": ClassificationStatus(status) if status else None,
             "dataset_id": dataset_id,
@@ -85,9 +101,9 @@ class ClassificationCRUD(BaseCRUD[Classification]):
         }
         filters = {k: v for k, v in filters.items() if v is not None}
 
-        classifications: list[Classification] = await self.model.filter(
-            **filters
-        ).order_by("-created_at")
+        classifications: list[Classification] = await paginate(
+            self.model.filter(**filters), LIST_ORDER_BY, limit, cursor
+        )
 
         return classifications
 
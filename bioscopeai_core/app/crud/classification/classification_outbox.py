@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta, UTC
+from typing import Any
+from uuid import UUID
+
+from loguru import logger
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.crud.base import BaseCRUD
+from bioscopeai_core.app.models.classification import (
+    Classification,
+    ClassificationJobOutbox,
+    ClassificationStatus,
+)
+
+
+MAX_ERROR_LENGTH = 1000
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before publishing again a message that failed ``attempts`` times."""
+    delay = settings.kafka.OUTBOX_RETRY_BACKOFF * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.kafka.OUTBOX_RETRY_BACKOFF_MAX))
+
+
+class ClassificationOutboxCRUD(BaseCRUD[ClassificationJobOutbox]):
+    model = ClassificationJobOutbox
+
+    async def enqueue(
+        self,
+        classification_id: UUID,
+        message: dict[str, Any],
+        device_id: str | None = None,
+    ) -> ClassificationJobOutbox:
+        """Store a job message for the outbox relay to publish.
+
+        Call inside the transaction creating the classification, so that the job
+        and its message are committed together or not at all.
+        """
+        entry: ClassificationJobOutbox = await self.model.create(
+            classification_id=classification_id,
+            device_id=device_id,
+            payload=message,
+            next_attempt_at=datetime.now(UTC),
+        )
+        return entry
+
+    async def claim_due(self, limit: int) -> list[ClassificationJobOutbox]:
+        """Lock up to ``limit`` messages that are due for publishing, oldest first.
+
+        Must run inside a transaction. Rows locked by another relay are skipped,
+        so several API instances can drain the outbox side by side.
+        """
+        entries: list[ClassificationJobOutbox] = (
+            await self.model.filter(next_attempt_at__lte=datetime.now(UTC))
+            .order_by("next_attempt_at")
+            .limit(limit)
+            .select_for_update(skip_locked=True)
+        )
+        return entries
+
+    async def delete_many(self, entries: list[ClassificationJobOutbox]) -> int:
+        """Delete published messages. Returns the number of rows deleted."""
+        if not entries:
+            return 0
+        deleted: int = await self.model.filter(
+            id__in=[entry.id for entry in entries]
+        ).delete()
+        return deleted
+
+    async def reschedule(
+        self, entry: ClassificationJobOutbox, error: BaseException
+    ) -> None:
+        """Schedule another attempt at a message that failed to publish.
+
+        Once ``OUTBOX_MAX_ATTEMPTS`` attempts failed the message is dropped and
+        its classification marked as failed.
+        """
+        attempts = entry.attempts + 1
+        if attempts >= settings.kafka.OUTBOX_MAX_ATTEMPTS:
+            await Classification.filter(id=entry.classification_id).update(
+                status=ClassificationStatus.FAILED, updated_at=datetime.now(UTC)
+            )
+            await entry.delete()
+            logger.error(
+                f"Gave up publishing classification job {entry.classification_id} "
+                f"after {attempts} attempts: {error!r}"
+            )
+            return
+        await self.model.filter(id=entry.id).update(
+            attempts=attempts,
+            next_attempt_at=datetime.now(UTC) + retry_delay(attempts),
+            last_error=repr(error)[:MAX_ERROR_LENGTH],
+        )
+        logger.warning(
+            f"Failed to publish classification job {entry.classification_id} "
+            f"(attempt {attempts}): {error!r}"
+        )
+
+
+def get_classification_outbox_crud() -> ClassificationOutboxCRUD:
+    return ClassificationOutboxCRUD()
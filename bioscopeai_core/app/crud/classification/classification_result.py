@@ -1,13 +1,35 @@
-from collections import Counter
 from datetime import datetime, timedelta, UTC
+from hashlib import sha256
 from typing import Any
 from uuid import UUID
 
+from tortoise.functions import Avg, Count
+
+from bioscopeai_core.app.core.config import settings
 from bioscopeai_core.app.crud.base import BaseCRUD
+from bioscopeai_core.app.db.functions import HOUR_FORMAT, TruncHour
+from bioscopeai_core.app.db.queries import insert_ignore_conflicts
 from bioscopeai_core.app.models.classification import ClassificationResult
 from bioscopeai_core.app.schemas.classification import (
     ClassificationResultCreate,
 )
+from bioscopeai_core.app.utils.pagination import paginate
+
+
+LIST_ORDER_BY = "-created_at"
+BULK_INSERT_BATCH_SIZE = 500
+
+
+def idempotency_key(data: ClassificationResultCreate) -> str:
+    """Natural key of a result.
+
+    The producer-supplied result ID when sent, otherwise a SHA-256 of
+    (classification_id, image_id, model_name, label).
+    """
+    if data.result_id is not None:
+        return str(data.result_id)
+    parts = (data.classification_id or "", data.image_id, data.model_name or "", data.label)
+    return sha256("|".join(map(str, parts)).encode()).hexdigest()
 
 
 class ClassificationResultCRUD(BaseCRUD[ClassificationResult]):
@@ -16,81 +38,147 @@ class ClassificationResultCRUD(BaseCRUD[ClassificationResult]):
     async def create_result(
         self,
         data: ClassificationResultCreate,
-    ) -> ClassificationResult:
-        obj: ClassificationResult = await self.model.create(
-            image_id=data.image_id,
-            classification_id=data.classification_id,
-            label=data.label,
-            confidence=data.confidence,
-            model_name=data.model_name,
+    ) -> ClassificationResult | None:
+        """Insert one result, or return None if it was stored before."""
+        results = await self.create_results([data])
+        return results[0] if results else None
+
+    async def create_results(
+        self,
+        data: list[ClassificationResultCreate],
+    ) -> list[ClassificationResult]:
+        """Insert results that were not stored before.
+
+        Results are matched by their idempotency key; already stored keys and
+        repeats within ``data`` are skipped, and a key inserted concurrently is
+        ignored by the database instead of failing the batch. Returns only the
+        results this call inserted, as reported by ``RETURNING``, so a result
+        stored by a concurrent consumer is never counted twice.
+        """
+        objs: dict[str, ClassificationResult] = {}
+        for item in data:
+            key = idempotency_key(item)
+            objs.setdefault(
+                key,
+                self.model(
+                    image_id=item.image_id,
+                    classification_id=item.classification_id,
+                    label=item.label,
+                    confidence=item.confidence,
+                    model_name=item.model_name,
+                    idempotency_key=key,
+                ),
+            )
+        if not objs:
+            return []
+
+        stored = set(
+            await self.model.filter(idempotency_key__in=list(objs)).values_list(
+                "idempotency_key", flat=True
+            )
         )
-        return obj
+        new = [obj for key, obj in objs.items() if key not in stored]
+        inserted: set[str] = set()
+        for start in range(0, len(new), BULK_INSERT_BATCH_SIZE):
+            inserted.update(
+                await insert_ignore_conflicts(
+                    new[start : start + BULK_INSERT_BATCH_SIZE], "idempotency_key"
+                )
+            )
+        return [obj for obj in new if obj.idempotency_key in inserted]
 
     async def get_filtered(
         self,
         classification_id: UUID | None = None,
         image_id: UUID | None = None,
+        limit: int = settings.app.DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
     ) -> list[ClassificationResult]:
+        """Return one page of matching results, newest first."""
         filters = {
             "classification_id": classification_id,
             "image_id": image_id,
         }
         filters = {k: v for k, v in filters.items() if v is not None}
 
-        classification_results: list[ClassificationResult] = await self.model.filter(
-            **filters
-        ).order_by("-created_at")
+        classification_results: list[ClassificationResult] = await paginate(
+            self.model.filter(**filters), LIST_ORDER_BY, limit, cursor
+        )
 
         return classification_results
 
     async def get_by_classification(
-        self, classification_id: UUID
+        self,
+        classification_id: UUID,
+        limit: int = settings.app.DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
     ) -> list[ClassificationResult]:
-        return await self.get_filtered(classification_id=classification_id)
+        return await self.get_filtered(
+            classification_id=classification_id, limit=limit, cursor=cursor
+        )
 
-    async def get_by_image(self, image_id: UUID) -> list[ClassificationResult]:
-        return await self.get_filtered(image_id=image_id)
+    async def get_by_image(
+        self,
+        image_id: UUID,
+        limit: int = settings.app.DEFAULT_PAGE_SIZE,
+        cursor: str | None = None,
+    ) -> list[ClassificationResult]:
+        return await self.get_filtered(image_id=image_id, limit=limit, cursor=cursor)
 
     async def get_today_statistics(self) -> dict[str, Any]:
+        """Summarise the results of the last 24 hours.
+
+        Count, average confidence and hourly counts are aggregated in the database;
+        only the 10 newest results are loaded as objects.
+        """
         now = datetime.now(UTC)
         date_range: datetime = now - timedelta(days=1)
-        classification_results: list[ClassificationResult] = await self.model.filter(
-            created_at__gte=date_range,
-        ).order_by("-created_at")
-
-        count: int = len(classification_results)
-        confidence: float = (
-            sum(result.confidence for result in classification_results) / count
-            if count > 0
-            else 0.0
-        )
-
-        hourly_counts: Counter[str] = Counter(
-            result.created_at.replace(minute=0, second=0, microsecond=0).strftime(
-                "%Y-%m-%dT%H:00:00Z"
-            )
-            for result in classification_results
+        recent = self.model.filter(created_at__gte=date_range)
+
+        totals = await recent.annotate(
+            count=Count("id"), average=Avg("confidence")
+        ).first().values("count", "average")
+        count: int = totals["count"] if totals else 0
+        confidence: float = float(totals["average"] or 0.0) if count > 0 else 0.0
+
+        buckets = await (
+            recent.annotate(hour=TruncHour("created_at"), count=Count("id"))
+            .group_by("hour")
+            .values("hour", "count")
         )
+        hourly_counts: dict[str, int] = {
+            _format_hour(bucket["hour"]): bucket["count"] for bucket in buckets
+        }
 
         hourly_data: list[dict[str, int | str]] = [
             {
                 "hour": (
                     hour_str := (now - timedelta(hours=i))
                     .replace(minute=0, second=0, microsecond=0)
-                    .strftime("%Y-%m-%dT%H:00:00Z")
+                    .strftime(HOUR_FORMAT)
                 ),
-                "count": hourly_counts[hour_str],
+                "count": hourly_counts.get(hour_str, 0),
             }
             for i in range(24, -1, -1)
         ]
 
+        last_10_results: list[ClassificationResult] = await recent.order_by(
+            "-created_at"
+        ).limit(10)
+
         return {
             "classified_last_24_hours": count,
             "average_confidence": confidence,
-            "last_10_results": classification_results[:10],
+            "last_10_results": last_10_results,
             "hourly_counts": hourly_data,
         }
 
 
+def _format_hour(value: datetime | str) -> str:
+    if isinstance(value, datetime):
+        return value.astimezone(UTC).strftime(HOUR_FORMAT)
+    return value
+
+
 def get_classification_result_crud() -> ClassificationResultCRUD:
     return ClassificationResultCRUD()
@@ -0,0 +1,240 @@
+from datetime import datetime, timedelta, UTC
+from typing import Any, Literal
+
+from fastapi import HTTPException
+from tortoise.functions import Count, Sum
+from tortoise.transactions import in_transaction
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.crud.base import BaseCRUD
+from bioscopeai_core.app.db.functions import HOUR_FORMAT, TruncHour
+from bioscopeai_core.app.db.queries import upsert_increments
+from bioscopeai_core.app.models import (
+    ClassificationResult,
+    ClassificationStatsHourly,
+    Image,
+)
+
+
+Granularity = Literal["hour", "day", "week"]
+Dimension = Literal["label", "model_name", "device_id", "dataset_id"]
+
+ROLLUP_KEY = ("bucket", "label", "model_name", "device_id", "dataset_id")
+UPSERT_BATCH_SIZE = 500
+
+GRANULARITY_STEPS: dict[str, timedelta] = {
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+
+def as_utc(moment: datetime) -> datetime:
+    """Convert ``moment`` to UTC, reading naive datetimes as UTC."""
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=UTC)
+    return moment.astimezone(UTC)
+
+
+def floor_bucket(moment: datetime, granularity: Granularity) -> datetime:
+    """Start of the UTC hour, day or ISO week (Monday) containing ``moment``."""
+    moment = as_utc(moment).replace(minute=0, second=0, microsecond=0)
+    if granularity == "hour":
+        return moment
+    moment = moment.replace(hour=0)
+    if granularity == "week":
+        moment -= timedelta(days=moment.weekday())
+    return moment
+
+
+def _parse_hour(value: datetime | str) -> datetime:
+    if isinstance(value, datetime):
+        return as_utc(value)
+    return datetime.strptime(value, HOUR_FORMAT).replace(tzinfo=UTC)
+
+
+class ClassificationStatsCRUD(BaseCRUD[ClassificationStatsHourly]):
+    model = ClassificationStatsHourly
+
+    async def record_result(self, result: ClassificationResult) -> None:
+        """Add a newly stored result to its hourly rollup row."""
+        await self.record_results([result])
+
+    async def record_results(self, results: list[ClassificationResult]) -> None:
+        """Add newly stored results to their hourly rollup rows.
+
+        Results are summed per rollup row first, then the sums are added to the
+        existing rows with one upsert per ``UPSERT_BATCH_SIZE`` distinct
+        (hour, label, model, device, dataset), so concurrent consumers never race
+        to create the same row.
+        """
+        images = await Image.filter(
+            id__in={result.image_id for result in results}
+        ).values("id", "dataset_id", "device_id")
+        dims = {
+            image["id"]: (str(image["device_id"] or ""), str(image["dataset_id"] or ""))
+            for image in images
+        }
+
+        increments: dict[tuple[datetime, str, str, str, str], list[float]] = {}
+        for result in results:
+            device_id, dataset_id = dims.get(result.image_id, ("", ""))
+            key = (
+                floor_bucket(result.created_at, "hour"),
+                result.label,
+                result.model_name or "",
+                device_id,
+                dataset_id,
+            )
+            totals = increments.setdefault(key, [0, 0.0])
+            totals[0] += 1
+            totals[1] += result.confidence
+
+        # Sorted so that concurrent batches lock the rollup rows in the same order
+        rollups = [
+            self.model(
+                bucket=bucket,
+                label=label,
+                model_name=model_name,
+                device_id=device_id,
+                dataset_id=dataset_id,
+                count=int(count),
+                confidence_sum=confidence,
+            )
+            for (bucket, label, model_name, device_id, dataset_id), (
+                count,
+                confidence,
+            ) in sorted(increments.items())
+        ]
+        for start in range(0, len(rollups), UPSERT_BATCH_SIZE):
+            await upsert_increments(
+                rollups[start : start + UPSERT_BATCH_SIZE],
+                conflict=ROLLUP_KEY,
+                increments=("count", "confidence_sum"),
+            )
+
+    async def get_series(
+        self,
+        start: datetime,
+        end: datetime,
+        granularity: Granularity = "hour",
+        group_by: Dimension | None = None,
+        filters: dict[Dimension, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return result counts and average confidence per bucket of ``[start, end)``.
+
+        ``start`` is aligned down to its bucket. Without ``group_by`` every bucket
+        of the window is returned, empty ones with a zero count; with it, one entry
+        per bucket and dimension value that has results.
+        """
+        start = floor_bucket(start, granularity)
+        end = as_utc(end)
+        if end <= start:
+            raise HTTPException(status_code=400, detail="end must be after start")
+        step = GRANULARITY_STEPS[granularity]
+        if (end - start) / step > settings.app.STATISTICS_MAX_BUCKETS:
+            raise HTTPException(
+                status_code=400, detail="Too many buckets, use a coarser granularity"
+            )
+
+        dimensions = [group_by] if group_by else []
+        rows = await (
+            self.model.filter(bucket__gte=start, bucket__lt=end, **(filters or {}))
+            .annotate(total=Sum("count"), confidence=Sum("confidence_sum"))
+            .group_by("bucket", *dimensions)
+            .values("bucket", *dimensions, "total", "confidence")
+        )
+
+        # Hourly rows are folded into coarser buckets here, which keeps the query
+        # free of dialect-specific date functions.
+        series: dict[tuple[datetime, str | None], list[float]] = {}
+        if group_by is None:
+            bucket = start
+            while bucket < end:
+                series[(bucket, None)] = [0, 0.0]
+                bucket += step
+        for row in rows:
+            key = (
+                floor_bucket(_parse_hour(row["bucket"]), granularity),
+                row[group_by] if group_by else None,
+            )
+            totals = series.setdefault(key, [0, 0.0])
+            totals[0] += row["total"] or 0
+            totals[1] += row["confidence"] or 0.0
+
+        return [
+            {
+                "bucket": bucket,
+                "group": group,
+                "count": int(count),
+                "average_confidence": confidence / count if count else 0.0,
+            }
+            for (bucket, group), (count, confidence) in sorted(
+                series.items(), key=lambda item: (item[0][0], item[0][1] or "")
+            )
+        ]
+
+    async def rebuild(self, since: datetime | None = None) -> int:
+        """Recompute the rollups from stored results.
+
+        Rows from the hour containing ``since`` onwards (all rows without it) are
+        replaced in one transaction. Returns the number of rollup rows written.
+        """
+        results = ClassificationResult.all()
+        stats = self.model.all()
+        if since is not None:
+            since = floor_bucket(since, "hour")
+            results = results.filter(created_at__gte=since)
+            stats = stats.filter(bucket__gte=since)
+
+        dimensions = ("label", "model_name", "image__dataset_id", "image__device_id")
+        rows = await (
+            results.annotate(
+                hour=TruncHour("created_at"),
+                total=Count("id"),
+                confidence=Sum("confidence"),
+            )
+            .group_by("hour", *dimensions)
+            .values("hour", *dimensions, "total", "confidence")
+        )
+
+        # NULL and "" model names share a rollup row, so merge before inserting
+        rollups: dict[tuple[datetime, str, str, str, str], list[float]] = {}
+        for row in rows:
+            key = (
+                _parse_hour(row["hour"]),
+                row["label"],
+                row["model_name"] or "",
+                str(row["image__device_id"] or ""),
+                str(row["image__dataset_id"] or ""),
+            )
+            totals = rollups.setdefault(key, [0, 0.0])
+            totals[0] += row["total"]
+            totals[1] += row["confidence"] or 0.0
+
+        async with in_transaction():
+            await stats.delete()
+            await self.model.bulk_create(
+                [
+                    self.model(
+                        bucket=bucket,
+                        label=label,
+                        model_name=model_name,
+                        device_id=device_id,
+                        dataset_id=dataset_id,
+                        count=int(count),
+                        confidence_sum=confidence,
+                    )
+                    for (bucket, label, model_name, device_id, dataset_id), (
+                        count,
+                        confidence,
+                    ) in rollups.items()
+                ],
+                batch_size=1000,
+            )
+        return len(rollups)
+
+
+def get_classification_stats_crud() -> ClassificationStatsCRUD:
+    """Returns an instance of ClassificationStatsCRUD."""
+    return ClassificationStatsCRUD()
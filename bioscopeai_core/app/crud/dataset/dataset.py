@@ -6,6 +6,7 @@ from loguru import logger
 from bioscopeai_core.app.crud.base import BaseCRUD
 from bioscopeai_core.app.models import Dataset, User
 from bioscopeai_core.app.schemas.dataset import DatasetCreate, DatasetUpdate
+from bioscopeai_core.app.services.image_location_cache import get_image_location_cache
 
 
 class DatasetCRUD(BaseCRUD[Dataset]):
@@ -67,6 +68,8 @@ class DatasetCRUD(BaseCRUD[Dataset]):
             )
 
         await dataset.delete()
+        # The dataset's images are deleted with it
+        get_image_location_cache().invalidate_dataset(obj_id)
         logger.info(f"Dataset {obj_id} deleted by user {user.id}")
         return True
 
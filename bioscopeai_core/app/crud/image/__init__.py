@@ -1,4 +1,12 @@
-from .image import get_image_crud, ImageCRUD
+from .image import get_image_crud, ImageCRUD, ImageUploadOutcome, SearchScope
+from .upload_session import get_upload_session_crud, UploadSessionCRUD
 
 
-__all__ = ["ImageCRUD", "get_image_crud"]
+__all__ = [
+    "ImageCRUD",
+    "ImageUploadOutcome",
+    "SearchScope",
+    "UploadSessionCRUD",
+    "get_image_crud",
+    "get_upload_session_crud",
+]
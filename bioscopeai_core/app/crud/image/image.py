@@ -1,19 +1,60 @@
+import asyncio
+import hashlib
 import re
+from dataclasses import dataclass
 from datetime import datetime
-from typing import cast
+from typing import Any, cast, Literal
 from uuid import UUID, uuid4
 
 from fastapi import HTTPException, UploadFile
 from loguru import logger
+from tortoise.exceptions import IntegrityError
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
 
 from bioscopeai_core.app.core.config import settings
 from bioscopeai_core.app.crud.base import BaseCRUD
-from bioscopeai_core.app.models import Image
-from bioscopeai_core.app.schemas.image import ImageCreate, ImageUpdate
+from bioscopeai_core.app.models import Dataset, Image
+from bioscopeai_core.app.schemas.image import (
+    ImageCreate,
+    ImageFinalizeFileIn,
+    ImageUpdate,
+    ImageUploadFileIn,
+)
+from bioscopeai_core.app.services.image_location_cache import (
+    get_image_location_cache,
+    ImageLocation,
+)
 from bioscopeai_core.app.services.storage_service import get_storage_service
+from bioscopeai_core.app.utils.pagination import (
+    keyset_filter,
+    keyset_ordering,
+    next_cursor,
+)
+from bioscopeai_core.app.utils.search import (
+    annotate_search,
+    search_condition,
+    SearchMode,
+)
 
 
 ALLOWED_ORDER_FIELDS = {"uploaded_at", "filename", "created_at"}
+# Images have no created_at column, the upload time plays that role
+ORDER_FIELD_ALIASES = {"created_at": "uploaded_at"}
+IMAGE_SEARCH_FIELDS = ("filename",)
+DATASET_SEARCH_FIELDS = ("name", "description")
+
+SearchScope = Literal["filename", "all"]
+
+
+@dataclass(slots=True)
+class ImageUploadOutcome:
+    """Result of uploading a single file as part of a batch."""
+
+    filename: str | None
+    image: Image | None = None
+    error: str | None = None
+    duplicate: bool = False  # image is an existing record with the same content
 
 
 class ImageCRUD(BaseCRUD[Image]):
@@ -22,6 +63,18 @@ class ImageCRUD(BaseCRUD[Image]):
     def __init__(self) -> None:
         super().__init__()
         self.storage_service = get_storage_service()
+        self.location_cache = get_image_location_cache()
+
+    async def get_location(self, image_id: UUID) -> ImageLocation | None:
+        """Object key, filename and derivatives of an image, cached by its ID."""
+        location = self.location_cache.get(image_id)
+        if location is None:
+            image = await self.get_by_id(image_id)
+            if not image:
+                return None
+            location = ImageLocation.of(image)
+            self.location_cache.put(image_id, location)
+        return location
 
     async def get_filtered_images(
         self,
@@ -35,11 +88,29 @@ class ImageCRUD(BaseCRUD[Image]):
         order_by: str = "-uploaded_at",
         page: int = 1,
         page_size: int = 25,
+        cursor: str | None = None,
+        search_mode: SearchMode = "contains",
+        search_scope: SearchScope = "filename",
     ) -> list[Image]:
-        """Retrieve images with optional filtering, pagination, and sorting."""
+        """Retrieve images with optional filtering, pagination, and sorting.
+
+        Pages are addressed either by ``page`` (OFFSET, kept for compatibility)
+        or by a ``cursor`` from ``next_cursor``, which seeks past the last seen
+        (order field, id) and stays fast on deep pages.
+
+        ``q`` matches filenames containing (or, in prefix mode, starting with) the
+        term, case-insensitively. With ``search_scope="all"`` images whose dataset
+        name or description matches are included as well.
+        """
         order_field = order_by.lstrip("-")
         if order_field not in ALLOWED_ORDER_FIELDS:
             raise HTTPException(status_code=400, detail="Invalid order_by field")
+        if order_field in ORDER_FIELD_ALIASES:
+            order_by = order_by.replace(order_field, ORDER_FIELD_ALIASES[order_field])
+        if cursor is not None and page != 1:
+            raise HTTPException(
+                status_code=400, detail="Use either page or cursor, not both"
+            )
 
         filters = {
             "dataset_id": dataset_id,
@@ -48,33 +119,68 @@ class ImageCRUD(BaseCRUD[Image]):
             "analyzed": analyzed,
             "uploaded_at__gte": created_from,
             "uploaded_at__lte": created_to,
-            "filename__icontains": q,
         }
         # Drop None values
         filters = {k: v for k, v in filters.items() if v is not None}
 
-        query = self.model.filter(**filters).order_by(order_by)
-        offset: int = (page - 1) * page_size
-        images: list[Image] = await query.offset(offset).limit(page_size)
+        query = self.model.filter(**filters)
+        if q:
+            query = await self._apply_search(query, q, search_mode, search_scope)
+        if cursor is not None:
+            query = query.filter(keyset_filter(order_by, cursor))
+        query = query.order_by(*keyset_ordering(order_by))
+        if cursor is None:
+            query = query.offset((page - 1) * page_size)
+        images: list[Image] = await query.limit(page_size)
         return images
 
+    @staticmethod
+    async def _apply_search(
+        query: QuerySet[Image], q: str, mode: SearchMode, scope: SearchScope
+    ) -> QuerySet[Image]:
+        condition = search_condition(IMAGE_SEARCH_FIELDS, q, mode)
+        if scope == "all":
+            # Datasets are few compared to images; resolving matching IDs first
+            # keeps the image query free of a join and on its own indexes.
+            datasets = annotate_search(Dataset.all(), DATASET_SEARCH_FIELDS)
+            dataset_ids = await datasets.filter(
+                search_condition(DATASET_SEARCH_FIELDS, q, mode)
+            ).values_list("id", flat=True)
+            if dataset_ids:
+                condition |= Q(dataset_id__in=dataset_ids)
+        return annotate_search(query, IMAGE_SEARCH_FIELDS).filter(condition)
+
+    @staticmethod
+    def next_cursor(images: list[Image], order_by: str, page_size: int) -> str | None:
+        """Cursor of the page following ``images``, or None on the last page."""
+        order_field = order_by.lstrip("-")
+        if order_field in ORDER_FIELD_ALIASES:
+            order_by = order_by.replace(order_field, ORDER_FIELD_ALIASES[order_field])
+        return next_cursor(images, order_by, page_size)
+
     async def create_image(
         self, image_in: ImageCreate, uploaded_by_id: UUID, uploaded_file: UploadFile
     ) -> Image:
-        """Create a new image record and save the uploaded file to S3/MinIO."""
-        await self._validate_file(uploaded_file)
+        """Create a new image record and save the uploaded file to S3/MinIO.
 
+        The file is hashed while it streams to storage. If the dataset already
+        holds the same content, the uploaded object is removed again and the
+        duplicate policy applies.
+        """
+        self._validate_file(uploaded_file)
         bucket_name = self.storage_service.default_bucket
-
-        # Generate object key with dataset prefix: dataset_id/uuid_filename.ext
-        file_extension = self._get_file_extension(uploaded_file.filename or "file")
-        object_key = f"{image_in.dataset_id}/{uuid4()}{file_extension}"
+        object_key = self._build_object_key(
+            image_in.dataset_id, uploaded_file.filename or "file"
+        )
+        digest = hashlib.sha256()
 
         try:
             await self.storage_service.upload_file(
                 file=uploaded_file,
                 bucket=bucket_name,
                 object_name=object_key,
+                max_size=settings.image.MAX_FILE_SIZE,
+                on_chunk=digest.update,
             )
             logger.info(
                 f"User {uploaded_by_id} uploaded {uploaded_file.filename} to "
@@ -86,30 +192,299 @@ class ImageCRUD(BaseCRUD[Image]):
             logger.exception("Failed to upload file to storage")
             raise HTTPException(status_code=500, detail="File upload failed") from e
 
-        # Create database record
+        return await self.create_from_object(
+            filename=uploaded_file.filename,
+            object_key=object_key,
+            dataset_id=image_in.dataset_id,
+            uploaded_by_id=uploaded_by_id,
+            device_id=image_in.device_id,
+            content_hash=digest.hexdigest(),
+        )
+
+    async def create_from_object(
+        self,
+        filename: str | None,
+        object_key: str,
+        dataset_id: UUID,
+        uploaded_by_id: UUID,
+        device_id: UUID | None = None,
+        content_hash: str | None = None,
+    ) -> Image:
+        """Create the record of an object already stored in the default bucket.
+
+        Without ``content_hash`` the object is read back to hash it. If the
+        dataset already holds the same content, including content inserted
+        concurrently, the object is removed and the duplicate policy applies.
+        The object is removed as well if its record cannot be created.
+        """
+        bucket_name = self.storage_service.default_bucket
+        if content_hash is None:
+            try:
+                content_hash = await self.storage_service.hash_object(
+                    object_key, bucket=bucket_name
+                )
+            except HTTPException:
+                await self._delete_orphaned_file(bucket_name, object_key)
+                raise
+
+        existing = await self.model.get_or_none(
+            dataset_id=dataset_id, content_hash=content_hash
+        )
+        if existing is not None:
+            await self._delete_orphaned_file(bucket_name, object_key)
+            return self._resolve_duplicate(existing)
+
         try:
             obj: Image = await self.model.create(
-                filename=uploaded_file.filename,
+                filename=filename,
                 filepath=object_key,
-                dataset_id=image_in.dataset_id,
+                dataset_id=dataset_id,
                 uploaded_by_id=uploaded_by_id,
-                device_id=image_in.device_id,
+                device_id=device_id,
+                content_hash=content_hash,
             )
             logger.info(f"Image record created in DB: {obj.id}")
+        except IntegrityError as e:
+            await self._delete_orphaned_file(bucket_name, object_key)
+            # A concurrent upload of the same content may have been inserted first
+            existing = await self.model.get_or_none(
+                dataset_id=dataset_id, content_hash=content_hash
+            )
+            if existing is None:
+                logger.exception("Failed to create image record in database")
+                raise HTTPException(
+                    status_code=500, detail="Image record creation failed"
+                ) from e
+            return self._resolve_duplicate(existing)
         except Exception as e:
             logger.exception("Failed to create image record in database")
+            await self._delete_orphaned_file(bucket_name, object_key)
+            raise HTTPException(
+                status_code=500, detail="Image record creation failed"
+            ) from e
+
+        return obj
+
+    async def create_images(
+        self,
+        image_in: ImageCreate,
+        uploaded_by_id: UUID,
+        uploaded_files: list[UploadFile],
+    ) -> list[ImageUploadOutcome]:
+        """Upload many files concurrently and create their records in one insert.
+
+        Object uploads run concurrently, bounded by
+        ``settings.image.BATCH_UPLOAD_CONCURRENCY``, and every file is hashed
+        while it streams. A file that fails validation or upload is reported in
+        its outcome and does not affect the others. Files whose content already
+        exists in the dataset, or earlier in the batch, have their object removed
+        again and follow the duplicate policy, as do files whose content a
+        concurrent upload inserted in the meantime. If the bulk insert fails,
+        every uploaded object of the batch is removed.
+        """
+        bucket_name = self.storage_service.default_bucket
+        semaphore = asyncio.Semaphore(settings.image.BATCH_UPLOAD_CONCURRENCY)
+
+        async def upload(uploaded_file: UploadFile) -> tuple[str, str]:
+            self._validate_file(uploaded_file)
+            object_key = self._build_object_key(
+                image_in.dataset_id, uploaded_file.filename or "file"
+            )
+            digest = hashlib.sha256()
+            async with semaphore:
+                await self.storage_service.upload_file(
+                    file=uploaded_file,
+                    bucket=bucket_name,
+                    object_name=object_key,
+                    max_size=settings.image.MAX_FILE_SIZE,
+                    on_chunk=digest.update,
+                )
+            return object_key, digest.hexdigest()
+
+        upload_results = await asyncio.gather(
+            *(upload(uploaded_file) for uploaded_file in uploaded_files),
+            return_exceptions=True,
+        )
+        outcomes: list[ImageUploadOutcome] = []
+        for uploaded_file, result in zip(uploaded_files, upload_results, strict=True):
+            filename = uploaded_file.filename
+            if not isinstance(result, tuple):
+                outcomes.append(self._failed_outcome(filename, result))
+                continue
+            object_key, content_hash = result
+            image = self.model(
+                filename=filename,
+                filepath=object_key,
+                dataset_id=image_in.dataset_id,
+                uploaded_by_id=uploaded_by_id,
+                device_id=image_in.device_id,
+                content_hash=content_hash,
+            )
+            outcomes.append(ImageUploadOutcome(filename, image=image))
+
+        images, copies = await self._deduplicate(outcomes)
+        if not images:
+            return outcomes
+
+        stored: dict[str, Image] = {}
+        try:
             try:
-                await self.storage_service.delete_file(object_key, bucket=bucket_name)
-                logger.info(f"Deleted orphaned file: {bucket_name}/{object_key}")
-            except Exception as cleanup_exc:  # noqa:BLE001
-                logger.exception(
-                    f"Failed to delete orphaned file {bucket_name}/{object_key}: {cleanup_exc}"
+                await self.model.bulk_create(images)
+            except IntegrityError:
+                # Concurrent calls may have inserted some content or key meanwhile
+                images, stored = await self._resolve_insert_conflicts(outcomes, images)
+                if images:
+                    await self.model.bulk_create(images)
+            logger.info(
+                f"User {uploaded_by_id} uploaded {len(images)} images to dataset "
+                f"{image_in.dataset_id}"
+            )
+        except Exception as e:
+            logger.exception("Failed to create image records in database")
+            await asyncio.gather(
+                *(
+                    self._delete_orphaned_file(bucket_name, image.filepath)
+                    for image in images
                 )
+            )
             raise HTTPException(
                 status_code=500, detail="Image record creation failed"
             ) from e
 
-        return obj
+        self._resolve_copies(outcomes, copies, images, stored)
+        return outcomes
+
+    async def create_upload_policies(
+        self, dataset_id: UUID, files: list[ImageUploadFileIn]
+    ) -> list[dict[str, Any]]:
+        """Issue presigned POST policies for direct uploads to the object store.
+
+        Each file gets its own object key under the ``{dataset_id}/`` prefix,
+        restricted to the declared content type and ``MAX_FILE_SIZE``.
+        """
+        for file_in in files:
+            try:
+                self._validate_file_type(file_in.content_type, file_in.filename)
+            except HTTPException as e:
+                raise HTTPException(
+                    status_code=400, detail=f"{file_in.filename}: {e.detail}"
+                ) from e
+
+        async def presign(file_in: ImageUploadFileIn) -> dict[str, Any]:
+            object_key = self._build_object_key(dataset_id, file_in.filename)
+            policy = await self.storage_service.generate_presigned_post(
+                object_name=object_key,
+                content_type=file_in.content_type,
+                max_size=settings.image.MAX_FILE_SIZE,
+                expires_in=settings.image.PRESIGNED_UPLOAD_EXPIRES_IN,
+            )
+            return {"filename": file_in.filename, "object_key": object_key, **policy}
+
+        return list(await asyncio.gather(*(presign(file_in) for file_in in files)))
+
+    async def finalize_uploads(
+        self,
+        image_in: ImageCreate,
+        uploaded_by_id: UUID,
+        files: list[ImageFinalizeFileIn],
+    ) -> list[ImageUploadOutcome]:
+        """Verify directly uploaded objects and create their records in one insert.
+
+        Every object is checked with one concurrent HEAD pass for existence,
+        size and content type, then read back to hash it. Keys outside the
+        dataset prefix or already registered, also by a concurrent call, are
+        rejected. Objects that exist
+        but fail verification are deleted, as are objects whose content the
+        dataset already holds, which follow the duplicate policy.
+        """
+        bucket_name = self.storage_service.default_bucket
+        prefix = f"{image_in.dataset_id}/"
+        registered: set[str] = set(
+            await self.model.filter(
+                filepath__in=[file_in.object_key for file_in in files]
+            ).values_list("filepath", flat=True)
+        )
+        semaphore = asyncio.Semaphore(settings.image.BATCH_UPLOAD_CONCURRENCY)
+
+        async def verify(file_in: ImageFinalizeFileIn) -> str:
+            object_name = file_in.object_key.removeprefix(prefix)
+            if object_name == file_in.object_key or not object_name or "/" in object_name:
+                raise HTTPException(status_code=400, detail="Invalid object key")
+            if file_in.object_key in registered:
+                raise HTTPException(status_code=409, detail="Upload already finalized")
+            async with semaphore:
+                metadata = await self.storage_service.get_file_metadata(
+                    file_in.object_key, bucket=bucket_name
+                )
+            if metadata is None:
+                raise HTTPException(status_code=404, detail="Uploaded object not found")
+            try:
+                self._validate_file_type(metadata.get("ContentType"), file_in.filename)
+                size: int = metadata.get("ContentLength", 0)
+                if not 0 < size <= settings.image.MAX_FILE_SIZE:
+                    raise HTTPException(status_code=400, detail="Invalid file size")
+            except HTTPException:
+                await self._delete_orphaned_file(bucket_name, file_in.object_key)
+                raise
+            async with semaphore:
+                return await self.storage_service.hash_object(
+                    file_in.object_key, bucket=bucket_name
+                )
+
+        verify_results = await asyncio.gather(
+            *(verify(file_in) for file_in in files), return_exceptions=True
+        )
+
+        outcomes: list[ImageUploadOutcome] = []
+        for file_in, result in zip(files, verify_results, strict=True):
+            if isinstance(result, str):
+                image = self.model(
+                    filename=file_in.filename,
+                    filepath=file_in.object_key,
+                    dataset_id=image_in.dataset_id,
+                    uploaded_by_id=uploaded_by_id,
+                    device_id=image_in.device_id,
+                    content_hash=result,
+                )
+                outcomes.append(ImageUploadOutcome(file_in.filename, image=image))
+            elif isinstance(result, HTTPException):
+                outcomes.append(
+                    ImageUploadOutcome(file_in.filename, error=str(result.detail))
+                )
+            else:
+                logger.opt(exception=result).error(
+                    f"Failed to verify uploaded object {file_in.object_key}"
+                )
+                outcomes.append(
+                    ImageUploadOutcome(file_in.filename, error="Upload verification failed")
+                )
+
+        images, copies = await self._deduplicate(outcomes)
+        if not images:
+            return outcomes
+
+        stored: dict[str, Image] = {}
+        try:
+            try:
+                await self.model.bulk_create(images)
+            except IntegrityError:
+                # Concurrent calls may have inserted some content or key meanwhile
+                images, stored = await self._resolve_insert_conflicts(outcomes, images)
+                if images:
+                    await self.model.bulk_create(images)
+            logger.info(
+                f"User {uploaded_by_id} finalized {len(images)} direct uploads to "
+                f"dataset {image_in.dataset_id}"
+            )
+        except Exception as e:
+            # Objects are kept so that the client can retry the finalize call
+            logger.exception("Failed to create image records in database")
+            raise HTTPException(
+                status_code=500, detail="Image record creation failed"
+            ) from e
+
+        self._resolve_copies(outcomes, copies, images, stored)
+        return outcomes
 
     async def update_image(self, image_id: UUID, image_in: ImageUpdate) -> Image | None:
         """Update an existing image record."""
@@ -126,6 +501,7 @@ class ImageCRUD(BaseCRUD[Image]):
         try:
             await image.save()
             await image.refresh_from_db()
+            self.location_cache.invalidate(image_id)
             logger.info(f"Image {image_id} updated")
         except Exception as e:
             logger.exception("Failed to update image record")
@@ -133,6 +509,11 @@ class ImageCRUD(BaseCRUD[Image]):
 
         return cast("Image", image)
 
+    async def delete_by_id(self, obj_id: UUID) -> bool:
+        deleted = await super().delete_by_id(obj_id)
+        self.location_cache.invalidate(obj_id)
+        return deleted
+
     async def mark_as_analyzed(self, image_id: UUID) -> Image | None:
         """Mark an image as analyzed."""
 
@@ -155,26 +536,214 @@ class ImageCRUD(BaseCRUD[Image]):
 
         return cast("Image", image)
 
+    async def mark_many_as_analyzed(self, image_ids: list[UUID]) -> int:
+        """Mark many images as analyzed in one UPDATE.
+
+        Returns the number of images that were not analyzed before.
+        """
+        if not image_ids:
+            return 0
+        updated: int = await self.model.filter(
+            id__in=image_ids, analyzed=False
+        ).update(analyzed=True)
+        return updated
+
+    @staticmethod
+    def _resolve_duplicate(existing: Image) -> Image:
+        """Apply ``settings.image.DUPLICATE_POLICY`` to an upload of known content."""
+        if settings.image.DUPLICATE_POLICY == "reject":
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "Duplicate image", "image_id": str(existing.id)},
+            )
+        logger.info(f"Reusing image {existing.id} for duplicate upload")
+        return existing
+
+    async def _deduplicate(
+        self, outcomes: list[ImageUploadOutcome]
+    ) -> tuple[list[Image], dict[int, str]]:
+        """Turn outcomes of content that is already stored into duplicates.
+
+        Content the dataset holds resolves right away. Content repeated within
+        the batch only resolves once the batch is inserted, so those outcomes are
+        returned by index with their content hash, for ``_resolve_copies``. The
+        objects uploaded for either are removed. Returns the new images that
+        still have to be inserted, and the repeated content.
+        """
+        new = [o.image for o in outcomes if o.image is not None and not o.duplicate]
+        if not new:
+            return [], {}
+        existing: dict[str, Image] = {
+            image.content_hash: image
+            for image in await self.model.filter(
+                dataset_id=new[0].dataset_id,
+                content_hash__in=[image.content_hash for image in new],
+            )
+        }
+
+        first: dict[str, Image] = {}
+        copies: dict[int, str] = {}
+        redundant: list[str] = []
+        for index, outcome in enumerate(outcomes):
+            image = outcome.image
+            if image is None or outcome.duplicate:
+                continue
+            content_hash = cast("str", image.content_hash)
+            if content_hash in first:
+                # The same key may be listed twice, its object is still needed
+                if image.filepath != first[content_hash].filepath:
+                    redundant.append(image.filepath)
+                copies[index] = content_hash
+                outcomes[index] = ImageUploadOutcome(outcome.filename)
+            elif content_hash not in existing:
+                first[content_hash] = image
+            elif existing[content_hash].filepath == image.filepath:
+                # Registered by a concurrent finalize call, the object is its own
+                outcomes[index] = ImageUploadOutcome(
+                    outcome.filename, error="Upload already finalized"
+                )
+            else:
+                redundant.append(image.filepath)
+                outcomes[index] = self._duplicate_outcome(
+                    outcome.filename, existing[content_hash]
+                )
+        bucket_name = self.storage_service.default_bucket
+        await asyncio.gather(
+            *(self._delete_orphaned_file(bucket_name, key) for key in redundant)
+        )
+        return list(first.values()), copies
+
+    async def _resolve_insert_conflicts(
+        self, outcomes: list[ImageUploadOutcome], images: list[Image]
+    ) -> tuple[list[Image], dict[str, Image]]:
+        """Resolve a bulk insert that failed on a unique constraint.
+
+        Outcomes whose object key a concurrent call registered are rejected and
+        their object, which belongs to that image, is kept. Outcomes whose
+        content was inserted concurrently become duplicates and their object is
+        removed. Returns the images that still have to be inserted, and the
+        concurrently stored images by the content hash they hold. Raises
+        IntegrityError again if nothing conflicts, i.e. the insert failed for
+        another reason.
+        """
+        registered: dict[str, Image] = {
+            image.filepath: image
+            for image in await self.model.filter(
+                filepath__in=[image.filepath for image in images]
+            )
+        }
+        stored: dict[str, Image] = {
+            image.content_hash: image
+            for image in await self.model.filter(
+                dataset_id=images[0].dataset_id,
+                content_hash__in=[
+                    image.content_hash
+                    for image in images
+                    if image.filepath not in registered
+                ],
+            )
+        }
+        if not registered and not stored:
+            raise IntegrityError("Image insert failed without a conflicting image")
+
+        redundant: list[str] = []
+        for index, outcome in enumerate(outcomes):
+            image = outcome.image
+            if image is None or outcome.duplicate:
+                continue
+            content_hash = cast("str", image.content_hash)
+            if image.filepath in registered:
+                stored[content_hash] = registered[image.filepath]
+                outcomes[index] = ImageUploadOutcome(
+                    outcome.filename, error="Upload already finalized"
+                )
+            elif content_hash in stored:
+                redundant.append(image.filepath)
+                outcomes[index] = self._duplicate_outcome(
+                    outcome.filename, stored[content_hash]
+                )
+        bucket_name = self.storage_service.default_bucket
+        await asyncio.gather(
+            *(self._delete_orphaned_file(bucket_name, key) for key in redundant)
+        )
+        remaining = [image for image in images if image.content_hash not in stored]
+        return remaining, stored
+
+    def _resolve_copies(
+        self,
+        outcomes: list[ImageUploadOutcome],
+        copies: dict[int, str],
+        inserted: list[Image],
+        stored: dict[str, Image],
+    ) -> None:
+        """Point outcomes of content repeated within the batch at the stored image.
+
+        That is the image inserted for the content by the batch, or the one a
+        concurrent call stored instead.
+        """
+        holders = {**stored, **{image.content_hash: image for image in inserted}}
+        for index, content_hash in copies.items():
+            outcomes[index] = self._duplicate_outcome(
+                outcomes[index].filename, holders[content_hash]
+            )
+
+    def _duplicate_outcome(
+        self, filename: str | None, existing: Image
+    ) -> ImageUploadOutcome:
+        try:
+            image = self._resolve_duplicate(existing)
+        except HTTPException:
+            return ImageUploadOutcome(filename, error=f"Duplicate of image {existing.id}")
+        return ImageUploadOutcome(filename, image=image, duplicate=True)
+
+    @staticmethod
+    def _failed_outcome(filename: str | None, error: BaseException) -> ImageUploadOutcome:
+        if isinstance(error, HTTPException):
+            return ImageUploadOutcome(filename, error=str(error.detail))
+        logger.opt(exception=error).error(f"Failed to upload {filename} to storage")
+        return ImageUploadOutcome(filename, error="File upload failed")
+
     @staticmethod
-    async def _validate_file(uploaded_file: UploadFile) -> None:
+    def _validate_file(uploaded_file: UploadFile) -> None:
         """Validate the uploaded file for MIME type, extension, and size."""
 
+        ImageCRUD._validate_file_type(uploaded_file.content_type, uploaded_file.filename)
+        # Size and empty file are enforced while streaming to storage,
+        # reject early only when the size is already known
+        if uploaded_file.size is not None:
+            if uploaded_file.size == 0:
+                raise HTTPException(status_code=400, detail="File is empty")
+            if uploaded_file.size > settings.image.MAX_FILE_SIZE:
+                raise HTTPException(status_code=400, detail="File too large")
+
+    @staticmethod
+    def _validate_file_type(content_type: str | None, filename: str | None) -> None:
+        """Validate MIME type and file extension."""
+
         # Validate MIME type
-        if uploaded_file.content_type not in settings.image.ALLOWED_MIME:
+        if content_type not in settings.image.ALLOWED_MIME:
             raise HTTPException(status_code=400, detail="Invalid file type")
-        if uploaded_file.filename is None:
+        if filename is None:
             raise HTTPException(status_code=400, detail="Filename is missing")
         # Validate file extension
-        ext = uploaded_file.filename.rsplit(".", 1)[-1].lower()
+        ext = filename.rsplit(".", 1)[-1].lower()
         if f".{ext}" not in settings.image.ALLOWED_EXT:
             raise HTTPException(status_code=400, detail="Invalid file extension")
-        # Validate size and empty file
-        contents = await uploaded_file.read()
-        if not contents:
-            raise HTTPException(status_code=400, detail="File is empty")
-        if len(contents) > settings.image.MAX_FILE_SIZE:
-            raise HTTPException(status_code=400, detail="File too large")
-        await uploaded_file.seek(0)
+
+    async def _delete_orphaned_file(self, bucket_name: str, object_key: str) -> None:
+        """Remove an uploaded object whose database record could not be created."""
+        try:
+            await self.storage_service.delete_file(object_key, bucket=bucket_name)
+            logger.info(f"Deleted orphaned file: {bucket_name}/{object_key}")
+        except Exception as cleanup_exc:  # noqa:BLE001
+            logger.exception(
+                f"Failed to delete orphaned file {bucket_name}/{object_key}: {cleanup_exc}"
+            )
+
+    @classmethod
+    def _build_object_key(cls, dataset_id: UUID, filename: str) -> str:
+        """Generate object key with dataset prefix: dataset_id/uuid_filename.ext"""
+        return f"{dataset_id}/{uuid4()}{cls._get_file_extension(filename)}"
 
     @staticmethod
     def _get_file_extension(filename: str) -> str:
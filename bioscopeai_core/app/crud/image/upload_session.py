@@ -0,0 +1,292 @@
+import math
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, UTC
+from uuid import UUID
+
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+from loguru import logger
+from tortoise.expressions import Q
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.crud.base import BaseCRUD
+from bioscopeai_core.app.crud.image.image import ImageCRUD
+from bioscopeai_core.app.models import Image, UploadSession, UploadSessionStatus
+from bioscopeai_core.app.schemas.image import UploadSessionCreate
+from bioscopeai_core.app.services.storage_service import get_storage_service
+
+
+S3_MAX_PARTS = 10000
+
+
+class UploadSessionCRUD(BaseCRUD[UploadSession]):
+    """Resumable uploads mapped onto S3 multipart uploads.
+
+    Every chunk is exactly one multipart part (the last one may be shorter), so
+    a client resumes a dropped upload by asking for ``received_bytes`` and
+    sending the next chunk from that offset. Session state lives in the
+    database, which lets any API instance accept the next chunk.
+    """
+
+    model = UploadSession
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.storage_service = get_storage_service()
+        self.image_crud = ImageCRUD()
+
+    async def get_for_user(self, session_id: UUID, user_id: UUID) -> UploadSession:
+        session = await self.model.get_or_none(id=session_id, uploaded_by_id=user_id)
+        if session is None:
+            raise HTTPException(status_code=404, detail="Upload session not found")
+        return session
+
+    async def create_session(
+        self, session_in: UploadSessionCreate, uploaded_by_id: UUID
+    ) -> UploadSession:
+        """Validate the announced file and start a multipart upload for it."""
+        ImageCRUD._validate_file_type(session_in.content_type, session_in.filename)
+        if session_in.total_size > settings.image.MAX_RESUMABLE_FILE_SIZE:
+            raise HTTPException(status_code=400, detail="File too large")
+
+        # S3 caps a multipart upload at 10,000 parts
+        part_size = max(
+            settings.minio.MULTIPART_PART_SIZE,
+            math.ceil(session_in.total_size / S3_MAX_PARTS),
+        )
+        object_key = ImageCRUD._build_object_key(
+            session_in.dataset_id, session_in.filename
+        )
+        try:
+            upload_id = await self.storage_service.create_multipart_upload(
+                self.storage_service.default_bucket,
+                object_key,
+                session_in.content_type,
+            )
+        except ClientError as e:
+            logger.exception(f"Failed to start multipart upload for {object_key}")
+            raise HTTPException(
+                status_code=500, detail="Upload session creation failed"
+            ) from e
+
+        session: UploadSession = await self.model.create(
+            dataset_id=session_in.dataset_id,
+            device_id=session_in.device_id,
+            uploaded_by_id=uploaded_by_id,
+            filename=session_in.filename,
+            content_type=session_in.content_type,
+            object_key=object_key,
+            upload_id=upload_id,
+            total_size=session_in.total_size,
+            part_size=part_size,
+        )
+        logger.info(
+            f"User {uploaded_by_id} started upload session {session.id} "
+            f"for {session_in.filename} ({session_in.total_size} bytes)"
+        )
+        return session
+
+    async def upload_chunk(
+        self, session: UploadSession, offset: int, chunks: AsyncIterator[bytes]
+    ) -> UploadSession:
+        """Store the part that starts at ``offset`` and advance the session.
+
+        The request body is buffered up to one part. The session only advances
+        if nobody else advanced it meanwhile, so concurrent or replayed chunks
+        for the same offset are rejected with 409 instead of corrupting state.
+        """
+        if session.status != UploadSessionStatus.ACTIVE:
+            raise HTTPException(status_code=409, detail="Upload session is not active")
+        if offset != session.received_bytes:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Expected offset {session.received_bytes}",
+            )
+
+        expected_size = min(session.part_size, session.total_size - offset)
+        body = bytearray()
+        async for chunk in chunks:
+            body.extend(chunk)
+            if len(body) > expected_size:
+                raise HTTPException(status_code=400, detail="Chunk too large")
+        if len(body) != expected_size:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Chunk must be exactly {expected_size} bytes",
+            )
+
+        part_number = offset // session.part_size + 1
+        try:
+            part = await self.storage_service.upload_part(
+                self.storage_service.default_bucket,
+                session.object_key,
+                session.upload_id,
+                part_number=part_number,
+                body=bytes(body),
+            )
+        except ClientError as e:
+            logger.exception(
+                f"Failed to upload part {part_number} of session {session.id}"
+            )
+            raise HTTPException(status_code=500, detail="Chunk upload failed") from e
+
+        received_bytes = offset + expected_size
+        parts = [*session.parts, part]
+        updated = await self.model.filter(
+            id=session.id,
+            received_bytes=offset,
+            status=UploadSessionStatus.ACTIVE,
+        ).update(received_bytes=received_bytes, parts=parts, updated_at=datetime.now(UTC))
+        if not updated:
+            raise HTTPException(
+                status_code=409, detail="Upload session was modified concurrently"
+            )
+
+        session.received_bytes = received_bytes
+        session.parts = parts
+        return session
+
+    async def complete_session(self, session: UploadSession) -> Image:
+        """Assemble the uploaded parts into one object and create its Image record.
+
+        The assembled object is hashed and deduplicated like any other upload,
+        so content the dataset already holds follows the duplicate policy. The
+        session stays COMPLETING until its image is registered, so a completion
+        cut short by a crash is settled by ``abort_expired_sessions``.
+        """
+        if session.received_bytes != session.total_size:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Upload incomplete: {session.received_bytes} of "
+                f"{session.total_size} bytes received",
+            )
+        claimed = await self.model.filter(
+            id=session.id, status=UploadSessionStatus.ACTIVE
+        ).update(status=UploadSessionStatus.COMPLETING, updated_at=datetime.now(UTC))
+        if not claimed:
+            raise HTTPException(status_code=409, detail="Upload session is not active")
+
+        bucket_name = self.storage_service.default_bucket
+        try:
+            await self.storage_service.complete_multipart_upload(
+                bucket_name, session.object_key, session.upload_id, session.parts
+            )
+        except ClientError as e:
+            logger.exception(f"Failed to complete upload session {session.id}")
+            await self.model.filter(id=session.id).update(
+                status=UploadSessionStatus.ACTIVE
+            )
+            raise HTTPException(status_code=500, detail="File upload failed") from e
+
+        try:
+            image = await self.image_crud.create_from_object(
+                filename=session.filename,
+                object_key=session.object_key,
+                dataset_id=session.dataset_id,
+                uploaded_by_id=session.uploaded_by_id,
+                device_id=session.device_id,
+            )
+        except HTTPException:
+            # The assembled object has been removed, nothing is left to complete
+            await self.model.filter(id=session.id).update(
+                status=UploadSessionStatus.ABORTED
+            )
+            raise
+
+        await self.model.filter(id=session.id).update(
+            status=UploadSessionStatus.COMPLETED
+        )
+        session.status = UploadSessionStatus.COMPLETED
+        logger.info(f"Upload session {session.id} completed as image {image.id}")
+        return image
+
+    async def abort_session(self, session: UploadSession) -> None:
+        """Abort the multipart upload, discarding every stored part.
+
+        If S3 cannot abort the upload the session stays ABORTING and the abort
+        is retried by ``abort_expired_sessions``.
+        """
+        claimed = await self.model.filter(
+            id=session.id, status=UploadSessionStatus.ACTIVE
+        ).update(status=UploadSessionStatus.ABORTING, updated_at=datetime.now(UTC))
+        if not claimed:
+            raise HTTPException(status_code=409, detail="Upload session is not active")
+
+        session.status = UploadSessionStatus.ABORTING
+        await self._finish_abort(session)
+
+    async def abort_expired_sessions(self) -> int:
+        """Clean up sessions that were abandoned or left half-settled.
+
+        Aborts active sessions that received no chunk within the session TTL
+        and retries aborts that S3 failed. Completions that stopped before
+        their image was registered for longer than the TTL are settled as
+        completed if the image exists and aborted otherwise. A session that
+        fails is logged and retried on the next run.
+        """
+        cutoff = datetime.now(UTC) - timedelta(seconds=settings.image.UPLOAD_SESSION_TTL)
+        sessions = await self.model.filter(
+            Q(status=UploadSessionStatus.ACTIVE, updated_at__lt=cutoff)
+            | Q(status=UploadSessionStatus.ABORTING)
+            | Q(status=UploadSessionStatus.COMPLETING, updated_at__lt=cutoff)
+        )
+        settled = 0
+        for session in sessions:
+            try:
+                if session.status == UploadSessionStatus.ACTIVE:
+                    await self.abort_session(session)
+                elif session.status == UploadSessionStatus.ABORTING:
+                    await self._finish_abort(session)
+                else:
+                    await self._settle_completion(session)
+            except HTTPException as e:
+                # 409: completed or aborted by its owner in the meantime
+                if e.status_code != 409:
+                    logger.warning(
+                        f"Failed to clean up upload session {session.id}: {e.detail}"
+                    )
+                continue
+            settled += 1
+        if settled:
+            logger.info(f"Cleaned up {settled} abandoned upload sessions")
+        return settled
+
+    async def _finish_abort(self, session: UploadSession) -> None:
+        await self._abort_multipart_upload(session)
+        await self.model.filter(
+            id=session.id, status=UploadSessionStatus.ABORTING
+        ).update(status=UploadSessionStatus.ABORTED)
+        session.status = UploadSessionStatus.ABORTED
+
+    async def _settle_completion(self, session: UploadSession) -> None:
+        """Finish a completion that stopped before the session was updated."""
+        if await Image.exists(filepath=session.object_key):
+            status = UploadSessionStatus.COMPLETED
+        else:
+            # The parts may or may not have been assembled, discard both
+            await self._abort_multipart_upload(session)
+            await self.storage_service.delete_file(session.object_key)
+            status = UploadSessionStatus.ABORTED
+        await self.model.filter(
+            id=session.id, status=UploadSessionStatus.COMPLETING
+        ).update(status=status)
+        session.status = status
+        logger.info(f"Settled interrupted upload session {session.id} as {status}")
+
+    async def _abort_multipart_upload(self, session: UploadSession) -> None:
+        try:
+            await self.storage_service.abort_multipart_upload(
+                self.storage_service.default_bucket,
+                session.object_key,
+                session.upload_id,
+            )
+        except ClientError as e:
+            logger.exception(f"Failed to abort upload session {session.id}")
+            raise HTTPException(
+                status_code=500, detail="Upload session abort failed"
+            ) from e
+
+
+def get_upload_session_crud() -> UploadSessionCRUD:
+    """Returns an instance of UploadSessionCRUD."""
+    return UploadSessionCRUD()
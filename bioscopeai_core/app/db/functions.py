@@ -0,0 +1,33 @@
+"""Database functions that Tortoise ORM does not ship."""
+
+from typing import Any
+
+from pypika_tortoise import SqlContext
+from pypika_tortoise.enums import Dialects
+from pypika_tortoise.terms import Function as PypikaFunction
+from tortoise.functions import Function
+
+
+# SQLite has no timestamp type, so its hour buckets come back as strings like this.
+HOUR_FORMAT = "%Y-%m-%dT%H:00:00Z"
+
+
+class _TruncHour(PypikaFunction):
+    def __init__(self, term: Any, alias: str | None = None) -> None:
+        super().__init__("DATE_TRUNC", term, alias=alias)
+
+    def get_function_sql(self, ctx: SqlContext) -> str:
+        field_sql = self.get_arg_sql(self.args[0], ctx)
+        if ctx.dialect == Dialects.SQLITE:
+            return f"STRFTIME('{HOUR_FORMAT}', {field_sql})"
+        return f"DATE_TRUNC('hour', {field_sql})"
+
+
+class TruncHour(Function):
+    """Truncate a datetime field to the start of its hour.
+
+    Renders ``DATE_TRUNC('hour', ...)`` on PostgreSQL, which returns a datetime,
+    and ``STRFTIME`` on SQLite, which returns a string in ``HOUR_FORMAT``.
+    """
+
+    database_func = _TruncHour
@@ -0,0 +1,74 @@
+"""Queries that Tortoise ORM cannot build."""
+
+from collections.abc import Sequence
+from typing import Any
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.models import Model
+
+
+async def insert_ignore_conflicts[T: Model](objs: list[T], returning: str) -> list[Any]:
+    """Insert ``objs`` with ``ON CONFLICT DO NOTHING`` in a single statement.
+
+    Returns the ``returning`` field of the rows that were actually inserted,
+    so rows skipped because a concurrent writer inserted them first can be
+    told apart, which ``bulk_create(ignore_conflicts=True)`` cannot do.
+    Supported on PostgreSQL and SQLite 3.35+.
+    """
+    if not objs:
+        return []
+    meta = type(objs[0])._meta
+    db, insert, values = _insert(objs)
+    returning_column = meta.fields_db_projection[returning]
+    _, inserted = await db.execute_query(
+        f'{insert} ON CONFLICT DO NOTHING RETURNING "{returning_column}"', values
+    )
+    return [row[returning_column] for row in inserted]
+
+
+async def upsert_increments[T: Model](
+    objs: list[T], conflict: Sequence[str], increments: Sequence[str]
+) -> None:
+    """Insert ``objs``, adding their ``increments`` fields to conflicting rows.
+
+    ``conflict`` names the fields of a unique constraint. A row that already
+    exists for them has the ``increments`` of the new row added to its own in
+    the same statement, so concurrent writers neither race to create the row
+    nor lose updates. ``objs`` must not conflict with each other.
+    Supported on PostgreSQL and SQLite 3.24+.
+    """
+    if not objs:
+        return
+    meta = type(objs[0])._meta
+    db, insert, values = _insert(objs)
+    conflict_columns = ", ".join(
+        f'"{meta.fields_db_projection[name]}"' for name in conflict
+    )
+    assignments = ", ".join(
+        f'"{column}" = "{meta.db_table}"."{column}" + EXCLUDED."{column}"'
+        for column in (meta.fields_db_projection[name] for name in increments)
+    )
+    await db.execute_query(
+        f"{insert} ON CONFLICT ({conflict_columns}) DO UPDATE SET {assignments}", values
+    )
+
+
+def _insert[T: Model](objs: list[T]) -> tuple[BaseDBAsyncClient, str, list[Any]]:
+    """Connection, ``INSERT ... VALUES`` statement and parameters for ``objs``."""
+    meta = type(objs[0])._meta
+    db = meta.db
+    names = [
+        name for name in meta.fields_db_projection if not meta.fields_map[name].generated
+    ]
+    columns = ", ".join(f'"{meta.fields_db_projection[name]}"' for name in names)
+
+    sqlite = db.capabilities.dialect == "sqlite"
+    values: list[Any] = []
+    rows: list[str] = []
+    for obj in objs:
+        placeholders = []
+        for name in names:
+            values.append(meta.fields_map[name].to_db_value(getattr(obj, name), obj))
+            placeholders.append("?" if sqlite else f"${len(values)}")
+        rows.append(f"({', '.join(placeholders)})")
+    return db, f'INSERT INTO "{meta.db_table}" ({columns}) VALUES {", ".join(rows)}', values
@@ -0,0 +1,60 @@
+from typing import Any
+
+from aiokafka.helpers import create_ssl_context
+
+from bioscopeai_core.app.core.config import KafkaSettings
+
+
+def security_kwargs(kafka_settings: KafkaSettings) -> dict[str, Any]:
+    """Connection security arguments for aiokafka clients.
+
+    Picks the security protocol from ``SSL_ENABLED`` and ``SASL_ENABLED``. An
+    SSL context is built from the configured CA and client certificate; without
+    a CA file the system CAs are trusted.
+    """
+    if not kafka_settings.SSL_ENABLED and not kafka_settings.SASL_ENABLED:
+        return {"security_protocol": "PLAINTEXT"}
+
+    kwargs: dict[str, Any] = {}
+    if kafka_settings.SSL_ENABLED:
+        kwargs["ssl_context"] = create_ssl_context(
+            cafile=kafka_settings.SSL_CAFILE or None,
+            certfile=kafka_settings.SSL_CERTFILE or None,
+            keyfile=kafka_settings.SSL_KEYFILE or None,
+        )
+    if kafka_settings.SASL_ENABLED:
+        password = kafka_settings.SASL_PASSWORD
+        kwargs.update(
+            security_protocol="SASL_SSL" if kafka_settings.SSL_ENABLED else "SASL_PLAINTEXT",
+            sasl_mechanism=kafka_settings.SASL_MECHANISM,
+            sasl_plain_username=kafka_settings.SASL_USERNAME,
+            sasl_plain_password=password.get_secret_value() if password else None,
+        )
+    else:
+        kwargs["security_protocol"] = "SSL"
+    return kwargs
+
+
+def consumer_kwargs(kafka_settings: KafkaSettings) -> dict[str, Any]:
+    """Connection, security and fetch tuning arguments for ``AIOKafkaConsumer``."""
+    return {
+        "bootstrap_servers": kafka_settings.BOOTSTRAP_SERVERS,
+        "fetch_max_bytes": kafka_settings.CONSUMER_FETCH_MAX_BYTES,
+        "fetch_min_bytes": kafka_settings.CONSUMER_FETCH_MIN_BYTES,
+        "fetch_max_wait_ms": kafka_settings.CONSUMER_FETCH_MAX_WAIT_MS,
+        "max_partition_fetch_bytes": kafka_settings.CONSUMER_MAX_PARTITION_FETCH_BYTES,
+        "max_poll_records": kafka_settings.CONSUMER_MAX_POLL_RECORDS,
+        **security_kwargs(kafka_settings),
+    }
+
+
+def producer_kwargs(kafka_settings: KafkaSettings) -> dict[str, Any]:
+    """Connection, security and batching arguments for ``AIOKafkaProducer``."""
+    return {
+        "bootstrap_servers": kafka_settings.BOOTSTRAP_SERVERS,
+        "acks": kafka_settings.PRODUCER_ACKS,
+        "linger_ms": kafka_settings.PRODUCER_LINGER_MS,
+        "max_batch_size": kafka_settings.PRODUCER_MAX_BATCH_SIZE,
+        "compression_type": kafka_settings.PRODUCER_COMPRESSION_TYPE,
+        **security_kwargs(kafka_settings),
+    }
@@ -1,13 +1,51 @@
 import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Iterator
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
 from typing import cast, Self
 
-from aiokafka import AIOKafkaConsumer
+from aiokafka import (
+    AIOKafkaConsumer,
+    ConsumerRebalanceListener,
+    ConsumerRecord,
+    TopicPartition,
+)
 from aiokafka.errors import KafkaConnectionError
 from loguru import logger
 
 from bioscopeai_core.app.core.config import KafkaSettings, settings
+from bioscopeai_core.app.kafka.connection import consumer_kwargs
+
+from .offset_tracker import OffsetTracker
+from .partition_worker import PartitionWorker
+
+
+# Records whose processing is in progress in the current task, acknowledged by
+# commit_message(). Partition workers each run in their own task and context.
+_current_records: ContextVar[list[ConsumerRecord]] = ContextVar("current_records")
+
+
+@contextmanager
+def _processing(records: list[ConsumerRecord]) -> Iterator[None]:
+    token = _current_records.set(records)
+    try:
+        yield
+    finally:
+        _current_records.reset(token)
+
+
+class _PartitionRevocationListener(ConsumerRebalanceListener):
+    """Commits finished work of revoked partitions before they are handed over."""
+
+    def __init__(self, consumer: "BaseKafkaConsumer") -> None:
+        self._consumer = consumer
+
+    async def on_partitions_revoked(self, revoked: list[TopicPartition]) -> None:
+        await self._consumer._release_partitions(revoked)
+
+    async def on_partitions_assigned(self, assigned: list[TopicPartition]) -> None:
+        logger.info(f"Assigned partitions: {sorted(tp.partition for tp in assigned)}")
 
 
 class BaseKafkaConsumer(ABC):
@@ -35,12 +73,43 @@ class BaseKafkaConsumer(ABC):
         self.enable_auto_commit: bool = False
         self._max_retries: int = 5
         self._retry_delay: float = 2.0
+        self.batch_mode: bool = self.kafka_settings.CONSUMER_BATCH_ENABLED
+        self.batch_max_records: int = self.kafka_settings.CONSUMER_BATCH_MAX_RECORDS
+        self.batch_max_wait_ms: int = self.kafka_settings.CONSUMER_BATCH_MAX_WAIT_MS
+        self.partition_workers: bool = self.kafka_settings.CONSUMER_PARTITION_WORKERS_ENABLED
+        self.max_in_flight_per_partition: int = (
+            self.kafka_settings.CONSUMER_MAX_IN_FLIGHT_PER_PARTITION
+        )
+        self._workers: dict[TopicPartition, PartitionWorker] = {}
+        self.commit_every_messages: int = self.kafka_settings.CONSUMER_COMMIT_EVERY_MESSAGES
+        self.commit_interval_ms: int = self.kafka_settings.CONSUMER_COMMIT_INTERVAL_MS
+        self._offsets: OffsetTracker = OffsetTracker()
+        self._commit_lock: asyncio.Lock = asyncio.Lock()
+        self._commit_task: asyncio.Task[None] | None = None
 
     # Abstract methods
     @abstractmethod
     async def process_message(self, message: str) -> None:
         """Process a single message (implement business logic here)."""
 
+    async def process_batch(self, messages: list[str]) -> None:
+        """Process a batch of messages in batch mode.
+
+        Processes the messages one by one by default; override to handle the
+        batch as a whole.
+        """
+        await self.process_one_by_one(messages)
+
+    async def process_one_by_one(self, messages: list[str]) -> None:
+        """Process the messages of the current batch with ``process_message``.
+
+        Each message is acknowledged on its own by its ``commit_message`` call.
+        """
+        records = _current_records.get([])
+        for index, message in enumerate(messages):
+            with _processing(records[index : index + 1]):
+                await self.process_message(message)
+
     @abstractmethod
     def _get_topic_name(self) -> str:
         """Get the Kafka topic name to subscribe to."""
@@ -82,6 +151,7 @@ class BaseKafkaConsumer(ABC):
 
         await self._initialize()
         self._consumer_task = asyncio.create_task(self._consume_loop())
+        self._commit_task = asyncio.create_task(self._commit_periodically())
         logger.info(f"{self.__class__.__name__} started consuming")
 
     async def stop_consuming(self) -> None:
@@ -99,11 +169,23 @@ class BaseKafkaConsumer(ABC):
         await self._shutdown()
         logger.info(f"{self.__class__.__name__} stopped")
 
+    async def wait_stopped(self) -> None:
+        """Wait until the consume loop ends, re-raising the error it failed with."""
+        if self._consumer_task is not None:
+            # Shielded, so that a cancelled waiter leaves the loop running
+            await asyncio.shield(self._consumer_task)
+
     async def _consume_loop(self) -> None:
         """Internal loop for consuming messages."""
         try:
-            async for message in self._consume_messages():
-                await self.process_message(message)
+            if self.partition_workers:
+                await self._consume_partitions()
+            elif self.batch_mode:
+                async for records in self._consume_batches():
+                    await self._process_records(records)
+            else:
+                async for record in self._consume_messages():
+                    await self._process_records([record])
         except asyncio.CancelledError:
             logger.info("Consumer loop cancelled")
             raise
@@ -111,8 +193,8 @@ class BaseKafkaConsumer(ABC):
             logger.exception("Error in consumer loop")
             raise
 
-    async def _consume_messages(self) -> AsyncGenerator[str]:
-        """Internal loop for consuming messages."""
+    async def _consume_messages(self) -> AsyncGenerator[ConsumerRecord]:
+        """Internal loop for consuming messages one at a time."""
         if not self._consumer:
             logger.error("Consumer not initialized")
             return
@@ -120,29 +202,131 @@ class BaseKafkaConsumer(ABC):
             async for _msg in self._consumer:
                 if self.should_stop_processing:
                     break
-                try:
-                    message_content = _msg.value.decode("utf-8").strip()
-                    if message_content:
-                        logger.debug(
-                            f"Consumed message from topic {_msg.topic},"
-                            f" partition {_msg.partition},"
-                            f" offset {_msg.offset}: {message_content}"
-                        )
-                    yield message_content
-                except UnicodeDecodeError:
-                    logger.exception("Failed to decode message")
-                    continue
-                except Exception:  # noqa: BLE001
-                    logger.exception("Error processing raw message")
-                    continue
+                self._offsets.track([_msg])
+                yield _msg
+        except Exception:
+            logger.exception("Error while consuming messages")
+            raise
+
+    async def _consume_batches(self) -> AsyncGenerator[list[ConsumerRecord]]:
+        """Internal loop for consuming messages in batches with getmany()."""
+        if not self._consumer:
+            logger.error("Consumer not initialized")
+            return
+        try:
+            while not self.should_stop_processing:
+                records = await self._consumer.getmany(
+                    timeout_ms=self.batch_max_wait_ms,
+                    max_records=self.batch_max_records,
+                )
+                batch = [
+                    record
+                    for partition_records in records.values()
+                    for record in partition_records
+                ]
+                if batch:
+                    logger.debug(f"Consumed batch of {len(batch)} messages")
+                    self._offsets.track(batch)
+                    yield batch
         except Exception:
             logger.exception("Error while consuming messages")
             raise
 
+    async def _consume_partitions(self) -> None:
+        """Poll records and dispatch them to one worker per partition.
+
+        A partition whose worker has ``max_in_flight_per_partition`` records
+        queued is paused until the worker catches up, so a slow partition
+        neither blocks the others nor buffers without bound.
+        """
+        if not self._consumer:
+            logger.error("Consumer not initialized")
+            return
+        while not self.should_stop_processing:
+            for worker in self._workers.values():
+                if worker.error is not None:
+                    raise worker.error
+            records = await self._consumer.getmany(
+                timeout_ms=self.batch_max_wait_ms,
+                max_records=self.batch_max_records,
+            )
+            for tp, partition_records in records.items():
+                self._offsets.track(partition_records)
+                worker = self._workers.get(tp)
+                if worker is None:
+                    worker = PartitionWorker(
+                        tp, self._process_records, self._on_worker_progress
+                    )
+                    self._workers[tp] = worker
+                worker.submit(partition_records)
+                if worker.in_flight >= self.max_in_flight_per_partition:
+                    self._consumer.pause(tp)
+
+    async def _process_records(self, records: list[ConsumerRecord]) -> None:
+        decoded, messages = self._decode_records(records)
+        if not messages:
+            return
+        with _processing(decoded):
+            if self.batch_mode:
+                await self.process_batch(messages)
+            else:
+                await self.process_one_by_one(messages)
+
+    def _on_worker_progress(self, worker: PartitionWorker) -> None:
+        if (
+            self._consumer is not None
+            and worker.in_flight < self.max_in_flight_per_partition
+            and worker.tp in self._consumer.paused()
+        ):
+            self._consumer.resume(worker.tp)
+
+    async def _release_partitions(self, partitions: list[TopicPartition]) -> None:
+        """Finish in-flight work of partitions, commit it and forget them."""
+        workers = [self._workers[tp] for tp in partitions if tp in self._workers]
+        timeout = self.kafka_settings.CONSUMER_DRAIN_TIMEOUT
+        await asyncio.gather(*(worker.drain(timeout) for worker in workers))
+        try:
+            await self._commit_offsets(partitions)
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to commit offsets of released partitions")
+        for worker in workers:
+            await worker.stop()
+            del self._workers[worker.tp]
+        self._offsets.forget(partitions)
+
+    def _decode_records(
+        self, records: list[ConsumerRecord]
+    ) -> tuple[list[ConsumerRecord], list[str]]:
+        """Decode records, acknowledging the ones that cannot be decoded.
+
+        Returns the decoded records and their messages.
+        """
+        decoded: list[ConsumerRecord] = []
+        messages: list[str] = []
+        for _msg in records:
+            try:
+                messages.append(_msg.value.decode("utf-8").strip())
+            except UnicodeDecodeError:
+                logger.exception(
+                    f"Failed to decode message from topic {_msg.topic},"
+                    f" partition {_msg.partition}, offset {_msg.offset}"
+                )
+                self._offsets.ack([_msg])
+            else:
+                decoded.append(_msg)
+        return decoded, messages
+
     async def _shutdown(self) -> None:
         """Shutdown connection if necessary"""
         self._stop_event.set()
+        if self._commit_task is not None:
+            self._commit_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._commit_task
+            self._commit_task = None
         if self._consumer:
+            # Commits whatever was processed, draining partition workers first
+            await self._release_partitions(list(self._consumer.assignment()))
             try:
                 await asyncio.wait_for(self._consumer.stop(), timeout=5.0)
                 logger.info("Consumer stopped successfully")
@@ -154,22 +338,51 @@ class BaseKafkaConsumer(ABC):
                 self._consumer = None
 
     async def commit_message(self) -> None:
-        """Commit the current message offset."""
-        if self._consumer:
+        """Acknowledge the messages being processed and commit per the commit policy.
+
+        Offsets are committed up to the highest contiguous acknowledged record of
+        each partition, once ``commit_every_messages`` messages were acknowledged
+        since the last commit and otherwise every ``commit_interval_ms``.
+        """
+        self._offsets.ack(_current_records.get([]))
+        if self._offsets.acked_since_commit >= self.commit_every_messages:
+            await self._commit_offsets()
+
+    async def _commit_offsets(self, partitions: list[TopicPartition] | None = None) -> None:
+        if self._consumer is None:
+            return
+        async with self._commit_lock:
+            offsets = self._offsets.uncommitted(partitions)
+            if not offsets:
+                return
             try:
-                await self._consumer.commit()
+                await self._consumer.commit(offsets)
             except Exception:
                 logger.exception("Failed to commit offset")
                 raise
+            self._offsets.mark_committed(offsets)
+
+    async def _commit_periodically(self) -> None:
+        while not self.should_stop_processing:
+            await asyncio.sleep(self.commit_interval_ms / 1000)
+            try:
+                await self._commit_offsets()
+            except Exception:  # noqa: BLE001
+                logger.warning("Periodic offset commit failed, retrying next interval")
 
     def _create_base_consumer(self) -> AIOKafkaConsumer:
-        return AIOKafkaConsumer(
-            self._get_topic_name(),
-            bootstrap_servers=self.kafka_settings.BOOTSTRAP_SERVERS,
+        consumer = AIOKafkaConsumer(
+            **consumer_kwargs(self.kafka_settings),
             group_id=self._get_group_id(),
             enable_auto_commit=self.enable_auto_commit,
             auto_commit_interval_ms=self.auto_commit_interval_ms,
         )
+        # The listener commits finished work of revoked partitions before they
+        # are handed over, draining partition workers first
+        consumer.subscribe(
+            [self._get_topic_name()], listener=_PartitionRevocationListener(self)
+        )
+        return consumer
 
     @property
     def is_kafka_ready(self) -> bool:
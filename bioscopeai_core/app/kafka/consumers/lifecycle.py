@@ -0,0 +1,35 @@
+import asyncio
+
+from .base_consumer import BaseKafkaConsumer
+from .result_consumer import get_classification_result_consumer
+from .retry_consumer import get_classification_result_retry_consumer
+
+
+def _result_consumers() -> list[BaseKafkaConsumer]:
+    return [
+        get_classification_result_consumer(),
+        get_classification_result_retry_consumer(),
+    ]
+
+
+async def start_result_consumers() -> None:
+    """Start consuming the classification results and their retries."""
+    for consumer in _result_consumers():
+        await consumer.start_consuming()
+
+
+async def wait_result_consumers() -> None:
+    """Wait until the first result consumer stops, re-raising its error."""
+    tasks = [asyncio.ensure_future(c.wait_stopped()) for c in _result_consumers()]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+    done.pop().result()
+
+
+async def stop_result_consumers() -> None:
+    """Stop the result consumers, committing the work they finished."""
+    for consumer in _result_consumers():
+        await consumer.stop_consuming()
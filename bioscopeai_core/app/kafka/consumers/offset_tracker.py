@@ -0,0 +1,65 @@
+from collections import deque
+
+from aiokafka import ConsumerRecord, TopicPartition
+
+
+class OffsetTracker:
+    """Track the highest contiguous processed offset of every partition.
+
+    Records are registered with ``track`` when fetched and acknowledged with
+    ``ack`` once processed, in any order. A partition's committable offset only
+    advances over acknowledged records, so a record that was fetched but never
+    acknowledged holds back the commits of its partition and is redelivered
+    after a restart or rebalance.
+    """
+
+    def __init__(self) -> None:
+        self._fetched: dict[TopicPartition, deque[int]] = {}
+        self._acked: dict[TopicPartition, set[int]] = {}
+        self._committable: dict[TopicPartition, int] = {}
+        self._committed: dict[TopicPartition, int] = {}
+        self.acked_since_commit: int = 0
+
+    def track(self, records: list[ConsumerRecord]) -> None:
+        """Register fetched records, in partition order."""
+        for record in records:
+            tp = TopicPartition(record.topic, record.partition)
+            self._fetched.setdefault(tp, deque()).append(record.offset)
+
+    def ack(self, records: list[ConsumerRecord]) -> None:
+        """Mark records as processed; records of untracked partitions are ignored."""
+        advanced: set[TopicPartition] = set()
+        for record in records:
+            tp = TopicPartition(record.topic, record.partition)
+            if tp not in self._fetched:
+                continue
+            self._acked.setdefault(tp, set()).add(record.offset)
+            self.acked_since_commit += 1
+            advanced.add(tp)
+        for tp in advanced:
+            fetched, acked = self._fetched[tp], self._acked[tp]
+            while fetched and fetched[0] in acked:
+                offset = fetched.popleft()
+                acked.discard(offset)
+                self._committable[tp] = offset + 1
+
+    def uncommitted(
+        self, partitions: list[TopicPartition] | None = None
+    ) -> dict[TopicPartition, int]:
+        """Committable offsets not committed yet, optionally only of ``partitions``."""
+        return {
+            tp: offset
+            for tp, offset in self._committable.items()
+            if self._committed.get(tp) != offset
+            and (partitions is None or tp in partitions)
+        }
+
+    def mark_committed(self, offsets: dict[TopicPartition, int]) -> None:
+        self._committed.update(offsets)
+        self.acked_since_commit = 0
+
+    def forget(self, partitions: list[TopicPartition]) -> None:
+        """Drop the state of partitions that are no longer assigned."""
+        for tp in partitions:
+            for state in (self._fetched, self._acked, self._committable, self._committed):
+                state.pop(tp, None)
@@ -0,0 +1,71 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from aiokafka import ConsumerRecord, TopicPartition
+from loguru import logger
+
+
+class PartitionWorker:
+    """Process the records of one partition in order on a dedicated task.
+
+    Records are handed over with ``submit`` and processed batch by batch, so
+    ordering within the partition is kept while other partitions progress
+    independently. Offsets are acknowledged by the handler.
+    """
+
+    def __init__(
+        self,
+        tp: TopicPartition,
+        handler: Callable[[list[ConsumerRecord]], Awaitable[None]],
+        on_progress: Callable[["PartitionWorker"], None],
+    ) -> None:
+        self.tp = tp
+        self.in_flight: int = 0  # records submitted but not processed yet
+        self._handler = handler
+        self._on_progress = on_progress
+        self._queue: asyncio.Queue[list[ConsumerRecord]] = asyncio.Queue()
+        self._task = asyncio.create_task(
+            self._run(), name=f"kafka-{tp.topic}-{tp.partition}"
+        )
+
+    def submit(self, records: list[ConsumerRecord]) -> None:
+        """Queue records of this partition for processing."""
+        self.in_flight += len(records)
+        self._queue.put_nowait(records)
+
+    @property
+    def error(self) -> BaseException | None:
+        """Exception that stopped the worker, if any."""
+        if self._task.done() and not self._task.cancelled():
+            return self._task.exception()
+        return None
+
+    async def drain(self, timeout: float) -> None:
+        """Wait until every submitted record has been processed."""
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except TimeoutError:
+            logger.warning(
+                f"Partition {self.tp.topic}-{self.tp.partition} not drained within"
+                f" {timeout}s, {self.in_flight} records left unprocessed"
+            )
+
+    async def stop(self) -> None:
+        """Cancel the worker task, dropping records that were not processed."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        except Exception:  # noqa: BLE001
+            logger.debug(f"Worker for {self.tp.topic}-{self.tp.partition} had failed")
+
+    async def _run(self) -> None:
+        while True:
+            records = await self._queue.get()
+            try:
+                await self._handler(records)
+            finally:
+                self._queue.task_done()
+            self.in_flight -= len(records)
+            self._on_progress(self)
@@ -1,5 +1,11 @@
+import asyncio
+
 from loguru import logger
 
+from bioscopeai_core.app.kafka.producers.failed_message_producer import (
+    FailedMessageProducer,
+    get_failed_message_producer,
+)
 from bioscopeai_core.app.services.classification_result import (
     ClassificationResultService,
     get_classification_result_service,
@@ -16,17 +22,81 @@ class ClassificationResultConsumer(BaseKafkaConsumer):
         self.classification_result_service: ClassificationResultService = (
             get_classification_result_service()
         )
+        self.failed_message_producer: FailedMessageProducer = (
+            get_failed_message_producer()
+        )
 
     async def process_message(self, message: str) -> None:
-        """Process a single classification result message."""
+        """Process a single classification result message.
+
+        A message that fails is handed to the retry topic, or dead-lettered if it
+        is invalid, and committed so that it never holds up the partition.
+        """
         try:
             await self.classification_result_service.process_classification_result(
                 classification_result_event=message
             )
-        except Exception:  # noqa: BLE001
+        except Exception as e:  # noqa: BLE001
             logger.exception("Failed to process classification result message")
-        else:
-            await self.commit_message()
+            await self.handle_failure(message, e, self._get_topic_name())
+        await self.commit_message()
+
+    async def process_batch(self, messages: list[str]) -> None:
+        """Store a batch of classification results and commit offsets once.
+
+        If the batch cannot be stored as a whole, e.g. because one result refers
+        to a missing image, the messages are retried one by one so that only the
+        offending ones are handed to the retry topic. Invalid messages are
+        dead-lettered.
+        """
+        rejected: list[tuple[str, ValueError]] = []
+        try:
+            await self.classification_result_service.process_classification_results(
+                classification_result_events=messages, rejected=rejected
+            )
+        except Exception:  # noqa: BLE001
+            logger.warning(
+                f"Batch of {len(messages)} results failed, processing one by one"
+            )
+            await self.process_one_by_one(messages)
+            return
+        for message, error in rejected:
+            await self.handle_failure(message, error, self._get_topic_name())
+        await self.commit_message()
+
+    async def handle_failure(
+        self, message: str, error: Exception, topic: str, attempt: int = 1
+    ) -> None:
+        """Send a message from ``topic`` that failed ``attempt`` times onwards.
+
+        Invalid messages are dead-lettered right away, others retried with
+        backoff. Handing the message over is itself retried with backoff; if
+        that keeps failing the error is raised, failing the consume loop so that
+        the uncommitted partition is fetched again once the consumer restarts.
+        """
+        for handover in range(1, self._max_retries + 1):
+            try:
+                if isinstance(error, ValueError):
+                    await self.failed_message_producer.dead_letter(
+                        message, topic, attempt, error
+                    )
+                else:
+                    await self.failed_message_producer.schedule_retry(
+                        message, topic, attempt, error
+                    )
+            except Exception:
+                if handover == self._max_retries:
+                    logger.exception(
+                        "Failed to hand over a failed classification result"
+                    )
+                    raise
+                logger.warning(
+                    f"Attempt {handover}/{self._max_retries} to hand over"
+                    " a failed classification result failed"
+                )
+                await asyncio.sleep(self._retry_delay * 2 ** (handover - 1))
+            else:
+                return
 
     def _get_topic_name(self) -> str:
         return self.kafka_settings.CLASSIFICATION_RESULTS_TOPIC
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from contextlib import suppress
+
+from aiokafka import ConsumerRecord
+from loguru import logger
+
+from bioscopeai_core.app.kafka.producers.failed_message_producer import (
+    ATTEMPT_HEADER,
+    header_value,
+    NOT_BEFORE_HEADER,
+    ORIGINAL_TOPIC_HEADER,
+)
+
+from .base_consumer import _processing
+from .result_consumer import ClassificationResultConsumer
+
+
+class ClassificationResultRetryConsumer(ClassificationResultConsumer):
+    """Kafka consumer retrying classification results that failed processing.
+
+    Runs in its own consumer group on the retry topic, so waiting for a message's
+    backoff never holds up the main topic. Messages are retried one at a time;
+    a failed retry is scheduled again or dead-lettered by the failed message
+    producer.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.batch_mode = False
+        self.partition_workers = False
+
+    async def process_record(self, record: ConsumerRecord) -> None:
+        """Retry one message from the retry topic and acknowledge it."""
+        message = record.value.decode("utf-8", errors="replace").strip()
+        attempt = int(header_value(record, ATTEMPT_HEADER) or 0)
+        topic = (
+            header_value(record, ORIGINAL_TOPIC_HEADER)
+            or self.kafka_settings.CLASSIFICATION_RESULTS_TOPIC
+        )
+        try:
+            await self.classification_result_service.process_classification_result(
+                classification_result_event=message
+            )
+        except Exception as e:  # noqa: BLE001
+            logger.exception(f"Retry {attempt} of a classification result failed")
+            await self.handle_failure(message, e, topic, attempt + 1)
+        await self.commit_message()
+
+    async def _process_records(self, records: list[ConsumerRecord]) -> None:
+        """Retry records once their backoff has passed."""
+        for record in records:
+            await self._wait_until_due(record)
+            if self.should_stop_processing:
+                return
+            with _processing([record]):
+                await self.process_record(record)
+
+    async def _wait_until_due(self, record: ConsumerRecord) -> None:
+        not_before = header_value(record, NOT_BEFORE_HEADER)
+        delay = int(not_before) / 1000 - time.time() if not_before else 0.0
+        if delay > 0:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+
+    def _get_topic_name(self) -> str:
+        return self.kafka_settings.CLASSIFICATION_RESULTS_RETRY_TOPIC
+
+    def _get_group_id(self) -> str:
+        return f"{self.kafka_settings.CLASSIFICATION_CONSUMER_GROUP}-retry"
+
+
+def get_classification_result_retry_consumer() -> ClassificationResultRetryConsumer:
+    """Get the singleton instance of ClassificationResultRetryConsumer."""
+    return ClassificationResultRetryConsumer.get_instance()
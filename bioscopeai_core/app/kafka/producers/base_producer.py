@@ -8,6 +8,7 @@ from aiokafka.errors import KafkaConnectionError
 from loguru import logger
 
 from bioscopeai_core.app.core.config import KafkaSettings, settings
+from bioscopeai_core.app.kafka.connection import producer_kwargs
 
 
 class BaseKafkaProducer(ABC):
@@ -61,7 +62,7 @@ class BaseKafkaProducer(ABC):
 
     def _create_base_producer(self) -> AIOKafkaProducer:
         return AIOKafkaProducer(
-            bootstrap_servers=self.kafka_settings.BOOTSTRAP_SERVERS,
+            **producer_kwargs(self.kafka_settings),
             value_serializer=lambda v: json.dumps(v).encode(),
         )
 
@@ -1,5 +1,7 @@
+import asyncio
 from typing import Any
 
+from aiokafka.structs import RecordMetadata
 from loguru import logger
 
 from .base_producer import BaseKafkaProducer
@@ -13,25 +15,65 @@ class ClassificationJobProducer(BaseKafkaProducer):
         self._topic_prefix: str = self.kafka_settings.CLASSIFICATION_JOBS_TOPIC
 
     async def send_event(self, device_id: str | None, message: dict[str, Any]) -> None:
-        """Send a classification job message to the specified Kafka topic."""
-        if self._producer:
-            if device_id:
-                self._topic = f"{self._topic_prefix}-{device_id}"
-            else:
-                self._topic = f"{self._topic_prefix}"
-            try:
-                await self._producer.send_and_wait(
-                    topic=self._topic,
-                    value=message,
-                )
-                logger.debug(f"Sent event to topic {self._topic}: {message}")
-            except Exception:
-                logger.exception("Failed to send event")
-                raise
-        else:
+        """Send a job message and wait for the broker to acknowledge it."""
+        future = await self.send(device_id, message)
+        try:
+            await future
+        except Exception:
+            logger.exception("Failed to send event")
+            raise
+
+    async def send(
+        self, device_id: str | None, message: dict[str, Any]
+    ) -> asyncio.Future[RecordMetadata]:
+        """Queue a classification job message for sending.
+
+        Returns once the message is in the producer's buffer, with a future that
+        resolves on broker acknowledgement. Queued messages are sent in batches,
+        so many sends cost a few round trips instead of one each.
+        """
+        if not self._producer:
             msg = "Producer is not initialized."
             logger.error(msg)
             raise RuntimeError(msg)
+        topic = self._topic_for(device_id)
+        try:
+            future = await self._producer.send(topic=topic, value=message)
+        except Exception:
+            logger.exception("Failed to send event")
+            raise
+        logger.debug(f"Queued event for topic {topic}: {message}")
+        return future
+
+    async def send_many(
+        self, messages: list[tuple[str | None, dict[str, Any]]]
+    ) -> list[RecordMetadata | BaseException]:
+        """Send ``(device_id, message)`` pairs and wait until every one is settled.
+
+        Returns the outcome of each message in order: its record metadata once
+        acknowledged, or the exception that failed it. When a message cannot
+        even be queued the broker is unreachable, so the remaining messages are
+        not attempted and fail with the same error.
+        """
+        futures: list[asyncio.Future[RecordMetadata]] = []
+        error: Exception | None = None
+        for device_id, message in messages:
+            try:
+                futures.append(await self.send(device_id, message))
+            except Exception as e:  # noqa: BLE001
+                error = e
+                break
+        outcomes: list[RecordMetadata | BaseException] = list(
+            await asyncio.gather(*futures, return_exceptions=True)
+        )
+        if error is not None:
+            outcomes.extend([error] * (len(messages) - len(futures)))
+        return outcomes
+
+    def _topic_for(self, device_id: str | None) -> str:
+        if device_id:
+            return f"{self._topic_prefix}-{device_id}"
+        return self._topic_prefix
 
 
 def get_classification_producer() -> ClassificationJobProducer:
@@ -0,0 +1,143 @@
+import json
+import time
+from typing import Any
+
+from aiokafka import AIOKafkaProducer, ConsumerRecord
+from loguru import logger
+
+from bioscopeai_core.app.kafka.connection import producer_kwargs
+
+from .base_producer import BaseKafkaProducer
+
+
+# Headers carried by messages on the retry and dead-letter topics
+ATTEMPT_HEADER = "x-attempt"  # processing attempts made so far
+NOT_BEFORE_HEADER = "x-not-before"  # epoch milliseconds before which not to retry
+ORIGINAL_TOPIC_HEADER = "x-original-topic"
+ERROR_HEADER = "x-error"
+MAX_ERROR_LENGTH = 1000
+
+
+def header_value(record: ConsumerRecord, name: str) -> str | None:
+    """Decoded value of header ``name`` of ``record``, or None if missing."""
+    for key, value in record.headers or ():
+        if key == name:
+            return value.decode("utf-8")
+    return None
+
+
+class FailedMessageProducer(BaseKafkaProducer):
+    """Kafka producer routing messages that failed processing.
+
+    Failed messages go to the retry topic with an exponential backoff until
+    ``CONSUMER_MAX_ATTEMPTS`` attempts were made, then to the dead-letter topic.
+    Values are sent as the raw bytes that were consumed.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._retry_topic: str = self.kafka_settings.CLASSIFICATION_RESULTS_RETRY_TOPIC
+        self._dead_letter_topic: str = self.kafka_settings.CLASSIFICATION_RESULTS_DLQ_TOPIC
+
+    async def send_event(self, device_id: str | None, message: dict[str, Any]) -> None:
+        """Send a JSON message straight to the dead-letter topic."""
+        await self._send(
+            self._dead_letter_topic,
+            json.dumps(message).encode(),
+            [(ATTEMPT_HEADER, b"0")],
+            key=device_id.encode() if device_id else None,
+        )
+
+    def retry_delay_ms(self, attempt: int) -> int:
+        """Backoff before retrying a message that failed ``attempt`` times."""
+        delay = self.kafka_settings.CONSUMER_RETRY_BACKOFF_MS * 2 ** (attempt - 1)
+        return int(min(delay, self.kafka_settings.CONSUMER_RETRY_BACKOFF_MAX_MS))
+
+    async def schedule_retry(
+        self, message: str, topic: str, attempt: int, error: BaseException
+    ) -> None:
+        """Route a message from ``topic`` whose ``attempt``-th processing failed.
+
+        The message is scheduled on the retry topic, or dead-lettered once it
+        has used up its attempts.
+        """
+        if attempt >= self.kafka_settings.CONSUMER_MAX_ATTEMPTS:
+            await self.dead_letter(message, topic, attempt, error)
+            return
+        not_before = int(time.time() * 1000) + self.retry_delay_ms(attempt)
+        await self._send(
+            self._retry_topic,
+            message.encode(),
+            [
+                *_failure_headers(topic, attempt, error),
+                (NOT_BEFORE_HEADER, str(not_before).encode()),
+            ],
+        )
+        logger.warning(f"Scheduled retry {attempt} of a message from {topic}: {error!r}")
+
+    async def dead_letter(
+        self, message: str, topic: str, attempt: int, error: BaseException
+    ) -> None:
+        """Send a message from ``topic`` to the dead-letter topic."""
+        await self._send(
+            self._dead_letter_topic,
+            message.encode(),
+            _failure_headers(topic, attempt, error),
+        )
+        logger.error(
+            f"Dead-lettered a message from {topic} after {attempt} attempts: {error!r}"
+        )
+
+    async def replay(self, record: ConsumerRecord) -> None:
+        """Re-publish a dead-lettered record to its original topic as a new message."""
+        topic = (
+            header_value(record, ORIGINAL_TOPIC_HEADER)
+            or self.kafka_settings.CLASSIFICATION_RESULTS_TOPIC
+        )
+        await self._send(topic, record.value, [], key=record.key)
+
+    async def dead_letter_partitions(self) -> set[int]:
+        """Partition ids of the dead-letter topic, waiting for its metadata."""
+        if not self._producer:
+            msg = "Producer is not initialized."
+            logger.error(msg)
+            raise RuntimeError(msg)
+        partitions: set[int] = await self._producer.partitions_for(self._dead_letter_topic)
+        return partitions
+
+    async def _send(
+        self,
+        topic: str,
+        value: bytes,
+        headers: list[tuple[str, bytes]],
+        key: bytes | None = None,
+    ) -> None:
+        if not self._producer:
+            msg = "Producer is not initialized."
+            logger.error(msg)
+            raise RuntimeError(msg)
+        try:
+            await self._producer.send_and_wait(
+                topic=topic, value=value, key=key, headers=headers
+            )
+        except Exception:
+            logger.exception(f"Failed to send message to topic {topic}")
+            raise
+
+    def _create_base_producer(self) -> AIOKafkaProducer:
+        return AIOKafkaProducer(**producer_kwargs(self.kafka_settings))
+
+
+def _failure_headers(
+    topic: str, attempt: int, error: BaseException
+) -> list[tuple[str, bytes]]:
+    return [
+        (ATTEMPT_HEADER, str(attempt).encode()),
+        (ORIGINAL_TOPIC_HEADER, topic.encode()),
+        (ERROR_HEADER, repr(error)[:MAX_ERROR_LENGTH].encode()),
+    ]
+
+
+def get_failed_message_producer() -> FailedMessageProducer:
+    """Get the singleton instance of FailedMessageProducer."""
+    return FailedMessageProducer.get_instance()
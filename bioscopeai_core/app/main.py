@@ -1,5 +1,6 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 import uvicorn
 from fastapi import FastAPI
@@ -9,13 +10,26 @@ from starlette.types import Lifespan
 
 from bioscopeai_core.app.api import api_router
 from bioscopeai_core.app.core import settings, setup_logger
-from bioscopeai_core.app.core.s3_client import ensure_bucket_exists
-from bioscopeai_core.app.kafka.consumers.result_consumer import (
-    get_classification_result_consumer,
+from bioscopeai_core.app.core.s3_client import (
+    ensure_bucket_exists,
+    shutdown_s3_executor,
+)
+from bioscopeai_core.app.kafka.consumers.lifecycle import (
+    start_result_consumers,
+    stop_result_consumers,
 )
 from bioscopeai_core.app.kafka.producers.classification_producer import (
     get_classification_producer,
 )
+from bioscopeai_core.app.kafka.producers.failed_message_producer import (
+    get_failed_message_producer,
+)
+from bioscopeai_core.app.services.derivative_service import (
+    shutdown_derivative_executor,
+)
+from bioscopeai_core.app.services.outbox_relay import run_outbox_relay
+from bioscopeai_core.app.services.upload_session_gc import run_upload_session_gc
+from bioscopeai_core.app.utils.pagination import NEXT_CURSOR_HEADER
 
 from .db import close_db, init_db
 
@@ -39,6 +53,7 @@ def create_app(lifespan: Lifespan) -> FastAPI:
             allow_credentials=True,
             allow_methods=["*"],
             allow_headers=["*"],
+            expose_headers=[NEXT_CURSOR_HEADER],
         )
     app.include_router(api_router, prefix="/api")
     return app
@@ -48,18 +63,31 @@ def create_app(lifespan: Lifespan) -> FastAPI:
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Lifespan context manager for startup and shutdown events."""
     classification_job_producer = get_classification_producer()
-    classification_result_consumer = get_classification_result_consumer()
+    failed_message_producer = get_failed_message_producer()
     setup_logger()
     await init_db()
     await classification_job_producer.initialize()
-    await classification_result_consumer.start_consuming()
-    ensure_bucket_exists()
+    await failed_message_producer.initialize()
+    # Otherwise results are consumed by bioscopeai_core.app.worker processes
+    if settings.app.RUN_CONSUMERS_IN_API:
+        await start_result_consumers()
+    await ensure_bucket_exists()
+    upload_session_gc = asyncio.create_task(run_upload_session_gc())
+    outbox_relay = asyncio.create_task(run_outbox_relay())
     logger.info("Application startup complete.")
     yield
     logger.info("Shutting down application...")
+    for task in (upload_session_gc, outbox_relay):
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
     await classification_job_producer.shutdown()
-    await classification_result_consumer.stop_consuming()
+    if settings.app.RUN_CONSUMERS_IN_API:
+        await stop_result_consumers()
+    await failed_message_producer.shutdown()
     await close_db()
+    shutdown_s3_executor()
+    shutdown_derivative_executor()
 
 
 app: FastAPI = create_app(lifespan=lifespan)
@@ -1,19 +1,29 @@
 from .auth import RefreshToken
-from .classification import Classification, ClassificationResult, ClassificationStatus
+from .classification import (
+    Classification,
+    ClassificationJobOutbox,
+    ClassificationResult,
+    ClassificationStatsHourly,
+    ClassificationStatus,
+)
 from .dataset import Dataset
 from .device import Device
-from .image import Image
+from .image import Image, UploadSession, UploadSessionStatus
 from .users import User, UserRole, UserStatus
 
 
 __all__ = [
     "Classification",
+    "ClassificationJobOutbox",
     "ClassificationResult",
+    "ClassificationStatsHourly",
     "ClassificationStatus",
     "Dataset",
     "Device",
     "Image",
     "RefreshToken",
+    "UploadSession",
+    "UploadSessionStatus",
     "User",
     "UserRole",
     "UserStatus",
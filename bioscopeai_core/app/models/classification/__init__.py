@@ -1,5 +1,13 @@
 from .classification import Classification, ClassificationStatus
+from .classification_outbox import ClassificationJobOutbox
 from .classification_result import ClassificationResult
+from .classification_stats import ClassificationStatsHourly
 
 
-__all__ = ["Classification", "ClassificationResult", "ClassificationStatus"]
+__all__ = [
+    "Classification",
+    "ClassificationJobOutbox",
+    "ClassificationResult",
+    "ClassificationStatsHourly",
+    "ClassificationStatus",
+]
@@ -25,3 +25,11 @@ class Classification(models.Model):
     created_by = fields.ForeignKeyField("models.User", related_name="classifications")
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
+
+    class Meta:
+        indexes = (
+            ("status", "created_at"),
+            ("dataset_id", "created_at"),
+            ("image_id", "created_at"),
+            ("created_by_id", "created_at"),
+        )
@@ -0,0 +1,23 @@
+from tortoise import fields, models
+
+
+class ClassificationJobOutbox(models.Model):
+    """Classification job message waiting to be published to Kafka.
+
+    Written in the same transaction as its classification and deleted by the
+    outbox relay once the broker acknowledged the message.
+    """
+
+    id = fields.UUIDField(pk=True)
+    classification = fields.ForeignKeyField(
+        "models.Classification", related_name="outbox_entries"
+    )
+    device_id = fields.CharField(max_length=36, null=True)  # selects the jobs topic
+    payload = fields.JSONField()
+    attempts = fields.IntField(default=0)  # failed publish attempts so far
+    next_attempt_at = fields.DatetimeField()
+    last_error = fields.TextField(null=True)
+    created_at = fields.DatetimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = (("next_attempt_at",),)
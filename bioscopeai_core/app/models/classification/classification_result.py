@@ -11,3 +11,12 @@ class ClassificationResult(models.Model):
     confidence = fields.FloatField()
     model_name = fields.CharField(max_length=100, null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
+    # Natural key of the result; replayed events collide on it and are skipped
+    idempotency_key = fields.CharField(max_length=64, null=True, unique=True)
+
+    class Meta:
+        indexes = (
+            ("classification_id", "created_at"),
+            ("image_id", "created_at"),
+            ("created_at",),
+        )
@@ -0,0 +1,23 @@
+from tortoise import fields, models
+
+
+class ClassificationStatsHourly(models.Model):
+    """Hourly rollup of classification results.
+
+    One row per hour and combination of label, model, device and dataset, kept up
+    to date as results arrive. Missing dimensions are stored as "" rather than NULL
+    so that the unique key also deduplicates them.
+    """
+
+    id = fields.UUIDField(pk=True)
+    bucket = fields.DatetimeField()  # start of the hour, UTC
+    label = fields.CharField(max_length=100)
+    model_name = fields.CharField(max_length=100, default="")
+    # Plain IDs rather than foreign keys, history outlives deleted devices/datasets
+    device_id = fields.CharField(max_length=36, default="")
+    dataset_id = fields.CharField(max_length=36, default="")
+    count = fields.IntField(default=0)
+    confidence_sum = fields.FloatField(default=0.0)
+
+    class Meta:
+        unique_together = (("bucket", "label", "model_name", "device_id", "dataset_id"),)
@@ -1,4 +1,5 @@
 from .image import Image
+from .upload_session import UploadSession, UploadSessionStatus
 
 
-__all__ = ["Image"]
+__all__ = ["Image", "UploadSession", "UploadSessionStatus"]
@@ -4,9 +4,22 @@ from tortoise import fields, models
 class Image(models.Model):
     id = fields.UUIDField(pk=True)
     filename = fields.CharField(max_length=255)
-    filepath = fields.CharField(max_length=512)
+    filepath = fields.CharField(max_length=512, unique=True)  # object key
     dataset = fields.ForeignKeyField("models.Dataset", related_name="images")
     uploaded_by = fields.ForeignKeyField("models.User", related_name="uploaded_images")
     device = fields.ForeignKeyField("models.Device", related_name="images", null=True)
     uploaded_at = fields.DatetimeField(auto_now_add=True)
     analyzed = fields.BooleanField(default=False)
+    content_hash = fields.CharField(max_length=64, null=True)  # hex SHA-256
+    # {name: {"key", "width", "height"}}, filled in once derivatives are rendered
+    derivatives = fields.JSONField(null=True)
+    # Deep-zoom pyramid descriptor, only set for images large enough to tile
+    tiles = fields.JSONField(null=True)
+
+    class Meta:
+        unique_together = (("dataset", "content_hash"),)
+        indexes = (
+            ("dataset_id", "uploaded_at"),
+            ("device_id", "uploaded_at"),
+            ("analyzed",),
+        )
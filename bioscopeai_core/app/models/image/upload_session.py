@@ -0,0 +1,33 @@
+from enum import StrEnum
+
+from tortoise import fields, models
+
+
+class UploadSessionStatus(StrEnum):
+    ACTIVE = "active"
+    # Claimed for completion or abort, the S3 side has not been settled yet
+    COMPLETING = "completing"
+    COMPLETED = "completed"
+    ABORTING = "aborting"
+    ABORTED = "aborted"
+
+
+class UploadSession(models.Model):
+    id = fields.UUIDField(pk=True)
+    dataset = fields.ForeignKeyField("models.Dataset", related_name="upload_sessions")
+    device = fields.ForeignKeyField(
+        "models.Device", related_name="upload_sessions", null=True
+    )
+    uploaded_by = fields.ForeignKeyField("models.User", related_name="upload_sessions")
+    filename = fields.CharField(max_length=255)
+    content_type = fields.CharField(max_length=100)
+    object_key = fields.CharField(max_length=512)
+    upload_id = fields.CharField(max_length=1024)  # S3 multipart upload ID
+    total_size = fields.BigIntField()
+    part_size = fields.IntField()
+    received_bytes = fields.BigIntField(default=0)
+    # [{"PartNumber", "ETag"}] of the parts stored so far, in order
+    parts = fields.JSONField(default=list)
+    status = fields.CharEnumField(UploadSessionStatus, default=UploadSessionStatus.ACTIVE)
+    created_at = fields.DatetimeField(auto_now_add=True)
+    updated_at = fields.DatetimeField(auto_now=True)
@@ -3,7 +3,12 @@ from .classification import (
     ClassificationMinimalOut,
     ClassificationOut,
 )
-from .classification_result import ClassificationResultCreate, ClassificationResultOut
+from .classification_result import (
+    ClassificationResultCreate,
+    ClassificationResultOut,
+    DeadLetterReplayOut,
+)
+from .classification_stats import ClassificationStatsBucketOut
 
 
 __all__ = [
@@ -12,4 +17,6 @@ __all__ = [
     "ClassificationOut",
     "ClassificationResultCreate",
     "ClassificationResultOut",
+    "ClassificationStatsBucketOut",
+    "DeadLetterReplayOut",
 ]
@@ -10,6 +10,7 @@ class ClassificationResultCreate(BaseModel):
     label: str
     confidence: float
     model_name: str | None = None
+    result_id: UUID | None = None
 
 
 class ClassificationResultOut(BaseModel):
@@ -20,3 +21,7 @@ class ClassificationResultOut(BaseModel):
     confidence: float
     model_name: str | None
     created_at: datetime
+
+
+class DeadLetterReplayOut(BaseModel):
+    replayed: int
@@ -0,0 +1,10 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ClassificationStatsBucketOut(BaseModel):
+    bucket: datetime
+    group: str | None = None  # value of the group_by dimension, if any
+    count: int
+    average_confidence: float
@@ -1,4 +1,37 @@
-from .image import ImageCreate, ImageMinimalOut, ImageOut, ImageUpdate
+from .image import (
+    ImageBatchUploadOut,
+    ImageCreate,
+    ImageFinalizeFileIn,
+    ImageFinalizeIn,
+    ImageMinimalOut,
+    ImageOut,
+    ImagePresignedUploadOut,
+    ImagePresignIn,
+    ImagePresignOut,
+    ImagePreviewOut,
+    ImagePreviewQueryIn,
+    ImageUpdate,
+    ImageUploadFileIn,
+    ImageUploadResultOut,
+)
+from .upload_session import UploadSessionCreate, UploadSessionOut
 
 
-__all__ = ["ImageCreate", "ImageMinimalOut", "ImageOut", "ImageUpdate"]
+__all__ = [
+    "ImageBatchUploadOut",
+    "ImageCreate",
+    "ImageFinalizeFileIn",
+    "ImageFinalizeIn",
+    "ImageMinimalOut",
+    "ImageOut",
+    "ImagePresignIn",
+    "ImagePresignOut",
+    "ImagePresignedUploadOut",
+    "ImagePreviewOut",
+    "ImagePreviewQueryIn",
+    "ImageUpdate",
+    "ImageUploadFileIn",
+    "ImageUploadResultOut",
+    "UploadSessionCreate",
+    "UploadSessionOut",
+]
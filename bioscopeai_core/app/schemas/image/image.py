@@ -1,7 +1,8 @@
 from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class ImageBase(BaseModel):
@@ -26,6 +27,80 @@ class ImageMinimalOut(BaseModel):
     analyzed: bool
 
 
+class ImageUploadResultOut(BaseModel):
+    filename: str | None
+    success: bool
+    duplicate: bool = False
+    image: ImageMinimalOut | None = None
+    error: str | None = None
+
+
+class ImageBatchUploadOut(BaseModel):
+    uploaded: int
+    failed: int
+    results: list[ImageUploadResultOut]
+
+
+class ImageUploadFileIn(BaseModel):
+    filename: str
+    content_type: str
+
+
+class ImagePresignIn(BaseModel):
+    dataset_id: UUID
+    files: list[ImageUploadFileIn] = Field(min_length=1)
+
+
+class ImagePresignedUploadOut(BaseModel):
+    filename: str
+    object_key: str
+    url: str
+    fields: dict[str, str]
+
+
+class ImagePresignOut(BaseModel):
+    expires_in: int
+    uploads: list[ImagePresignedUploadOut]
+
+
+class ImageFinalizeFileIn(BaseModel):
+    filename: str
+    object_key: str
+
+
+class ImageFinalizeIn(BaseModel):
+    dataset_id: UUID
+    device_id: UUID | None = None
+    files: list[ImageFinalizeFileIn] = Field(min_length=1)
+
+
+class ImagePreviewQueryIn(BaseModel):
+    """Select images either by ID or by the same filters as the image listing."""
+
+    image_ids: list[UUID] | None = Field(default=None, min_length=1, max_length=200)
+    dataset_id: UUID | None = None
+    device_id: UUID | None = None
+    uploaded_by: UUID | None = None
+    analyzed: bool | None = None
+    created_from: datetime | None = None
+    created_to: datetime | None = None
+    q: str | None = None
+    search_mode: Literal["contains", "prefix"] = "contains"
+    search_scope: Literal["filename", "all"] = "filename"
+    order_by: str = "-uploaded_at"
+    page: int = Field(default=1, ge=1)
+    page_size: int = Field(default=25, ge=1, le=200)
+    size: int | None = Field(default=None, ge=1)
+    expires_in: int = Field(default=3600, ge=60, le=604800)
+
+
+class ImagePreviewOut(BaseModel):
+    image_id: UUID
+    filename: str
+    url: str
+    expires_in: int
+
+
 class ImageOut(ImageBase):
     id: UUID
     dataset_id: UUID
@@ -33,6 +108,8 @@ class ImageOut(ImageBase):
     device_id: UUID | None = None
     filepath: str
     uploaded_at: datetime
+    content_hash: str | None = None
+    preview_url: str | None = None
 
     class Config:
         from_attributes = True
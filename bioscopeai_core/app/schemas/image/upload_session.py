@@ -0,0 +1,28 @@
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+from bioscopeai_core.app.models.image import UploadSessionStatus
+
+
+class UploadSessionCreate(BaseModel):
+    dataset_id: UUID
+    device_id: UUID | None = None
+    filename: str
+    content_type: str
+    total_size: int = Field(ge=1)
+
+
+class UploadSessionOut(BaseModel):
+    id: UUID
+    filename: str
+    total_size: int
+    part_size: int
+    received_bytes: int
+    status: UploadSessionStatus
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
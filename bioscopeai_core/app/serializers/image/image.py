@@ -1,10 +1,18 @@
+from uuid import UUID
+
+from bioscopeai_core.app.crud.image import ImageUploadOutcome
 from bioscopeai_core.app.models.image import Image
-from bioscopeai_core.app.schemas.image import ImageMinimalOut, ImageOut
+from bioscopeai_core.app.schemas.image import (
+    ImageBatchUploadOut,
+    ImageMinimalOut,
+    ImageOut,
+    ImageUploadResultOut,
+)
 
 
 class ImageSerializer:
     @staticmethod
-    def to_out(image: Image) -> ImageOut:
+    def to_out(image: Image, preview_url: str | None = None) -> ImageOut:
         return ImageOut(
             id=image.id,
             filename=image.filename,
@@ -14,10 +22,15 @@ class ImageSerializer:
             device_id=image.device_id,
             filepath=image.filepath,
             uploaded_at=image.uploaded_at,
+            content_hash=image.content_hash,
+            preview_url=preview_url,
         )
 
-    def to_out_list(self, images: list[Image]) -> list[ImageOut]:
-        return [self.to_out(img) for img in images]
+    def to_out_list(
+        self, images: list[Image], preview_urls: dict[UUID, str] | None = None
+    ) -> list[ImageOut]:
+        preview_urls = preview_urls or {}
+        return [self.to_out(img, preview_urls.get(img.id)) for img in images]
 
     @staticmethod
     def to_minimal(image: Image) -> ImageMinimalOut:
@@ -27,6 +40,28 @@ class ImageSerializer:
             analyzed=image.analyzed,
         )
 
+    def to_batch_upload_out(
+        self, outcomes: list[ImageUploadOutcome]
+    ) -> ImageBatchUploadOut:
+        results = [
+            ImageUploadResultOut(
+                filename=outcome.filename,
+                success=outcome.image is not None,
+                duplicate=outcome.duplicate,
+                image=(
+                    self.to_minimal(outcome.image) if outcome.image is not None else None
+                ),
+                error=outcome.error,
+            )
+            for outcome in outcomes
+        ]
+        uploaded = sum(result.success for result in results)
+        return ImageBatchUploadOut(
+            uploaded=uploaded,
+            failed=len(results) - uploaded,
+            results=results,
+        )
+
 
 def get_image_serializer() -> ImageSerializer:
     return ImageSerializer()
@@ -1,17 +1,22 @@
-from typing import TYPE_CHECKING
+from typing import cast, TYPE_CHECKING
 
 from loguru import logger
+from tortoise.transactions import in_transaction
 
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from bioscopeai_core.app.schemas.classification import ClassificationResultCreate
 
 
 from bioscopeai_core.app.crud.classification import (
     ClassificationCRUD,
     ClassificationResultCRUD,
+    ClassificationStatsCRUD,
     get_classification_crud,
     get_classification_result_crud,
+    get_classification_stats_crud,
 )
 from bioscopeai_core.app.crud.image import get_image_crud, ImageCRUD
 from bioscopeai_core.app.models.classification import ClassificationStatus
@@ -33,6 +38,9 @@ class ClassificationResultService:
             get_classification_result_serializer()
         )
         self.image_crud: ImageCRUD = get_image_crud()
+        self.classification_stats_crud: ClassificationStatsCRUD = (
+            get_classification_stats_crud()
+        )
 
     async def process_classification_result(
         self, classification_result_event: str
@@ -54,9 +62,17 @@ class ClassificationResultService:
                 f"Processing classification result: {classification_result.classification_id}"
             )
         try:
-            await self.classification_result_crud.create_result(
-                data=classification_result
-            )
+            async with in_transaction():
+                result = await self.classification_result_crud.create_result(
+                    data=classification_result
+                )
+                if result is not None:
+                    await self.classification_stats_crud.record_result(result)
+                else:
+                    logger.info(
+                        "Skipping already stored classification result: "
+                        f"{classification_result.classification_id}"
+                    )
             if classification_result.classification_id is not None:
                 await self.classification_crud.set_status(
                     classification_id=classification_result.classification_id,
@@ -76,6 +92,66 @@ class ClassificationResultService:
                 f"{classification_result.classification_id}"
             )
 
+    async def process_classification_results(
+        self,
+        classification_result_events: list[str],
+        rejected: list[tuple[str, ValueError]] | None = None,
+    ) -> int:
+        """Process a batch of classification result messages.
+
+        Results are bulk-inserted, their classifications marked completed and their
+        images flagged as analyzed in one transaction, a constant number of queries
+        per batch. Invalid events are logged and skipped, and appended with their
+        error to ``rejected`` when given. Results stored before (replays) are not
+        inserted or counted again. If the transaction fails nothing is written and
+        the error is raised, so the caller can fall back to processing the events
+        one by one.
+
+        Returns the number of newly stored results.
+        """
+        classification_results: list[ClassificationResultCreate] = []
+        for event in classification_result_events:
+            try:
+                classification_results.append(
+                    self.classification_result_serializer.create_from_event(
+                        classification_result_event=event
+                    )
+                )
+            except ValueError as e:
+                logger.exception(f"Invalid classification result event: {event}")
+                if rejected is not None:
+                    rejected.append((event, e))
+        if not classification_results:
+            return 0
+
+        completed = [
+            result for result in classification_results if result.classification_id
+        ]
+        try:
+            async with in_transaction():
+                results = await self.classification_result_crud.create_results(
+                    data=classification_results
+                )
+                await self.classification_stats_crud.record_results(results)
+                await self.classification_crud.set_status_many(
+                    classification_ids=list(
+                        {cast("UUID", result.classification_id) for result in completed}
+                    ),
+                    status=ClassificationStatus.COMPLETED,
+                )
+                await self.image_crud.mark_many_as_analyzed(
+                    image_ids=list({result.image_id for result in completed})
+                )
+        except Exception:
+            logger.exception(
+                f"Failed to process batch of {len(classification_results)} "
+                "classification results"
+            )
+            raise
+
+        logger.info(f"Stored batch of {len(results)} classification results")
+        return len(results)
+
 
 def get_classification_result_service() -> ClassificationResultService:
     return ClassificationResultService()
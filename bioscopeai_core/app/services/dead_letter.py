@@ -0,0 +1,104 @@
+import asyncio
+from functools import lru_cache
+
+from aiokafka import AIOKafkaConsumer, TopicPartition
+from loguru import logger
+
+from bioscopeai_core.app.core.config import KafkaSettings, settings
+from bioscopeai_core.app.kafka.connection import consumer_kwargs
+from bioscopeai_core.app.kafka.producers.failed_message_producer import (
+    FailedMessageProducer,
+    get_failed_message_producer,
+)
+
+
+MAX_REPLAY_LIMIT = 10000
+REPLAY_POLL_TIMEOUT_MS = 1000
+REPLAY_MAX_IDLE_POLLS = 10  # empty polls before giving up on reaching the end
+
+
+class DeadLetterService:
+    """Service for replaying dead-lettered classification results."""
+
+    def __init__(self) -> None:
+        self.kafka_settings: KafkaSettings = settings.kafka
+        self.failed_message_producer: FailedMessageProducer = (
+            get_failed_message_producer()
+        )
+
+    async def replay(self, limit: int) -> int:
+        """Re-publish up to ``limit`` dead-lettered messages to their original topic.
+
+        The dead-letter partitions are assigned directly and read until the end
+        offsets found at the start, so the replay does not wait for a group
+        rebalance and stops once it caught up. Each fetched batch is re-published
+        concurrently and its offsets are committed for a dedicated consumer group
+        afterwards, so a message is replayed once. Replayed messages start over
+        with a fresh attempt count. Returns the number of messages replayed.
+        """
+        topic = self.kafka_settings.CLASSIFICATION_RESULTS_DLQ_TOPIC
+        partitions = [
+            TopicPartition(topic, partition)
+            for partition in sorted(
+                await self.failed_message_producer.dead_letter_partitions()
+            )
+        ]
+        consumer = AIOKafkaConsumer(
+            **consumer_kwargs(self.kafka_settings),
+            group_id=f"{self.kafka_settings.CLASSIFICATION_CONSUMER_GROUP}-dlq-replay",
+            enable_auto_commit=False,
+            auto_offset_reset="earliest",
+        )
+        await consumer.start()
+        replayed = 0
+        idle_polls = 0
+        try:
+            consumer.assign(partitions)
+            end_offsets = await consumer.end_offsets(partitions)
+            while replayed < limit and not await _caught_up(consumer, end_offsets):
+                records = await consumer.getmany(
+                    timeout_ms=REPLAY_POLL_TIMEOUT_MS, max_records=limit - replayed
+                )
+                if not records:
+                    idle_polls += 1
+                    if idle_polls >= REPLAY_MAX_IDLE_POLLS:
+                        logger.warning(
+                            f"Stopped replaying {topic} after {idle_polls} empty polls "
+                            "before reaching its end offsets"
+                        )
+                        break
+                    continue
+                idle_polls = 0
+                await asyncio.gather(
+                    *(
+                        self.failed_message_producer.replay(record)
+                        for partition_records in records.values()
+                        for record in partition_records
+                    )
+                )
+                await consumer.commit(
+                    {
+                        tp: partition_records[-1].offset + 1
+                        for tp, partition_records in records.items()
+                    }
+                )
+                replayed += sum(len(batch) for batch in records.values())
+        finally:
+            await consumer.stop()
+        logger.info(f"Replayed {replayed} dead-lettered classification results")
+        return replayed
+
+
+async def _caught_up(
+    consumer: AIOKafkaConsumer, end_offsets: dict[TopicPartition, int]
+) -> bool:
+    for tp, end_offset in end_offsets.items():
+        if await consumer.position(tp) < end_offset:
+            return False
+    return True
+
+
+@lru_cache(maxsize=1)
+def get_dead_letter_service() -> DeadLetterService:
+    """Get cached dead-letter service instance for dependency injection."""
+    return DeadLetterService()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import multiprocessing
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from pathlib import PurePosixPath
+from typing import Any, IO
+
+from loguru import logger
+from PIL import Image as PILImage, ImageOps
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.core.s3_client import get_s3_client
+from bioscopeai_core.app.models import Image
+from bioscopeai_core.app.services.image_location_cache import (
+    get_image_location_cache,
+    ImageLocation,
+    ImageLocationCache,
+)
+from bioscopeai_core.app.services.storage_service import (
+    get_storage_service,
+    StorageService,
+)
+
+
+DERIVATIVE_CONTENT_TYPES = {
+    "WEBP": "image/webp",
+    "JPEG": "image/jpeg",
+    "PNG": "image/png",
+}
+
+
+def render_derivatives(
+    data: bytes | IO[bytes], sizes: dict[str, int], image_format: str, quality: int
+) -> dict[str, tuple[bytes, int, int]]:
+    """Decode an image once and encode a downscaled copy for every size.
+
+    Runs in a worker process. Sizes are rendered largest first and each one is
+    resized from the previous result, so the full-resolution frame is only
+    resampled once. Returns ``{name: (payload, width, height)}``.
+    """
+    with PILImage.open(io.BytesIO(data) if isinstance(data, bytes) else data) as source:
+        largest = max(sizes.values())
+        source.draft("RGB", (largest, largest))  # JPEG only: decode at a reduced scale
+        frame = ImageOps.exif_transpose(source)
+        if frame.mode not in {"RGB", "L"}:
+            frame = frame.convert("RGB")
+
+        rendered: dict[str, tuple[bytes, int, int]] = {}
+        for name, edge in sorted(sizes.items(), key=lambda item: item[1], reverse=True):
+            frame.thumbnail((edge, edge), PILImage.Resampling.LANCZOS)
+            buffer = io.BytesIO()
+            frame.save(buffer, format=image_format, quality=quality)
+            rendered[name] = (buffer.getvalue(), frame.width, frame.height)
+        return rendered
+
+
+def render_object_derivatives(
+    bucket: str, object_key: str, sizes: dict[str, int], image_format: str, quality: int
+) -> dict[str, tuple[bytes, int, int]]:
+    """Download an original and render its derivatives.
+
+    Runs in a worker process with its own S3 client, so the original never
+    passes through the API process. It is spooled to a temporary file rather
+    than read into memory, which matters for multi-gigabyte session uploads.
+    """
+    with tempfile.TemporaryFile() as spool:
+        get_s3_client().download_fileobj(bucket, object_key, spool)
+        spool.seek(0)
+        return render_derivatives(spool, sizes, image_format, quality)
+
+
+@lru_cache(maxsize=1)
+def get_derivative_executor() -> ProcessPoolExecutor:
+    """Get the process pool that decodes and resizes images."""
+    # Spawn instead of fork: the parent runs an event loop and S3 worker threads
+    return ProcessPoolExecutor(
+        max_workers=settings.image.DERIVATIVE_WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def shutdown_derivative_executor() -> None:
+    """Shut down the derivative process pool, dropping renders that have not started."""
+    if get_derivative_executor.cache_info().currsize:
+        get_derivative_executor().shutdown(wait=False, cancel_futures=True)
+        get_derivative_executor.cache_clear()
+
+
+class DerivativeService:
+    """Generate thumbnails and previews for uploaded images.
+
+    Derivatives are stored next to the original object and recorded on
+    ``Image.derivatives`` so preview URLs can point at a small rendition instead
+    of the full-resolution frame.
+    """
+
+    def __init__(self) -> None:
+        self.storage_service: StorageService = get_storage_service()
+        self.location_cache: ImageLocationCache = get_image_location_cache()
+
+    @staticmethod
+    def derivative_key(object_key: str, name: str) -> str:
+        """Build the storage key of a derivative, stored beside the original."""
+        extension = settings.image.DERIVATIVE_FORMAT.lower()
+        return str(PurePosixPath(object_key).with_suffix(f".{name}.{extension}"))
+
+    @staticmethod
+    def select_object_key(image: Image | ImageLocation, size: int | None = None) -> str:
+        """Pick the smallest derivative whose longest edge covers ``size``.
+
+        Falls back to the original when no size is requested or no derivative is
+        large enough.
+        """
+        if size is None or not image.derivatives:
+            return image.filepath
+
+        fitting: list[dict[str, Any]] = [
+            derivative
+            for derivative in image.derivatives.values()
+            if max(derivative["width"], derivative["height"]) >= size
+        ]
+        if not fitting:
+            return image.filepath
+        smallest = min(fitting, key=lambda d: d["width"] * d["height"])
+        return str(smallest["key"])
+
+    async def generate(self, image: Image) -> None:
+        """Render, store and record all configured derivatives of an image.
+
+        Meant to run as a background task, so failures are logged, not raised.
+        """
+        image_format = settings.image.DERIVATIVE_FORMAT
+        content_type = DERIVATIVE_CONTENT_TYPES.get(
+            image_format, "application/octet-stream"
+        )
+        try:
+            loop = asyncio.get_running_loop()
+            rendered = await loop.run_in_executor(
+                get_derivative_executor(),
+                partial(
+                    render_object_derivatives,
+                    self.storage_service.default_bucket,
+                    image.filepath,
+                    settings.image.DERIVATIVE_SIZES,
+                    image_format,
+                    settings.image.DERIVATIVE_QUALITY,
+                ),
+            )
+
+            derivatives: dict[str, dict[str, Any]] = {
+                name: {
+                    "key": self.derivative_key(image.filepath, name),
+                    "width": width,
+                    "height": height,
+                }
+                for name, (_, width, height) in rendered.items()
+            }
+            await asyncio.gather(
+                *(
+                    self.storage_service.upload_bytes(
+                        payload, derivatives[name]["key"], content_type
+                    )
+                    for name, (payload, _, _) in rendered.items()
+                )
+            )
+            await Image.filter(id=image.id).update(derivatives=derivatives)
+            image.derivatives = derivatives
+            self.location_cache.invalidate(image.id)
+            logger.info(f"Generated {len(derivatives)} derivatives for image {image.id}")
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Failed to generate derivatives for image {image.id}")
+
+    async def generate_many(self, images: list[Image]) -> None:
+        """Generate derivatives for several images, one render per pool worker."""
+        semaphore = asyncio.Semaphore(settings.image.DERIVATIVE_WORKERS)
+
+        async def generate_one(image: Image) -> None:
+            async with semaphore:
+                await self.generate(image)
+
+        await asyncio.gather(*(generate_one(image) for image in images))
+
+
+@lru_cache(maxsize=1)
+def get_derivative_service() -> DerivativeService:
+    """Get cached derivative service instance for dependency injection."""
+    return DerivativeService()
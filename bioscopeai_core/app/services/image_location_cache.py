@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, TYPE_CHECKING
+from uuid import UUID
+
+from bioscopeai_core.app.core.config import settings
+
+
+if TYPE_CHECKING:
+    from bioscopeai_core.app.models import Image
+
+
+@dataclass(frozen=True, slots=True)
+class ImageLocation:
+    """What is needed to sign URLs for an image without loading its record."""
+
+    filepath: str
+    filename: str
+    derivatives: dict[str, Any] | None
+    dataset_id: UUID
+
+    @classmethod
+    def of(cls, image: Image) -> ImageLocation:
+        return cls(
+            filepath=image.filepath,
+            filename=image.filename,
+            derivatives=image.derivatives,
+            dataset_id=image.dataset_id,
+        )
+
+
+class ImageLocationCache:
+    """Bounded LRU cache of image locations keyed by image ID.
+
+    Lets the preview and download endpoints sign URLs without a database
+    round trip. Entries are invalidated when an image changes in this process
+    and expire after ``ttl`` seconds, which bounds how long a change made by
+    another process goes unnoticed.
+    """
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self._entries: OrderedDict[UUID, tuple[ImageLocation, float]] = OrderedDict()
+        self._max_size = max_size
+        self._ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, image_id: UUID) -> ImageLocation | None:
+        entry = self._entries.get(image_id)
+        if entry is None or entry[1] <= time.monotonic():
+            if entry is not None:
+                del self._entries[image_id]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(image_id)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, image_id: UUID, location: ImageLocation) -> None:
+        self._entries[image_id] = (location, time.monotonic() + self._ttl)
+        self._entries.move_to_end(image_id)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *image_ids: UUID) -> None:
+        """Drop the cached locations of the given images."""
+        for image_id in image_ids:
+            self._entries.pop(image_id, None)
+
+    def invalidate_dataset(self, dataset_id: UUID) -> None:
+        """Drop the cached locations of every image in a dataset."""
+        stale = [
+            image_id
+            for image_id, (location, _) in self._entries.items()
+            if location.dataset_id == dataset_id
+        ]
+        self.invalidate(*stale)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+@lru_cache(maxsize=1)
+def get_image_location_cache() -> ImageLocationCache:
+    """Get the process-wide image location cache."""
+    return ImageLocationCache(
+        max_size=settings.image.LOCATION_CACHE_SIZE,
+        ttl=settings.image.LOCATION_CACHE_TTL,
+    )
@@ -0,0 +1,60 @@
+import asyncio
+
+from loguru import logger
+from tortoise.transactions import in_transaction
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.crud.classification import get_classification_outbox_crud
+from bioscopeai_core.app.kafka.producers.classification_producer import (
+    get_classification_producer,
+)
+from bioscopeai_core.app.models import ClassificationJobOutbox
+
+
+async def relay_outbox_batch() -> int:
+    """Publish one batch of due classification jobs from the outbox to Kafka.
+
+    Claimed messages stay locked until the batch is settled: acknowledged ones
+    are deleted, failed ones are scheduled for another attempt. Returns the
+    number of messages claimed.
+    """
+    outbox_crud = get_classification_outbox_crud()
+    producer = get_classification_producer()
+    async with in_transaction():
+        entries = await outbox_crud.claim_due(settings.kafka.OUTBOX_BATCH_SIZE)
+        if not entries:
+            return 0
+        outcomes = await producer.send_many(
+            [(entry.device_id, entry.payload) for entry in entries]
+        )
+        published: list[ClassificationJobOutbox] = []
+        failed: list[tuple[ClassificationJobOutbox, BaseException]] = []
+        for entry, outcome in zip(entries, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                failed.append((entry, outcome))
+            else:
+                published.append(entry)
+        await outbox_crud.delete_many(published)
+        for entry, error in failed:
+            await outbox_crud.reschedule(entry, error)
+    if published:
+        logger.debug(f"Published {len(published)} classification jobs from the outbox")
+    return len(entries)
+
+
+async def run_outbox_relay() -> None:
+    """Publish classification jobs from the outbox until cancelled.
+
+    Full batches are followed by the next one straight away; once the outbox is
+    drained it is polled every ``OUTBOX_POLL_INTERVAL`` seconds. Messages are
+    claimed with ``SKIP LOCKED``, so several API instances can run this loop
+    side by side.
+    """
+    while True:
+        try:
+            claimed = await relay_outbox_batch()
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to publish classification jobs from the outbox")
+            claimed = 0
+        if claimed < settings.kafka.OUTBOX_BATCH_SIZE:
+            await asyncio.sleep(settings.kafka.OUTBOX_POLL_INTERVAL)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+
+from bioscopeai_core.app.core.config import settings
+
+
+CacheKey = tuple[str, str, str | None, int]
+
+
+@dataclass(frozen=True, slots=True)
+class PresignedUrl:
+    """A presigned URL together with its absolute expiry time."""
+
+    url: str
+    expires_at: float
+
+    @property
+    def expires_in(self) -> int:
+        """Seconds of validity left."""
+        return max(0, int(self.expires_at - time.time()))
+
+
+class PresignedUrlCache:
+    """Bounded LRU cache of presigned GET URLs.
+
+    Entries are keyed by (bucket, object key, content disposition, requested
+    expiry) and additionally indexed by (bucket, object key), so invalidating
+    an object only touches its own entries. A cached URL is only reused while
+    more than ``min_remaining_ratio`` of its requested validity is left, so
+    callers never receive a URL that is about to expire.
+    """
+
+    def __init__(self, max_size: int, min_remaining_ratio: float) -> None:
+        self._entries: OrderedDict[CacheKey, PresignedUrl] = OrderedDict()
+        self._by_object: dict[tuple[str, str], set[CacheKey]] = {}
+        self._max_size = max_size
+        self._min_remaining_ratio = min_remaining_ratio
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: CacheKey) -> PresignedUrl | None:
+        entry = self._entries.get(key)
+        expires_in = key[3]
+        if entry is None or entry.expires_in <= expires_in * self._min_remaining_ratio:
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: CacheKey, entry: PresignedUrl) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._by_object.setdefault((key[0], key[1]), set()).add(key)
+        while len(self._entries) > self._max_size:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, bucket: str, object_name: str) -> None:
+        """Drop every cached URL for the given object."""
+        for key in self._by_object.pop((bucket, object_name), set()):
+            del self._entries[key]
+
+    def _remove(self, key: CacheKey) -> None:
+        del self._entries[key]
+        keys = self._by_object[(key[0], key[1])]
+        keys.discard(key)
+        if not keys:
+            del self._by_object[(key[0], key[1])]
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+@lru_cache(maxsize=1)
+def get_presigned_url_cache() -> PresignedUrlCache:
+    """Get the process-wide presigned URL cache."""
+    return PresignedUrlCache(
+        max_size=settings.minio.PRESIGNED_URL_CACHE_SIZE,
+        min_remaining_ratio=settings.minio.PRESIGNED_URL_MIN_REMAINING_RATIO,
+    )
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import hashlib
+import time
+from collections.abc import Callable
 from functools import lru_cache
-from io import BytesIO
+from typing import Any
 from uuid import uuid4
 
 from botocore.exceptions import ClientError
@@ -9,16 +12,26 @@ from fastapi import HTTPException, UploadFile
 from loguru import logger
 
 from bioscopeai_core.app.core.config import settings
-from bioscopeai_core.app.core.s3_client import get_s3_client
+from bioscopeai_core.app.core.s3_client import get_s3_client, run_s3_call
+from bioscopeai_core.app.services.presigned_url_cache import (
+    get_presigned_url_cache,
+    PresignedUrl,
+    PresignedUrlCache,
+)
 
 
 class StorageService:
-    """Service for managing file storage operations with S3/MinIO."""
+    """Service for managing file storage operations with S3/MinIO.
+
+    boto3 is synchronous, so every client call is dispatched to the bounded S3
+    executor via ``run_s3_call`` and never blocks the event loop.
+    """
 
     def __init__(self) -> None:
         """Initialize storage service with S3 client."""
         self.s3_client = get_s3_client()
         self.default_bucket = settings.minio.DEFAULT_BUCKET
+        self.presigned_url_cache: PresignedUrlCache = get_presigned_url_cache()
 
     @staticmethod
     def _get_file_extension(filename: str) -> str:
@@ -41,29 +54,90 @@ class StorageService:
         file: UploadFile,
         bucket: str | None = None,
         object_name: str | None = None,
+        max_size: int | None = None,
+        on_chunk: Callable[[bytes], None] | None = None,
     ) -> str:
-        """Upload file to S3/MinIO."""
+        """Stream file to S3/MinIO without buffering the whole upload in memory.
+
+        The file is read in ``UPLOAD_CHUNK_SIZE`` chunks. Files that fit into a
+        single part are sent with one ``put_object`` call, larger ones are sent
+        as a multipart upload, so at most one part is held in memory at a time.
+        Emptiness and ``max_size`` are enforced while reading. Every accepted
+        chunk is passed to ``on_chunk``, e.g. to hash the content in the same pass.
+        """
         bucket_name = bucket or self.default_bucket
 
         if not object_name:
             file_extension = self._get_file_extension(file.filename or "file")
             object_name = f"{uuid4()}{file_extension}"
 
+        content_type = file.content_type or "application/octet-stream"
+        chunk_size = settings.image.UPLOAD_CHUNK_SIZE
+        part_size = settings.minio.MULTIPART_PART_SIZE
+        buffer = bytearray()
+        total_size = 0
+        upload_id: str | None = None
+        parts: list[dict[str, Any]] = []
+
         try:
-            contents = await file.read()
-            file_obj = BytesIO(contents)
+            while chunk := await file.read(chunk_size):
+                total_size += len(chunk)
+                if max_size is not None and total_size > max_size:
+                    raise HTTPException(status_code=400, detail="File too large")
+                if on_chunk is not None:
+                    on_chunk(chunk)
+                buffer.extend(chunk)
+                if len(buffer) < part_size:
+                    continue
+                if upload_id is None:
+                    upload_id = await self.create_multipart_upload(
+                        bucket_name, object_name, content_type
+                    )
+                parts.append(
+                    await self.upload_part(
+                        bucket_name,
+                        object_name,
+                        upload_id,
+                        part_number=len(parts) + 1,
+                        body=bytes(buffer[:part_size]),
+                    )
+                )
+                del buffer[:part_size]
 
-            self.s3_client.upload_fileobj(
-                file_obj,
-                bucket_name,
-                object_name,
-                ExtraArgs={
-                    "ContentType": file.content_type or "application/octet-stream"
-                },
-            )
+            if total_size == 0:
+                raise HTTPException(status_code=400, detail="File is empty")
 
+            if upload_id is None:
+                await run_s3_call(
+                    self.s3_client.put_object,
+                    Bucket=bucket_name,
+                    Key=object_name,
+                    Body=bytes(buffer),
+                    ContentType=content_type,
+                )
+            else:
+                if buffer:
+                    parts.append(
+                        await self.upload_part(
+                            bucket_name,
+                            object_name,
+                            upload_id,
+                            part_number=len(parts) + 1,
+                            body=bytes(buffer),
+                        )
+                    )
+                await self.complete_multipart_upload(
+                    bucket_name, object_name, upload_id, parts
+                )
+
+        except HTTPException:
+            if upload_id is not None:
+                await self._discard_multipart_upload(bucket_name, object_name, upload_id)
+            raise
         except ClientError as e:
             logger.exception(f"Failed to upload file to {bucket_name}/{object_name}")
+            if upload_id is not None:
+                await self._discard_multipart_upload(bucket_name, object_name, upload_id)
             raise HTTPException(
                 status_code=500,
                 detail=f"File upload failed: {e.response['Error']['Message']}",
@@ -72,17 +146,184 @@ class StorageService:
             logger.exception(
                 f"Unexpected error during file upload: {bucket_name}/{object_name}"
             )
+            if upload_id is not None:
+                await self._discard_multipart_upload(bucket_name, object_name, upload_id)
             raise HTTPException(
                 status_code=500,
                 detail=f"File upload failed: {e!s}",
             ) from e
         else:
-            logger.info(f"Uploaded file to {bucket_name}/{object_name}")
+            logger.info(
+                f"Uploaded file to {bucket_name}/{object_name} ({total_size} bytes)"
+            )
             return object_name
         finally:
             # Reset file pointer for potential reuse
             await file.seek(0)
 
+    async def create_multipart_upload(
+        self, bucket_name: str, object_name: str, content_type: str
+    ) -> str:
+        response = await run_s3_call(
+            self.s3_client.create_multipart_upload,
+            Bucket=bucket_name,
+            Key=object_name,
+            ContentType=content_type,
+        )
+        upload_id: str = response["UploadId"]
+        return upload_id
+
+    async def upload_part(
+        self,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        part_number: int,
+        body: bytes,
+    ) -> dict[str, Any]:
+        response = await run_s3_call(
+            self.s3_client.upload_part,
+            Bucket=bucket_name,
+            Key=object_name,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=body,
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+
+    async def complete_multipart_upload(
+        self,
+        bucket_name: str,
+        object_name: str,
+        upload_id: str,
+        parts: list[dict[str, Any]],
+    ) -> None:
+        await run_s3_call(
+            self.s3_client.complete_multipart_upload,
+            Bucket=bucket_name,
+            Key=object_name,
+            UploadId=upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    async def abort_multipart_upload(
+        self, bucket_name: str, object_name: str, upload_id: str
+    ) -> None:
+        """Abort a multipart upload, discarding its parts.
+
+        An upload that no longer exists counts as aborted, so retrying is safe.
+        Other failures raise ``ClientError``.
+        """
+        try:
+            await run_s3_call(
+                self.s3_client.abort_multipart_upload,
+                Bucket=bucket_name,
+                Key=object_name,
+                UploadId=upload_id,
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "NoSuchUpload":
+                raise
+            logger.warning(
+                f"Multipart upload already gone: {bucket_name}/{object_name}"
+            )
+            return
+        logger.info(f"Aborted multipart upload {bucket_name}/{object_name}")
+
+    async def _discard_multipart_upload(
+        self, bucket_name: str, object_name: str, upload_id: str
+    ) -> None:
+        """Abort a failed upload's multipart upload, logging instead of raising."""
+        try:
+            await self.abort_multipart_upload(bucket_name, object_name, upload_id)
+        except Exception:  # noqa: BLE001
+            logger.exception(
+                f"Failed to abort multipart upload {bucket_name}/{object_name}"
+            )
+
+    async def download_bytes(
+        self,
+        object_name: str,
+        bucket: str | None = None,
+    ) -> bytes:
+        """Read a whole object from S3/MinIO into memory."""
+        bucket_name = bucket or self.default_bucket
+
+        def read_object() -> bytes:
+            response = self.s3_client.get_object(Bucket=bucket_name, Key=object_name)
+            body: bytes = response["Body"].read()
+            return body
+
+        try:
+            return await run_s3_call(read_object)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code")
+            if error_code == "NoSuchKey":
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"File not found: {object_name}",
+                ) from e
+            logger.exception(f"Failed to download {bucket_name}/{object_name}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"File download failed: {e.response['Error']['Message']}",
+            ) from e
+
+    async def hash_object(
+        self,
+        object_name: str,
+        bucket: str | None = None,
+    ) -> str:
+        """SHA-256 of a stored object, read in ``UPLOAD_CHUNK_SIZE`` chunks."""
+        bucket_name = bucket or self.default_bucket
+
+        def read_digest() -> str:
+            response = self.s3_client.get_object(Bucket=bucket_name, Key=object_name)
+            digest = hashlib.sha256()
+            for chunk in response["Body"].iter_chunks(settings.image.UPLOAD_CHUNK_SIZE):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+        try:
+            return await run_s3_call(read_digest)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code")
+            if error_code == "NoSuchKey":
+                raise HTTPException(
+                    status_code=404,
+                    detail=f"File not found: {object_name}",
+                ) from e
+            logger.exception(f"Failed to hash {bucket_name}/{object_name}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"File download failed: {e.response['Error']['Message']}",
+            ) from e
+
+    async def upload_bytes(
+        self,
+        data: bytes,
+        object_name: str,
+        content_type: str,
+        bucket: str | None = None,
+    ) -> None:
+        """Store an in-memory payload in S3/MinIO with a single PUT."""
+        bucket_name = bucket or self.default_bucket
+        try:
+            await run_s3_call(
+                self.s3_client.put_object,
+                Bucket=bucket_name,
+                Key=object_name,
+                Body=data,
+                ContentType=content_type,
+            )
+            self.presigned_url_cache.invalidate(bucket_name, object_name)
+        except ClientError as e:
+            logger.exception(f"Failed to upload {bucket_name}/{object_name}")
+            raise HTTPException(
+                status_code=500,
+                detail=f"File upload failed: {e.response['Error']['Message']}",
+            ) from e
+
     async def delete_file(
         self,
         object_name: str,
@@ -91,7 +332,10 @@ class StorageService:
         """Delete file from S3/MinIO."""
         bucket_name = bucket or self.default_bucket
         try:
-            self.s3_client.delete_object(Bucket=bucket_name, Key=object_name)
+            await run_s3_call(
+                self.s3_client.delete_object, Bucket=bucket_name, Key=object_name
+            )
+            self.presigned_url_cache.invalidate(bucket_name, object_name)
             logger.info(f"Deleted file from {bucket_name}/{object_name}")
 
         except ClientError as e:
@@ -121,14 +365,41 @@ class StorageService:
         object_name: str,
         bucket: str | None = None,
         expires_in: int = 604800,  # 7 days in seconds
+        response_content_disposition: str | None = None,
     ) -> str:
         """Generate presigned URL for file access."""
+        presigned = await self.generate_presigned_get(
+            object_name,
+            bucket=bucket,
+            expires_in=expires_in,
+            response_content_disposition=response_content_disposition,
+        )
+        return presigned.url
+
+    async def generate_presigned_get(
+        self,
+        object_name: str,
+        bucket: str | None = None,
+        expires_in: int = 604800,  # 7 days in seconds
+        response_content_disposition: str | None = None,
+    ) -> PresignedUrl:
+        """Return a presigned GET URL, reusing a cached one while still fresh."""
         bucket_name = bucket or self.default_bucket
+        cache_key = (bucket_name, object_name, response_content_disposition, expires_in)
+        cached = self.presigned_url_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        params = {"Bucket": bucket_name, "Key": object_name}
+        if response_content_disposition:
+            params["ResponseContentDisposition"] = response_content_disposition
 
         try:
-            url: str = self.s3_client.generate_presigned_url(
+            signed_at = time.time()
+            url: str = await run_s3_call(
+                self.s3_client.generate_presigned_url,
                 "get_object",
-                Params={"Bucket": bucket_name, "Key": object_name},
+                Params=params,
                 ExpiresIn=expires_in,
             )
         except ClientError as e:
@@ -148,21 +419,138 @@ class StorageService:
                 detail=f"URL generation failed: {e!s}",
             ) from e
         else:
-            return url
+            presigned = PresignedUrl(url=url, expires_at=signed_at + expires_in)
+            self.presigned_url_cache.put(cache_key, presigned)
+            return presigned
 
-    async def file_exists(
+    async def generate_presigned_gets(
+        self,
+        object_names: list[str],
+        bucket: str | None = None,
+        expires_in: int = 604800,  # 7 days in seconds
+        response_content_disposition: str | None = None,
+    ) -> dict[str, PresignedUrl]:
+        """Return presigned GET URLs for many objects.
+
+        Cached URLs are reused and all missing ones are signed in a single
+        executor call instead of one round trip per object.
+        """
+        bucket_name = bucket or self.default_bucket
+        presigned: dict[str, PresignedUrl] = {}
+        missing: list[str] = []
+        for object_name in dict.fromkeys(object_names):
+            cached = self.presigned_url_cache.get(
+                (bucket_name, object_name, response_content_disposition, expires_in)
+            )
+            if cached is not None:
+                presigned[object_name] = cached
+            else:
+                missing.append(object_name)
+        if not missing:
+            return presigned
+
+        def sign_all() -> list[str]:
+            params: dict[str, str] = {"Bucket": bucket_name}
+            if response_content_disposition:
+                params["ResponseContentDisposition"] = response_content_disposition
+            return [
+                self.s3_client.generate_presigned_url(
+                    "get_object",
+                    Params={**params, "Key": object_name},
+                    ExpiresIn=expires_in,
+                )
+                for object_name in missing
+            ]
+
+        try:
+            signed_at = time.time()
+            urls = await run_s3_call(sign_all)
+        except ClientError as e:
+            logger.exception(f"Failed to generate {len(missing)} presigned URLs")
+            raise HTTPException(
+                status_code=500,
+                detail=f"URL generation failed: {e.response['Error']['Message']}",
+            ) from e
+        except Exception as e:
+            logger.exception(
+                f"Unexpected error generating {len(missing)} presigned URLs"
+            )
+            raise HTTPException(
+                status_code=500,
+                detail=f"URL generation failed: {e!s}",
+            ) from e
+
+        for object_name, url in zip(missing, urls, strict=True):
+            entry = PresignedUrl(url=url, expires_at=signed_at + expires_in)
+            self.presigned_url_cache.put(
+                (bucket_name, object_name, response_content_disposition, expires_in),
+                entry,
+            )
+            presigned[object_name] = entry
+        return presigned
+
+    async def generate_presigned_post(
         self,
         object_name: str,
+        content_type: str,
+        max_size: int,
         bucket: str | None = None,
-    ) -> bool:
+        expires_in: int = 900,
+    ) -> dict[str, Any]:
+        """Generate a presigned POST policy for uploading directly to S3/MinIO.
+
+        The policy pins the object key and content type and limits the body
+        to 1..``max_size`` bytes. Returns the form ``url`` and ``fields``.
+        """
+        bucket_name = bucket or self.default_bucket
+
+        try:
+            policy: dict[str, Any] = await run_s3_call(
+                self.s3_client.generate_presigned_post,
+                Bucket=bucket_name,
+                Key=object_name,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_size],
+                ],
+                ExpiresIn=expires_in,
+            )
+        except ClientError as e:
+            logger.exception(
+                f"Failed to generate presigned POST: {bucket_name}/{object_name}"
+            )
+            raise HTTPException(
+                status_code=500,
+                detail=f"Upload policy generation failed: {e.response['Error']['Message']}",
+            ) from e
+        except Exception as e:
+            logger.exception(
+                f"Unexpected error generating presigned POST: {bucket_name}/{object_name}"
+            )
+            raise HTTPException(
+                status_code=500,
+                detail=f"Upload policy generation failed: {e!s}",
+            ) from e
+        else:
+            return policy
+
+    async def get_file_metadata(
+        self,
+        object_name: str,
+        bucket: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Return the object's HEAD response, or None if it does not exist."""
         bucket_name = bucket or self.default_bucket
 
         try:
-            self.s3_client.head_object(Bucket=bucket_name, Key=object_name)
+            metadata: dict[str, Any] = await run_s3_call(
+                self.s3_client.head_object, Bucket=bucket_name, Key=object_name
+            )
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code")
             if error_code == "404":
-                return False
+                return None
             logger.exception(
                 f"Error checking file existence: {bucket_name}/{object_name}"
             )
@@ -179,7 +567,14 @@ class StorageService:
                 detail=f"File existence check failed: {e!s}",
             ) from e
         else:
-            return True
+            return metadata
+
+    async def file_exists(
+        self,
+        object_name: str,
+        bucket: str | None = None,
+    ) -> bool:
+        return await self.get_file_metadata(object_name, bucket=bucket) is not None
 
 
 @lru_cache(maxsize=1)
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from functools import lru_cache
+
+from bioscopeai_core.app.core.config import settings
+
+
+class TileCache:
+    """LRU cache of encoded deep-zoom tiles, bounded by total payload size.
+
+    Tiles are immutable once written, so entries never go stale and are only
+    evicted to stay under ``max_bytes``.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._max_bytes = max_bytes
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> bytes | None:
+        tile = self._entries.get(key)
+        if tile is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return tile
+
+    def put(self, key: str, tile: bytes) -> None:
+        if len(tile) > self._max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = tile
+        self._bytes += len(tile)
+        while self._bytes > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+
+@lru_cache(maxsize=1)
+def get_tile_cache() -> TileCache:
+    """Get the process-wide tile cache."""
+    return TileCache(max_bytes=settings.image.TILE_CACHE_MAX_BYTES)
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import math
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from pathlib import PurePosixPath
+from typing import Any, TYPE_CHECKING
+
+from fastapi import HTTPException
+from loguru import logger
+from PIL import Image as PILImage, ImageOps
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.core.s3_client import get_s3_client
+from bioscopeai_core.app.models import Image
+from bioscopeai_core.app.services.derivative_service import (
+    DERIVATIVE_CONTENT_TYPES,
+    get_derivative_executor,
+)
+from bioscopeai_core.app.services.storage_service import (
+    get_storage_service,
+    StorageService,
+)
+from bioscopeai_core.app.services.tile_cache import get_tile_cache, TileCache
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Future
+
+
+def level_size(width: int, height: int, max_level: int, level: int) -> tuple[int, int]:
+    """Pixel size of a pyramid level; ``max_level`` is full resolution."""
+    scale = 2 ** (max_level - level)
+    return max(1, math.ceil(width / scale)), max(1, math.ceil(height / scale))
+
+
+def tile_boxes(
+    width: int, height: int, tile_size: int, overlap: int
+) -> Iterator[tuple[int, int, tuple[int, int, int, int]]]:
+    """Yield ``(col, row, crop box)`` for every tile of a level, DZI style.
+
+    Each tile extends ``overlap`` pixels into its neighbours on every inner edge.
+    """
+    for row in range(math.ceil(height / tile_size)):
+        for col in range(math.ceil(width / tile_size)):
+            left = max(0, col * tile_size - overlap)
+            top = max(0, row * tile_size - overlap)
+            right = min(width, (col + 1) * tile_size + overlap)
+            bottom = min(height, (row + 1) * tile_size + overlap)
+            yield col, row, (left, top, right, bottom)
+
+
+def build_tile_pyramid(
+    bucket: str,
+    object_key: str,
+    tiles_prefix: str,
+    tile_size: int,
+    overlap: int,
+    image_format: str,
+    quality: int,
+    min_dimension: int,
+    max_pixels: int,
+) -> dict[str, Any] | None:
+    """Decode an image and upload its deep-zoom tile pyramid.
+
+    Runs in a worker process with its own S3 client, so the tiles never have to
+    be pickled back to the API process. The original is spooled to a temporary
+    file like in ``render_object_derivatives``. Tiles are encoded and uploaded by
+    a thread pool one level at a time, which bounds memory to roughly one level.
+    Returns the pyramid descriptor, or None if the image is too small to tile.
+    """
+    s3 = get_s3_client()
+    with tempfile.TemporaryFile() as spool:
+        s3.download_fileobj(bucket, object_key, spool)
+        spool.seek(0)
+        # Derivatives are rendered by the same pool and keep Pillow's own limit
+        default_max_pixels = PILImage.MAX_IMAGE_PIXELS
+        PILImage.MAX_IMAGE_PIXELS = max_pixels
+        try:
+            with PILImage.open(spool) as source:
+                width, height = source.size
+                if max(width, height) <= min_dimension:
+                    return None
+                level_image = ImageOps.exif_transpose(source)
+        finally:
+            PILImage.MAX_IMAGE_PIXELS = default_max_pixels
+    if level_image.mode not in {"RGB", "L"}:
+        level_image = level_image.convert("RGB")
+    width, height = level_image.size
+
+    extension = image_format.lower()
+    content_type = DERIVATIVE_CONTENT_TYPES.get(image_format, "application/octet-stream")
+    max_level = math.ceil(math.log2(max(width, height)))
+
+    def upload_tile(key: str, tile: PILImage.Image) -> None:
+        buffer = io.BytesIO()
+        tile.save(buffer, format=image_format, quality=quality)
+        s3.put_object(
+            Bucket=bucket, Key=key, Body=buffer.getvalue(), ContentType=content_type
+        )
+
+    with ThreadPoolExecutor(max_workers=settings.minio.MAX_CONCURRENCY) as uploader:
+        for level in range(max_level, -1, -1):
+            futures: list[Future[None]] = [
+                uploader.submit(
+                    upload_tile,
+                    f"{tiles_prefix}/{level}/{col}_{row}.{extension}",
+                    level_image.crop(box),
+                )
+                for col, row, box in tile_boxes(*level_image.size, tile_size, overlap)
+            ]
+            for future in futures:
+                future.result()
+            if level > 0:
+                level_image = level_image.resize(
+                    level_size(width, height, max_level, level - 1),
+                    PILImage.Resampling.LANCZOS,
+                )
+
+    return {
+        "prefix": tiles_prefix,
+        "width": width,
+        "height": height,
+        "tile_size": tile_size,
+        "overlap": overlap,
+        "format": extension,
+        "max_level": max_level,
+    }
+
+
+class TileService:
+    """Build and serve deep-zoom tile pyramids for large images.
+
+    Pyramids follow the Deep Zoom (DZI) layout: level ``max_level`` is the full
+    resolution frame, every level below halves it, and each level is cut into
+    ``tile_size`` tiles stored under ``<object>_files/<level>/<col>_<row>``.
+    """
+
+    def __init__(self) -> None:
+        self.storage_service: StorageService = get_storage_service()
+        self.tile_cache: TileCache = get_tile_cache()
+
+    @staticmethod
+    def tiles_prefix(object_key: str) -> str:
+        """Build the storage prefix of an image's tiles, stored beside the original."""
+        return f"{PurePosixPath(object_key).with_suffix('')}_files"
+
+    async def generate(self, image: Image) -> None:
+        """Build and record the tile pyramid of an image, if it is large enough.
+
+        Meant to run as a background task, so failures are logged, not raised.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            descriptor = await loop.run_in_executor(
+                get_derivative_executor(),
+                partial(
+                    build_tile_pyramid,
+                    self.storage_service.default_bucket,
+                    image.filepath,
+                    self.tiles_prefix(image.filepath),
+                    settings.image.TILE_SIZE,
+                    settings.image.TILE_OVERLAP,
+                    settings.image.TILE_FORMAT,
+                    settings.image.TILE_QUALITY,
+                    settings.image.TILE_MIN_DIMENSION,
+                    settings.image.TILE_MAX_PIXELS,
+                ),
+            )
+            if descriptor is None:
+                return
+            await Image.filter(id=image.id).update(tiles=descriptor)
+            image.tiles = descriptor
+            logger.info(
+                f"Generated {descriptor['max_level'] + 1} tile levels for image {image.id}"
+            )
+        except Exception:  # noqa: BLE001
+            logger.exception(f"Failed to generate tiles for image {image.id}")
+
+    async def generate_many(self, images: list[Image]) -> None:
+        """Build tile pyramids for several images, one at a time.
+
+        Pyramids are large, so they are built sequentially to leave pool workers
+        free for thumbnails.
+        """
+        for image in images:
+            await self.generate(image)
+
+    @staticmethod
+    def tile_key(descriptor: dict[str, Any], level: int, col: int, row: int) -> str | None:
+        """Storage key of a tile, or None if it lies outside the pyramid."""
+        if not 0 <= level <= descriptor["max_level"]:
+            return None
+        width, height = level_size(
+            descriptor["width"], descriptor["height"], descriptor["max_level"], level
+        )
+        tile_size = descriptor["tile_size"]
+        if not (
+            0 <= col < math.ceil(width / tile_size)
+            and 0 <= row < math.ceil(height / tile_size)
+        ):
+            return None
+        return f"{descriptor['prefix']}/{level}/{col}_{row}.{descriptor['format']}"
+
+    async def get_tile(self, image: Image, level: int, col: int, row: int) -> bytes | None:
+        """Return an encoded tile, served from the in-process cache when possible."""
+        if not image.tiles:
+            return None
+        key = self.tile_key(image.tiles, level, col, row)
+        if key is None:
+            return None
+
+        tile = self.tile_cache.get(key)
+        if tile is None:
+            try:
+                tile = await self.storage_service.download_bytes(key)
+            except HTTPException as e:
+                if e.status_code == 404:
+                    return None  # pyramid only partly uploaded or since deleted
+                raise
+            self.tile_cache.put(key, tile)
+        return tile
+
+
+@lru_cache(maxsize=1)
+def get_tile_service() -> TileService:
+    """Get cached tile service instance for dependency injection."""
+    return TileService()
@@ -0,0 +1,22 @@
+import asyncio
+
+from loguru import logger
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.crud.image import get_upload_session_crud
+
+
+async def run_upload_session_gc() -> None:
+    """Periodically abort abandoned upload sessions until cancelled.
+
+    Aborting releases the parts S3 keeps for unfinished multipart uploads.
+    Sessions are claimed with conditional updates, so several API instances
+    can run this loop side by side.
+    """
+    upload_session_crud = get_upload_session_crud()
+    while True:
+        try:
+            await upload_session_crud.abort_expired_sessions()
+        except Exception:  # noqa: BLE001
+            logger.exception("Failed to clean up abandoned upload sessions")
+        await asyncio.sleep(settings.image.UPLOAD_SESSION_GC_INTERVAL)
@@ -0,0 +1,109 @@
+"""Opaque keyset cursors for paginating ordered listings.
+
+A cursor records the ordering and the (order field, id) values of the last
+row of a page. The next page is fetched with a range condition on that tuple
+instead of an OFFSET, so deep pages cost the same as the first one as long as
+(order field, id) is backed by an index.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Response
+from tortoise.expressions import Q
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+from bioscopeai_core.app.core.config import settings
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def _load_value(value: Any) -> Any:
+    if isinstance(value, dict) and "dt" in value:
+        return datetime.fromisoformat(value["dt"])
+    return value
+
+
+def encode_cursor(order_by: str, value: Any, obj_id: UUID) -> str:
+    """Encode the position after a row into an opaque, URL-safe cursor."""
+    payload = json.dumps(
+        {"o": order_by, "v": _dump_value(value), "id": str(obj_id)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, order_by: str) -> tuple[Any, UUID]:
+    """Decode a cursor into the (order field value, id) of the last seen row.
+
+    Raises 400 if the cursor is malformed or was issued for another ordering.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded))
+        if payload["o"] != order_by:
+            raise HTTPException(status_code=400, detail="Cursor does not match order_by")
+        return _load_value(payload["v"]), UUID(payload["id"])
+    except HTTPException:
+        raise
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def keyset_ordering(order_by: str) -> tuple[str, str]:
+    """Ordering with ``id`` as tie-breaker so that every row has a unique position."""
+    return order_by, "-id" if order_by.startswith("-") else "id"
+
+
+def keyset_filter(order_by: str, cursor: str) -> Q:
+    """Condition selecting the rows after the cursor position in ``order_by`` order."""
+    value, last_id = decode_cursor(cursor, order_by)
+    field = order_by.lstrip("-")
+    op = "lt" if order_by.startswith("-") else "gt"
+    return Q(**{f"{field}__{op}": value}) | Q(
+        Q(**{field: value}), Q(**{f"id__{op}": last_id})
+    )
+
+
+def next_cursor(items: list[Any], order_by: str, limit: int) -> str | None:
+    """Cursor for the page after ``items``, or None if this was the last page."""
+    if len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(order_by, getattr(last, order_by.lstrip("-")), last.id)
+
+
+def clamp_limit(limit: int) -> int:
+    """Apply the server-side page size cap."""
+    return max(1, min(limit, settings.app.MAX_PAGE_SIZE))
+
+
+def paginate[M: Model](
+    query: QuerySet[M], order_by: str, limit: int, cursor: str | None = None
+) -> QuerySet[M]:
+    """Order a query by (order field, id), seek past ``cursor`` and cap the page."""
+    if cursor is not None:
+        query = query.filter(keyset_filter(order_by, cursor))
+    return query.order_by(*keyset_ordering(order_by)).limit(clamp_limit(limit))
+
+
+def set_next_cursor(
+    response: Response, items: list[Any], order_by: str, limit: int
+) -> None:
+    """Expose the next page's cursor in the ``X-Next-Cursor`` response header."""
+    if cursor := next_cursor(items, order_by, clamp_limit(limit)):
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,42 @@
+"""Case-insensitive substring and prefix search over text columns.
+
+Every searched column is compared as ``LOWER(column)`` against the lowered
+term. On PostgreSQL that expression is covered by a ``pg_trgm`` GIN index
+(see migration 11), which serves both ``LIKE '%term%'`` and ``LIKE 'term%'``
+without scanning the table. Terms shorter than three characters produce no
+trigrams and fall back to scanning the index.
+"""
+
+from collections.abc import Sequence
+from typing import Literal
+
+from tortoise.expressions import Q
+from tortoise.functions import Lower
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+
+SearchMode = Literal["contains", "prefix"]
+
+
+def search_alias(field: str) -> str:
+    """Name of the lowered annotation used to search ``field``."""
+    return f"{field.replace('__', '_')}_search"
+
+
+def annotate_search[M: Model](query: QuerySet[M], fields: Sequence[str]) -> QuerySet[M]:
+    """Annotate ``query`` with the lowered value of every searched field."""
+    return query.annotate(**{search_alias(field): Lower(field) for field in fields})
+
+
+def search_condition(fields: Sequence[str], term: str, mode: SearchMode = "contains") -> Q:
+    """Condition matching rows where any of ``fields`` contains or starts with ``term``.
+
+    The query must be annotated with ``annotate_search`` over the same fields.
+    """
+    lookup = "startswith" if mode == "prefix" else "contains"
+    term = term.lower()
+    return Q(
+        *(Q(**{f"{search_alias(field)}__{lookup}": term}) for field in fields),
+        join_type=Q.OR,
+    )
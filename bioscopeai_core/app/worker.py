@@ -0,0 +1,65 @@
+"""Standalone worker running only the Kafka result consumers.
+
+Ingestion can be scaled separately from the API by running this module on as
+many processes as the results topic has partitions, with
+``RUN_CONSUMERS_IN_API`` turned off:
+
+    python -m bioscopeai_core.app.worker
+"""
+
+import asyncio
+import signal
+
+from loguru import logger
+
+from bioscopeai_core.app.core import setup_logger
+from bioscopeai_core.app.kafka.consumers.lifecycle import (
+    start_result_consumers,
+    stop_result_consumers,
+    wait_result_consumers,
+)
+from bioscopeai_core.app.kafka.producers.failed_message_producer import (
+    get_failed_message_producer,
+)
+
+from .db import close_db, init_db
+
+
+async def run_worker() -> None:
+    """Consume classification results until SIGINT or SIGTERM is received.
+
+    Raises the error of a consumer that stopped on its own, so that the process
+    exits and is restarted by its supervisor.
+    """
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    failed_message_producer = get_failed_message_producer()
+    setup_logger()
+    await init_db()
+    await failed_message_producer.initialize()
+    await start_result_consumers()
+    logger.info("Worker startup complete.")
+    stopped = asyncio.ensure_future(stop_event.wait())
+    consuming = asyncio.ensure_future(wait_result_consumers())
+    try:
+        await asyncio.wait({stopped, consuming}, return_when=asyncio.FIRST_COMPLETED)
+        if consuming.done():
+            consuming.result()
+    finally:
+        stopped.cancel()
+        consuming.cancel()
+        logger.info("Shutting down worker...")
+        await stop_result_consumers()
+        await failed_message_producer.shutdown()
+        await close_db()
+
+
+def start_worker() -> None:
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    start_worker()
@@ -3,10 +3,14 @@
 import pytest
 from httpx import AsyncClient
 from uuid import UUID
-from unittest.mock import AsyncMock, patch
 
+from bioscopeai_core.app.crud.classification import get_classification_stats_crud
 from bioscopeai_core.app.models import User, Dataset, Image, Device
-from bioscopeai_core.app.models.classification import Classification
+from bioscopeai_core.app.models.classification import (
+    Classification,
+    ClassificationJobOutbox,
+    ClassificationResult,
+)
 from bioscopeai_core.app.models.users.user import UserRole
 from bioscopeai_core.tests.conftest import (
     TEST_PASSWORD,
@@ -78,18 +82,12 @@ async def test_classification(analyst_user: User, test_image: Image) -> Classifi
 
 
 class TestRunClassification:
-    @patch("bioscopeai_core.app.crud.classification.classification.get_classification_producer")
     async def test_creates_classification_for_image(
         self,
-        mock_producer: AsyncMock,
         api_client: AsyncClient,
         analyst_headers: dict,
         test_image: Image,
     ):
-        mock_instance = AsyncMock()
-        mock_instance.send_event = AsyncMock()
-        mock_producer.return_value = mock_instance
-
         classification_data = {
             "image_id": str(test_image.id),
             "model_name": "resnet50",
@@ -110,20 +108,15 @@ class TestRunClassification:
         assert classification is not None
         assert classification.image_id == test_image.id
         assert classification.model_name == "resnet50"
-        mock_instance.send_event.assert_called_once()
+        entry = await ClassificationJobOutbox.get(classification_id=classification.id)
+        assert entry.payload["image_id"] == str(test_image.id)
 
-    @patch("bioscopeai_core.app.crud.classification.classification.get_classification_producer")
     async def test_creates_classification_for_dataset(
         self,
-        mock_producer: AsyncMock,
         api_client: AsyncClient,
         analyst_headers: dict,
         test_dataset: Dataset,
     ):
-        mock_instance = AsyncMock()
-        mock_instance.send_event = AsyncMock()
-        mock_producer.return_value = mock_instance
-
         classification_data = {
             "dataset_id": str(test_dataset.id),
             "model_name": "vgg16",
@@ -142,7 +135,8 @@ class TestRunClassification:
         classification = await Classification.get_or_none(id=data["id"])
         assert classification is not None
         assert classification.dataset_id == test_dataset.id
-        mock_instance.send_event.assert_called_once()
+        entry = await ClassificationJobOutbox.get(classification_id=classification.id)
+        assert entry.payload["dataset_id"] == str(test_dataset.id)
 
     async def test_rejects_both_image_and_dataset(
         self,
@@ -358,3 +352,107 @@ class TestDeleteClassification:
             f"/api/classifications/{fake_id}", headers=admin_headers
         )
         assert response.status_code == 404
+
+
+class TestTodayStatistics:
+    async def test_aggregates_results_of_last_24_hours(
+        self,
+        api_client: AsyncClient,
+        analyst_headers: dict,
+        test_image: Image,
+        test_classification: Classification,
+    ):
+        for i, confidence in enumerate((0.5, 0.7, 0.9)):
+            await ClassificationResult.create(
+                classification=test_classification,
+                image=test_image,
+                label=f"label_{i}",
+                confidence=confidence,
+                model_name="test_model",
+            )
+
+        response = await api_client.get(
+            "/api/classification-results/today/statistics", headers=analyst_headers
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["classified_last_24_hours"] == 3
+        assert data["average_confidence"] == pytest.approx(0.7)
+        assert len(data["last_10_results"]) == 3
+        assert len(data["hourly_counts"]) == 25
+        assert sum(bucket["count"] for bucket in data["hourly_counts"]) == 3
+
+    async def test_returns_zeros_without_results(
+        self, api_client: AsyncClient, analyst_headers: dict
+    ):
+        response = await api_client.get(
+            "/api/classification-results/today/statistics", headers=analyst_headers
+        )
+
+        data = response.json()
+        assert data["classified_last_24_hours"] == 0
+        assert data["average_confidence"] == 0.0
+        assert data["last_10_results"] == []
+        assert all(bucket["count"] == 0 for bucket in data["hourly_counts"])
+
+
+class TestStatistics:
+    async def test_serves_recorded_and_rebuilt_rollups(
+        self,
+        api_client: AsyncClient,
+        analyst_headers: dict,
+        test_image: Image,
+        test_classification: Classification,
+    ):
+        stats_crud = get_classification_stats_crud()
+        for label, confidence in (("cell", 0.6), ("cell", 0.8), ("debris", 0.5)):
+            result = await ClassificationResult.create(
+                classification=test_classification,
+                image=test_image,
+                label=label,
+                confidence=confidence,
+                model_name="test_model",
+            )
+            await stats_crud.record_result(result)
+
+        url = "/api/classification-results/statistics?granularity=day&group_by=label"
+        recorded = await api_client.get(url, headers=analyst_headers)
+        rebuilt_rows = await stats_crud.rebuild()
+        rebuilt = await api_client.get(url, headers=analyst_headers)
+
+        assert recorded.status_code == 200
+        counts = {b["group"]: b["count"] for b in recorded.json()}
+        assert counts == {"cell": 2, "debris": 1}
+        assert rebuilt_rows == 2
+        assert rebuilt.json() == recorded.json()
+
+    async def test_filters_by_dataset(
+        self,
+        api_client: AsyncClient,
+        analyst_headers: dict,
+        test_image: Image,
+        test_classification: Classification,
+    ):
+        result = await ClassificationResult.create(
+            classification=test_classification,
+            image=test_image,
+            label="cell",
+            confidence=0.9,
+            model_name="test_model",
+        )
+        await get_classification_stats_crud().record_result(result)
+
+        own = await api_client.get(
+            "/api/classification-results/statistics",
+            params={"dataset_id": str(test_image.dataset_id)},
+            headers=analyst_headers,
+        )
+        other = await api_client.get(
+            "/api/classification-results/statistics",
+            params={"dataset_id": "00000000-0000-0000-0000-000000000000"},
+            headers=analyst_headers,
+        )
+
+        assert sum(b["count"] for b in own.json()) == 1
+        assert sum(b["count"] for b in other.json()) == 0
@@ -157,6 +157,77 @@ class TestListImages:
         data = response.json()
         assert len(data) == 2
 
+    async def test_cursor_pagination_visits_every_image_once(
+        self,
+        api_client: AsyncClient,
+        analyst_headers: dict,
+        analyst_user: User,
+        test_dataset: Dataset,
+    ):
+        for i in range(5):
+            await Image.create(
+                dataset=test_dataset,
+                uploaded_by=analyst_user,
+                filename=f"image_{i}.jpg",
+                filepath=f"/tmp/image_{i}.jpg",
+            )
+
+        seen: list[str] = []
+        url = "/api/images/?page_size=2&order_by=filename"
+        while True:
+            response = await api_client.get(url, headers=analyst_headers)
+            assert response.status_code == 200
+            seen.extend(image["filename"] for image in response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            url = f"/api/images/?page_size=2&order_by=filename&cursor={cursor}"
+
+        assert seen == [f"image_{i}.jpg" for i in range(5)]
+
+    async def test_searches_filenames_by_substring_and_prefix(
+        self,
+        api_client: AsyncClient,
+        analyst_headers: dict,
+        analyst_user: User,
+        test_dataset: Dataset,
+    ):
+        for filename in ("Blood_smear.jpg", "tissue_blood.jpg", "other.jpg"):
+            await Image.create(
+                dataset=test_dataset,
+                uploaded_by=analyst_user,
+                filename=filename,
+                filepath=f"/tmp/{filename}",
+            )
+
+        contains = await api_client.get(
+            "/api/images/?q=BLOOD&order_by=filename", headers=analyst_headers
+        )
+        prefix = await api_client.get(
+            "/api/images/?q=blood&search_mode=prefix", headers=analyst_headers
+        )
+
+        assert [i["filename"] for i in contains.json()] == [
+            "Blood_smear.jpg",
+            "tissue_blood.jpg",
+        ]
+        assert [i["filename"] for i in prefix.json()] == ["Blood_smear.jpg"]
+
+    async def test_rejects_cursor_for_other_ordering(
+        self, api_client: AsyncClient, analyst_headers: dict, test_image: Image
+    ):
+        response = await api_client.get(
+            "/api/images/?page_size=1&order_by=filename", headers=analyst_headers
+        )
+        cursor = response.headers["X-Next-Cursor"]
+
+        response = await api_client.get(
+            f"/api/images/?order_by=-uploaded_at&cursor={cursor}",
+            headers=analyst_headers,
+        )
+
+        assert response.status_code == 400
+
     async def test_requires_analyst_role(self, api_client: AsyncClient):
         viewer = await User.create_user(
             email="viewer@test.example.com",
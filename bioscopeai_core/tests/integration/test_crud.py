@@ -1,19 +1,33 @@
 """Integration tests for CRUD operations with database."""
 
+import asyncio
+import json
+from datetime import datetime, UTC
 from uuid import uuid4
 
 import pytest
+from tortoise.exceptions import IntegrityError
 
-from bioscopeai_core.app.crud.classification import ClassificationCRUD
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.crud.classification import (
+    ClassificationCRUD,
+    ClassificationOutboxCRUD,
+)
 from bioscopeai_core.app.crud.classification.classification_result import (
     ClassificationResultCRUD,
 )
 from bioscopeai_core.app.crud.dataset import DatasetCRUD
 from bioscopeai_core.app.crud.device import DeviceCRUD
 from bioscopeai_core.app.crud.image import ImageCRUD
+from bioscopeai_core.app.db.queries import insert_ignore_conflicts, upsert_increments
+from bioscopeai_core.app.kafka.producers.classification_producer import (
+    ClassificationJobProducer,
+)
 from bioscopeai_core.app.models import (
     Classification,
+    ClassificationJobOutbox,
     ClassificationResult,
+    ClassificationStatsHourly,
     Dataset,
     Device,
     Image,
@@ -28,6 +42,10 @@ from bioscopeai_core.app.schemas.classification import (
 from bioscopeai_core.app.schemas.dataset import DatasetCreate, DatasetUpdate
 from bioscopeai_core.app.schemas.device import DeviceCreate, DeviceUpdate
 from bioscopeai_core.app.schemas.image import ImageUpdate
+from bioscopeai_core.app.services.classification_result import (
+    ClassificationResultService,
+)
+from bioscopeai_core.app.services.outbox_relay import relay_outbox_batch
 
 
 @pytest.fixture
@@ -162,6 +180,102 @@ class TestClassificationCRUDLifecycle:
         assert completed.status == ClassificationStatus.COMPLETED
 
 
+class TestClassificationJobOutbox:
+    """Test queueing classification jobs and relaying them to Kafka."""
+
+    @pytest.fixture
+    async def dataset(self, test_user: User) -> Dataset:
+        return await Dataset.create(name="Outbox Dataset", owner=test_user)
+
+    @pytest.fixture
+    def producer(self, mocker) -> ClassificationJobProducer:
+        producer = ClassificationJobProducer()
+        mocker.patch.object(
+            producer, "send", mocker.AsyncMock(side_effect=lambda *_: acknowledged(None))
+        )
+        mocker.patch(
+            "bioscopeai_core.app.services.outbox_relay.get_classification_producer",
+            return_value=producer,
+        )
+        return producer
+
+    async def create_job(self, user: User, dataset: Dataset) -> Classification:
+        return await ClassificationCRUD().create_job(
+            created_by_id=user.id,
+            create_in=ClassificationCreate(dataset_id=dataset.id, model_name="resnet50"),
+        )
+
+    async def test_job_and_message_are_stored_together(
+        self, db, test_user: User, dataset: Dataset
+    ):
+        classification = await self.create_job(test_user, dataset)
+
+        entry = await ClassificationJobOutbox.get(classification_id=classification.id)
+        assert entry.payload["classification_id"] == str(classification.id)
+        assert entry.payload["dataset_id"] == str(dataset.id)
+
+    async def test_job_is_rolled_back_without_its_message(
+        self, db, mocker, test_user: User, dataset: Dataset
+    ):
+        mocker.patch.object(
+            ClassificationOutboxCRUD, "enqueue", side_effect=RuntimeError("db down")
+        )
+
+        with pytest.raises(RuntimeError):
+            await self.create_job(test_user, dataset)
+
+        assert await Classification.all().count() == 0
+
+    async def test_relay_publishes_and_deletes_messages(
+        self, db, producer, test_user: User, dataset: Dataset
+    ):
+        classification = await self.create_job(test_user, dataset)
+
+        assert await relay_outbox_batch() == 1
+
+        message = producer.send.call_args.args[1]
+        assert message["classification_id"] == str(classification.id)
+        assert await ClassificationJobOutbox.all().count() == 0
+        assert await relay_outbox_batch() == 0
+
+    async def test_relay_reschedules_unacknowledged_messages(
+        self, db, producer, test_user: User, dataset: Dataset
+    ):
+        producer.send.side_effect = lambda *_: acknowledged(RuntimeError("timeout"))
+        await self.create_job(test_user, dataset)
+
+        assert await relay_outbox_batch() == 1
+
+        entry = await ClassificationJobOutbox.get()
+        assert entry.attempts == 1
+        assert entry.next_attempt_at > datetime.now(UTC)
+        assert "timeout" in entry.last_error
+        assert await relay_outbox_batch() == 0  # not due yet
+
+    async def test_relay_fails_job_after_last_attempt(
+        self, db, mocker, producer, test_user: User, dataset: Dataset
+    ):
+        mocker.patch.object(settings.kafka, "OUTBOX_MAX_ATTEMPTS", 1)
+        producer.send.side_effect = RuntimeError("broker unreachable")
+        classification = await self.create_job(test_user, dataset)
+
+        await relay_outbox_batch()
+
+        await classification.refresh_from_db()
+        assert classification.status == ClassificationStatus.FAILED
+        assert await ClassificationJobOutbox.all().count() == 0
+
+
+def acknowledged(outcome: object) -> asyncio.Future:
+    """Send future already resolved with ``outcome``, raised if it is an exception."""
+    future = asyncio.get_running_loop().create_future()
+    if isinstance(outcome, BaseException):
+        future.set_exception(outcome)
+    else:
+        future.set_result(outcome)
+    return future
+
+
 class TestClassificationResultCRUDLifecycle:
     """Test classification result CRUD lifecycle with database."""
 
@@ -206,3 +320,132 @@ class TestClassificationResultCRUDLifecycle:
         by_image = await crud.get_by_image(image.id)
         assert len(by_image) == 1
         assert by_image[0].id == created.id
+
+
+    async def test_insert_ignore_conflicts_returns_only_new_rows(
+        self, db, test_user: User
+    ):
+        dataset = await Dataset.create(name="Conflict Dataset", owner=test_user)
+        image = await Image.create(
+            filename="conflict.jpg",
+            filepath="/uploads/conflict.jpg",
+            dataset_id=dataset.id,
+            uploaded_by_id=test_user.id,
+        )
+        await ClassificationResult.create(
+            image_id=image.id, label="a", confidence=0.5, idempotency_key="k1"
+        )
+        results = [
+            ClassificationResult(
+                image_id=image.id, label="a", confidence=0.5, idempotency_key=key
+            )
+            for key in ("k1", "k2")
+        ]
+
+        inserted = await insert_ignore_conflicts(results, "idempotency_key")
+
+        assert inserted == ["k2"]
+        assert await ClassificationResult.all().count() == 2
+
+    async def test_upsert_increments_adds_to_existing_rows(self, db):
+        bucket = datetime(2025, 12, 1, 8, tzinfo=UTC)
+        await ClassificationStatsHourly.create(
+            bucket=bucket, label="a", count=2, confidence_sum=1.5
+        )
+        rows = [
+            ClassificationStatsHourly(
+                bucket=bucket, label=label, count=1, confidence_sum=0.5
+            )
+            for label in ("a", "b")
+        ]
+
+        await upsert_increments(
+            rows,
+            conflict=("bucket", "label", "model_name", "device_id", "dataset_id"),
+            increments=("count", "confidence_sum"),
+        )
+
+        stats = {
+            row.label: (row.count, row.confidence_sum)
+            for row in await ClassificationStatsHourly.all()
+        }
+        assert stats == {"a": (3, 2.0), "b": (1, 0.5)}
+
+
+class TestClassificationResultBatchProcessing:
+    """Test storing a batch of classification result events."""
+
+    async def test_stores_batch_and_updates_jobs_and_images(self, db, test_user: User):
+        dataset = await Dataset.create(name="Batch Dataset", owner=test_user)
+        images = [
+            await Image.create(
+                filename=f"batch_{i}.jpg",
+                filepath=f"/uploads/batch_{i}.jpg",
+                dataset_id=dataset.id,
+                uploaded_by_id=test_user.id,
+            )
+            for i in range(2)
+        ]
+        classifications = [
+            await Classification.create(
+                image_id=image.id, model_name="resnet50", created_by_id=test_user.id
+            )
+            for image in images
+        ]
+        events = [
+            json.dumps(
+                {
+                    "image_id": str(image.id),
+                    "classification_id": str(classification.id),
+                    "label": "positive",
+                    "confidence": 0.8,
+                    "model_name": "resnet50",
+                }
+            )
+            for image, classification in zip(images, classifications, strict=True)
+        ]
+
+        stored = await ClassificationResultService().process_classification_results(
+            [*events, "not json"]
+        )
+
+        assert stored == 2
+        assert await ClassificationResult.filter(label="positive").count() == 2
+        assert await Classification.filter(
+            status=ClassificationStatus.COMPLETED
+        ).count() == 2
+        assert await Image.filter(analyzed=True).count() == 2
+        rollup = await ClassificationStatsHourly.get(label="positive")
+        assert rollup.count == 2
+
+    async def test_replayed_batch_is_not_stored_again(self, db, test_user: User):
+        dataset = await Dataset.create(name="Replay Dataset", owner=test_user)
+        image = await Image.create(
+            filename="replay.jpg",
+            filepath="/uploads/replay.jpg",
+            dataset_id=dataset.id,
+            uploaded_by_id=test_user.id,
+        )
+        events = [
+            json.dumps({"image_id": str(image.id), "label": label, "confidence": 0.9})
+            for label in ("positive", "negative", "positive")
+        ]
+        service = ClassificationResultService()
+
+        first = await service.process_classification_results(events)
+        replayed = await service.process_classification_results(events)
+
+        assert (first, replayed) == (2, 0)
+        assert await ClassificationResult.all().count() == 2
+        rollup = await ClassificationStatsHourly.get(label="positive")
+        assert rollup.count == 1
+
+    async def test_batch_is_rolled_back_on_error(self, db, test_user: User):
+        events = [
+            json.dumps({"image_id": str(uuid4()), "label": "x", "confidence": 0.5})
+        ]
+
+        with pytest.raises(IntegrityError):
+            await ClassificationResultService().process_classification_results(events)
+
+        assert await ClassificationResult.all().count() == 0
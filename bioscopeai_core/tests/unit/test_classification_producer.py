@@ -0,0 +1,54 @@
+"""Unit tests for pipelined sends in ClassificationJobProducer."""
+
+import asyncio
+
+import pytest
+
+from bioscopeai_core.app.kafka.producers.classification_producer import (
+    ClassificationJobProducer,
+)
+
+
+class TestPipelinedSends:
+    """Test enqueue-only sends, fan-out and per-call topics."""
+
+    @pytest.fixture
+    def producer(self, mocker) -> ClassificationJobProducer:
+        producer = ClassificationJobProducer()
+        producer._producer = mocker.MagicMock()
+
+        async def send(topic, value):
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(topic)
+            return future
+
+        producer._producer.send = mocker.AsyncMock(side_effect=send)
+        yield producer
+        producer._producer = None
+
+    async def test_send_returns_acknowledgement_future(
+        self, producer: ClassificationJobProducer
+    ):
+        future = await producer.send(None, {"classification_id": "1"})
+
+        assert await future == producer._topic_prefix
+
+    async def test_send_many_uses_topic_of_each_message(
+        self, producer: ClassificationJobProducer
+    ):
+        results = await producer.send_many([("dev-1", {}), (None, {}), ("dev-2", {})])
+
+        prefix = producer._topic_prefix
+        assert results == [f"{prefix}-dev-1", prefix, f"{prefix}-dev-2"]
+
+    async def test_send_many_fails_rest_when_queueing_fails(
+        self, producer: ClassificationJobProducer
+    ):
+        acknowledged = asyncio.get_running_loop().create_future()
+        acknowledged.set_result("first")
+        error = RuntimeError("broker unreachable")
+        producer._producer.send.side_effect = [acknowledged, error]
+
+        results = await producer.send_many([(None, {}), (None, {}), (None, {})])
+
+        assert results == ["first", error, error]
@@ -4,9 +4,11 @@ from uuid import uuid4
 
 import pytest
 
+from bioscopeai_core.app.core.config import settings
 from bioscopeai_core.app.crud.classification import ClassificationCRUD
 from bioscopeai_core.app.crud.classification.classification_result import (
     ClassificationResultCRUD,
+    idempotency_key,
 )
 from bioscopeai_core.app.models.classification import (
     Classification,
@@ -67,7 +69,8 @@ class TestGetFilteredClassifications:
     async def test_filters_by_status(self, crud: ClassificationCRUD, mocker):
         mock_classifications = [Classification()]
         mock_query = mocker.MagicMock()
-        mock_query.order_by = mocker.AsyncMock(return_value=mock_classifications)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=mock_classifications)
         mocker.patch.object(Classification, "filter", return_value=mock_query)
 
         result = await crud.get_filtered(status="completed")
@@ -81,7 +84,8 @@ class TestGetFilteredClassifications:
         dataset_id = uuid4()
         mock_classifications = [Classification()]
         mock_query = mocker.MagicMock()
-        mock_query.order_by = mocker.AsyncMock(return_value=mock_classifications)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=mock_classifications)
         mocker.patch.object(Classification, "filter", return_value=mock_query)
 
         result = await crud.get_filtered(dataset_id=dataset_id)
@@ -93,7 +97,8 @@ class TestGetFilteredClassifications:
         image_id = uuid4()
         mock_classifications = [Classification()]
         mock_query = mocker.MagicMock()
-        mock_query.order_by = mocker.AsyncMock(return_value=mock_classifications)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=mock_classifications)
         mocker.patch.object(Classification, "filter", return_value=mock_query)
 
         result = await crud.get_filtered(image_id=image_id)
@@ -105,7 +110,8 @@ class TestGetFilteredClassifications:
         user_id = uuid4()
         mock_classifications = [Classification()]
         mock_query = mocker.MagicMock()
-        mock_query.order_by = mocker.AsyncMock(return_value=mock_classifications)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=mock_classifications)
         mocker.patch.object(Classification, "filter", return_value=mock_query)
 
         result = await crud.get_filtered(created_by=user_id)
@@ -121,22 +127,99 @@ class TestCreateResult:
     def crud(self) -> ClassificationResultCRUD:
         return ClassificationResultCRUD()
 
-    async def test_creates_result_with_provided_data(
-        self, crud: ClassificationResultCRUD, mocker
-    ):
-        result_data = ClassificationResultCreate(
+    @pytest.fixture
+    def result_data(self) -> ClassificationResultCreate:
+        return ClassificationResultCreate(
             image_id=uuid4(),
             classification_id=uuid4(),
             label="positive",
             confidence=0.95,
             model_name="resnet50",
         )
-        mock_result = ClassificationResult()
-        mocker.patch.object(ClassificationResult, "create", return_value=mock_result)
 
+    @pytest.fixture
+    def stored_keys(self, mocker):
+        mock_query = mocker.MagicMock()
+        mock_query.values_list = mocker.AsyncMock(return_value=[])
+        mocker.patch.object(ClassificationResult, "filter", return_value=mock_query)
+        return mock_query.values_list
+
+    @pytest.fixture
+    def insert(self, mocker):
+        return mocker.patch(
+            "bioscopeai_core.app.crud.classification.classification_result."
+            "insert_ignore_conflicts",
+            mocker.AsyncMock(
+                side_effect=lambda objs, returning: [obj.idempotency_key for obj in objs]
+            ),
+        )
+
+    async def test_creates_result_with_provided_data(
+        self,
+        crud: ClassificationResultCRUD,
+        result_data: ClassificationResultCreate,
+        stored_keys,
+        insert,
+    ):
         result = await crud.create_result(result_data)
 
-        assert result == mock_result
+        assert result is not None
+        assert result.label == "positive"
+        assert result.idempotency_key == idempotency_key(result_data)
+        insert.assert_awaited_once()
+        assert insert.call_args.args[1] == "idempotency_key"
+
+    async def test_skips_result_stored_before(
+        self,
+        crud: ClassificationResultCRUD,
+        result_data: ClassificationResultCreate,
+        stored_keys,
+        insert,
+    ):
+        stored_keys.return_value = [idempotency_key(result_data)]
+
+        result = await crud.create_result(result_data)
+
+        assert result is None
+        insert.assert_not_called()
+
+    async def test_skips_result_inserted_concurrently(
+        self,
+        crud: ClassificationResultCRUD,
+        result_data: ClassificationResultCreate,
+        stored_keys,
+        insert,
+    ):
+        insert.side_effect = None
+        insert.return_value = []  # ON CONFLICT skipped the row, nothing returned
+
+        result = await crud.create_result(result_data)
+
+        assert result is None
+
+    async def test_inserts_repeated_result_once(
+        self,
+        crud: ClassificationResultCRUD,
+        result_data: ClassificationResultCreate,
+        stored_keys,
+        insert,
+    ):
+        results = await crud.create_results([result_data, result_data])
+
+        assert len(results) == 1
+        assert len(insert.call_args.args[0]) == 1
+
+    def test_prefers_producer_result_id_as_key(
+        self, result_data: ClassificationResultCreate
+    ):
+        result_id = uuid4()
+
+        assert idempotency_key(result_data) == idempotency_key(
+            result_data.model_copy(update={"confidence": 0.5})
+        )
+        assert idempotency_key(
+            result_data.model_copy(update={"result_id": result_id})
+        ) == str(result_id)
 
 
 class TestGetFilteredResults:
@@ -152,7 +235,8 @@ class TestGetFilteredResults:
         classification_id = uuid4()
         mock_results = [ClassificationResult()]
         mock_query = mocker.MagicMock()
-        mock_query.order_by = mocker.AsyncMock(return_value=mock_results)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=mock_results)
         mocker.patch.object(ClassificationResult, "filter", return_value=mock_query)
 
         result = await crud.get_by_classification(classification_id)
@@ -166,10 +250,25 @@ class TestGetFilteredResults:
         image_id = uuid4()
         mock_results = [ClassificationResult()]
         mock_query = mocker.MagicMock()
-        mock_query.order_by = mocker.AsyncMock(return_value=mock_results)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=mock_results)
         mocker.patch.object(ClassificationResult, "filter", return_value=mock_query)
 
         result = await crud.get_by_image(image_id)
 
         ClassificationResult.filter.assert_called_once_with(image_id=image_id)
         assert result == mock_results
+
+    async def test_clamps_limit_and_orders_by_id(
+        self, crud: ClassificationResultCRUD, mocker
+    ):
+        mocker.patch.object(settings.app, "MAX_PAGE_SIZE", 50)
+        mock_query = mocker.MagicMock()
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=[])
+        mocker.patch.object(ClassificationResult, "filter", return_value=mock_query)
+
+        await crud.get_by_classification(uuid4(), limit=10_000)
+
+        mock_query.order_by.assert_called_once_with("-created_at", "-id")
+        mock_query.limit.assert_called_once_with(50)
@@ -0,0 +1,96 @@
+"""Unit tests for the hourly classification statistics rollups."""
+
+from datetime import datetime, UTC
+
+import pytest
+from fastapi import HTTPException
+
+from bioscopeai_core.app.crud.classification import ClassificationStatsCRUD
+from bioscopeai_core.app.crud.classification.classification_stats import floor_bucket
+from bioscopeai_core.app.models.classification import ClassificationStatsHourly
+
+
+class TestFloorBucket:
+    """Test alignment of datetimes to bucket starts."""
+
+    moment = datetime(2025, 12, 4, 15, 42, 7, tzinfo=UTC)  # a Thursday
+
+    def test_hour(self):
+        assert floor_bucket(self.moment, "hour") == datetime(2025, 12, 4, 15, tzinfo=UTC)
+
+    def test_day(self):
+        assert floor_bucket(self.moment, "day") == datetime(2025, 12, 4, tzinfo=UTC)
+
+    def test_week_starts_on_monday(self):
+        assert floor_bucket(self.moment, "week") == datetime(2025, 12, 1, tzinfo=UTC)
+
+    def test_naive_datetime_is_read_as_utc(self):
+        naive = datetime(2025, 12, 4, 15, 42)
+        assert floor_bucket(naive, "hour") == datetime(2025, 12, 4, 15, tzinfo=UTC)
+
+
+class TestGetSeries:
+    """Test folding hourly rollups into series."""
+
+    @pytest.fixture
+    def crud(self) -> ClassificationStatsCRUD:
+        return ClassificationStatsCRUD()
+
+    @pytest.fixture
+    def rollup_rows(self, mocker):
+        def patch(rows: list[dict]):
+            mock_query = mocker.MagicMock()
+            mock_query.annotate = mocker.MagicMock(return_value=mock_query)
+            mock_query.group_by = mocker.MagicMock(return_value=mock_query)
+            mock_query.values = mocker.AsyncMock(return_value=rows)
+            mocker.patch.object(ClassificationStatsHourly, "filter", return_value=mock_query)
+            return mock_query
+
+        return patch
+
+    async def test_folds_hours_into_days_and_fills_gaps(
+        self, crud: ClassificationStatsCRUD, rollup_rows
+    ):
+        rollup_rows(
+            [
+                {"bucket": datetime(2025, 12, 1, 8, tzinfo=UTC), "total": 2, "confidence": 1.0},
+                {"bucket": datetime(2025, 12, 1, 9, tzinfo=UTC), "total": 2, "confidence": 2.0},
+            ]
+        )
+
+        series = await crud.get_series(
+            datetime(2025, 12, 1, 6, tzinfo=UTC),
+            datetime(2025, 12, 3, tzinfo=UTC),
+            granularity="day",
+        )
+
+        assert [(s["bucket"].day, s["count"]) for s in series] == [(1, 4), (2, 0)]
+        assert series[0]["average_confidence"] == pytest.approx(0.75)
+        assert series[1]["average_confidence"] == 0.0
+
+    async def test_groups_by_dimension(self, crud: ClassificationStatsCRUD, rollup_rows):
+        hour = datetime(2025, 12, 1, 8, tzinfo=UTC)
+        query = rollup_rows(
+            [
+                {"bucket": hour, "label": "b", "total": 1, "confidence": 0.9},
+                {"bucket": hour, "label": "a", "total": 3, "confidence": 1.5},
+            ]
+        )
+
+        series = await crud.get_series(
+            hour, datetime(2025, 12, 2, tzinfo=UTC), group_by="label"
+        )
+
+        query.group_by.assert_called_once_with("bucket", "label")
+        assert [(s["group"], s["count"]) for s in series] == [("a", 3), ("b", 1)]
+
+    async def test_rejects_too_many_buckets(self, crud: ClassificationStatsCRUD, mocker):
+        mocker.patch.object(ClassificationStatsHourly, "filter")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.get_series(
+                datetime(2020, 1, 1, tzinfo=UTC), datetime(2025, 1, 1, tzinfo=UTC)
+            )
+
+        assert exc_info.value.status_code == 400
+        ClassificationStatsHourly.filter.assert_not_called()
@@ -1,14 +1,23 @@
 """Unit tests for ImageCRUD operations."""
 
+import hashlib
 from datetime import datetime, UTC
 from uuid import uuid4
 
 import pytest
 from fastapi import HTTPException
+from tortoise.exceptions import IntegrityError
 
+from bioscopeai_core.app.core.config import settings
 from bioscopeai_core.app.crud.image import ImageCRUD
+from bioscopeai_core.app.models.dataset import Dataset
 from bioscopeai_core.app.models.image import Image
-from bioscopeai_core.app.schemas.image import ImageUpdate
+from bioscopeai_core.app.schemas.image import (
+    ImageCreate,
+    ImageFinalizeFileIn,
+    ImageUpdate,
+)
+from bioscopeai_core.app.services.image_location_cache import ImageLocationCache
 
 
 class TestGetFilteredImages:
@@ -84,13 +93,53 @@ class TestGetFilteredImages:
         mock_query.order_by = mocker.MagicMock(return_value=mock_query)
         mock_query.offset = mocker.MagicMock(return_value=mock_query)
         mock_query.limit = mocker.AsyncMock(return_value=mock_images)
+        mock_query.annotate = mocker.MagicMock(return_value=mock_query)
+        mock_query.filter = mocker.MagicMock(return_value=mock_query)
         mocker.patch.object(Image, "filter", return_value=mock_query)
 
-        result = await crud.get_filtered_images(q="microscope")
+        result = await crud.get_filtered_images(q="Microscope")
 
-        Image.filter.assert_called_once_with(filename__icontains="microscope")
+        Image.filter.assert_called_once_with()
+        assert "filename_search" in mock_query.annotate.call_args.kwargs
+        condition = mock_query.filter.call_args.args[0]
+        assert condition.children[0].filters == {"filename_search__contains": "microscope"}
         assert result == mock_images
 
+    async def test_prefix_search_by_filename(self, crud: ImageCRUD, mocker):
+        mock_query = mocker.MagicMock()
+        mock_query.annotate = mocker.MagicMock(return_value=mock_query)
+        mock_query.filter = mocker.MagicMock(return_value=mock_query)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.offset = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=[])
+        mocker.patch.object(Image, "filter", return_value=mock_query)
+
+        await crud.get_filtered_images(q="Slide_", search_mode="prefix")
+
+        condition = mock_query.filter.call_args.args[0]
+        assert condition.children[0].filters == {"filename_search__startswith": "slide_"}
+
+    async def test_search_all_includes_matching_datasets(self, crud: ImageCRUD, mocker):
+        dataset_id = uuid4()
+        mock_query = mocker.MagicMock()
+        mock_query.annotate = mocker.MagicMock(return_value=mock_query)
+        mock_query.filter = mocker.MagicMock(return_value=mock_query)
+        mock_query.order_by = mocker.MagicMock(return_value=mock_query)
+        mock_query.offset = mocker.MagicMock(return_value=mock_query)
+        mock_query.limit = mocker.AsyncMock(return_value=[])
+        mocker.patch.object(Image, "filter", return_value=mock_query)
+        dataset_query = mocker.MagicMock()
+        dataset_query.annotate = mocker.MagicMock(return_value=dataset_query)
+        dataset_query.filter = mocker.MagicMock(return_value=dataset_query)
+        dataset_query.values_list = mocker.AsyncMock(return_value=[dataset_id])
+        mocker.patch.object(Dataset, "all", return_value=dataset_query)
+
+        await crud.get_filtered_images(q="blood", search_scope="all")
+
+        condition = mock_query.filter.call_args.args[0]
+        assert condition.join_type == "OR"
+        assert condition.children[-1].filters == {"dataset_id__in": [dataset_id]}
+
     async def test_pagination_offset_and_limit(self, crud: ImageCRUD, mocker):
         mock_images = [Image()]
         mock_query = mocker.MagicMock()
@@ -148,6 +197,83 @@ class TestUpdateImage:
         assert result is None
 
 
+class TestGetLocation:
+    """Test the cached image lookup used to sign preview and download URLs."""
+
+    @pytest.fixture
+    def crud(self) -> ImageCRUD:
+        crud = ImageCRUD()
+        crud.location_cache = ImageLocationCache(max_size=10, ttl=60)
+        return crud
+
+    @pytest.fixture
+    def image(self, mocker) -> Image:
+        image = Image(
+            id=uuid4(), filename="a.png", filepath="datasets/d/a.png", dataset_id=uuid4()
+        )
+        image.save = mocker.AsyncMock()
+        image.refresh_from_db = mocker.AsyncMock()
+        image.delete = mocker.AsyncMock()
+        mocker.patch.object(
+            Image, "get_or_none", side_effect=lambda **_: mocker.AsyncMock(return_value=image)()
+        )
+        return image
+
+    async def test_cache_hit_skips_database(self, crud: ImageCRUD, image: Image):
+        first = await crud.get_location(image.id)
+        second = await crud.get_location(image.id)
+
+        assert first == second
+        assert second.filepath == "datasets/d/a.png"
+        Image.get_or_none.assert_called_once_with(id=image.id)
+
+    async def test_returns_none_for_missing_image(self, crud: ImageCRUD, mocker):
+        mocker.patch.object(
+            Image, "get_or_none", return_value=mocker.AsyncMock(return_value=None)()
+        )
+
+        assert await crud.get_location(uuid4()) is None
+
+    async def test_update_invalidates_location(self, crud: ImageCRUD, image: Image):
+        await crud.get_location(image.id)
+
+        await crud.update_image(image.id, ImageUpdate(filename="b.png"))
+        location = await crud.get_location(image.id)
+
+        assert location.filename == "b.png"
+
+    async def test_delete_invalidates_location(self, crud: ImageCRUD, image: Image):
+        await crud.get_location(image.id)
+
+        await crud.delete_by_id(image.id)
+
+        assert crud.location_cache.get(image.id) is None
+
+    async def test_dataset_invalidation_drops_its_images(
+        self, crud: ImageCRUD, image: Image
+    ):
+        await crud.get_location(image.id)
+
+        crud.location_cache.invalidate_dataset(uuid4())
+        assert crud.location_cache.get(image.id) is not None
+        crud.location_cache.invalidate_dataset(image.dataset_id)
+        assert crud.location_cache.get(image.id) is None
+
+    def test_expired_location_is_reloaded(self, mocker):
+        cache = ImageLocationCache(max_size=10, ttl=60)
+        monotonic = mocker.patch(
+            "bioscopeai_core.app.services.image_location_cache.time.monotonic",
+            return_value=0.0,
+        )
+        image_id = uuid4()
+        cache.put(image_id, mocker.sentinel.location)
+
+        assert cache.get(image_id) is mocker.sentinel.location
+        monotonic.return_value = 61.0
+        assert cache.get(image_id) is None
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 0}
+
+
 class TestMarkAsAnalyzed:
     """Test marking image as analyzed."""
 
@@ -180,3 +306,414 @@ class TestMarkAsAnalyzed:
         result = await crud.mark_as_analyzed(image_id)
 
         assert result is None
+
+
+class FakeQuery:
+    """Awaitable stand-in for a queryset returning ``rows``."""
+
+    def __init__(self, rows: list[Image]):
+        self.rows = rows
+
+    def __await__(self):
+        return self._all().__await__()
+
+    async def _all(self) -> list[Image]:
+        return self.rows
+
+    async def values_list(self, field: str, flat: bool = False) -> list:
+        return [getattr(row, field) for row in self.rows]
+
+
+def mock_filter(mocker, by_key=(), by_hash=()):
+    """Patch ``Image.filter`` to answer object key and content hash lookups in turn.
+
+    Lookups past the given results find nothing.
+    """
+    results = {"filepath__in": list(by_key), "content_hash__in": list(by_hash)}
+
+    def filter_images(**kwargs):
+        lookup = "content_hash__in" if "content_hash__in" in kwargs else "filepath__in"
+        rows = results[lookup].pop(0) if results[lookup] else []
+        return FakeQuery(rows)
+
+    return mocker.patch.object(Image, "filter", side_effect=filter_images)
+
+
+async def stream_upload(file, on_chunk=None, **_) -> None:
+    """Stand-in for ``StorageService.upload_file`` passing chunks to ``on_chunk``."""
+    while chunk := await file.read(1024):
+        if on_chunk is not None:
+            on_chunk(chunk)
+
+
+class TestCreateImages:
+    """Test batch image upload."""
+
+    @pytest.fixture
+    def crud(self, mocker) -> ImageCRUD:
+        crud = ImageCRUD()
+        crud.storage_service = mocker.MagicMock()
+        crud.storage_service.default_bucket = "test-images"
+        crud.storage_service.upload_file = mocker.AsyncMock(side_effect=stream_upload)
+        crud.storage_service.delete_file = mocker.AsyncMock()
+        return crud
+
+    @pytest.fixture
+    def existing_images(self, mocker) -> list[Image]:
+        existing: list[Image] = []
+        mocker.patch.object(Image, "filter", mocker.AsyncMock(return_value=existing))
+        return existing
+
+    @staticmethod
+    def make_file(
+        mocker,
+        filename: str,
+        content_type: str = "image/png",
+        content: bytes | None = None,
+    ):
+        uploaded_file = mocker.MagicMock()
+        uploaded_file.filename = filename
+        uploaded_file.content_type = content_type
+        uploaded_file.size = 10
+        uploaded_file.read = mocker.AsyncMock(
+            side_effect=[content or filename.encode(), b""]
+        )
+        uploaded_file.seek = mocker.AsyncMock()
+        return uploaded_file
+
+    async def test_bulk_inserts_successful_uploads(
+        self, crud: ImageCRUD, existing_images, mocker
+    ):
+        dataset_id = uuid4()
+        bulk_create = mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        files = [self.make_file(mocker, "a.png"), self.make_file(mocker, "b.png")]
+
+        outcomes = await crud.create_images(
+            ImageCreate(dataset_id=dataset_id), uuid4(), files
+        )
+
+        assert [o.filename for o in outcomes] == ["a.png", "b.png"]
+        assert all(o.image is not None and o.error is None for o in outcomes)
+        assert all(o.image.filepath.startswith(f"{dataset_id}/") for o in outcomes)
+        bulk_create.assert_awaited_once()
+        assert len(bulk_create.call_args.args[0]) == 2
+
+    async def test_reports_invalid_files_without_uploading(
+        self, crud: ImageCRUD, existing_images, mocker
+    ):
+        mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        files = [
+            self.make_file(mocker, "a.png"),
+            self.make_file(mocker, "b.gif", content_type="image/gif"),
+        ]
+
+        outcomes = await crud.create_images(
+            ImageCreate(dataset_id=uuid4()), uuid4(), files
+        )
+
+        assert outcomes[0].image is not None
+        assert outcomes[1].image is None
+        assert outcomes[1].error == "Invalid file type"
+        crud.storage_service.upload_file.assert_awaited_once()
+
+    async def test_removes_uploaded_objects_when_insert_fails(
+        self, crud: ImageCRUD, existing_images, mocker
+    ):
+        mocker.patch.object(
+            Image, "bulk_create", mocker.AsyncMock(side_effect=RuntimeError("db down"))
+        )
+        files = [self.make_file(mocker, "a.png"), self.make_file(mocker, "b.png")]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.create_images(ImageCreate(dataset_id=uuid4()), uuid4(), files)
+
+        assert exc_info.value.status_code == 500
+        assert crud.storage_service.delete_file.await_count == 2
+
+    async def test_keeps_one_object_of_duplicate_content(
+        self, crud: ImageCRUD, existing_images, mocker
+    ):
+        bulk_create = mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        files = [
+            self.make_file(mocker, "a.png", content=b"same"),
+            self.make_file(mocker, "b.png", content=b"same"),
+        ]
+
+        outcomes = await crud.create_images(
+            ImageCreate(dataset_id=uuid4()), uuid4(), files
+        )
+
+        assert crud.storage_service.upload_file.await_count == 2
+        crud.storage_service.delete_file.assert_awaited_once()
+        assert outcomes[1].duplicate
+        assert outcomes[1].image is outcomes[0].image
+        assert len(bulk_create.call_args.args[0]) == 1
+
+    async def test_concurrently_inserted_content_becomes_duplicate(
+        self, crud: ImageCRUD, mocker
+    ):
+        concurrent = Image(
+            id=uuid4(),
+            filepath="ds/other.png",
+            content_hash=hashlib.sha256(b"raced").hexdigest(),
+        )
+        mock_filter(mocker, by_hash=[[], [concurrent]])
+        bulk_create = mocker.patch.object(
+            Image,
+            "bulk_create",
+            mocker.AsyncMock(side_effect=[IntegrityError("duplicate key"), None]),
+        )
+        files = [
+            self.make_file(mocker, "a.png", content=b"raced"),
+            self.make_file(mocker, "b.png", content=b"new"),
+        ]
+
+        outcomes = await crud.create_images(
+            ImageCreate(dataset_id=uuid4()), uuid4(), files
+        )
+
+        assert outcomes[0].image is concurrent
+        assert outcomes[0].duplicate
+        assert outcomes[1].image is not None and not outcomes[1].duplicate
+        crud.storage_service.delete_file.assert_awaited_once()
+        assert bulk_create.call_args.args[0] == [outcomes[1].image]
+
+    async def test_repeated_content_points_at_concurrently_stored_image(
+        self, crud: ImageCRUD, mocker
+    ):
+        concurrent = Image(
+            id=uuid4(),
+            filepath="ds/other.png",
+            content_hash=hashlib.sha256(b"raced").hexdigest(),
+        )
+        mock_filter(mocker, by_hash=[[], [concurrent]])
+        bulk_create = mocker.patch.object(
+            Image, "bulk_create", mocker.AsyncMock(side_effect=IntegrityError("dup"))
+        )
+        files = [
+            self.make_file(mocker, "a.png", content=b"raced"),
+            self.make_file(mocker, "b.png", content=b"raced"),
+        ]
+
+        outcomes = await crud.create_images(
+            ImageCreate(dataset_id=uuid4()), uuid4(), files
+        )
+
+        assert [o.image for o in outcomes] == [concurrent, concurrent]
+        assert all(o.duplicate for o in outcomes)
+        bulk_create.assert_awaited_once()
+        assert crud.storage_service.delete_file.await_count == 2
+
+    async def test_reuses_existing_image_with_same_content(
+        self, crud: ImageCRUD, existing_images, mocker
+    ):
+        bulk_create = mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        existing = Image(
+            id=uuid4(),
+            filepath="ds/old.png",
+            content_hash=hashlib.sha256(b"same").hexdigest(),
+        )
+        existing_images.append(existing)
+        files = [self.make_file(mocker, "a.png", content=b"same")]
+
+        outcomes = await crud.create_images(
+            ImageCreate(dataset_id=uuid4()), uuid4(), files
+        )
+
+        assert outcomes[0].image is existing
+        assert outcomes[0].duplicate
+        crud.storage_service.delete_file.assert_awaited_once()
+        bulk_create.assert_not_awaited()
+
+    async def test_rejects_existing_content_when_configured(
+        self, crud: ImageCRUD, existing_images, mocker
+    ):
+        mocker.patch.object(settings.image, "DUPLICATE_POLICY", "reject")
+        existing = Image(id=uuid4(), content_hash=hashlib.sha256(b"same").hexdigest())
+        existing_images.append(existing)
+        files = [self.make_file(mocker, "a.png", content=b"same")]
+
+        outcomes = await crud.create_images(
+            ImageCreate(dataset_id=uuid4()), uuid4(), files
+        )
+
+        assert outcomes[0].image is None
+        assert outcomes[0].error == f"Duplicate of image {existing.id}"
+
+
+class TestCreateImage:
+    """Test single image upload."""
+
+    @pytest.fixture
+    def crud(self, mocker) -> ImageCRUD:
+        crud = ImageCRUD()
+        crud.storage_service = mocker.MagicMock()
+        crud.storage_service.default_bucket = "test-images"
+        crud.storage_service.upload_file = mocker.AsyncMock(side_effect=stream_upload)
+        crud.storage_service.delete_file = mocker.AsyncMock()
+        return crud
+
+    async def test_hashes_content_while_uploading(self, crud: ImageCRUD, mocker):
+        mocker.patch.object(Image, "get_or_none", mocker.AsyncMock(return_value=None))
+        create = mocker.patch.object(Image, "create", mocker.AsyncMock())
+        uploaded_file = TestCreateImages.make_file(mocker, "a.png", content=b"data")
+
+        await crud.create_image(ImageCreate(dataset_id=uuid4()), uuid4(), uploaded_file)
+
+        crud.storage_service.upload_file.assert_awaited_once()
+        assert create.call_args.kwargs["content_hash"] == hashlib.sha256(b"data").hexdigest()
+
+    async def test_removes_upload_of_existing_content(self, crud: ImageCRUD, mocker):
+        existing = Image(id=uuid4(), filepath="ds/old.png")
+        mocker.patch.object(Image, "get_or_none", mocker.AsyncMock(return_value=existing))
+        create = mocker.patch.object(Image, "create", mocker.AsyncMock())
+        uploaded_file = TestCreateImages.make_file(mocker, "a.png")
+
+        image = await crud.create_image(
+            ImageCreate(dataset_id=uuid4()), uuid4(), uploaded_file
+        )
+
+        assert image is existing
+        crud.storage_service.delete_file.assert_awaited_once()
+        create.assert_not_awaited()
+
+    async def test_integrity_error_without_duplicate_is_500(
+        self, crud: ImageCRUD, mocker
+    ):
+        mocker.patch.object(
+            Image, "get_or_none", mocker.AsyncMock(return_value=None)
+        )
+        mocker.patch.object(
+            Image, "create", mocker.AsyncMock(side_effect=IntegrityError("bad fk"))
+        )
+        uploaded_file = TestCreateImages.make_file(mocker, "a.png")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.create_image(ImageCreate(dataset_id=uuid4()), uuid4(), uploaded_file)
+
+        assert exc_info.value.status_code == 500
+        crud.storage_service.delete_file.assert_awaited_once()
+
+
+class TestFinalizeUploads:
+    """Test registration of directly uploaded objects."""
+
+    @pytest.fixture
+    def crud(self, mocker) -> ImageCRUD:
+        crud = ImageCRUD()
+        crud.storage_service = mocker.MagicMock()
+        crud.storage_service.default_bucket = "test-images"
+        crud.storage_service.get_file_metadata = mocker.AsyncMock(
+            return_value={"ContentType": "image/png", "ContentLength": 100}
+        )
+        crud.storage_service.hash_object = mocker.AsyncMock(
+            side_effect=lambda key, **_: hashlib.sha256(key.encode()).hexdigest()
+        )
+        crud.storage_service.delete_file = mocker.AsyncMock()
+        return crud
+
+    @pytest.fixture
+    def registered(self, mocker) -> list[Image]:
+        existing: list[Image] = []
+        mock_query = mocker.MagicMock()
+        mock_query.values_list = mocker.AsyncMock(return_value=[])
+
+        def filter_images(**kwargs):
+            if "filepath__in" in kwargs:
+                return mock_query
+            return mocker.AsyncMock(return_value=existing)()
+
+        mocker.patch.object(Image, "filter", side_effect=filter_images)
+        return existing
+
+    async def test_creates_records_for_verified_objects(
+        self, crud: ImageCRUD, registered, mocker
+    ):
+        dataset_id = uuid4()
+        bulk_create = mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        files = [ImageFinalizeFileIn(filename="a.png", object_key=f"{dataset_id}/x.png")]
+
+        outcomes = await crud.finalize_uploads(
+            ImageCreate(dataset_id=dataset_id), uuid4(), files
+        )
+
+        assert outcomes[0].image is not None
+        assert outcomes[0].image.filepath == f"{dataset_id}/x.png"
+        assert outcomes[0].image.content_hash == (
+            hashlib.sha256(f"{dataset_id}/x.png".encode()).hexdigest()
+        )
+        bulk_create.assert_awaited_once()
+
+    async def test_removes_objects_of_existing_content(
+        self, crud: ImageCRUD, registered, mocker
+    ):
+        dataset_id = uuid4()
+        bulk_create = mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        existing = Image(
+            id=uuid4(),
+            filepath=f"{dataset_id}/old.png",
+            content_hash=hashlib.sha256(f"{dataset_id}/x.png".encode()).hexdigest(),
+        )
+        registered.append(existing)
+        files = [ImageFinalizeFileIn(filename="a.png", object_key=f"{dataset_id}/x.png")]
+
+        outcomes = await crud.finalize_uploads(
+            ImageCreate(dataset_id=dataset_id), uuid4(), files
+        )
+
+        assert outcomes[0].image is existing
+        assert outcomes[0].duplicate
+        crud.storage_service.delete_file.assert_awaited_once()
+        bulk_create.assert_not_awaited()
+
+    async def test_key_registered_concurrently_is_conflict(self, crud: ImageCRUD, mocker):
+        dataset_id = uuid4()
+        object_key = f"{dataset_id}/x.png"
+        concurrent = Image(id=uuid4(), filepath=object_key)
+        mock_filter(mocker, by_key=[[], [concurrent]])
+        bulk_create = mocker.patch.object(
+            Image, "bulk_create", mocker.AsyncMock(side_effect=IntegrityError("filepath"))
+        )
+        files = [ImageFinalizeFileIn(filename="a.png", object_key=object_key)]
+
+        outcomes = await crud.finalize_uploads(
+            ImageCreate(dataset_id=dataset_id), uuid4(), files
+        )
+
+        assert outcomes[0].image is None
+        assert outcomes[0].error == "Upload already finalized"
+        bulk_create.assert_awaited_once()
+        crud.storage_service.delete_file.assert_not_awaited()
+
+    async def test_rejects_keys_outside_dataset_prefix(
+        self, crud: ImageCRUD, registered, mocker
+    ):
+        bulk_create = mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        files = [ImageFinalizeFileIn(filename="a.png", object_key=f"{uuid4()}/x.png")]
+
+        outcomes = await crud.finalize_uploads(
+            ImageCreate(dataset_id=uuid4()), uuid4(), files
+        )
+
+        assert outcomes[0].image is None
+        assert outcomes[0].error == "Invalid object key"
+        crud.storage_service.get_file_metadata.assert_not_awaited()
+        bulk_create.assert_not_awaited()
+
+    async def test_deletes_objects_failing_verification(
+        self, crud: ImageCRUD, registered, mocker
+    ):
+        dataset_id = uuid4()
+        mocker.patch.object(Image, "bulk_create", mocker.AsyncMock())
+        crud.storage_service.get_file_metadata.return_value = {
+            "ContentType": "application/pdf",
+            "ContentLength": 100,
+        }
+        files = [ImageFinalizeFileIn(filename="a.png", object_key=f"{dataset_id}/x.png")]
+
+        outcomes = await crud.finalize_uploads(
+            ImageCreate(dataset_id=dataset_id), uuid4(), files
+        )
+
+        assert outcomes[0].error == "Invalid file type"
+        crud.storage_service.delete_file.assert_awaited_once()
@@ -0,0 +1,254 @@
+"""Unit tests for resumable upload sessions."""
+
+from uuid import uuid4
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import HTTPException
+
+from bioscopeai_core.app.crud.image import UploadSessionCRUD
+from bioscopeai_core.app.models.image import Image, UploadSession, UploadSessionStatus
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def make_session(
+    received_bytes: int = 0,
+    total_size: int = 25,
+    status: UploadSessionStatus = UploadSessionStatus.ACTIVE,
+) -> UploadSession:
+    return UploadSession(
+        id=uuid4(),
+        object_key="ds/a.tif",
+        upload_id="up-1",
+        total_size=total_size,
+        part_size=10,
+        received_bytes=received_bytes,
+        parts=[],
+        status=status,
+    )
+
+
+def s3_error(code: str = "InternalError") -> ClientError:
+    return ClientError({"Error": {"Code": code, "Message": code}}, "AbortMultipartUpload")
+
+
+class TestUploadChunk:
+    """Test chunk validation and optimistic session advancement."""
+
+    @pytest.fixture
+    def crud(self, mocker) -> UploadSessionCRUD:
+        crud = UploadSessionCRUD()
+        crud.storage_service = mocker.MagicMock()
+        crud.storage_service.upload_part = mocker.AsyncMock(
+            side_effect=lambda *args, part_number, body: {
+                "ETag": f"etag-{part_number}",
+                "PartNumber": part_number,
+            }
+        )
+        return crud
+
+    def mock_update(self, mocker, updated: int):
+        query = mocker.MagicMock()
+        query.update = mocker.AsyncMock(return_value=updated)
+        mocker.patch.object(UploadSession, "filter", return_value=query)
+        return query
+
+    async def test_advances_session_by_one_part(self, crud: UploadSessionCRUD, mocker):
+        session = make_session(received_bytes=10)
+        query = self.mock_update(mocker, updated=1)
+
+        result = await crud.upload_chunk(session, 10, stream(b"12345", b"67890"))
+
+        assert result.received_bytes == 20
+        assert result.parts == [{"ETag": "etag-2", "PartNumber": 2}]
+        UploadSession.filter.assert_called_once_with(
+            id=session.id, received_bytes=10, status=UploadSessionStatus.ACTIVE
+        )
+        assert query.update.call_args.kwargs["received_bytes"] == 20
+
+    async def test_last_chunk_may_be_short(self, crud: UploadSessionCRUD, mocker):
+        self.mock_update(mocker, updated=1)
+
+        result = await crud.upload_chunk(make_session(received_bytes=20), 20, stream(b"abcde"))
+
+        assert result.received_bytes == 25
+
+    async def test_rejects_wrong_offset(self, crud: UploadSessionCRUD):
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.upload_chunk(make_session(received_bytes=10), 0, stream(b"x" * 10))
+
+        assert exc_info.value.status_code == 409
+        crud.storage_service.upload_part.assert_not_called()
+
+    async def test_rejects_short_chunk(self, crud: UploadSessionCRUD):
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.upload_chunk(make_session(), 0, stream(b"x" * 9))
+
+        assert exc_info.value.status_code == 400
+        crud.storage_service.upload_part.assert_not_called()
+
+    async def test_rejects_concurrent_advance(self, crud: UploadSessionCRUD, mocker):
+        self.mock_update(mocker, updated=0)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.upload_chunk(make_session(), 0, stream(b"x" * 10))
+
+        assert exc_info.value.status_code == 409
+
+
+class TestCompleteSession:
+    """Test assembling a finished upload into an image."""
+
+    @pytest.fixture
+    def crud(self, mocker) -> UploadSessionCRUD:
+        crud = UploadSessionCRUD()
+        crud.storage_service = mocker.MagicMock()
+        crud.storage_service.complete_multipart_upload = mocker.AsyncMock()
+        crud.image_crud = mocker.MagicMock()
+        crud.image_crud.create_from_object = mocker.AsyncMock()
+        return crud
+
+    @pytest.fixture
+    def query(self, mocker):
+        query = mocker.MagicMock()
+        query.update = mocker.AsyncMock(return_value=1)
+        mocker.patch.object(UploadSession, "filter", return_value=query)
+        return query
+
+    async def test_assembled_object_is_hashed_and_registered(
+        self, crud: UploadSessionCRUD, query
+    ):
+        session = make_session(received_bytes=25)
+
+        image = await crud.complete_session(session)
+
+        UploadSession.filter.assert_any_call(
+            id=session.id, status=UploadSessionStatus.ACTIVE
+        )
+        assert query.update.call_args_list[0].kwargs["status"] == (
+            UploadSessionStatus.COMPLETING
+        )
+        assert image is crud.image_crud.create_from_object.return_value
+        kwargs = crud.image_crud.create_from_object.call_args.kwargs
+        assert kwargs["object_key"] == "ds/a.tif"
+        assert "content_hash" not in kwargs  # read back from storage
+        assert session.status == UploadSessionStatus.COMPLETED
+
+    async def test_rejected_duplicate_aborts_session(
+        self, crud: UploadSessionCRUD, query
+    ):
+        crud.image_crud.create_from_object.side_effect = HTTPException(
+            status_code=409, detail="Duplicate image"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.complete_session(make_session(received_bytes=25))
+
+        assert exc_info.value.status_code == 409
+        assert query.update.call_args.kwargs == {"status": UploadSessionStatus.ABORTED}
+
+
+class TestAbortSession:
+    """Test aborting sessions and cleaning up abandoned ones."""
+
+    @pytest.fixture
+    def crud(self, mocker) -> UploadSessionCRUD:
+        crud = UploadSessionCRUD()
+        crud.storage_service = mocker.MagicMock()
+        crud.storage_service.abort_multipart_upload = mocker.AsyncMock()
+        crud.storage_service.delete_file = mocker.AsyncMock()
+        return crud
+
+    @pytest.fixture
+    def query(self, mocker):
+        query = mocker.MagicMock()
+        query.update = mocker.AsyncMock(return_value=1)
+        mocker.patch.object(UploadSession, "filter", return_value=query)
+        return query
+
+    def mock_sessions(self, mocker, *sessions: UploadSession):
+        query = mocker.MagicMock()
+        query.update = mocker.AsyncMock(return_value=1)
+        lookup = mocker.AsyncMock(return_value=list(sessions))()
+        mocker.patch.object(
+            UploadSession,
+            "filter",
+            side_effect=lambda *args, **_: lookup if args else query,
+        )
+        return query
+
+    async def test_marks_aborted_once_s3_aborted(self, crud: UploadSessionCRUD, query):
+        session = make_session()
+
+        await crud.abort_session(session)
+
+        statuses = [c.kwargs["status"] for c in query.update.call_args_list]
+        assert statuses == [UploadSessionStatus.ABORTING, UploadSessionStatus.ABORTED]
+        assert session.status == UploadSessionStatus.ABORTED
+
+    async def test_failed_s3_abort_leaves_session_aborting(
+        self, crud: UploadSessionCRUD, query
+    ):
+        crud.storage_service.abort_multipart_upload.side_effect = s3_error()
+        session = make_session()
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud.abort_session(session)
+
+        assert exc_info.value.status_code == 500
+        assert query.update.await_count == 1
+        assert session.status == UploadSessionStatus.ABORTING
+
+    async def test_cleanup_continues_after_failed_session(
+        self, crud: UploadSessionCRUD, mocker
+    ):
+        failing, expired = make_session(), make_session()
+        self.mock_sessions(mocker, failing, expired)
+        crud.storage_service.abort_multipart_upload.side_effect = [s3_error(), None]
+
+        settled = await crud.abort_expired_sessions()
+
+        assert settled == 1
+        assert crud.storage_service.abort_multipart_upload.await_count == 2
+        assert failing.status == UploadSessionStatus.ABORTING
+        assert expired.status == UploadSessionStatus.ABORTED
+
+    async def test_cleanup_retries_aborting_sessions(
+        self, crud: UploadSessionCRUD, mocker
+    ):
+        session = make_session(status=UploadSessionStatus.ABORTING)
+        query = self.mock_sessions(mocker, session)
+
+        await crud.abort_expired_sessions()
+
+        crud.storage_service.abort_multipart_upload.assert_awaited_once()
+        assert query.update.call_args.kwargs == {"status": UploadSessionStatus.ABORTED}
+
+    async def test_interrupted_completion_with_image_is_completed(
+        self, crud: UploadSessionCRUD, mocker
+    ):
+        session = make_session(received_bytes=25, status=UploadSessionStatus.COMPLETING)
+        self.mock_sessions(mocker, session)
+        mocker.patch.object(Image, "exists", mocker.AsyncMock(return_value=True))
+
+        await crud.abort_expired_sessions()
+
+        crud.storage_service.abort_multipart_upload.assert_not_awaited()
+        assert session.status == UploadSessionStatus.COMPLETED
+
+    async def test_interrupted_completion_without_image_is_discarded(
+        self, crud: UploadSessionCRUD, mocker
+    ):
+        session = make_session(received_bytes=25, status=UploadSessionStatus.COMPLETING)
+        self.mock_sessions(mocker, session)
+        mocker.patch.object(Image, "exists", mocker.AsyncMock(return_value=False))
+
+        await crud.abort_expired_sessions()
+
+        crud.storage_service.abort_multipart_upload.assert_awaited_once()
+        crud.storage_service.delete_file.assert_awaited_once_with("ds/a.tif")
+        assert session.status == UploadSessionStatus.ABORTED
@@ -0,0 +1,87 @@
+"""Unit tests for replaying dead-lettered classification results."""
+
+import pytest
+from aiokafka import TopicPartition
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.services.dead_letter import DeadLetterService
+
+
+DLQ_TOPIC = settings.kafka.CLASSIFICATION_RESULTS_DLQ_TOPIC
+
+
+class TestDeadLetterService:
+    """Test replaying the dead-letter topic up to its end offsets."""
+
+    @pytest.fixture
+    def consumer(self, mocker):
+        consumer = mocker.MagicMock()
+        consumer.start = mocker.AsyncMock()
+        consumer.stop = mocker.AsyncMock()
+        consumer.commit = mocker.AsyncMock()
+        consumer.getmany = mocker.AsyncMock()
+        consumer.position = mocker.AsyncMock()
+        mocker.patch(
+            "bioscopeai_core.app.services.dead_letter.AIOKafkaConsumer",
+            return_value=consumer,
+        )
+        return consumer
+
+    @pytest.fixture
+    def service(self, mocker) -> DeadLetterService:
+        service = DeadLetterService()
+        producer = mocker.MagicMock()
+        producer.dead_letter_partitions = mocker.AsyncMock(return_value={1, 0})
+        producer.replay = mocker.AsyncMock()
+        service.failed_message_producer = producer
+        return service
+
+    @staticmethod
+    def record(mocker, offset: int):
+        return mocker.MagicMock(offset=offset)
+
+    async def test_assigns_partitions_and_stops_at_end_offsets(
+        self, mocker, consumer, service: DeadLetterService
+    ):
+        tp0, tp1 = TopicPartition(DLQ_TOPIC, 0), TopicPartition(DLQ_TOPIC, 1)
+        consumer.end_offsets = mocker.AsyncMock(return_value={tp0: 2, tp1: 1})
+        records = {
+            tp0: [self.record(mocker, 0), self.record(mocker, 1)],
+            tp1: [self.record(mocker, 0)],
+        }
+        batches = [{}, records]  # an empty poll does not end the replay
+        positions = {tp0: 0, tp1: 0}
+
+        async def getmany(**_):
+            batch = batches.pop(0)
+            for tp, partition_records in batch.items():
+                positions[tp] = partition_records[-1].offset + 1
+            return batch
+
+        async def position(tp):
+            return positions[tp]
+
+        consumer.getmany.side_effect = getmany
+        consumer.position.side_effect = position
+
+        replayed = await service.replay(limit=10)
+
+        assert replayed == 3
+        consumer.assign.assert_called_once_with([tp0, tp1])
+        assert consumer.getmany.await_count == 2
+        assert service.failed_message_producer.replay.await_count == 3
+        consumer.commit.assert_awaited_once_with({tp0: 2, tp1: 1})
+        consumer.stop.assert_awaited_once()
+
+    async def test_does_not_poll_when_already_caught_up(
+        self, mocker, consumer, service: DeadLetterService
+    ):
+        tp0 = TopicPartition(DLQ_TOPIC, 0)
+        consumer.end_offsets = mocker.AsyncMock(return_value={tp0: 5})
+        consumer.position.return_value = 5
+
+        replayed = await service.replay(limit=10)
+
+        assert replayed == 0
+        consumer.getmany.assert_not_awaited()
+        consumer.stop.assert_awaited_once()
@@ -0,0 +1,85 @@
+"""Unit tests for image derivative rendering and selection."""
+
+from io import BytesIO
+
+from PIL import Image as PILImage
+
+from bioscopeai_core.app.services.derivative_service import (
+    DerivativeService,
+    render_derivatives,
+    render_object_derivatives,
+)
+
+
+def make_png(width: int, height: int) -> bytes:
+    buffer = BytesIO()
+    PILImage.new("RGB", (width, height), color=(10, 20, 30)).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class TestRenderDerivatives:
+    """Test decoding and resizing in the worker function."""
+
+    def test_renders_every_size_keeping_aspect_ratio(self):
+        rendered = render_derivatives(
+            make_png(2000, 1000), {"thumbnail": 256, "preview": 1024}, "WEBP", 80
+        )
+
+        assert rendered["preview"][1:] == (1024, 512)
+        assert rendered["thumbnail"][1:] == (256, 128)
+        with PILImage.open(BytesIO(rendered["thumbnail"][0])) as thumbnail:
+            assert thumbnail.format == "WEBP"
+
+    def test_never_upscales(self):
+        rendered = render_derivatives(make_png(100, 50), {"preview": 1024}, "WEBP", 80)
+
+        assert rendered["preview"][1:] == (100, 50)
+
+    def test_worker_downloads_original_by_key(self, mocker):
+        s3 = mocker.MagicMock()
+        s3.download_fileobj.side_effect = lambda bucket, key, spool: spool.write(
+            make_png(400, 200)
+        )
+        mocker.patch(
+            "bioscopeai_core.app.services.derivative_service.get_s3_client",
+            return_value=s3,
+        )
+
+        rendered = render_object_derivatives(
+            "bucket", "ds/a.png", {"thumbnail": 100}, "WEBP", 80
+        )
+
+        assert rendered["thumbnail"][1:] == (100, 50)
+        assert s3.download_fileobj.call_args.args[:2] == ("bucket", "ds/a.png")
+
+
+class TestSelectObjectKey:
+    """Test picking the smallest derivative that fits a requested size."""
+
+    DERIVATIVES = {
+        "thumbnail": {"key": "ds/a.thumbnail.webp", "width": 256, "height": 128},
+        "preview": {"key": "ds/a.preview.webp", "width": 1024, "height": 512},
+    }
+
+    def test_picks_smallest_fitting_derivative(self, mocker):
+        image = mocker.MagicMock(filepath="ds/a.png", derivatives=self.DERIVATIVES)
+
+        assert DerivativeService.select_object_key(image, 200) == "ds/a.thumbnail.webp"
+        assert DerivativeService.select_object_key(image, 300) == "ds/a.preview.webp"
+
+    def test_falls_back_to_original(self, mocker):
+        image = mocker.MagicMock(filepath="ds/a.png", derivatives=self.DERIVATIVES)
+
+        assert DerivativeService.select_object_key(image, 4000) == "ds/a.png"
+        assert DerivativeService.select_object_key(image) == "ds/a.png"
+
+    def test_original_when_not_generated_yet(self, mocker):
+        image = mocker.MagicMock(filepath="ds/a.png", derivatives=None)
+
+        assert DerivativeService.select_object_key(image, 100) == "ds/a.png"
+
+    def test_derivative_key_sits_beside_original(self):
+        assert (
+            DerivativeService.derivative_key("ds/abc.png", "thumbnail")
+            == "ds/abc.thumbnail.webp"
+        )
@@ -0,0 +1,54 @@
+"""Unit tests for routing failed messages to the retry and dead-letter topics."""
+
+import pytest
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.kafka.producers.failed_message_producer import (
+    ATTEMPT_HEADER,
+    FailedMessageProducer,
+    NOT_BEFORE_HEADER,
+    ORIGINAL_TOPIC_HEADER,
+)
+
+
+class TestFailedMessageProducer:
+    """Test retry scheduling, backoff and dead-lettering."""
+
+    @pytest.fixture
+    def producer(self, mocker) -> FailedMessageProducer:
+        mocker.patch.object(settings.kafka, "CONSUMER_MAX_ATTEMPTS", 3)
+        mocker.patch.object(settings.kafka, "CONSUMER_RETRY_BACKOFF_MS", 1000)
+        mocker.patch.object(settings.kafka, "CONSUMER_RETRY_BACKOFF_MAX_MS", 3000)
+        producer = FailedMessageProducer()
+        producer._producer = mocker.MagicMock()
+        producer._producer.send_and_wait = mocker.AsyncMock()
+        return producer
+
+    def test_backoff_doubles_up_to_maximum(self, producer: FailedMessageProducer):
+        assert [producer.retry_delay_ms(attempt) for attempt in (1, 2, 3)] == [
+            1000,
+            2000,
+            3000,
+        ]
+
+    async def test_schedules_retry_with_attempt_headers(
+        self, producer: FailedMessageProducer
+    ):
+        await producer.schedule_retry("a", "results", 1, RuntimeError("boom"))
+
+        kwargs = producer._producer.send_and_wait.call_args.kwargs
+        headers = dict(kwargs["headers"])
+        assert kwargs["topic"] == settings.kafka.CLASSIFICATION_RESULTS_RETRY_TOPIC
+        assert kwargs["value"] == b"a"
+        assert headers[ATTEMPT_HEADER] == b"1"
+        assert headers[ORIGINAL_TOPIC_HEADER] == b"results"
+        assert NOT_BEFORE_HEADER in headers
+
+    async def test_dead_letters_after_last_attempt(
+        self, producer: FailedMessageProducer
+    ):
+        await producer.schedule_retry("a", "results", 3, RuntimeError("boom"))
+
+        kwargs = producer._producer.send_and_wait.call_args.kwargs
+        assert kwargs["topic"] == settings.kafka.CLASSIFICATION_RESULTS_DLQ_TOPIC
+        assert dict(kwargs["headers"])[ATTEMPT_HEADER] == b"3"
@@ -0,0 +1,62 @@
+"""Unit tests for aiokafka client arguments built from KafkaSettings."""
+
+from pydantic import SecretStr
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.kafka import connection
+
+
+class TestSecurityKwargs:
+    """Test the security protocol chosen from the SSL and SASL settings."""
+
+    def test_plaintext_by_default(self):
+        kafka_settings = settings.kafka.model_copy(
+            update={"SSL_ENABLED": False, "SASL_ENABLED": False}
+        )
+
+        assert connection.security_kwargs(kafka_settings) == {
+            "security_protocol": "PLAINTEXT"
+        }
+
+    def test_ssl_context_from_certificate_files(self, mocker):
+        create_ssl_context = mocker.patch.object(connection, "create_ssl_context")
+        kafka_settings = settings.kafka.model_copy(
+            update={"SSL_ENABLED": True, "SASL_ENABLED": False, "SSL_CAFILE": "ca.pem"}
+        )
+
+        kwargs = connection.security_kwargs(kafka_settings)
+
+        assert kwargs["security_protocol"] == "SSL"
+        assert kwargs["ssl_context"] is create_ssl_context.return_value
+        assert create_ssl_context.call_args.kwargs["cafile"] == "ca.pem"
+
+    def test_sasl_over_ssl(self, mocker):
+        mocker.patch.object(connection, "create_ssl_context")
+        kafka_settings = settings.kafka.model_copy(
+            update={
+                "SSL_ENABLED": True,
+                "SASL_ENABLED": True,
+                "SASL_USERNAME": "core",
+                "SASL_PASSWORD": SecretStr("secret"),
+            }
+        )
+
+        kwargs = connection.security_kwargs(kafka_settings)
+
+        assert kwargs["security_protocol"] == "SASL_SSL"
+        assert kwargs["sasl_plain_username"] == "core"
+        assert kwargs["sasl_plain_password"] == "secret"
+
+
+class TestClientKwargs:
+    """Test that tuning settings reach the clients."""
+
+    def test_producer_batching_settings_are_applied(self):
+        kafka_settings = settings.kafka.model_copy(
+            update={"PRODUCER_LINGER_MS": 20, "PRODUCER_COMPRESSION_TYPE": "gzip"}
+        )
+
+        kwargs = connection.producer_kwargs(kafka_settings)
+
+        assert kwargs["linger_ms"] == 20
+        assert kwargs["compression_type"] == "gzip"
@@ -0,0 +1,70 @@
+"""Check that model ``Meta.indexes`` and the migrations declare the same indexes."""
+
+import hashlib
+import re
+from pathlib import Path
+
+import pytest
+from tortoise.models import Model
+
+from bioscopeai_core.app.models import (
+    Classification,
+    ClassificationJobOutbox,
+    ClassificationResult,
+    Image,
+    RefreshToken,
+)
+
+
+MIGRATIONS_DIR = Path(__file__).parents[3] / "migrations" / "models"
+CREATE_INDEX = re.compile(
+    r'CREATE INDEX (?:CONCURRENTLY )?IF NOT EXISTS "(\w+)" ON "(\w+)" \(([^)]*)\)'
+)
+DROP_INDEX = re.compile(r'DROP INDEX (?:CONCURRENTLY )?IF EXISTS "(\w+)"')
+
+
+def index_name(table: str, columns: list[str]) -> str:
+    """Index name as generated by Tortoise ORM and aerich."""
+    digest = hashlib.sha256(";".join([table, *columns]).encode()).hexdigest()[:6]
+    return f"idx_{table[:11]}_{columns[0][:7]}_{digest}"
+
+
+def migrated_indexes() -> dict[str, tuple[str, list[str]]]:
+    """Indexes left after applying every migration's upgrade, by name."""
+    indexes: dict[str, tuple[str, list[str]]] = {}
+    migrations = sorted(
+        MIGRATIONS_DIR.glob("*.py"), key=lambda path: int(path.name.split("_", 1)[0])
+    )
+    for path in migrations:
+        upgrade = path.read_text().split("async def downgrade", 1)[0]
+        for name, table, columns in CREATE_INDEX.findall(upgrade):
+            indexes[name] = (table, [c.strip().strip('"') for c in columns.split(",")])
+        for name in DROP_INDEX.findall(upgrade):
+            indexes.pop(name, None)
+    return indexes
+
+
+def model_indexes(model: type[Model]) -> list[list[str]]:
+    indexes = model._meta.indexes
+    if indexes and isinstance(indexes[0], str):
+        indexes = (indexes,)
+    return [
+        [model._meta.fields_db_projection[field] for field in index]
+        for index in indexes
+    ]
+
+
+@pytest.mark.parametrize(
+    "model",
+    [Image, Classification, ClassificationResult, ClassificationJobOutbox, RefreshToken],
+)
+def test_model_indexes_match_migrations(model: type[Model]):
+    table = model._meta.db_table
+    migrated = {
+        name: columns
+        for name, (index_table, columns) in migrated_indexes().items()
+        if index_table == table
+    }
+    declared = {index_name(table, columns): columns for columns in model_indexes(model)}
+
+    assert declared == migrated
@@ -0,0 +1,103 @@
+"""Unit tests for offset tracking and the consumer commit policy."""
+
+import pytest
+from aiokafka import TopicPartition
+
+from bioscopeai_core.app.kafka.consumers.base_consumer import (
+    _processing,
+    BaseKafkaConsumer,
+)
+from bioscopeai_core.app.kafka.consumers.offset_tracker import OffsetTracker
+
+
+TP = TopicPartition("results", 0)
+
+
+def make_records(mocker, offsets: list[int]) -> list:
+    return [
+        mocker.MagicMock(topic=TP.topic, partition=TP.partition, offset=offset)
+        for offset in offsets
+    ]
+
+
+class TestOffsetTracker:
+    """Test the highest contiguous processed offset."""
+
+    def test_advances_over_contiguous_acks_only(self, mocker):
+        tracker = OffsetTracker()
+        records = make_records(mocker, [0, 1, 2, 5])
+        tracker.track(records)
+
+        tracker.ack([records[0], records[2]])
+        assert tracker.uncommitted() == {TP: 1}
+
+        tracker.ack([records[1], records[3]])
+        assert tracker.uncommitted() == {TP: 6}
+
+    def test_committed_offsets_are_not_returned_again(self, mocker):
+        tracker = OffsetTracker()
+        records = make_records(mocker, [0])
+        tracker.track(records)
+        tracker.ack(records)
+
+        tracker.mark_committed(tracker.uncommitted())
+
+        assert tracker.uncommitted() == {}
+        assert tracker.acked_since_commit == 0
+
+    def test_ignores_acks_of_forgotten_partitions(self, mocker):
+        tracker = OffsetTracker()
+        records = make_records(mocker, [0])
+        tracker.track(records)
+        tracker.forget([TP])
+
+        tracker.ack(records)
+
+        assert tracker.uncommitted() == {}
+
+
+class _Consumer(BaseKafkaConsumer):
+    async def process_message(self, message: str) -> None:
+        await self.commit_message()
+
+    def _get_topic_name(self) -> str:
+        return TP.topic
+
+    def _get_group_id(self) -> str:
+        return "test-group"
+
+
+class TestCommitPolicy:
+    """Test commits every N messages and on partition release."""
+
+    @pytest.fixture
+    def consumer(self, mocker):
+        consumer = _Consumer()
+        consumer._offsets = OffsetTracker()
+        consumer.commit_every_messages = 3
+        consumer._consumer = mocker.MagicMock()
+        consumer._consumer.commit = mocker.AsyncMock()
+        yield consumer
+        consumer._consumer = None
+
+    async def test_commits_after_every_n_messages(self, consumer, mocker):
+        records = make_records(mocker, [0, 1, 2, 3])
+        consumer._offsets.track(records)
+
+        with _processing(records):
+            await consumer.process_one_by_one(["a", "b", "c", "d"])
+
+        consumer._consumer.commit.assert_awaited_once_with({TP: 3})
+
+    async def test_commits_processed_work_of_released_partitions(
+        self, consumer, mocker
+    ):
+        records = make_records(mocker, [0, 1])
+        consumer._offsets.track(records)
+        with _processing(records[:1]):
+            await consumer.commit_message()
+
+        await consumer._release_partitions([TP])
+
+        consumer._consumer.commit.assert_awaited_once_with({TP: 1})
+        assert consumer._offsets.uncommitted() == {}
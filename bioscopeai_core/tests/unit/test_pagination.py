@@ -0,0 +1,52 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import datetime, UTC
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from bioscopeai_core.app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_ordering,
+    next_cursor,
+)
+
+
+class TestCursors:
+    """Test cursor encoding, validation and page boundaries."""
+
+    def test_round_trips_datetime_and_id(self):
+        value = datetime(2025, 11, 20, 12, 30, tzinfo=UTC)
+        obj_id = uuid4()
+
+        cursor = encode_cursor("-uploaded_at", value, obj_id)
+
+        assert decode_cursor(cursor, "-uploaded_at") == (value, obj_id)
+
+    def test_rejects_cursor_for_other_ordering(self):
+        cursor = encode_cursor("filename", "a.png", uuid4())
+
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor(cursor, "-filename")
+
+        assert exc_info.value.status_code == 400
+
+    def test_rejects_garbage(self):
+        with pytest.raises(HTTPException) as exc_info:
+            decode_cursor("not-a-cursor", "filename")
+
+        assert exc_info.value.status_code == 400
+
+    def test_orders_by_id_in_the_same_direction(self):
+        assert keyset_ordering("-uploaded_at") == ("-uploaded_at", "-id")
+        assert keyset_ordering("filename") == ("filename", "id")
+
+    def test_next_cursor_only_for_full_pages(self):
+        rows = [SimpleNamespace(id=uuid4(), filename=f"{i}.png") for i in range(3)]
+
+        assert next_cursor(rows[:2], "filename", 3) is None
+        cursor = next_cursor(rows, "filename", 3)
+        assert decode_cursor(cursor, "filename") == ("2.png", rows[2].id)
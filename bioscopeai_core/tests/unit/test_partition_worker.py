@@ -0,0 +1,52 @@
+"""Unit tests for per-partition Kafka workers."""
+
+import asyncio
+
+from aiokafka import TopicPartition
+
+from bioscopeai_core.app.kafka.consumers.partition_worker import PartitionWorker
+
+
+def make_records(mocker, offsets: range) -> list:
+    return [mocker.MagicMock(offset=offset) for offset in offsets]
+
+
+class TestPartitionWorker:
+    """Test ordering, backpressure accounting and failure handling."""
+
+    tp = TopicPartition("results", 0)
+
+    async def test_processes_batches_in_order(self, mocker):
+        seen: list[int] = []
+        progress = mocker.MagicMock()
+
+        async def handler(records):
+            await asyncio.sleep(0)
+            seen.extend(record.offset for record in records)
+
+        worker = PartitionWorker(self.tp, handler, progress)
+        worker.submit(make_records(mocker, range(0, 3)))
+        worker.submit(make_records(mocker, range(3, 5)))
+        assert worker.in_flight == 5
+
+        await worker.drain(timeout=1)
+
+        assert seen == [0, 1, 2, 3, 4]
+        assert worker.in_flight == 0
+        assert progress.call_count == 2
+        await worker.stop()
+
+    async def test_failed_batch_stops_worker(self, mocker):
+        async def handler(records):
+            if records[0].offset == 2:
+                raise RuntimeError("db down")
+
+        worker = PartitionWorker(self.tp, handler, mocker.MagicMock())
+        worker.submit(make_records(mocker, range(0, 2)))
+        worker.submit(make_records(mocker, range(2, 4)))
+
+        await worker.drain(timeout=1)
+
+        assert worker.in_flight == 2
+        assert isinstance(worker.error, RuntimeError)
+        await worker.stop()
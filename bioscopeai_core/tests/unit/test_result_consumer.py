@@ -0,0 +1,199 @@
+"""Unit tests for batch processing and failure handling in the result consumers."""
+
+import pytest
+
+from bioscopeai_core.app.kafka.consumers.result_consumer import (
+    ClassificationResultConsumer,
+)
+from bioscopeai_core.app.kafka.consumers.retry_consumer import (
+    ClassificationResultRetryConsumer,
+)
+from bioscopeai_core.app.kafka.producers.failed_message_producer import (
+    ATTEMPT_HEADER,
+    ORIGINAL_TOPIC_HEADER,
+)
+
+
+class TestProcessBatch:
+    """Test batch storage, commits and the per-message fallback."""
+
+    @pytest.fixture
+    def consumer(self, mocker) -> ClassificationResultConsumer:
+        consumer = ClassificationResultConsumer()
+        consumer.classification_result_service = mocker.MagicMock()
+        consumer.classification_result_service.process_classification_results = (
+            mocker.AsyncMock()
+        )
+        consumer.classification_result_service.process_classification_result = (
+            mocker.AsyncMock()
+        )
+        consumer.failed_message_producer = mocker.MagicMock()
+        consumer.failed_message_producer.schedule_retry = mocker.AsyncMock()
+        consumer.failed_message_producer.dead_letter = mocker.AsyncMock()
+        mocker.patch.object(consumer, "commit_message", mocker.AsyncMock())
+        return consumer
+
+    async def test_commits_once_per_batch(self, consumer: ClassificationResultConsumer):
+        await consumer.process_batch(["a", "b", "c"])
+
+        service = consumer.classification_result_service
+        service.process_classification_results.assert_awaited_once_with(
+            classification_result_events=["a", "b", "c"], rejected=[]
+        )
+        service.process_classification_result.assert_not_awaited()
+        consumer.commit_message.assert_awaited_once()
+
+    async def test_falls_back_to_single_messages_when_batch_fails(
+        self, consumer: ClassificationResultConsumer
+    ):
+        service = consumer.classification_result_service
+        service.process_classification_results.side_effect = RuntimeError("boom")
+        service.process_classification_result.side_effect = [None, RuntimeError(), None]
+
+        await consumer.process_batch(["a", "b", "c"])
+
+        assert service.process_classification_result.await_count == 3
+        consumer.failed_message_producer.schedule_retry.assert_awaited_once()
+        assert consumer.commit_message.await_count == 3
+
+    async def test_dead_letters_invalid_messages_of_stored_batch(
+        self, consumer: ClassificationResultConsumer
+    ):
+        error = ValueError("Invalid JSON format")
+
+        async def reject(classification_result_events, rejected):
+            rejected.append(("b", error))
+
+        service = consumer.classification_result_service
+        service.process_classification_results.side_effect = reject
+
+        await consumer.process_batch(["a", "b"])
+
+        consumer.failed_message_producer.dead_letter.assert_awaited_once_with(
+            "b", consumer._get_topic_name(), 1, error
+        )
+        consumer.commit_message.assert_awaited_once()
+
+    async def test_raises_without_commit_when_rejected_cannot_be_handed_over(
+        self, consumer: ClassificationResultConsumer, mocker
+    ):
+        mocker.patch("bioscopeai_core.app.kafka.consumers.result_consumer.asyncio.sleep")
+
+        async def reject(classification_result_events, rejected):
+            rejected.append(("b", ValueError("Invalid JSON format")))
+
+        service = consumer.classification_result_service
+        service.process_classification_results.side_effect = reject
+        consumer.failed_message_producer.dead_letter.side_effect = RuntimeError()
+
+        with pytest.raises(RuntimeError):
+            await consumer.process_batch(["a", "b"])
+
+        consumer.commit_message.assert_not_awaited()
+
+
+class TestProcessMessage:
+    """Test routing of messages that fail processing."""
+
+    @pytest.fixture
+    def consumer(self, mocker) -> ClassificationResultConsumer:
+        consumer = ClassificationResultConsumer()
+        consumer.classification_result_service = mocker.MagicMock()
+        consumer.classification_result_service.process_classification_result = (
+            mocker.AsyncMock(side_effect=RuntimeError("database is down"))
+        )
+        consumer.failed_message_producer = mocker.MagicMock()
+        consumer.failed_message_producer.schedule_retry = mocker.AsyncMock()
+        consumer.failed_message_producer.dead_letter = mocker.AsyncMock()
+        mocker.patch.object(consumer, "commit_message", mocker.AsyncMock())
+        return consumer
+
+    async def test_schedules_retry_and_moves_on(
+        self, consumer: ClassificationResultConsumer
+    ):
+        await consumer.process_message("a")
+
+        producer = consumer.failed_message_producer
+        producer.schedule_retry.assert_awaited_once()
+        assert producer.schedule_retry.call_args.args[:3] == (
+            "a",
+            consumer._get_topic_name(),
+            1,
+        )
+        consumer.commit_message.assert_awaited_once()
+
+    async def test_dead_letters_invalid_message(
+        self, consumer: ClassificationResultConsumer
+    ):
+        service = consumer.classification_result_service
+        service.process_classification_result.side_effect = ValueError("bad")
+
+        await consumer.process_message("a")
+
+        consumer.failed_message_producer.dead_letter.assert_awaited_once()
+        consumer.failed_message_producer.schedule_retry.assert_not_awaited()
+        consumer.commit_message.assert_awaited_once()
+
+    async def test_retries_handover_with_backoff(
+        self, consumer: ClassificationResultConsumer, mocker
+    ):
+        sleep = mocker.patch(
+            "bioscopeai_core.app.kafka.consumers.result_consumer.asyncio.sleep"
+        )
+        producer = consumer.failed_message_producer
+        producer.schedule_retry.side_effect = [RuntimeError(), RuntimeError(), None]
+
+        await consumer.process_message("a")
+
+        assert producer.schedule_retry.await_count == 3
+        assert [c.args[0] for c in sleep.await_args_list] == [
+            consumer._retry_delay,
+            consumer._retry_delay * 2,
+        ]
+        consumer.commit_message.assert_awaited_once()
+
+    async def test_raises_without_commit_when_handover_keeps_failing(
+        self, consumer: ClassificationResultConsumer, mocker
+    ):
+        mocker.patch("bioscopeai_core.app.kafka.consumers.result_consumer.asyncio.sleep")
+        producer = consumer.failed_message_producer
+        producer.schedule_retry.side_effect = RuntimeError("broker down")
+
+        with pytest.raises(RuntimeError, match="broker down"):
+            await consumer.process_message("a")
+
+        assert producer.schedule_retry.await_count == consumer._max_retries
+        consumer.commit_message.assert_not_awaited()
+
+
+class TestRetryConsumer:
+    """Test retries of messages from the retry topic."""
+
+    @pytest.fixture
+    def consumer(self, mocker) -> ClassificationResultRetryConsumer:
+        consumer = ClassificationResultRetryConsumer()
+        consumer.classification_result_service = mocker.MagicMock()
+        consumer.classification_result_service.process_classification_result = (
+            mocker.AsyncMock(side_effect=RuntimeError("database is down"))
+        )
+        consumer.failed_message_producer = mocker.MagicMock()
+        consumer.failed_message_producer.schedule_retry = mocker.AsyncMock()
+        mocker.patch.object(consumer, "commit_message", mocker.AsyncMock())
+        return consumer
+
+    async def test_counts_attempt_and_keeps_original_topic(
+        self, consumer: ClassificationResultRetryConsumer, mocker
+    ):
+        record = mocker.MagicMock(
+            value=b"a",
+            headers=[(ATTEMPT_HEADER, b"2"), (ORIGINAL_TOPIC_HEADER, b"results")],
+        )
+
+        await consumer.process_record(record)
+
+        assert consumer.failed_message_producer.schedule_retry.call_args.args[:3] == (
+            "a",
+            "results",
+            3,
+        )
+        consumer.commit_message.assert_awaited_once()
@@ -0,0 +1,97 @@
+"""Unit tests for running boto3 calls in the bounded S3 executor."""
+
+import asyncio
+import threading
+
+import pytest
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.core.s3_client import (
+    get_s3_executor,
+    run_s3_call,
+    shutdown_s3_executor,
+)
+from bioscopeai_core.app.main import app, lifespan
+
+
+@pytest.fixture(autouse=True)
+def fresh_executor():
+    shutdown_s3_executor()
+    yield
+    shutdown_s3_executor()
+
+
+class TestRunS3Call:
+    """Test that blocking S3 calls run in the dedicated, bounded thread pool."""
+
+    async def test_runs_call_in_s3_executor(self):
+        def call(bucket: str, key: str) -> tuple[str, str, str]:
+            return threading.current_thread().name, bucket, key
+
+        thread_name, bucket, key = await run_s3_call(call, "bucket", key="a.png")
+
+        assert thread_name.startswith("s3")
+        assert (bucket, key) == ("bucket", "a.png")
+
+    async def test_limits_calls_in_flight_to_max_concurrency(self, mocker):
+        mocker.patch.object(settings.minio, "MAX_CONCURRENCY", 2)
+        lock = threading.Lock()
+        release = threading.Event()
+        in_flight = 0
+        peak = 0
+
+        def call() -> None:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            release.wait(timeout=5)
+            with lock:
+                in_flight -= 1
+
+        calls = asyncio.gather(*(run_s3_call(call) for _ in range(5)))
+        await asyncio.sleep(0.1)
+        release.set()
+        await calls
+
+        assert peak == 2
+
+    def test_shutdown_replaces_executor(self):
+        executor = get_s3_executor()
+
+        shutdown_s3_executor()
+
+        assert executor._shutdown
+        assert get_s3_executor() is not executor
+
+
+class TestLifespan:
+    """Test that application shutdown releases the S3 executor."""
+
+    @pytest.fixture
+    def services(self, mocker):
+        for name in (
+            "init_db",
+            "close_db",
+            "ensure_bucket_exists",
+            "start_result_consumers",
+            "stop_result_consumers",
+            "run_upload_session_gc",
+            "run_outbox_relay",
+        ):
+            mocker.patch(f"bioscopeai_core.app.main.{name}", mocker.AsyncMock())
+        for name in ("get_classification_producer", "get_failed_message_producer"):
+            producer = mocker.MagicMock()
+            producer.initialize = mocker.AsyncMock()
+            producer.shutdown = mocker.AsyncMock()
+            mocker.patch(f"bioscopeai_core.app.main.{name}", return_value=producer)
+        mocker.patch("bioscopeai_core.app.main.setup_logger")
+        mocker.patch("bioscopeai_core.app.main.shutdown_derivative_executor")
+
+    async def test_shuts_down_s3_executor(self, services):
+        async with lifespan(app):
+            executor = get_s3_executor()
+            assert not executor._shutdown
+
+        assert executor._shutdown
+        assert get_s3_executor.cache_info().currsize == 0
@@ -0,0 +1,225 @@
+"""Unit tests for StorageService uploads and presigned URL caching."""
+
+import hashlib
+import time
+from io import BytesIO
+
+import pytest
+from botocore.exceptions import ClientError
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+
+from bioscopeai_core.app.core.config import settings
+from bioscopeai_core.app.services.presigned_url_cache import (
+    PresignedUrl,
+    PresignedUrlCache,
+)
+from bioscopeai_core.app.services.storage_service import StorageService
+
+
+def make_upload(data: bytes, filename: str = "image.png") -> UploadFile:
+    return UploadFile(
+        file=BytesIO(data),
+        filename=filename,
+        headers=Headers({"content-type": "image/png"}),
+    )
+
+
+class TestUploadFile:
+    """Test chunked upload to S3/MinIO."""
+
+    @pytest.fixture
+    def service(self, mocker) -> StorageService:
+        service = StorageService()
+        service.s3_client = mocker.MagicMock()
+        service.s3_client.create_multipart_upload.return_value = {"UploadId": "up-1"}
+        service.s3_client.upload_part.side_effect = lambda **kw: {
+            "ETag": f"etag-{kw['PartNumber']}"
+        }
+        return service
+
+    @pytest.fixture(autouse=True)
+    def small_parts(self, mocker):
+        mocker.patch.object(settings.image, "UPLOAD_CHUNK_SIZE", 4)
+        mocker.patch.object(settings.minio, "MULTIPART_PART_SIZE", 10)
+
+    async def test_small_file_uses_single_put(self, service: StorageService):
+        await service.upload_file(make_upload(b"12345"), object_name="a.png")
+
+        service.s3_client.put_object.assert_called_once()
+        assert service.s3_client.put_object.call_args.kwargs["Body"] == b"12345"
+        service.s3_client.create_multipart_upload.assert_not_called()
+
+    async def test_large_file_uses_multipart_upload(self, service: StorageService):
+        data = b"x" * 25
+
+        await service.upload_file(make_upload(data), object_name="a.png")
+
+        bodies = [
+            c.kwargs["Body"] for c in service.s3_client.upload_part.call_args_list
+        ]
+        assert b"".join(bodies) == data
+        assert all(len(body) == 10 for body in bodies[:-1])
+        service.s3_client.complete_multipart_upload.assert_called_once()
+        parts = service.s3_client.complete_multipart_upload.call_args.kwargs[
+            "MultipartUpload"
+        ]["Parts"]
+        assert [p["PartNumber"] for p in parts] == [1, 2, 3]
+        service.s3_client.put_object.assert_not_called()
+
+    async def test_passes_every_chunk_to_callback(self, service: StorageService):
+        digest = hashlib.sha256()
+
+        await service.upload_file(
+            make_upload(b"x" * 25), object_name="a.png", on_chunk=digest.update
+        )
+
+        assert digest.hexdigest() == hashlib.sha256(b"x" * 25).hexdigest()
+
+    async def test_rejects_empty_file(self, service: StorageService):
+        with pytest.raises(HTTPException) as exc_info:
+            await service.upload_file(make_upload(b""), object_name="a.png")
+
+        assert exc_info.value.status_code == 400
+        service.s3_client.put_object.assert_not_called()
+
+    async def test_aborts_multipart_when_file_too_large(self, service: StorageService):
+        with pytest.raises(HTTPException) as exc_info:
+            await service.upload_file(
+                make_upload(b"x" * 30), object_name="a.png", max_size=20
+            )
+
+        assert exc_info.value.status_code == 400
+        service.s3_client.abort_multipart_upload.assert_called_once_with(
+            Bucket=service.default_bucket, Key="a.png", UploadId="up-1"
+        )
+        service.s3_client.complete_multipart_upload.assert_not_called()
+
+
+class TestDownloadBytes:
+    """Test reading whole objects from S3/MinIO."""
+
+    async def test_missing_object_is_not_found(self, mocker):
+        service = StorageService()
+        service.s3_client = mocker.MagicMock()
+        service.s3_client.get_object.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchKey", "Message": "missing"}}, "GetObject"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await service.download_bytes("ds/a_files/9/0_0.jpeg")
+
+        assert exc_info.value.status_code == 404
+
+
+class TestAbortMultipartUpload:
+    """Test aborting multipart uploads."""
+
+    @pytest.fixture
+    def service(self, mocker) -> StorageService:
+        service = StorageService()
+        service.s3_client = mocker.MagicMock()
+        return service
+
+    async def test_raises_client_errors(self, service: StorageService):
+        service.s3_client.abort_multipart_upload.side_effect = ClientError(
+            {"Error": {"Code": "SlowDown", "Message": "busy"}}, "AbortMultipartUpload"
+        )
+
+        with pytest.raises(ClientError):
+            await service.abort_multipart_upload("bucket", "ds/a.tif", "up-1")
+
+    async def test_missing_upload_counts_as_aborted(self, service: StorageService):
+        service.s3_client.abort_multipart_upload.side_effect = ClientError(
+            {"Error": {"Code": "NoSuchUpload", "Message": "gone"}},
+            "AbortMultipartUpload",
+        )
+
+        await service.abort_multipart_upload("bucket", "ds/a.tif", "up-1")
+
+
+class TestHashObject:
+    """Test hashing stored objects."""
+
+    async def test_hashes_object_in_chunks(self, mocker):
+        service = StorageService()
+        service.s3_client = mocker.MagicMock()
+        body = service.s3_client.get_object.return_value["Body"]
+        body.iter_chunks.return_value = [b"ab", b"c"]
+
+        content_hash = await service.hash_object("ds/a.png")
+
+        assert content_hash == hashlib.sha256(b"abc").hexdigest()
+        body.iter_chunks.assert_called_once_with(settings.image.UPLOAD_CHUNK_SIZE)
+
+
+class TestPresignedUrlCache:
+    """Test presigned URL reuse and eviction."""
+
+    @pytest.fixture
+    def cache(self) -> PresignedUrlCache:
+        return PresignedUrlCache(max_size=2, min_remaining_ratio=0.5)
+
+    def test_reuses_fresh_entry(self, cache: PresignedUrlCache):
+        key = ("bucket", "a.png", "inline", 3600)
+        entry = PresignedUrl(url="u", expires_at=time.time() + 3600)
+        cache.put(key, entry)
+
+        assert cache.get(key) == entry
+        assert cache.stats() == {"hits": 1, "misses": 0, "size": 1}
+
+    def test_drops_entry_below_safety_margin(self, cache: PresignedUrlCache):
+        key = ("bucket", "a.png", "inline", 3600)
+        cache.put(key, PresignedUrl(url="u", expires_at=time.time() + 600))
+
+        assert cache.get(key) is None
+        assert cache.stats() == {"hits": 0, "misses": 1, "size": 0}
+
+    def test_evicts_least_recently_used(self, cache: PresignedUrlCache):
+        keys = [("bucket", f"{i}.png", None, 60) for i in range(3)]
+        for key in keys:
+            cache.put(key, PresignedUrl(url=key[1], expires_at=time.time() + 60))
+
+        assert cache.get(keys[0]) is None
+        assert cache.get(keys[2]) is not None
+
+    def test_invalidate_drops_only_that_object(self, cache: PresignedUrlCache):
+        inline = ("bucket", "a.png", "inline", 3600)
+        other = ("bucket", "b.png", "inline", 3600)
+        for key in (inline, other):
+            cache.put(key, PresignedUrl(url=key[1], expires_at=time.time() + 3600))
+
+        cache.invalidate("bucket", "a.png")
+        cache.invalidate("bucket", "a.png")
+
+        assert cache.get(inline) is None
+        assert cache.get(other) is not None
+
+    async def test_storage_service_signs_once_per_key(self, mocker):
+        service = StorageService()
+        service.s3_client = mocker.MagicMock()
+        service.s3_client.generate_presigned_url.return_value = "signed"
+        service.presigned_url_cache = PresignedUrlCache(10, 0.5)
+
+        first = await service.get_presigned_url("a.png", expires_in=3600)
+        second = await service.get_presigned_url("a.png", expires_in=3600)
+
+        assert first == second == "signed"
+        service.s3_client.generate_presigned_url.assert_called_once()
+
+    async def test_batch_signing_only_signs_misses(self, mocker):
+        service = StorageService()
+        service.s3_client = mocker.MagicMock()
+        service.s3_client.generate_presigned_url.side_effect = (
+            lambda *args, **kwargs: f"signed-{kwargs['Params']['Key']}"
+        )
+        service.presigned_url_cache = PresignedUrlCache(10, 0.5)
+        await service.get_presigned_url("a.png", expires_in=3600)
+
+        urls = await service.generate_presigned_gets(["a.png", "b.png"], expires_in=3600)
+
+        assert {key: url.url for key, url in urls.items()} == {
+            "a.png": "signed-a.png",
+            "b.png": "signed-b.png",
+        }
+        assert service.s3_client.generate_presigned_url.call_count == 2
@@ -0,0 +1,128 @@
+"""Unit tests for deep-zoom tile geometry and the tile cache."""
+
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException
+from PIL import Image as PILImage
+
+from bioscopeai_core.app.services.tile_cache import TileCache
+from bioscopeai_core.app.services.tile_service import (
+    build_tile_pyramid,
+    level_size,
+    tile_boxes,
+    TileService,
+)
+
+
+DESCRIPTOR = {
+    "prefix": "ds/a_files",
+    "width": 1000,
+    "height": 600,
+    "tile_size": 256,
+    "overlap": 1,
+    "format": "jpeg",
+    "max_level": 10,
+}
+
+
+class TestPyramidGeometry:
+    """Test level sizes and tile boxes."""
+
+    def test_level_size_halves_per_level(self):
+        assert level_size(1000, 600, 10, 10) == (1000, 600)
+        assert level_size(1000, 600, 10, 9) == (500, 300)
+        assert level_size(1000, 600, 10, 0) == (1, 1)
+
+    def test_tile_boxes_overlap_inner_edges(self):
+        boxes = {(col, row): box for col, row, box in tile_boxes(300, 200, 256, 1)}
+
+        assert boxes == {
+            (0, 0): (0, 0, 257, 200),
+            (1, 0): (255, 0, 300, 200),
+        }
+
+    def test_tile_key_rejects_out_of_range(self):
+        assert TileService.tile_key(DESCRIPTOR, 10, 3, 2) == "ds/a_files/10/3_2.jpeg"
+        assert TileService.tile_key(DESCRIPTOR, 10, 4, 0) is None
+        assert TileService.tile_key(DESCRIPTOR, 11, 0, 0) is None
+        assert TileService.tile_key(DESCRIPTOR, 9, 1, 1) == "ds/a_files/9/1_1.jpeg"
+
+    def test_tiles_prefix_sits_beside_original(self):
+        assert TileService.tiles_prefix("ds/abc.png") == "ds/abc_files"
+
+
+class TestBuildTilePyramid:
+    """Test the worker function that cuts an original into tiles."""
+
+    @pytest.fixture
+    def s3(self, mocker):
+        buffer = BytesIO()
+        PILImage.new("RGB", (300, 200)).save(buffer, "PNG")
+        s3 = mocker.MagicMock()
+        s3.download_fileobj.side_effect = lambda bucket, key, spool: spool.write(
+            buffer.getvalue()
+        )
+        mocker.patch(
+            "bioscopeai_core.app.services.tile_service.get_s3_client", return_value=s3
+        )
+        return s3
+
+    def build(self, max_pixels: int = 1_000_000):
+        return build_tile_pyramid(
+            "bucket", "ds/a.png", "ds/a_files", 256, 1, "JPEG", 80, 100, max_pixels
+        )
+
+    def test_spools_original_and_uploads_every_level(self, s3):
+        descriptor = self.build()
+
+        s3.download_fileobj.assert_called_once()
+        s3.get_object.assert_not_called()
+        assert descriptor["max_level"] == 9
+        keys = {c.kwargs["Key"] for c in s3.put_object.call_args_list}
+        assert {"ds/a_files/9/0_0.jpeg", "ds/a_files/9/1_0.jpeg"} <= keys
+        assert "ds/a_files/0/0_0.jpeg" in keys
+
+    def test_pixel_limit_is_restored_for_other_renders(self, s3):
+        default_max_pixels = PILImage.MAX_IMAGE_PIXELS
+
+        with pytest.raises(PILImage.DecompressionBombError):
+            self.build(max_pixels=100)
+
+        assert PILImage.MAX_IMAGE_PIXELS == default_max_pixels
+
+
+class TestTileCache:
+    """Test byte-bounded LRU eviction."""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = TileCache(max_bytes=10)
+        cache.put("a", b"1234")
+        cache.put("b", b"1234")
+        cache.get("a")
+        cache.put("c", b"1234")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"1234"
+        assert cache.stats()["bytes"] == 8
+
+    def test_skips_tiles_larger_than_cache(self):
+        cache = TileCache(max_bytes=4)
+        cache.put("a", b"12345")
+
+        assert cache.stats()["size"] == 0
+
+
+class TestGetTile:
+    """Test serving tiles from storage."""
+
+    async def test_missing_tile_object_is_not_found(self, mocker):
+        service = TileService()
+        service.tile_cache = TileCache(max_bytes=1024)
+        service.storage_service = mocker.MagicMock()
+        service.storage_service.download_bytes = mocker.AsyncMock(
+            side_effect=HTTPException(status_code=404, detail="File not found")
+        )
+        image = mocker.MagicMock(tiles=DESCRIPTOR)
+
+        assert await service.get_tile(image, 10, 0, 0) is None
@@ -0,0 +1,36 @@
+"""Unit tests for the standalone result-consumer worker."""
+
+import pytest
+
+from bioscopeai_core.app import worker
+
+
+class TestRunWorker:
+    """Test worker startup and shutdown."""
+
+    @pytest.fixture(autouse=True)
+    def lifecycle(self, mocker):
+        mocker.patch.object(worker, "setup_logger")
+        mocker.patch.object(worker, "init_db", mocker.AsyncMock())
+        mocker.patch.object(worker, "close_db", mocker.AsyncMock())
+        producer = mocker.MagicMock()
+        producer.initialize = mocker.AsyncMock()
+        producer.shutdown = mocker.AsyncMock()
+        mocker.patch.object(worker, "get_failed_message_producer", return_value=producer)
+        mocker.patch.object(worker, "start_result_consumers", mocker.AsyncMock())
+        mocker.patch.object(worker, "stop_result_consumers", mocker.AsyncMock())
+        return producer
+
+    async def test_exits_with_error_of_failed_consumer(self, mocker, lifecycle):
+        mocker.patch.object(
+            worker,
+            "wait_result_consumers",
+            mocker.AsyncMock(side_effect=RuntimeError("broker gone")),
+        )
+
+        with pytest.raises(RuntimeError, match="broker gone"):
+            await worker.run_worker()
+
+        worker.stop_result_consumers.assert_awaited_once()
+        lifecycle.shutdown.assert_awaited_once()
+        worker.close_db.assert_awaited_once()
@@ -0,0 +1,89 @@
+from tortoise import BaseDBAsyncClient
+
+# Trigram indexes on LOWER(column) back the case-insensitive substring and prefix
+# search in bioscopeai_core.app.utils.search. Expression indexes cannot be declared
+# in Meta.indexes, so they only live here. CREATE INDEX CONCURRENTLY cannot run in
+# a transaction block; statements are executed one by one.
+RUN_IN_TRANSACTION = False
+
+UPGRADE_STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "trgm_image_filename" ON "image" USING GIN (LOWER("filename") gin_trgm_ops)',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "trgm_dataset_name" ON "dataset" USING GIN (LOWER("name") gin_trgm_ops)',
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS "trgm_dataset_description" ON "dataset" USING GIN (LOWER("description") gin_trgm_ops)',
+]
+
+# The extension is left installed, other objects may depend on it.
+DOWNGRADE_STATEMENTS = [
+    'DROP INDEX CONCURRENTLY IF EXISTS "trgm_image_filename"',
+    'DROP INDEX CONCURRENTLY IF EXISTS "trgm_dataset_name"',
+    'DROP INDEX CONCURRENTLY IF EXISTS "trgm_dataset_description"',
+]
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    for statement in UPGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    for statement in DOWNGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+MODELS_STATE = (
+    "eJztXWtv2zgW/SuGvkwLZIvEebXBYAEnUTveSezAcTqzkwwMRqJtbmXKI9F5tOh/X5J6i5"
+    "Qi2ZYtJfwSxCQvJR6+7rm8vPqhzWwTWu6HMwu4LhojAxBkY+2k9UPDYAbpPxkldloamM+j"
+    "fJZAwL3FRQyx7L1LHGAQmjsGlgtpkgldw0Fz/3l4YVks0TZoQYQnUdICo38WcETsCSRT6N"
+    "CM279pMsImfIIu+3mruQSQBX8Hw4GAQHMEiEZL3WomIMCFZIRMWS6agQnMyAt+3z9LCrA3"
+    "mH8bjRG0zARaXlGePiLPc552c9M9/8xLshbejwzbWsxwVHr+TKY2DosvFsj8wGRY3gRi6L"
+    "DHxpBjwPhQB0keSDSBOAsYomNGCSYcg4XF8Nd+HS+wwWBv8SexPwf/1kr0iGFj1psIEwb/"
+    "j59eq6I281SNPerst87g3f7Re95K2yUTh2dyRLSfXJD2jyfKuzI17Eb8lwDo2RQ4ckCTUi"
+    "lg6UsXgNQHLEQ0KBJBGo3gANMAq+UA1GbgaWRBPCFT+nNvdzcH0a+dAQeVluKo2nRWeZOu"
+    "52e1vTyGboRmNEFEJHW8mHE0u/StADaggGokvRSiwiAtAqk2h9hkqAm4ald677zb+3LS8o"
+    "vc4cFNr8dTnAXGPOWsf3l1oQ/185OWYc/mFqRvd4c/d7oXLGkMkAW90VOydz4V6JtPmT3z"
+    "Kd0vsTVF6JtzmkPQDMpHelIy1S+mL/oh+KeqXlpx4NM2mH1sPfvTLgfbYfdSvx52Lq9YS2"
+    "au+4/FIeoMdZbT5qnPqdR3R6mOCCtp/dEd/tZiP1t/9Xt6enkKyw3/0tg7gQWxR9h+HAEz"
+    "tqQGqQEwiY5dzM0lOzYpqTp2qx3rv7w4YUOtoOhWLwiuc9evvkdX2eQj9JLaWFHoklIr4L"
+    "b5rX09sMXV1MKqZUzmjUDGlPLxN6k2ydEQ4ftsOxBN8O/wWVCAUpj5LKgb1FNX2KLU6C0c"
+    "8BgylcS4oO2jraKqEQe3c33WOdc12YRdA3LnUU2NxS65EL2MXrTmrwHAGxdWpmxvBj5hC5"
+    "QjyKbxPTC+PQLHHGXMZzrx6ZtLCM2pL/j59wG0QvODHNGkSWPAq2zU+ORQ2W07BlECPDFr"
+    "1p6lUwCmC4LpP5s9KQ+dFw1DEYpFzUNOJFGtkSj52BUsQsoAtAkDEG0htMrYfkKBzRkpam"
+    "/3oU8cIxP6G0tqB7JsQDLISkIsheeYydUT0RwAz/s3pxd662qgn3Wvu/1ekljyTJZEE5C3"
+    "Hw30zkUKTWWTXOvYVLav12AiEW1f0o22sJ1EJvxGCGxNOH+9Fu7mkP4aU69yrF88v10RQf"
+    "HwuK6z9mUSK1ufyhLZKnlbYGiRULWYDSabncVMPpUSMsWgqmZQZRXVlVTUrfOn9uFhAR2V"
+    "lsrUUXle6sAi9mYCkkP4lMGfUmIN0fnzVFD9z2FC+wxQe3fZ+fN9QgO96Pe+BMVjKJ9d9E"
+    "8VAXgbBMB+pGCX1F3jMkp39eBQpwapgbH8gUFSbVvrwUGd13LxyEDgmCti0UBylHLUsWxg"
+    "jlxIe3TlgXHDK7v26mrWuKiUksAHZEBNxki8nJ1cQhKVUXxE8ZE3zUemFPGyMMZl1gPlyy"
+    "Oy9kBadpZxK+eAMSbTEEq3ASTHyJnRLQKOHqDjlkRUJttIZA+LnI8dZh+PHQqnY8gd2dhC"
+    "WDLVT23bggBn7D9xuRSW91SwqqWz7IZcfMc57fcvEsT3tJs2LtxcnuqDd3vvkye43d4wPe"
+    "uBS6iqByWDNN/gkBBcg72hXsadGpkXgmbn2hccOEEugc5StiNBWJmPamA+EkwhRUj9Jvlr"
+    "jaiaoq+bpa/eEJGw13DsZJPX8Ax6vdz1Nn5MR9EgEJPRFLhTzzMx4feY9Fr2Bkz8hiyn11"
+    "m5FBPr+TtFRXk8Vs6Px4jqkyXJXVxG8eQElHNA6y8JZSDTTCgP99pFaMheO5uHsLyfkh1m"
+    "yauMCVGlaNVA0Yp3bbi4i1pDHsWMiymGKThcR3txicUnLddIK8jRQYHl5+ggc/VhWWn/Cw"
+    "c9UK31Qabm/+e638vyv0iIpcC8wbSVtyYyyE7Lolzw71pCmwMla3hivAreGGnHi9TawSpI"
+    "e2MQuv2VAjkUUPAWgHfLV58b5ReRXAFi9KQwbHGhN+g8HipepcMUiJJvZdDlOONs4xZ0jf"
+    "wldla8Bh0bU2uAsPkeTeIcK3ARP3SCWHUEhhXVde17efzFV3flErZWe/I2L9bXaMpWak8e"
+    "wDGFeTq0v0FpqMVE/k6eddnxSo4IK+qu38ws2JLh05w9xYEP9InKKLwBozDv2tLmhKSU8v"
+    "rxwfSHbxkbpi/STNtlQ2yVhQ79UXn7M1J251ranYPtQ1Qy8szOMSlldU7xfbf0fZuYiGL4"
+    "HA3FTZPDok6XmjmwElU5ADxbRWYNKqYZa6yyFq+iNbadFl3CphATn8W0ADZ5ku2g7zzlg5"
+    "ZCfqkK1MWEzUz+PB0bzgAqFWoqFFCadWwBLeu7EpdpIpDrd/qeA9d9tOliWZbvCYLNdGCp"
+    "6oKCS0pH7UpKNRPO9Q9Q7gdfFsqEkELS50CU6chBfPl7DIHsBr/G8IDgo6dqpZSmzvllt3"
+    "fSAuYM4Ts80K911mZ9cNKi+y8EjkGVmjvc6XUu/ns9pOWY75BL7vDXrv4HKxWruHRQugJ9"
+    "spcXku5VfyWjczbsftUp4gbzg7nD3V6QgnCQdn1zzT6mwT6J4S5cVhf7Skb6+xrLdM6av5"
+    "OB6KMQWZS9sZcSa6RT1fqXHhPOgUNmlJqUwTIppaD0FDYKQqm9MBRoJIDtIgC2swFsy645"
+    "PkAH0frKmgNTksokKADrLubQkVu2XkI2IaqgVXGr3sS5hPpo06voWMGphRNQy56g5e59h5"
+    "Lq4veWz4BDMxfjlsRze1nKTJaSb6YyVoWxLIUQfJojR3YtIH/aZNeiptCWpxA/uvA1Zz+G"
+    "celplFeHmkoypJdSKqQVqAm0hQm0VHSK7foX18jHQHYPakU4GnmPQn4pQgXhlPkxL49F2n"
+    "u6oZCowC7VO+J36NZqTDWJX5Gfs5PnWQSiMrWJS9rFGRHppd4/CAsrqN/zW3Wy4MF2/tXe"
+    "Ozg++Lh/dPCRFuFvEqYc5+gTgbku29tniTiFq4Yn3Pr5dSUKLpsaJUD0izcTwKq+zkekp3"
+    "DZl+5jImu4dl8v99213bsvoa5X6rSa2HVl3qvpbTnHjZUXdWNFa7PnKJfT9DhUsb42uQ0F"
+    "oXM4FiXgTMs1E9JKNib7/n/QIKNvUHJhPxvQpFQz4awwhJr0gk6Od3RcqJlg7u22i0SEYs"
+    "VyRmdbiApFbAKskYu+y4Jjo0kmCUrKvUyGaoKpx4c+tdv7+8ft3f2jj4cHx8eHH3dDYiRm"
+    "5TGk0+4X0aeB+XZlIJoJZ0KmYWiuyC7jpisDogcezINIzXg541GU3RyKuw0YkKXCkYUC2+"
+    "JF2q/c4t/6hT3ll4pUzkpikzXQ79nzYBYxFtyez/qXVxf6kLk4G/Zszu4zmne4c9of8DRw"
+    "bzvE8yDcsouz8ip7Fc5HyqvsVXSs5Cg46yhThXTUithCVEjHlUBTIR3L45cT8EGFdFwppK"
+    "MKR1gqHKGKhrl6NMxNnuH8/D9uUTMa"
+)
@@ -0,0 +1,87 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "classificationstatshourly" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "bucket" TIMESTAMPTZ NOT NULL,
+    "label" VARCHAR(100) NOT NULL,
+    "model_name" VARCHAR(100) NOT NULL DEFAULT '',
+    "device_id" VARCHAR(36) NOT NULL DEFAULT '',
+    "dataset_id" VARCHAR(36) NOT NULL DEFAULT '',
+    "count" INT NOT NULL DEFAULT 0,
+    "confidence_sum" DOUBLE PRECISION NOT NULL DEFAULT 0,
+    CONSTRAINT "uid_classificat_bucket_779762" UNIQUE ("bucket", "label", "model_name", "device_id", "dataset_id")
+);
+COMMENT ON TABLE "classificationstatshourly" IS 'Hourly rollup of classification results.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "classificationstatshourly";"""
+
+
+MODELS_STATE = (
+    "eJztXWlv27gW/SuCvkwL5AWJs7XF4AFOorZ+49iBl84SDwxFom1OZMojUUnTov/9kdRKbZ"
+    "Fsy5YafglikpcSD7d7Li+vvstLUweGfXhlqLYNZ1BTMTSR/EH6LiN1Ccg/GSUOJFldrcJ8"
+    "moDVe4OJaMmy9za2VA2T3Jlq2IAk6cDWLLjynoccw6CJpkYKQjQPkxwE/3XAFJtzgBfAIh"
+    "l3f5NkiHTwFdj0551sYxU77B00C6gY6FMVy6TUnayrWLUBnkI9LRcu1TnIyPN/3z+nFKBv"
+    "sHqYziAwdA4ttyhLn+LnFUsbjzvXH1lJ2sL7qWYazhKFpVfPeGGioLjjQP2QytC8OUDAoo"
+    "+NIEeB8aD2k1yQSAK2HBCgo4cJOpipjkHxl3+dOUijsEvsSfTP6X/lEj2imYj2JkSYwv/9"
+    "h9uqsM0sVaaPuvrcHrw5OX/LWmnaeG6xTIaI/IMJkv5xRVlXxobdlP1KAHq1UK10QHmpGL"
+    "DkpQtA6gEWIOoXCSENR7CPqY/VegDKS/Xr1ABojhfk5/HRUQ6iX9oDBiopxVA1yaxyJ13P"
+    "y2q5eRTdEM1wgiSRVJCzZGh2yFupSAMJVEPptRBNDNIikMorgHSKWgJX+VbpXXd6nz5IXp"
+    "EJGox7PZZiOQixlKv+zW1XGSnXHyTNXK4MQN5ugj62O12aNFOhAdzRU7J33hfom/eZPfM+"
+    "3i+RNSXRN9ckB8MlSB/pvGSsX3RP9ND/p6pe2nDgkzbofWQ8e9MuB9tR50YZjto3t7QlS9"
+    "v+12AQtUcKzWmx1OdY6pvzWEcElUi/d0afJfpT+qvfU+LLU1Bu9JdM30l1sDlF5tNU1SNL"
+    "qp/qA8N1rLPS1+xYXlJ07F471nv55IQNtIKiW31CcJu7fvU9uskmH6LHa2NFoeOlNsBt91"
+    "v7dmCLqqmFVcuIzCuBjCrls4dUbZKhkYTvo2kBOEe/geeEAhTDzGNBHb+eusIWpoZvYalP"
+    "AVPhxgVpH2kVUY0YuO3hVftakdMm7BaQuw5raix2/EL0Mnrhmr8FAMc2qEzZ3g18iS0wHU"
+    "E6je9V7eFJtfRpxnwmE5+8eQqhufQEP/42AEZgfkhHlDdpDFiVjRqfDCqzZUYg4sBLZi1b"
+    "y3iKisiCoHvPpk/KQ+dFw1CIYlHzkBVKVGsk4h+7gUVIGIB2YQAiLQRGGdtPILA7I0Xt7T"
+    "7kiTOoA29jie1AhqniDLLCicXwnFG5eiKaA+B1f3zZVaTbgXLVGXb6PZ5YskyaRBKgux8N"
+    "lHY3hqawSW51bArb189gIknavlI32sJ2kjThV0Jga8L567VwN4f015h6lWP9yfPbDRFMHh"
+    "7Xdda+TGLT1qeyRLZK3uYbWlKoWsQGk83OIiafSgmZYFBVM6iyiupGKure+VPr7KyAjkpK"
+    "ZeqoLC92YBF5swSSI/A1gz/FxBqi8+epoMofI0779FF7c9P+4y2ngXb7vU9+8QjKV93+pS"
+    "AAr4MAmE8E7JK6a1RG6K4uHOLUIDYw1j8w4NW2rR4c1HktTx4ZJDjmhlg0kBzFHHUMU9Wn"
+    "NiA9uvHAGLPKhm5dzRoXlVIS8Ag1IKcxEjfnIJeQhGUEHxF85FXzkQVBvCyMUZntQPnyiK"
+    "w9kIaZZdzKOWCMyDSE0u0AyRm0lmSLANNHYNklEU2TbSSyZ0XOx86yj8fOEqdj0J6ayIAo"
+    "ZapfmqYBVJSx/0TlYljeE8Gqls6yG3LxHeey3+9yxPeyEzcujG8ulcGb47f8CW6nN4rPet"
+    "XGRNUDKYM03+DACW7B3lAv406NzAt+s3PtCxaYQxsDay3bUUJYmI9qYD5KmEKKkPpd8tca"
+    "UTVBX3dLX90hksJeg7GTTV6DM+jtcte76DEdQQMDhKcL1V64nomc3yPvtewOmOgNWUavs3"
+    "IJJsbzN4KK8HisnB/PINEnS5K7qIzgyRyUK5XUXxJKX6aZUJ4dt4rQkONWNg+heT9Sdpg1"
+    "rzJyokLRqoGiFe3aYHFPag15FDMqJhhmwuE63ItLLD5xuUZaQc5PCyw/56eZqw/NivtfWP"
+    "CRaK2PaWr+/4b9Xpb/BScWA3OMSCvvdKjhA8kgXPDvWkKbAyVtODdeE94YcceL2NpBK4h7"
+    "Y2Cy/ZUCORAQ8BaAd89XnxvlF8GvABF6Uhi2qNArdB4PFK/SYQqSkq9l0OU44+zjFnSN/C"
+    "UONrwGHRlTW4Cw+R5NyTlW4CJ+4ASx6QgMKqrr2vfy+Iuu7sIlbKv25H1erK/RlK3UnjwA"
+    "MwLzYmQ+gNRQi1z+QZ512XJLTjEtam/fzJywJYOvK/oUCzySJwqj8A6MwqxrS5sTeCnh9e"
+    "OB6Q3fMjZMT6SZtsuG2CoLHfrD8vZnKOzOtbQ7+9tHUsnIMztHpITVOcb37dL3bSIiguEz"
+    "NAQ35YdFnS41M2BTVGUf8GwVmTaomGYs08okVoU0My2JLGELgLDHYiQV6SzJtOA3lnIox5"
+    "BfqwJxMWE3kz9PxwZLFZYKNRUICM06soCW9V2JyjQRyO07fa9U234yyWJZlu8lBJvpwFLV"
+    "BQUbl47axUs1E87tD1DmB18WSk5IIOlxIMJ00kF8+XsMvuwOv8bwCMGTq2rFlKb29U2n90"
+    "FS9SVEEzRQhgptszL4IJH9F6iWRpSaCWr32t0/hyNSjvoO2XiCvnSU32mpSMWlg9IV6JPj"
+    "vJB0P/VXMtpXo84XhSCuUT+YCer0/BSI/LTheEg/pkE/iWE7Nq2LfiUj/n2NdTpny9/JgO"
+    "RREDtlb+zFxBrpVLX9pUcHK9XCS0JNymDJSwkoXYWNgFBqLwwEGglgqwiArWwAW2nXHB+B"
+    "BUl9Zc2BMUlhEkwAazsrYKVbtl5ClhMV0Iq4Va/iXEJ8tOmn6NiEUwsjoIY5h+vd+w4kxc"
+    "XvPZ8BB2Yuyi2x6/aylpksJt9MZawKY1kMIfB1Ba20awH50ya7FjGF9jyF2NGFpzl7MYxL"
+    "T6O8OsRUSkN6LaUitQIxgfYwgdaKTrFf/+Ia+Rik3YPaEI5G3qNIvxQhgnCm+TGvj0Xce7"
+    "qhkIjALtU74rfJ1qot5BS/Ii/nIM+zSA3L1CYuaQdlRKRP9f6BKLGCej2/VycLFmznP63j"
+    "04vTdyfnp+9IEfYmQcpFjj7hm+uyvX3WiFO4aXjCvZ9fV6Lg0qlRAkSveDMBrOrrfDj1FC"
+    "770n1EZAvX7uvlvru1e/cl1PVKnVa5XTfNezW+Lee4sbKidqRobfYc4XIaH4ci1tcutyE/"
+    "dA7DogSccblmQlrJxmTe/wM0PH0AKRf2swHlpZoJZ4Uh1FIv6OR4R0eFmgnm8VGrSEQoWi"
+    "xndLYSUaGwiVVjasNvacGx4TyTBPFyL5OhmmDq8qH3rdbJyUXr6OT83dnpxcXZu6OAGCWz"
+    "8hjSZedT0qeB+nZlIJoJJyfTMDQ3ZJdR05UG4CML5oFTzXg54zEpuzsUjxowIEuFIwsE9s"
+    "WL5F+ZxV/6hT7ll4pUzkpikzXQ79n1YE5inHB7vurf3HaVEXVx1szlit5n1CeofdkfsDT1"
+    "3rSw60G4Zxdn4VX2UzgfCa+yn6JjU46Cs44yRUhHuYgtRIR03Ag0EdKxPH45AR9ESMeNQj"
+    "qKcISlwhGKaJibR8PczxkO73c1JFTH/mw6FlNnEuc52YUP8s52Yo5iVGwRir0YtsR9hGSZ"
+    "huGsJHMm8fVJXkjHZLiSooITNEF9BEjBJ2kFLIm+HItmQgjVPURuYSJOBhsgA4G18EBypw"
+    "Ur560uB9IDWGHJWU0QNmkiybX9p0iqZRHCdijdQPIOaC7pRKVFzPeFZAHJxmRq6FRgIk9k"
+    "iYz1BXkVvFCR1Bt3uxNkm/QXJn+A5A5z8rhniWBGngV0Msxou4BNCyyzQq/cyfeO9uCu5q"
+    "w5sj8Uggvs3HSPrJvxD++IM7Sqz9DCripDqkKpZhKq5hKoJDUOpljRQ5FAoKkHIhUc1vHL"
+    "U1EkeakdWu42WEZ2AGYON827Gp/NTRsB5cl5ASRP4itFCCTNKv65ixwg82wjrxRJzXTSXM"
+    "QyD5WC8k06S9racRypfgZ1QDjT1HaWKQSLkI1M4OKiMQRnVLYyDA83QDEHouv++LKrSLcD"
+    "5aoz7HiHR4ESwDJpUnjffaC0u/v2ofvxf1WOkVM="
+)
@@ -0,0 +1,92 @@
+from tortoise import BaseDBAsyncClient
+
+# The unique index is built CONCURRENTLY so result ingestion keeps running while
+# it scans the table, which cannot happen in a transaction block; statements are
+# executed one by one. Existing results keep a NULL key.
+RUN_IN_TRANSACTION = False
+
+UPGRADE_STATEMENTS = [
+    'ALTER TABLE "classificationresult" ADD "idempotency_key" VARCHAR(64)',
+    'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "uid_classificat_idempot_7986e3" ON "classificationresult" ("idempotency_key")',
+]
+
+DOWNGRADE_STATEMENTS = [
+    'DROP INDEX CONCURRENTLY IF EXISTS "uid_classificat_idempot_7986e3"',
+    'ALTER TABLE "classificationresult" DROP COLUMN "idempotency_key"',
+]
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    for statement in UPGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    for statement in DOWNGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+MODELS_STATE = (
+    "eJztXWlv4zgS/SuCvkw3kA0S5+gDgwWcRN3jHccOfPTMTjwwFImOuZEpj0QlnW70f1+SOq"
+    "krki3ZUodfgphkUeLjVa9YLH2XV6YODPvw0lBtGy6gpmJoIvmj9F1G6gqQfzJKHEiyul6H"
+    "+TQBq3cGE9GSZe9sbKkaJrkL1bABSdKBrVlw7T0POYZBE02NFIToPkxyEPzHAXNs3gO8BB"
+    "bJuP2bJEOkg6/Apj9vZRur2GHvoFlAxUCfq1gmpW5lXcWqDfAc6mm5cKXeg4w8//fdc0oB"
+    "+gbrh/kCAkPn0HKLsvQ5fl6ztOm0d/WJlaQtvJtrpuGsUFh6/YyXJgqKOw7UD6kMzbsHCF"
+    "j0sRHkKDAe1H6SCxJJwJYDAnT0MEEHC9UxKP7yrwsHaRR2iT2J/jn9t1yiRzQT0d6ECFP4"
+    "v/9wWxW2maXK9FGXv3VHb07O37JWmja+t1gmQ0T+wQRJ/7iirCtjw27OfiUAvVyqVjqgvF"
+    "QMWPLSBSD1AAsQ9YuEkIYj2MfUx2ozAOWV+nVuAHSPl+Tn8dFRDqJfuiMGKinFUDXJrHIn"
+    "3cDL6rh5FN0QzXCCJJFUkLNiaPbIW6lIAwlUQ+mNEE0M0iKQymuAdIpaAlf5Rhlc9QafP0"
+    "pekRkaTQcDlmI5CLGUy+H1TV+ZKFcfJc1crQ1A3m6GPnV7fZq0UKEB3NFTsnc+FOibD5k9"
+    "8yHeL5E1JdE3VyQHwxVIH+m8ZKxfdE/00P+nrl7acuCTNuhDZDx70y4H20nvWhlPutc3tC"
+    "Ur2/7HYBB1JwrN6bDU51jqm/NYRwSVSH/0Jr9J9Kf013CgxJenoNzkL5m+k+pgc47Mp7mq"
+    "R5ZUP9UHhutYZ61v2LG8pOjYvXas9/LJCRtoBUW3+oRglbt+/T26zSYfosdrY0Wh46W2wG"
+    "33W3s1sEXV1MKqZUTmlUBGlfLFQ6o2ydBIwvfJtAC8R7+D54QCFMPMY0E9v56mwhamhm9h"
+    "qU8BU+HGBWkfaRVRjRi43fFl90qR0yZsBchdhTW1Fjt+IXoZvXDNrwDAqQ1qU7Z3A19iC0"
+    "xHkE7jO1V7eFItfZ4xn8nEJ2+eQmguPMFPv4+AEZgf0hHlTRojVmWrxieDyuyYEYg48JJZ"
+    "q84qnqIisiDo3rPpk/LQedEwFKJY1DxkhRL1Gon4x25hERIGoF0YgEgLgVHG9hMI7M5I0X"
+    "i7D3niAurA21hiO5BhqjiDrHBiMTwXVK6ZiOYAeDWcXvQV6WakXPbGveGAJ5YskyaRBOju"
+    "RyOl24+hKWySlY5NYfv6GUwkSdtX6kZb2E6SJvxKCGxDOH+zFu4ymOlgtTYx2bee5w8ghX"
+    "RlL9IpopWs1C+rY1Wu0+enBZbp89PMVZpmNcqO0mA2W86QkjwS3xLB5Hl8UxfCl+0CaUt+"
+    "WdtAnVTYt12lsN+IWSub8EasaLVyXEFK6yalZXX/rbT+vVPSztlZgf2ElMrcUFhe7Awo8m"
+    "YJJCfgawYljYm1hEblafXKnxNOofdRe3Pd/fMtp9T3h4PPfvEIypf94YXgVK+DU5lPBOyS"
+    "dCAq81roQI7uyuAQBzGxgbH5GQyvtlV6FtPktTx5CpOg7Vti0UJyFPN9MkxVn9uA9OjWA2"
+    "PKKhu7dbVrXNRKScAj1ICcxkjcnINcQhKWEXxE8JFXzUeWBPGyMEZlqoFyt3bCWoA0zCzj"
+    "Vs6ZbUSmJZRuB0guoLUiWwSYPwLLLolommwrkT0rcuR4ln3ieJY4cIT23EQGRClT/cI0Da"
+    "CijP0nKhfD8o4I1rV0lt2Qi+84F8NhnyO+F724cWF6faGM3hy/5Q/Fe4NJfNarNiaqHkgZ"
+    "pPkGB06wAntDs4w7DTIv+M3OtS9Y4B7aGFgb2Y4SwsJ81ADzUcIUUoTU75K/NoiqCfq6W/"
+    "rqDpEU9hqMnWzyGpxBV8tdb6PHdAQNDBCeL1V76Tp7cq6kvCO4O2Cil44Zvc7KJZgYz98I"
+    "KsKJtHZ+vIBEnyxJ7qIygidzUK5VUn9JKH2ZdkJ5dtwpQkOOO9k8hOb9SNlhNrwdyokKRa"
+    "sBila0a4PFPak15FHMqJhgmAkf9nAvLrH4xOVaaQWpxqOP97+w4CPRWh/T1Pz/jIeDLP8L"
+    "TiwG5hSRVt7qUMMHkkG44N+NhDYHStpwbrwmvDHijhextYNWEPfGwGT7KwVyICDgLQDvnm"
+    "+Tt8ovgl8BIvSkMGxRoVfojx8oXqUjPyQlX8ugy3HG2cfF8gb5SxxsebM8MqYqgLD9Hk3J"
+    "OVYgtkHgBLHtCAwqaura9/L4i67uwiWsUnvyPmMVNGjK1mpPHoEFgXk5MR9AavRKLv8gz7"
+    "psuSXnmBa1qzczJ2zJ4OuaPsUCj+SJwii8A6Mw69rS5gReSnj9eGB6w7eMDdMTaaftsiW2"
+    "ykKH/rC8/RkKu3Mj7c7+9pFUMvLMzhEpYXWO8X279H2biIhg+AwNwU35YdGkS80M2BRV2Q"
+    "c8W0WmDSqmGcu0MolVIS1MSyJL2BIg7LEYSUU6SzIt+I2lHMox5DeqQFxM2M3kz9OxwUqF"
+    "paJ3BQJCs44soGV9V6IybQSyeqfvtWrbTyZZLMvyvYRgOx1Y6rqgYOPSgdB4qXbCWf0AZX"
+    "7wZaHkhASSHgciTCcdxJc/ceHL7vADF48QPLmqVkxp6l5d9wYfJVVfQTRDI2Ws0DYro48S"
+    "2X+BamlEqZmh7qDb/+94QspR3yEbz9CXnvIHLRWpuHScvwJ9cpwX5e+n/vBI93LS+6IQxD"
+    "XqBzNDvYGfApGfNp6O6fdJ6FdGbMemddEPj8Q/WbJJ51T86RFIHgWxU/bGXkyslU5V1S89"
+    "OlirFl4RalIGS15KQOkqbASEUnthINBKADtFAOxkA9hJu+b4CCxI6itrDoxJCpNgAljbWQ"
+    "Mr3bL1ErKcqIBWxK16FecS4jtYP0XHJpxaGAE1zHu42b3vQFJc/N7zGXBg5qLcErtuLxuZ"
+    "yWLy7VTG6jCWxRACX9fQSrsWkD9tsmsRU2jPU4gdXXiasxfDuPQ0yqtDTKU0pDdSKlIrEB"
+    "NoDxNoo+gU+/UvbpCPQdo9qC3haOU9ivRLESIIZ5of8+ZYxL2nWwqJCOxSvyN+l2yt2lJO"
+    "8Svycg7yPIvUsExj4pL2UEZE+lTvH4gSK6jX83t1smDBdv7VOT59d/r+5Pz0PSnC3iRIeZ"
+    "ejT/jmumxvnw3iFG4bnnDv59e1KLh0apQA0SveTgDr+uAhTj2Fy750HxGp4Np9s9x3K7t3"
+    "X0Jdr9Vpldt107xX49tyjhsrK2pHijZmzxEup/FxKGJ97XIb8kPnMCxKwBmXayektWxM5t"
+    "3/gIbLfpaQl2onnDWGUEu9oJPjHR0VaieYx0edIhGhaLGc0dlJRIXCJlaNuQ2/pQXHhveZ"
+    "JIiXe5kMNQRTlw996HROTt51jk7O35+dvnt39v4oIEbJrDyGdNH7nPRpoL5dGYhmwsnJtA"
+    "zNLdll1HSlAfjIgnngVDNeznhMyu4OxaMWDMhS4cgCgX3xIvlXZvGXfqFP+aUmlbOW2GQt"
+    "9Ht2PZiTGCfcni+H1zd9ZUJdnDVztab3GfUZ6l4MRyxNvTMt7HoQ7tnFWXiV/RTOR8Kr7K"
+    "fo2JSj4KyjTBHSUS5iCxEhHbcCTYR0LI9fTsAHEdJxq5COIhxhqXCEIhrm9tEw93OGw/td"
+    "jQnVsX8zHYupM4nznOzCB3lnOzFHMSq2DMVeDFviPkKyTMNw1pK5kPj6JC+kYzJcSVHBGZ"
+    "qhIQKk4JO0BpZEX45FMyGE6g4itzARJ4MNkIHAWnggudOClfNWlwPpAayx5KxnCJs0keTa"
+    "/lMk1bIIYTuUriF5B3Qv6USlRcz3hWQBycZkauhUYCbPZImM9SV5FbxUkTSY9vszZJv0Fy"
+    "Z/gOQOc/K4Z4lgRp4FdDLMaLuATQusskKv3Mp3jvbgruasObI/FIIL7Nx0j6yb8Q/viDO0"
+    "us/Qwq4qQ6pCqXYSqvYSqCQ1DqZY0UORQKCtByI1HNbxy1NRJHmpHVrutlhGdgBmDjfNux"
+    "qfzU1bAeXJeQEkT+IrRQgkzSr+uYscIPNsI68USc100lzEMg+VgvJtOkuq7DiOVL+AOiCc"
+    "aW47qxSCRchGJnBx0RiCCypbG4aHW6CYA9HVcHrRV6SbkXLZG/e8w6NACWCZNCm87z5Suv"
+    "19+9D9+D/kW/8s"
+)
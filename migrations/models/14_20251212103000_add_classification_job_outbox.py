@@ -0,0 +1,94 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "classificationjoboutbox" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "device_id" VARCHAR(36),
+    "payload" JSONB NOT NULL,
+    "attempts" INT NOT NULL DEFAULT 0,
+    "next_attempt_at" TIMESTAMPTZ NOT NULL,
+    "last_error" TEXT,
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "classification_id" UUID NOT NULL REFERENCES "classification" ("id") ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS "idx_classificat_next_at_97b896" ON "classificationjoboutbox" ("next_attempt_at");
+COMMENT ON TABLE "classificationjoboutbox" IS 'Classification job message waiting to be published to Kafka.';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "classificationjoboutbox";"""
+
+
+MODELS_STATE = (
+    "eJztXWtv27gS/SuCvmwL5AaN8+gDiws4idu6dezCcdrejRcGbdExNzLllag8WvS/3yEl6y"
+    "1Fsi1bavgliEkOJR6+5gyHo5/q3NCwbu2f6ciyyJRMECMGVd8pP1WK5hj+SSmxp6hosfDz"
+    "eQJDY12ITOJlxxYz0YRB7hTpFoYkDVsTkyzc51Fb13miMYGChN74STYl/9p4xIwbzGbYhI"
+    "zrvyGZUA0/YIv/vFYthpgt3mFiYsSwNkJMhVLXqoYYsjAbES0pl8zRDU7JW/4ePyYU4G+w"
+    "uB1NCda1EFpOUZE+Yo8LkXZ11T5/L0ryFo5HE0O359QvvXhkM4N6xW2baPtchufdYIpN/t"
+    "gAchwYF+plkgMSJDDTxh46mp+g4SmydY6/+ufUphMOuyKexP8c/Vct0CMTg/LeJJRx+H/+"
+    "clrlt1mkqvxRZx+b/ReHJy9FKw2L3ZgiUyCi/hKC0D+OqOjKyLAbiV8xQM9myEwGNCwVAR"
+    "ZeOgekLmAeossiPqT+CF5iusRqNQDVOXoY6ZjesBn8PHj1KgPRr82+ABVKCVQNmFXOpOu6"
+    "WQ0nj6Pro+lPkDiSLWrPBZpteCtEJziGqi+9EqKxQZoHUnWBqcZRi+Gqfml1z9vdD+8Ut8"
+    "iQ9q+6XZFi2pSKlLPexZdOa9A6f6dMjPlCx/B2Q/q+2e7wpCkiOnZGT8HeeZujb96m9szb"
+    "aL8E1pRY35xDDiNznDzSw5KRftFc0f3lP2X10poDH9qg9aj+6E67DGwH7YvW5aB58YW3ZG"
+    "5Z/+oCouagxXMaIvUxkvriJNIRXiXKt/bgo8J/Kn/1uq3o8uSVG/yl8ndCNjNG1LgfIS2w"
+    "pC5Tl8CEOtZeaCt2bFhSduxOO9Z9+fiE9bSCvFt9THCTu375PbrOJu+jF9bG8kIXlloDt+"
+    "1v7ZuBLaim5lYtAzLPBDKulE9vE7VJgUYcvveGickN/YwfYwpQBDOXBbWX9VQVNj/VfwsT"
+    "3XtMJTQuoH3QKlCNBLjNy7PmeUtNmrAbQO7cr6m22IUXoqfR89f8DQB4ZeHSlO3twBfbAp"
+    "MR5NN4jCa398jURinzGSY+vHkCoTl1Bd9/7mPdMz8kIxo2afRFlbUan6HBZthsbDyMMIW6"
+    "8EaR+WSMe6LyeoHDx5HRMALjJzSy4lnzxjyagiislpr7bP6krKHzpNXMH2J5bWemL1GuBS"
+    "382DXMZdI6tg3rGLQQ60UMY57A9iw4lTeKwROnRMPurhvZnnUDsRQmFxKL4DnlctVENAPA"
+    "897VaaelfOm3ztqX7V43zLpFJk+CBOJs1v1WsxNBUxpsNzo2pWHwd7AfxQ2DiRttbiNSkv"
+    "AzYfcVMYhUa+EugpmG5wuDwb71OLrFCYw0fZFOEN3ISv20OrbJdfrkKMcyfXKUukrzrEoZ"
+    "mSpM9YtZmeL+AmsiGHdWqOpC+LTRJGnJL2o4KZMKLw17Cew3YPNLJ7wBE2OpHFeS0rJJaV"
+    "Hdfy2tf+eUtHF8nGM/gVKpG4rIixyQBd4shuQAP6RQ0ohYTWhUllbf+j4IKfRL1F5cNL+/"
+    "DCn1nV73w7J4AOWzTu9UcqrnwamMewC7IB0IyjwXOpChuwo45ClVZGCsfkAVVts2ehxT5b"
+    "U8+4hKsII1saghOYo4hukG0kYWhh5de2BcicounbrqNS5KpST4jkywmsRInJy9TELil5F8"
+    "RPKRZ81HZoB4URiDMpuBcrt2wlKA1I0041bGmW1ApiaUbgtITok5hy0Cj+6waRVENEm2ls"
+    "ge5zlyPE4/cTyOHTgSa2RQndCEqX5qGDpGNGX/CcpFsByDYFlLZ9ENOf+Oc9rrdULE97Qd"
+    "NS5cXZy2+i8OXoYPxdvdQXTWI4uBqocTBmm2wSEkuAF7Q7WMOxUyLyybnWlfMPENsRg2V7"
+    "IdxYSl+agC5qOYKSQPqd8mf60QVZP0dbv01RkiCezVGzvp5NU7g94sd70OHtMBGgxTNpoh"
+    "a+Y4e4ZcScNe8s6ACd7IFvQ6LRcw0R9/ACrSibR0fjwloE8WJHdBGcmTQ1AuENRfEMqlTD"
+    "2hPD5o5KEhB410HsLzfiXsMCtenQ2JSkWrAopWsGu9xT2uNWRRzKCYZJgxH3Z/Ly6w+ETl"
+    "amkF2YxHX9j/wiR3oLXeJan5ny573TT/i5BYBMwrCq281siE7Sk6cMG/KwltBpS84aHxGv"
+    "PGiDpeRNYOXkHUG4PB9lcIZE9AwpsD3h1fta+VX0R4BQjQk9ywBYWeoT++p3gVDosRl3wu"
+    "gy7DGWcXt+4r5C+xt+a1+8CY2gCE9fdois+xHIEfPCeIdUegV1FV176nx19wdZcuYRu1J+"
+    "8ykEOFpmyp9uQ+ngLMs4FxixNDe4by97Ksy6ZTcsR4UWvzZuaYLRk/LPhTTHwHT5RG4S0Y"
+    "hUXXFjYnhKWk148Lpjt8i9gwXZF62i5rYqvMdehPitufibQ7V9LuvNw+4kpGltk5ICWtzh"
+    "G+bxW+bxMQkQxfoCG5aXhYVOlSswA2QVVeAp6uIvMG5dOMVV6ZIqpQpoapwBI2w5S5LEZB"
+    "VBNJhkl+iJR9NYL8ShXIiwnbmfxZOjaeI1IoepcnIDXrwAJa1HclKFNHIDfv9L1AlnVvwG"
+    "JZlO/FBOvpwFLWBQWLFQ6EFpaqJ5ybH6DCD74olCEhiaTLgYDpJIP49Pc/lrJb/PrHHcH3"
+    "jqoVUZqa5xft7jsFaXNCh7TfumzxNrf67xTYfzEyJ6DUDGmz2+z873IA5bjvkMWG9Gu79Y"
+    "2XClRcOM5fjj45yIry91t/laV5Nmh/bQHiE+4HM6Tt7jKF0GXa5dUl/3gL/wSLZVu8Lv5V"
+    "luj3XFbpnA1/l4XAowizi97Yi4jV0qlq80uPhhfIZHOgJkWwDEtJKB2FDUAotBd6ArUEsJ"
+    "EHwEY6gI2ka4532CRQX1FzYERSmgRjwFr2ApvJlq2nkA2JSmhl3KpncS4hPxL2W3RszKlF"
+    "EFDduCGr3fv2JOXF7x2fAXtmLs4tmeP2spKZLCJfT2WsDGNZBCH8sCBm0rWA7GmTXoucQj"
+    "ueQuLowtWc3RjGhadRVh1yKiUhvZJSkViBnEA7mEArRafYrX9xhXwMku5BrQlHLe9RJF+K"
+    "kEE4k/yYV8ci6j1dU0hkYJfyHfGbsLVOZmqCX5Gbs5flWYT8MpWJS9qmKRHpE71/CI2toG"
+    "7P79TJQgTb+U/j4Oj10ZvDk6M3UES8iZfyOkOfWJrr0r19VohTuG54wp2fX5ei4PKpUQBE"
+    "t3g9ASzrg4cs8RQu/dJ9QGQD1+6r5b67sXv3BdT1Up1WQ7tukvdqdFvOcGMVRa1A0crsOd"
+    "LlNDoOZayvbW5Dy9A5AosCcEbl6glpKRuTMf4HT1jRzxKGpeoJZ4kh1BIv6GR4RweF6gnm"
+    "watGnohQvFjG6GzEokIxgyF9ZJEfScGxyU0qCQrLPU2GKoKpw4feNhqHh68brw5P3hwfvX"
+    "59/OaVR4ziWVkM6bT9Ie7TwH27UhBNhTMkUzM012SXQdPVBJM7EcyDJZrxMsZjXHZ7KL6q"
+    "wYAsFI7ME9gVL1L/FBZ/5Q/+lD9KUjlLiU1WQ79nx4M5jnHM7fmsd/Gl0xpwF+eJMV/w+4"
+    "zakDZPe32RhsaGyRwPwh27OEuvst/C+Uh6lf0WHZtwFJx2lClDOqp5bCEypONaoMmQjsXx"
+    "ywj4IEM6rhXSUYYjLBSOUEbDXD8a5m7OcMJ+V5dAdayPhm0KdSZ2npNeeC/rbCfiKMbFZr"
+    "7Yk2FLnEcopqHr9kIxpkq4PsUN6RgPV5JXcEiHtEcxFLxXFthU+MuJaCZAqMaEOoVBHAYb"
+    "hoEgWrinONNClHNXlz3lFi+YYi+GlBk8EXKt5VMUZJpA2PaVCwLvQG8UDVRaKnxfIAsrFo"
+    "OpoXGBoTpUFRjrM3gVNkNU6V51OkNqGfwXgz9YcYY5PO5RAczgWViDYcbbhS1eYJ4WeuVa"
+    "HduTW2c1F81Rl0PBu8Aemu6BdTP64R15hlb2GZrfVUVIlS9VT0JVXwIVp8beFMt7KOIJ1P"
+    "VApITDuvDylBfJsNQWLXdrLCNbADODm2ZdjU/nprWA8vAkB5KH0ZXCB5Jn5f/cRQaQWbaR"
+    "Z4rkxLCTXMRSD5W88nU6S9rYcRxUPyUaBs40sux5AsECspEKXFQ0guCUy5aG4f4aKGZAdN"
+    "67Ou20lC/91ln7su0eHnlKgMjkSf59936r2amOD12YUn0yxj2bjY0H9Un25Rfdy8+9/jHG"
+    "hi/0JPMKP1EBaWWOLQtaotwjwjiLAaIzxsrCHuvEmgF/gd+f0fQWxdnYOpVxhvbNJIxhqh"
+    "AqKJAF4IBmj6iFHE0emBMBmhXheIKeCbKtKeNHLjmkDgRAzHT0qBgwH0SFY9O4BcYFvQra"
+    "nI61G/4CkO6+ZM5gltcqxQ9shOBV5wsmPjMqiVLZRGlHSs2ub3Vufi9eoEdurIrDmOWW4I"
+    "lIh+3o2E1yRnCXhgR3hFSVJyjyLLWe6Joagy7bJJIgLm0ju7eNWGyETdNICN80gA5LM5AE"
+    "pWqybGd1W+v7IHuJ8Xqt0+t+WBaPrjvS1ab2HhlprjYZh7yT2KX5NU/b6nwLfy9y7hYGpz"
+    "JHb7/+D5kh8cA="
+)
@@ -0,0 +1,97 @@
+from tortoise import BaseDBAsyncClient
+
+# The unique index is built CONCURRENTLY so uploads keep running while it scans
+# the image table, which cannot happen in a transaction block; statements are
+# executed one by one. It fails if two images already share an object key,
+# such rows have to be cleaned up by hand first.
+RUN_IN_TRANSACTION = False
+
+UPGRADE_STATEMENTS = [
+    'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "uid_image_filepat_e5eda4" ON "image" ("filepath")',
+]
+
+DOWNGRADE_STATEMENTS = [
+    'DROP INDEX CONCURRENTLY IF EXISTS "uid_image_filepat_e5eda4"',
+]
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    for statement in UPGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    for statement in DOWNGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+MODELS_STATE = (
+    "eJztXWtv27gS/SuCvmwL5AaN8+gDiws4idu6dezCcdrejRcGbdExNzLllag8WvS/3yEl6y"
+    "1Fsi1bavgliEkOJR6+5gyHo5/q3NCwbu2f6ciyyJRMECMGVd8pP1WK5hj+SSmxp6hosfDz"
+    "eQJDY12ITOJlxxYz0YRB7hTpFoYkDVsTkyzc51Fb13miMYGChN74STYl/9p4xIwbzGbYhI"
+    "zrvyGZUA0/YIv/vFYthpgt3mFiYsSwNkJMhVLXqoYYsjAbES0pl8zRDU7JW/4ePyYU4G+w"
+    "uB1NCda1EFpOUZE+Yo8LkXZ11T5/L0ryFo5HE0O359QvvXhkM4N6xW2baPtchufdYIpN/t"
+    "gAchwYF+plkgMSJDDTxh46mp+g4SmydY6/+ufUphMOuyKexP8c/Vct0CMTg/LeJJRx+H/+"
+    "clrlt1mkqvxRZx+b/ReHJy9FKw2L3ZgiUyCi/hKC0D+OqOjKyLAbiV8xQM9myEwGNCwVAR"
+    "ZeOgekLmAeossiPqT+CF5iusRqNQDVOXoY6ZjesBn8PHj1KgPRr82+ABVKCVQNmFXOpOu6"
+    "WQ0nj6Pro+lPkDiSLWrPBZpteCtEJziGqi+9EqKxQZoHUnWBqcZRi+Gqfml1z9vdD+8Ut8"
+    "iQ9q+6XZFi2pSKlLPexZdOa9A6f6dMjPlCx/B2Q/q+2e7wpCkiOnZGT8HeeZujb96m9szb"
+    "aL8E1pRY35xDDiNznDzSw5KRftFc0f3lP2X10poDH9qg9aj+6E67DGwH7YvW5aB58YW3ZG"
+    "5Z/+oCouagxXMaIvUxkvriJNIRXiXKt/bgo8J/Kn/1uq3o8uSVG/yl8ndCNjNG1LgfIS2w"
+    "pC5Tl8CEOtZeaCt2bFhSduxOO9Z9+fiE9bSCvFt9THCTu375PbrOJu+jF9bG8kIXlloDt+"
+    "1v7ZuBLaim5lYtAzLPBDKulE9vE7VJgUYcvveGickN/YwfYwpQBDOXBbWX9VQVNj/VfwsT"
+    "3XtMJTQuoH3QKlCNBLjNy7PmeUtNmrAbQO7cr6m22IUXoqfR89f8DQB4ZeHSlO3twBfbAp"
+    "MR5NN4jCa398jURinzGSY+vHkCoTl1Bd9/7mPdMz8kIxo2afRFlbUan6HBZthsbDyMMIW6"
+    "8EaR+WSMe6LyeoHDx5HRMALjJzSy4lnzxjyagiislpr7bP6krKHzpNXMH2J5bWemL1GuBS"
+    "382DXMZdI6tg3rGLQQ60UMY57A9iw4lTeKwROnRMPurhvZnnUDsRQmFxKL4DnlctVENAPA"
+    "897VaaelfOm3ztqX7V43zLpFJk+CBOJs1v1WsxNBUxpsNzo2pWHwd7AfxQ2DiRttbiNSkv"
+    "AzYfcVMYhUa+EugpmG5wuDwb71OLrFCYw0fZFOEN3ISv20OrbJdfrkKMcyfXKUukrzrEoZ"
+    "mSpM9YtZmeL+AmsiGHdWqOpC+LTRJGnJL2o4KZMKLw17Cew3YPNLJ7wBE2OpHFeS0rJJaV"
+    "Hdfy2tf+eUtHF8nGM/gVKpG4rIixyQBd4shuQAP6RQ0ohYTWhUllbf+j4IKfRL1F5cNL+/"
+    "DCn1nV73w7J4AOWzTu9UcqrnwamMewC7IB0IyjwXOpChuwo45ClVZGCsfkAVVts2ehxT5b"
+    "U8+4hKsII1saghOYo4hukG0kYWhh5de2BcicounbrqNS5KpST4jkywmsRInJy9TELil5F8"
+    "RPKRZ81HZoB4URiDMpuBcrt2wlKA1I0041bGmW1ApiaUbgtITok5hy0Cj+6waRVENEm2ls"
+    "ge5zlyPE4/cTyOHTgSa2RQndCEqX5qGDpGNGX/CcpFsByDYFlLZ9ENOf+Oc9rrdULE97Qd"
+    "NS5cXZy2+i8OXoYPxdvdQXTWI4uBqocTBmm2wSEkuAF7Q7WMOxUyLyybnWlfMPENsRg2V7"
+    "IdxYSl+agC5qOYKSQPqd8mf60QVZP0dbv01RkiCezVGzvp5NU7g94sd70OHtMBGgxTNpoh"
+    "a+Y4e4ZcScNe8s6ACd7IFvQ6LRcw0R9/ACrSibR0fjwloE8WJHdBGcmTQ1AuENRfEMqlTB"
+    "158vFBIw8JOWiksxCe9ythf1nx4mxIVKpZFVCzgl3rLe1xnSGLYAbFJL+MebD7O3GBpScq"
+    "V0sbyGb8+cLeFya5A531LknJ/3TZ66Z5X4TEImBeUWjltUYmbE/RgQn+XUloM6DkDQ+N15"
+    "gvRtTtIrJ28AqivhgMNr9CIHsCEt4c8O74on2tvCLCK0CAnOSGLSj0DL3xPcWrcFCMuORz"
+    "GXQZrji7uHNfIW+JvTUv3QfG1AYgrL8/U3yO5Qj74LlArDsCvYqquvY9Pf6Cq7t0CNuoNX"
+    "mXYRwqNGVLtSb38RRgng2MW5wY2DOUv5dlWzadkiPGi1qbNzLHLMn4YcGfYuI7eKI0CW/B"
+    "JCy6trA5ISxVR1tmKUZhd/gWsWG6IvW0XdbEVpnryJ8Utz8TaXeupN15uX3ElYwss3NASl"
+    "qdI3zfKnzbJiAiGb5AQ3LT8LCo0pVmAWyCqrwEPF1F5g3KpxmrvDJFVKFMDVOBJWyGKXNZ"
+    "jIKoJpIMk/wQKftqBPmVKpDXErYz+bN0bDxHpFDsLk9AataBBbSo50pQpo5Abt7le4Es69"
+    "6AxbIo34sJSk+g4PUEixUOgxaWqiecmx+gwgu+KJQhIYmky4GA6SSD+PTXP5ayW/z2xx3B"
+    "946qFVGamucX7e47BWlzQoe037ps8Ta3+u8U2H8xMieg1Axps9vs/O9yAOW475DFhvRru/"
+    "WNlwpUXDjKX44+OciK8fdbf5OleTZof20B4hPuBzOk7e4yhdBl2uXVJf90C/8Ai2VbvC7+"
+    "TZbo11xW6ZwNf5WFwKMIs4ve14uI1dKpavNLj4YXyGRzoCZFsAxLSSgdhQ1AKLQXegK1BL"
+    "CRB8BGOoCNpEuOd9gkUF9Rc2BEUpoEY8Ba9gKbyZatp5ANiUpoZdSqZ3EuIT8R9lt0bMyp"
+    "RRBQ3bghq9369iTlte8dnwF7Zi7OLZnj9rKSmSwiX09lrAxjWQQh/LAgZtK1gOxpk16LnE"
+    "I7nkLi6MLVnN0IxoWnUVYdciolIb2SUpFYgZxAO5hAK8Wm2K1/cYV8DJLuQa0JRy3vUSRf"
+    "ipAhOJP8mFfHIuo9XVNIZFiX8h3xm7C1TmZqgl+Rm7OX5VmE/DKViUrapinx6BO9fwiNra"
+    "Buz+/UyUKE2vlP4+Do9dGbw5OjN1BEvImX8jpDn1ia69K9fVaIUrhucMKdn1+XouDyqVEA"
+    "RLd4PQEs63OHLPEULv3SfUBkA9fuq+W+u7F79wXU9VKdVkO7bpL3anRbznBjFUWtQNHK7D"
+    "nS5TQ6DmWkr21uQ8vQOQKLAnBG5eoJaSkbkzH+B09Y0Y8ShqXqCWeJIdQSL+hkeEcHheoJ"
+    "5sGrRp6IULxYxuhsxKJCMYMhfWSRH0mhsclNKgkKyz1NhiqCqcOH3jYah4evG68OT94cH7"
+    "1+ffzmlUeM4llZDOm0/SHu08B9u1IQTYUzJFMzNNdkl0HT1QSTOxHMgyWa8TLGY1x2eyi+"
+    "qsGALBSOzBPYFS9S/xQWf+UP/pQ/SlI5S4lNVkO/Z8eDOY5xzO35rHfxpdMacBfniTFf8P"
+    "uM2pA2T3t9kYbGhskcD8IduzhLr7LfwvlIepX9Fh2bcBScdpQpQzqqeWwhMqTjWqDJkI7F"
+    "8csI+CBDOq4V0lGGIywUjlBGw1w/GuZuznDCfleXQHWsj4ZtCnUmdp6TXngv62wn4ijGxW"
+    "a+2JNhS5xHKKah6/ZCMaZKuD7FDekYD1eSV3BIh7RHMRS8VxbYVPjLiWgmQKjGhDqFQRwG"
+    "G4aBIFq4pzjTQpRzV5c95RYvmGIvhpQZPBFyreVTFGSaQNj2lQsC70BvFA1UWip8XyALKx"
+    "aDqaFxgaE6VBUY6zN4FTZDVOledTpDahn8F4M/WHGGOTzuUQHM4FlYg2HG24UtXmCeFnrl"
+    "Wh3bk1tnNRfNUZdDwbvAHprugXUz+tkdeYZW9hma31VFSJUvVU9CVV8CFafG3hTLeyjiCd"
+    "T1QKSEw7rw8pQXybDUFi13aywjWwAzg5tmXY1P56a1gPLwJAeSh9GVwgeSZ+X/3EUGkFm2"
+    "kWeK5MSwk1zEUg+VvPJ1Okva2HEcVD8lGgbONLLseQLBArKRClxUNILglMuWhuH+GihmQH"
+    "TeuzrttJQv/dZZ+7LtHh55SoDI5En+ffd+q9mpjg9dmFJ9MsY9m42NB/VJ9uUX3cvPvf4x"
+    "xoYv9CTzCj9RAWllji0LWqLcI8I4iwGiM8bKwh7rxJoBf4Hfn9H0FsXZ2DqVcYb2zSSMYa"
+    "oQKiiQBeCAZo+ohRxNHpgTAZoV4XiCngmyrSnjRy45pA4EQMx09KgYMB9EhWPTuAXGBb0K"
+    "2pyOtRv+ApDuvmTOYJbXKsUPbITgVecLJj4yKolS2URpR0rNrm91bn4vXqBHbqyKw5jllu"
+    "CJSIft6NhNckZwl4YEd4RUlSco8iy1nuiaGoMu2ySSIC5tI7u3jVhshE3TSAjfNIAOSzOQ"
+    "BKVqsmxndVvr+yB7ifF6rdPrflgWj6470tWm9h4Zaa42GYe8k9il+TVP2+p8C38vcu4WBq"
+    "cyR2+//g9jbvEq"
+)
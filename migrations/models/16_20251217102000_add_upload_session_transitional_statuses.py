@@ -0,0 +1,87 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "uploadsession" ALTER COLUMN "status" TYPE VARCHAR(10) USING "status"::VARCHAR(10);
+        COMMENT ON COLUMN "uploadsession"."status" IS 'ACTIVE: active\nCOMPLETING: completing\nCOMPLETED: completed\nABORTING: aborting\nABORTED: aborted';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        UPDATE "uploadsession" SET "status" = 'active' WHERE "status" = 'completing';
+        UPDATE "uploadsession" SET "status" = 'aborted' WHERE "status" = 'aborting';
+        ALTER TABLE "uploadsession" ALTER COLUMN "status" TYPE VARCHAR(9) USING "status"::VARCHAR(9);
+        COMMENT ON COLUMN "uploadsession"."status" IS 'ACTIVE: active\nCOMPLETED: completed\nABORTED: aborted';"""
+
+
+MODELS_STATE = (
+    "eJztXWtv27gS/SuCvmwL5AaN8+gDiws4idu6dezCcdrejRcGbdExNzLllag8WvS/3yEl6y"
+    "1Fsi1bavgliEkOJR6+5gyHo5/q3NCwbu2f6ciyyJRMECMGVd8pP1WK5hj+SSmxp6hosfDz"
+    "eQJDY12ITOJlxxYz0YRB7hTpFoYkDVsTkyzc51Fb13miMYGChN74STYl/9p4xIwbzGbYhI"
+    "zrvyGZUA0/YIv/vFYthpgt3mFiYsSwNkJMhVLXqoYYsjAbES0pl8zRDU7JW/4ePyYU4G+w"
+    "uB1NCda1EFpOUZE+Yo8LkXZ11T5/L0ryFo5HE0O359QvvXhkM4N6xW2baPtchufdYIpN/t"
+    "gAchwYF+plkgMSJDDTxh46mp+g4SmydY6/+ufUphMOuyKexP8c/Vct0CMTg/LeJJRx+H/+"
+    "clrlt1mkqvxRZx+b/ReHJy9FKw2L3ZgiUyCi/hKC0D+OqOjKyLAbiV8xQM9myEwGNCwVAR"
+    "ZeOgekLmAeossiPqT+CF5iusRqNQDVOXoY6ZjesBn8PHj1KgPRr82+ABVKCVQNmFXOpOu6"
+    "WQ0nj6Pro+lPkDiSLWrPBZpteCtEJziGqi+9EqKxQZoHUnWBqcZRi+Gqfml1z9vdD+8Ut8"
+    "iQ9q+6XZFi2pSKlLPexZdOa9A6f6dMjPlCx/B2Q/q+2e7wpCkiOnZGT8HeeZujb96m9szb"
+    "aL8E1pRY35xDDiNznDzSw5KRftFc0f3lP2X10poDH9qg9aj+6E67DGwH7YvW5aB58YW3ZG"
+    "5Z/+oCouagxXMaIvUxkvriJNIRXiXKt/bgo8J/Kn/1uq3o8uSVG/yl8ndCNjNG1LgfIS2w"
+    "pC5Tl8CEOtZeaCt2bFhSduxOO9Z9+fiE9bSCvFt9THCTu375PbrOJu+jF9bG8kIXlloDt+"
+    "1v7ZuBLaim5lYtAzLPBDKulE9vE7VJgUYcvveGickN/YwfYwpQBDOXBbWX9VQVNj/VfwsT"
+    "3XtMJTQuoH3QKlCNBLjNy7PmeUtNmrAbQO7cr6m22IUXoqfR89f8DQB4ZeHSlO3twBfbAp"
+    "MR5NN4jCa398jURinzGSY+vHkCoTl1Bd9/7mPdMz8kIxo2afRFlbUan6HBZthsbDyMMIW6"
+    "8EaR+WSMe6LyeoHDx5HRMALjJzSy4lnzxjyagiislpr7bP6krKHzpNXMH2J5bWemL1GuBS"
+    "382DXMZdI6tg3rGLQQ60UMY57A9iw4lTeKwROnRMPurhvZnnUDsRQmFxKL4DnlctVENAPA"
+    "897VaaelfOm3ztqX7V43zLpFJk+CBOJs1v1WsxNBUxpsNzo2pWHwd7AfxQ2DiRttbiNSkv"
+    "AzYfcVMYhUa+EugpmG5wuDwb71OLrFCYw0fZFOEN3ISv20OrbJdfrkKMcyfXKUukrzrEoZ"
+    "mSpM9YtZmeL+AmsiGHdWqOpC+LTRJGnJL2o4KZMKLw17Cew3YPNLJ7wBE2OpHFeS0rJJaV"
+    "Hdfy2tf+eUtHF8nGM/gVKpG4rIixyQBd4shuQAP6RQ0ohYTWhUllbf+j4IKfRL1F5cNL+/"
+    "DCn1nV73w7J4AOWzTu9UcqrnwamMewC7IB0IyjwXOpChuwo45ClVZGCsfkAVVts2ehxT5b"
+    "U8+4hKsII1saghOYo4hukG0kYWhh5de2BcicounbrqNS5KpST4jkywmsRInJy9TELil5F8"
+    "RPKRZ81HZoB4URiDMpuBcrt2wlKA1I0041bGmW1ApiaUbgtITok5hy0Cj+6waRVENEm2ls"
+    "ge5zlyPE4/cTyOHTgSa2RQndCEqX5qGDpGNGX/CcpFsByDYFlLZ9ENOf+Oc9rrdULE97Qd"
+    "NS5cXZy2+i8OXoYPxdvdQXTWI4uBqocTBmm2wSEkuAF7Q7WMOxUyLyybnWlfMPENsRg2V7"
+    "IdxYSl+agC5qOYKSQPqd8mf60QVZP0dbv01RkiCezVGzvp5NU7g94sd70OHtMBGgxTNpoh"
+    "a+Y4e4ZcScNe8s6ACd7IFvQ6LRcw0R9/ACrSibR0fjwloE8WJHdBGcmTQ1AuENRfEMqlTB"
+    "158vFBIw8JOWiksxCe9ythf1nx4mxIVKpZFVCzgl3rLe1xnSGLYAbFJL+MebD7O3GBpScq"
+    "V0sbyGb8+cLeFya5A531LknJ/3TZ66Z5X4TEImBeUWjltUYmbE/RgQn+XUloM6DkDQ+N15"
+    "gvRtTtIrJ28AqivhgMNr9CIHsCEt4c8O74on2tvCLCK0CAnOSGLSj0DL3xPcWrcFCMuORz"
+    "GXQZrji7uHNfIW+JvTUv3QfG1AYgrL8/U3yO5Qj74LlArDsCvYqquvY9Pf6Cq7t0CNuoNX"
+    "mXYRwqNGVLtSb38RRgng2MW5wY2DOUv5dlWzadkiPGi1qbNzLHLMn4YcGfYuI7eKI0CW/B"
+    "JCy6trA5ISxVR1tmKUZhd/gWsWG6IvW0XdbEVpnryJ8Utz8TaXeupN15uX3ElYwss3NASl"
+    "qdI3zfKnzbJiAiGb5AQ3LT8LCo0pVmAWyCqrwEPF1F5g3KpxmrvDJFVKFMDVOBJWyGKXNZ"
+    "jIKoJpIMk/wQKftqBPmVKpDXErYz+bN0bDxHpFDsLk9AataBBbSo50pQpo5Abt7le4Es69"
+    "6AxbIo34sJSk+g4PUEixUOgxaWqiecmx+gwgu+KJQhIYmky4GA6SSD+PTXP5ayW/z2xx3B"
+    "946qFVGamucX7e47BWlzQoe037ps8Ta3+u8U2H8xMieg1Axps9vs/O9yAOW475DFhvRru/"
+    "WNlwpUXDjKX44+OciK8fdbf5OleTZof20B4hPuBzOk7e4yhdBl2uXVJf90C/8Ai2VbvC7+"
+    "TZbo11xW6ZwNf5WFwKMIs4ve14uI1dKpavNLj4YXyGRzoCZFsAxLSSgdhQ1AKLQXegK1BL"
+    "CRB8BGOoCNpEuOd9gkUF9Rc2BEUpoEY8Ba9gKbyZatp5ANiUpoZdSqZ3EuIT8R9lt0bMyp"
+    "RRBQ3bghq9369iTlte8dnwF7Zi7OLZnj9rKSmSwiX09lrAxjWQQh/LAgZtK1gOxpk16LnE"
+    "I7nkLi6MLVnN0IxoWnUVYdciolIb2SUpFYgZxAO5hAK8Wm2K1/cYV8DJLuQa0JRy3vUSRf"
+    "ipAhOJP8mFfHIuo9XVNIZFiX8h3xm7C1TmZqgl+Rm7OX5VmE/DKViUrapinx6BO9fwiNra"
+    "Buz+/UyUKE2vlP4+Do9dGbw5OjN1BEvImX8jpDn1ia69K9fVaIUrhucMKdn1+XouDyqVEA"
+    "RLd4PQEs63OHLPEULv3SfUBkA9fuq+W+u7F79wXU9VKdVkO7bpL3anRbznBjFUWtQNHK7D"
+    "nS5TQ6DmWkr21uQ8vQOQKLAnBG5eoJaSkbkzH+B09Y0Y8ShqXqCWeJIdQSL+hkeEcHheoJ"
+    "5sGrRp6IULxYxuhsxKJCMYMhfWSRH0mhsclNKgkKyz1NhiqCqcOH3jYah4evG68OT94cH7"
+    "1+ffzmlUeM4llZDOm0/SHu08B9u1IQTYUzJFMzNNdkl0HT1QSTOxHMgyWa8TLGY1x2eyi+"
+    "qsGALBSOzBPYFS9S/xQWf+UP/pQ/SlI5S4lNVkO/Z8eDOY5xzO35rHfxpdMaCH/miTFf6J"
+    "gB9F46d312k7nrc/O013fKorFhOiVFGi8nkhxvw937qksntN/CV0k6of0WHZtwcpx28ikj"
+    "QKp5TCcyAuRaoMkIkMXxy4gPISNArhUBUkYvLBS9UAbPXD945m6OfMJuWpfAjKyPhm0KdS"
+    "Z2/JNeeC/rKCjiV8bFZr7Yk1FOnEcopqHr9kIxpkq4PsWNABmPbpJXcEiHtEcxFLxXFthU"
+    "+MuJ4CfAs8aEOoVBHAYbhoEgWrinONNClHNXlz3lFi+YYi+GlBk8EXKt5VMUZJrA7/aVCw"
+    "LvQG8UDVRaKlxlIAsrFoOpoXGBoTpUFRjrM3gVNkNU6V51OkNqGfwXgz9YcYY5PO5RAczg"
+    "WViDYcbbhS1eYJ4WqeVaHduTW2c1F81Rl0PBu+8emu6BdTP6lR555Fb2kZvfVUVIlS9VT0"
+    "JVXwIVp8beFMt7huIJ1PX8pISzvfDylBfJsNQWDX1rLCNbADODm2bdpE/nprWA8vAkB5KH"
+    "0ZXCB5Jn5f86RgaQWbaRZ4rkxLCTPMpSz6C88nU6etrY6R1UPyUaBs40sux5AsECspEKXF"
+    "Q0guCUy5aG4f4aKGZAdN67Ou20lC/91ln7su2eNXlKgMjkSf71+H6r2amOy12YUn0yxj2b"
+    "jY0H9Un25Rfdy8+9/jHGhi/0JPMKP1EBaWWOLQtaotwjwg+bFCA6Y6ws7LFOrBnwF/j9GU"
+    "1vUZyNrVMZZ2jfTMIYpgqhggJZAA5o9ohayNHkgTkRoFkRjifomSDbmjJ+5JJD6kAAxExH"
+    "j4oB80FUODaNW2Bc0KugzelYu+EvAOnuS+aMfXmtUvzARghedb5g4pukkiiVTZR2pNTs+h"
+    "Lo5vfiBXrkxqo4jFleDJ6I9O+Ojt0k3wV3aUjwXkhVeYIiz1Lria6pMeiyTSIJ4tI2snvb"
+    "iMVG2DSNhGhPA+iwNANJUKomy3ZWt7W+D7KXGK/XOr3uh2Xx6LojXW1q75GR5mqTccg7id"
+    "2xX/O0rc6X9vci525hcCpz9Pbr/7SxAMk="
+)
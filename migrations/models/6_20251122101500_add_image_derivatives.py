@@ -0,0 +1,60 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "image" ADD "derivatives" JSONB;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "image" DROP COLUMN "derivatives";"""
+
+
+MODELS_STATE = (
+    "eJztnWtv2joYgP8KyqdO6qlW1u5SHR2JQrpxRqECuu1snZCbGLAaHJZLL5v2349tcnWcFH"
+    "MpyeovU7H9Osnj23uxvV/azDah5R40LeC6aIwM4CEbaye1XxoGM0j+yCmxX9PAfB7n0wQP"
+    "XFtMxMiWvXY9BxgeyR0Dy4UkyYSu4aB58DzsWxZNtA1SEOFJnORj9MOHI8+eQG8KHZLx7T"
+    "tJRtiE99ANf85vRmMELTP16sikz2bpI+9hztIuL9utM1aSPu56ZNiWP8Nx6fmDN7VxVNz3"
+    "kXlAZWjeBGLoAA+aic+gbxl8d5i0eGOS4Dk+jF7VjBNMOAa+RWFof499bFAGNfYk+s/RP5"
+    "oEHsPGFC3CHmXx6/fiq+JvZqkafVTzQ6O/9+r1C/aVtutNHJbJiGi/mSDwwEKUceX6wIj9"
+    "ygBtToEjBpqW4sCSl14CaQAsIhoWiZHG3SlkGrJaDaA2A/cjC+KJNyU/D1++LCD6qdFnUE"
+    "kpRtUmXXwxArpBVn2RR+nGNF0PeL4rJqljf8ZotslbAWzADNVYeiWimU66DFJtDrFJqWW4"
+    "ahd6t9Xuvj+pBUWucP+y22Upjo8xS2n2zi86+lBvndQMeza3IHm7K3zWaHdo0hggCy56j2"
+    "TrvFuibd7ltsw7vl0MB1JuI+Bl26ZFcjw0g+Kenpbk2sUMRA/CP7bVSmt2fPINZg9bD8Gw"
+    "K2A7bJ/rg2Hj/IJ+ycx1f1gMUWOo05w6S33gUvdecw0RVVL73B5+qNGfta+9rs5PT1G54V"
+    "eNvhPwPXuE7bsRMBNTapgagkk1rD83V2zYtKRq2J02bPDy2QF7/TCSW+ozgptc9bffouss"
+    "8jE9utq70JNEl5Zag9vTL+2bwYZmYAIloSVlngkyqpSPb4TaJKORxXdmOxBN8Ef4kFGAOG"
+    "aBSdIO6ykrtjg1fgsH3EWWSqpfkO8jX0VUIwa3MWg2WromGrAbINeKa6osu/RE9Di9eM7f"
+    "AMBLF25N2X4afJklUEyQDuNrYNzcAccc5YxnMvDJmwsMmtNA8OxjH1qRL0BMNO1f6LMqK9"
+    "U/GSq7bicQpeBls2b1GZ8CMJkQzODZ9ElFdB710sQUl/XVOLGE8thU2WNDvhBaMs6aSODp"
+    "vAqld9SQJ46RCYOVgFsyLBt4OdZFSozjOaZy5SRaALDVuzzt6LWLvt5sD9q9btoSZJk0iS"
+    "SgxQLS1xsdjqZyIm60bypn1Z/g08g6q9ILsqxjQyT8TCzOkhjp5Zq4q2Oll9hWkjPTs9HP"
+    "NQlmQ69lHbWPW52i+UnW8tymoRV6RgS2VcJpkm9OJXw0yoKqtAUlq6iupaLu3H6qHx8voa"
+    "OSUrk6KsvjIgyJN8uQHML7HPuJE6uIzl+kgupfhintM6S2d9748iKlgXZ63fdh8QTlZqd3"
+    "qgyA52EA2HcEtqTumpRRuusCh3Lzcx1jdQ9/Wm3bqKe/zHN51sefsTHXZFFB42ircY4WvE"
+    "UG1ETa9yKnWPmOyyjdW+nez1r3nhLishiTMptB+XiPLD1Iy85z5BQE0xIyFTFfnoDkGDkz"
+    "skTA0S10XEmiItlKkj1eJhZ0nB8KOs5EgpA7srGFsGCon9q2BQHOWX+SchzLayK4ralTdk"
+    "FefsU57fU6KSPvtM0b0pfnp3p/7/BFOlrZ7g75UQ9cb+RCKOikxcZ1SnADtnW5HBklMqXD"
+    "zy60pR04Qa4HnZX8JBlh5SopgaskY/YvY8A+pa1WInN1m6baAofAUos45RtqUWxR2WmVtt"
+    "PGiOg1kkZGUkbZaymUc0Dql0QZylQT5fFhfRl1+LCerw/TvDRKf27ZwFzxvFdKVC34JVjw"
+    "k01LFiPr4ScUzN+Fpk5STFk6fJDWQbdE9bkV6Uf/DnrdvCBtSoyjeonJt34zkeHt1yyiRH"
+    "8vs94kAkw/vDhky0dnuc5OK+BDtjs+cVep6F66i1K/viy2pNAz3AIZLWXSp2Ozks+l0xWE"
+    "lHdx+K5EUb/9NU/fJfqUissLx9gS5z+j8Oa6PTCqqKxz3+P9Lzm7q40NG93YsMvznCUasl"
+    "v1nvXhmGCeDu0bKLxuK5W/X+RLcxYlRx4t6m7dqfZNg/dz+hQH3pInmtp35WbbtpuNNe1o"
+    "Clwp71BaSsXzA5hB95XxCgUi1fQGVcT7s1Q4D8l79JDy5JXSkxcuH1klo8iRl5BSfjzO3n"
+    "eld40nRJSFz2go2zTdLcp0NI+BFajKIfB8FZl+0HKasUYrq7EqamPbqZEpbAqxF1gxNYBN"
+    "lmQ76CdLOdA48itVoELZTzP4i3RsOANI6sKUSEBp1okJVHY3QFKmiiA3v51zDlz3ziaTpa"
+    "y9lxGs5paAbW09dj3pu2fSUtXEufkOyna4yqJMCSmSgQ1ELB0xxMevAQ9ln/AS8FsE7xaq"
+    "Fqc0NVrn7e5JDZgzhK9wXx/o9Jv1/kmNrL8QOAZRaq5wo9vo/DcYknJ0N4brXeFPbf0zLZ"
+    "WoWPpqpSXa5LDoYqU/+nL2RnPY/qQT4gbdqHGF290wBeEwbXA5oHe405vYXd+lddHL2flr"
+    "3VdpnA1fz47Io5Dny57F4cTUoZEgljgHjjcjpokMy7SUQrlQ2AgEqbUwEqgkwPoyAOv5AO"
+    "uiA0y30EGkPll3ICepXIIZsK4/h47Ys/UY2ZSoQqtuX3kWcQn1f4X8EQ2b2dTCDFDLnqDV"
+    "TnRGkupI545jwJGbi9qW3mLby0puMk6+msrYNpxlHCF4P0eO6HBA8bDJr0UNoR0PIRa6CD"
+    "Tn4CZO6WFUVIcaSiLSKykVwgrUANrBAFrp3Plu9xeXaI+B6BzUmjgqeY5CfCjiuV4ll94Q"
+    "xu9jXp0Fv3u6Qki2uYOmQZYRY6oJ9tAEOftFu2hAXKY0tza0cc4dwsKdLghnZotgHdzphg"
+    "J2jcZf9cOjN0dvX70+ekuKsDeJUt4UrJ2hayp/Z8sKt22te8nWzmO1W1Hm6NCQgBgUrybA"
+    "bf1/Sp4w4pR/zDwhsoEj5uXaqrqxM+YSqunml5ff/wPG+o+6"
+)
@@ -0,0 +1,60 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "image" ADD "tiles" JSONB;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        ALTER TABLE "image" DROP COLUMN "tiles";"""
+
+
+MODELS_STATE = (
+    "eJztnetv2joUwP8VlE+d1FutrN2juroShXTjjkIFdNvdOiE3MWA1OCxx+ti0//3aJk/nUc"
+    "yjJKu/TMX2ceyfX+ccP/ZLm9kmtNyDpgVcF42RAQiysXZS+6VhMIP0j5wU+zUNzOdRPAsg"
+    "4NriIkY67bVLHGAQGjsGlgtpkAldw0Fz/3vYsywWaBs0IcKTKMjD6IcHR8SeQDKFDo349p"
+    "0GI2zCe+gGP+c3ozGClpkoOjLZt3n4iDzMedjlZbt1xlOyz12PDNvyZjhKPX8gUxuHyT0P"
+    "mQdMhsVNIIYOINCMVYOV0q93ELQoMQ0gjgfDoppRgAnHwLMYDO3vsYcNxqDGv8T+OfpHk8"
+    "Bj2JihRZgwFr9+L2oV1ZmHauxTzQ+N/t6r1y94LW2XTBweyYlov7kgIGAhyrkKfWDEf6WA"
+    "NqfAyQaalBLA0kIvgdQHFhINkkRIo+4UMA1YrQZQm4H7kQXxhEzpz8OXLwuIfmr0OVSail"
+    "O1aRdfjICuH1VfxDG6EU2XAOK52SR17M04zTYtFcAGTFGNpFcimuqkyyDV5hCbjFqKq3ah"
+    "d1vt7vuTmp/kCvcvu10e4ngY85Bm7/yiow/11knNsGdzC9LSXeGzRrvDgsYAWXDReyRb59"
+    "0SbfMut2Xeie1iOJBxGwGSbpsWjSFoBrN7elJSaBfTFz0I/thWK63Z8WkdzB62HvxhV8B2"
+    "2D7XB8PG+QWrycx1f1gcUWOos5g6D30QQvdeCw0RZlL73B5+qLGfta+9ri5OT2G64VeNlQ"
+    "l4xB5h+24EzNiUGoQGYBIN683NFRs2KakadqcN6xc+PWCvH0ZyS31KcJOr/vZbdJ1FPqLH"
+    "VnsXEkl0Sak1uD390r4ZbGgGJlASWlzmmSBjSvn4JlOb5DTS+M5sB6IJ/ggfUgqQwMw3Sd"
+    "pBPmXFFoVGpXDAXWipJPoFrR+tFVWNONzGoNlo6VrWgN0AuVaUU2XZJSeix+lFc/4GAF66"
+    "cGvK9tPgSy2B2QTZML4Gxs0dcMxRznimA5+WPMOgOfUFzz72oRX6ArKJJv0LfZ5lpfonR2"
+    "XX7RiiBLx01Kw+E0MAphOC6X+bfamIzqNemojisr4aJ5JQHpsqe2xoDaEl46wJBZ7Oq1B6"
+    "Rw394hiZ0F8JhCXDsgHJsS4SYgLPMZMrJ9ECgK3e5WlHr1309WZ70O51k5Ygj2RBNAAtFp"
+    "C+3ugINJUTcaN9Uzmr/gSfRtpZlVyQZR0bWcLPxOIsiZFerom7OlZ6iW0lOTM9vfu5JsH0"
+    "1mtZR+3jVmfW/CRreW7T0Ao8Ixm2Vcxpkm9OxXw0yoKqtAUlq6iupaLu3H6qHx8voaPSVL"
+    "k6Ko8TdhhiJUuRHML7HPtJEKuIzl+kgupfhgntM6C2d9748iKhgXZ63fdB8hjlZqd3qgyA"
+    "52EA2HcUtqTuGpdRuusCh3LzCx1jdQ9/Um3bqKe/zHN52sefsjHXZFFB42ir+xwteIsMqG"
+    "Vp34uYYuU7SqN0b6V7P2vde0qJy2KMy2wG5eM9svQgLTvPkVOwmRaTqYj58gQkx8iZ0SUC"
+    "jm6h40oSzZKtJNnjZfaCjvO3go5TO0HIHdnYQjhjqJ/atgUBzll/4nICy2squK2pU3ZBXn"
+    "7FOe31Ogkj77QtGtKX56d6f+/wRXK3st0diqMeuGTkQpjRSYuN64TgBmzrcjkySmRKB9Uu"
+    "tKUdOEEugc5KfpKUsHKVlMBVkjL7lzFgn9JWK5G5uk1TbYEjw1ILOeUbauHeorLTKm2njR"
+    "HVaySNjLiMstcSKOeA5i+JMpCpJsrjw/oy6vBhPV8fZnFJlN7csoG54n2vhKha8Euw4Meb"
+    "li5G1sNPmDF/F5o6cTFl6YibtA66parPbZZ+9O+g183bpE2ICVQvMa3rNxMZZL9mUSX6e5"
+    "n1pizArOLFW7bi7qzQ2VkG4pYtofO1FORQQOFdAu+OLzRWavM0OQOwbRNZbHGhZ3jCNNQU"
+    "pC8fpyWfS6cr2LHfxd3GEm2q7q95uTHWpzaAsPrHHtJjbInrteHu8bo9MMyorHPf4/0vPr"
+    "urcyMbPTeyy+uyJRqyW3VO9uGYYp4O7RuY+ZpZIn6/yFXpLFKOCEvqbt1n+U2D93P2FQfe"
+    "0i+a2nflxdy2F5M37WgKXCnnW1JKHZfwYfrdV8bp5otU09lWEefaUrulSN5hipSjtJSO0m"
+    "D5SCsZRX7SmJRykwr2vit9KD8moix8TkPZpsluUaabjxxshqocAM9XkVmFltOMNZZZjWdR"
+    "G9tOjU5hU4iJb8XUADZ5kO2gnzzkQBPIr5SBOinwNIO/SMeGM4Ck3qMJBZRmHZtAZQ9bxG"
+    "WqCHLzp2XnwHXvbDpZytp7KcFqnrjY1slul0g/7ZOUqibOzXdQfoBYFmVCSJH0bSBq6WRD"
+    "fPyV9UD2Cd9Yv0XwbqFqCUpTo3Xe7p7UgDlD+Ar39YHO6qz3T2p0/YXAMahSc4Ub3Ubnv8"
+    "GQpmOHXVxyhT+19c8sVSxj6ZerlmiTw6J3q/7ot+8bzWH7k06JG+wczBVud4MQhIOwweWA"
+    "PZHPHrp3PZflxd6+F1/NX6VxNvz6PaKfQsSTveokiKk7Of5e4hw4ZEZNExmWSSmFcqGwUQ"
+    "hSa2EoUEmA9WUA1vMB1rPuh91CB9H8ZN2BgqRyCabAut4cOtmercfIJkQVWvW4zbPYl1D/"
+    "Fcsf0bCpQy3cALXsCVrtwmwoqW7M7ngPOHRzMduSLI69rOQmE+SrqYxtw1kmEIL3c+RkXQ"
+    "soHjb5uaghtOMhxLcufM3Zf+hUehgV5aGGUhbplZSKzAzUANrBAFrpWv9uzxeX6IxB1j2o"
+    "NXFU8h5F9qWI5/pSX/JAmHiOeXUW4unpCiHZ5gmaBl1GjKmWcYbGj9kvOkUDojSleRSjjX"
+    "OeaM486YJwarbw18GdHijgr5T8VT88enP09tXro7c0CS9JGPKmYO0MXFP5J1tWeMxs3TfM"
+    "dr5XuxVljg0NCYh+8moC3NZ/V0Uyd5zyL5jHRDZwxbxcR1U3dsdcQjXd/PLy+38hAf8p"
+)
@@ -0,0 +1,84 @@
+from tortoise import BaseDBAsyncClient
+
+RUN_IN_TRANSACTION = True
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS "uploadsession" (
+    "id" UUID NOT NULL PRIMARY KEY,
+    "filename" VARCHAR(255) NOT NULL,
+    "content_type" VARCHAR(100) NOT NULL,
+    "object_key" VARCHAR(512) NOT NULL,
+    "upload_id" VARCHAR(1024) NOT NULL,
+    "total_size" BIGINT NOT NULL,
+    "part_size" INT NOT NULL,
+    "received_bytes" BIGINT NOT NULL DEFAULT 0,
+    "parts" JSONB NOT NULL,
+    "status" VARCHAR(9) NOT NULL DEFAULT 'active',
+    "created_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "updated_at" TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    "dataset_id" UUID NOT NULL REFERENCES "dataset" ("id") ON DELETE CASCADE,
+    "device_id" UUID REFERENCES "device" ("id") ON DELETE CASCADE,
+    "uploaded_by_id" UUID NOT NULL REFERENCES "users" ("id") ON DELETE CASCADE
+);
+COMMENT ON COLUMN "uploadsession"."status" IS 'ACTIVE: active\nCOMPLETED: completed\nABORTED: aborted';"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        DROP TABLE IF EXISTS "uploadsession";"""
+
+
+MODELS_STATE = (
+    "eJztXW1T27gW/isZf9l2htuBAKVldu5MALebuyFhQui+lE5G2ErQ4shZW+Glnf73K8kvsW"
+    "XZREmc2KAvDJF0ZOvR23mOjo5/GBPXho7/7tQBvo9GyAIEudg4bvwwMJhA+k9OiZ2GAabT"
+    "eT5LIODG4SJWtuyNTzxgEZo7Ao4PaZINfctD0/B5eOY4LNG1aEGEx/OkGUb/zuCQuGNIbq"
+    "FHM75+o8kI2/AR+tHP6d1whKBjp14d2ezZPH1InqY87eqqffaJl2SPuxlarjOb4Hnp6RO5"
+    "dXFcfDZD9jsmw/LGEEMPEGgnmsHeMmx3lBS8MU0g3gzGr2rPE2w4AjOHgWH8Opphi2HQ4E"
+    "9ifw7+ayjAY7mYQYswYVj8+Bm0at5mnmqwR53+1uq/2X//lrfS9cnY45kcEeMnFwQEBKIc"
+    "V2EMDPmvDKCnt8CTA5qWEoClL70ApCFgMaJRkTmk8+EUYRphtRyAxgQ8Dh2Ix+SW/tzb3S"
+    "1A9Eurz0GlpTiqLh3iwQzohlnNII+hO0fTJ4DMfDmSJp5NOJpt+lYAWzCD6lx6KUQzg3QR"
+    "SI0pxDZDLYOrcWF2z9rdz8eNsMg17l91uzzFm2HMU0575xcdc2CeHTcsdzJ1IH27a/yp1e"
+    "6wpBFADgxGj2LvfFygbz7m9sxHsV8sDzLchoBk++aM5hA0gfKRnpYU+sUORd9F/5TVSysO"
+    "fNoGu4edp3DaFWA7aJ+bl4PW+QVrycT3/3U4RK2ByXKaPPVJSH3zXuiIuJLGH+3Bbw32s/"
+    "F3r2uKy1NcbvC3wd4JzIg7xO7DENiJJTVKjYBJdexsai/ZsWlJ3bFb7djw5bMT9uZpqLbV"
+    "ZwTXueuX36OrbPJz9Nhu70OiCF1aagXcNr+1rwc2NAFjqAhaUuaVQMaU8tGdVJvkaGTh++"
+    "R6EI3x7/ApowAJmIWUpB3VU1XY5qnzt/DAQ8xUUuOCto+2iqpGHNzW5WnrzDRkE3YNyJ3N"
+    "a6otdumF6Hn05mv+GgC88mFpyvZm4MtsgXIE2TS+AdbdA/DsYc58phOfvrmE0JyEgp9+70"
+    "MntgXIEU3bF/q8ylqNTw6V23QTEKXAy2ZNmhMxBWC6INjhs9mTitB51kozR3FRW403l9AW"
+    "mzpbbGgLoaNirIkFNmdVqLyhhj5xhGwY7gTCluG4gOSwi5SYgOeIyVUT0QIAz3pXJx2zcd"
+    "E3T9uX7V43zQR5JkuiCSjYQPpmqyOgqY2Iax2b2lj1EmwaWWNVekNWNWzIhF8J46wISa/W"
+    "wl0fll5hrqRG07OnnysimD16reqsfZ51ytYnVeZZJtGKLCMSbpUwmuTTqYSNRjOoWjMoVU"
+    "V1JRV16/ypeXi4gI5KS+XqqDxPOGFIvFkGyQF8zOFPglhNdP4iFdT8c5DSPiPU3py3/nyb"
+    "0kA7ve7nqHgC5dNO70QTgNdBANwHCrai7pqU0bprAIc28wsDY3kLf1ptW6ulv8predbGn+"
+    "GYK2JRQ3IkeNY4LrCHPqQ9uvLAuOKVXQZ11WtclEpJ4D2yoCFjJEHOTiEhmZfRfETzkVfN"
+    "R24p4qowJmXWA+XzI7LyQDpunnGr4IAxIVMTSrcBJEfIm9AtAg7voecrIiqTrSWyh4ucjx"
+    "3mH48dZk7HkD90sYOwZKqfuK4DAc7Zf5JyApY3VLCspVN1Q158xznp9Top4nvSFo0LV+cn"
+    "Zv/N3tv0CW67OxBnPfAJVfWgZJAWGxxSgmuwN1TLuFMh80LU7EL7ggfHyCfQW8p2lBHW5q"
+    "MKmI8yppBFSP0m+WuFqJqmr5ulr8EQkbDXeOzkk9f4DFpz11pz1xGiup4i8UrKaA6bgnIK"
+    "aP2KUEYy9YTycK+5CEXYa+ZzBJb3U7L6L3kvMCWqlaAKKEHJrqWbkfP0HUrW70L6lxTT7E"
+    "88zPfQPVWB7mU64/8ue928w/yUmIDqFaZt/Woji+w0HEosvlVZb5IBzBpefLQvnuILg51V"
+    "IB7tE7peK4EcC2h4F4B3yxdfa3XInl4B2FGSKmxJoVfoiRxrCsqX1LOSr2XQFXh2bOMObI"
+    "UO33dWvASbGFNrgLD+7jHZObbANez4RH3VERhXVNW17/nxl1zdtX/RWo2T27xWXaEpW6px"
+    "sg9HFObbgXsHpVHvUvk7RaZKLyg5JKyoX7rN8qsBH6fsKR68p0+0jW/ailm2FZN37fAW+E"
+    "rGt7SUdiEJwQyHr4rRLRSpp7GtJsa1hU6QkbrBFGlDaSUNpdH2kVUyiuykCSltJhX4vq98"
+    "eSMhohk+R0Nz0/SwqNINWQ6sRFWOAM9XkVmDFtOMDVZZg1fRGLlegy5htxCTkMU0ALZ5ku"
+    "uh7zzlnSEgv1QF2lNgM5O/SMeGE4CU4hbFAlqzTiygqs4WSZk6Arl+D+Ip8P0Hly6Wqnwv"
+    "I1hPj4uyvN19ohwCKi1VTzjXP0C5U7UqlCkhjWTIgSjTkYP4fDT+SHaDsfjvEXwIVC1BaW"
+    "qdnbe7xw1gTxC+xn3z0mRtNvvHDbr/QuBZVKm5xq1uq/PX5YCWY84uPrnGX9rmH6xUomLl"
+    "CGcL9MleUXyzF/2NhNbpoP3FpIhbzA/mGre7UQrCUdrl1SX7lAL7III/81ld7BsJ4tcVlu"
+    "mcNX8lAdFHITJTvf4liOl7SuFZ4hR4ZEKpiQqWaSkNZaCwURCU9sJYoJYANhcBsJkPYFN2"
+    "Z+4eeojWp2oOFCS1STADrD+bQk9u2XoO2ZSohlYHQXoV5xL6kz0vomMzTi2cgDruGC13iT"
+    "iW1LeIt3wGHJu5GLckgdvLUmYyQb6eylgZxjIBIfg4RZ7sWkDxtMmvRU+hLU8hfnQRas5h"
+    "QFzlaVRUh55KMqSXUiqkFegJtIUJtFSog+36F1fIx0B2D2pFOGp5j0J+KUJHdJT5MS+Phe"
+    "g9XVNIdJSQ8h3xW3RrtW4NiV9RmLNT5FkE5mUqEyikjXPCm0u9fxDOrKBhz2/VyYJHbvlP"
+    "c+/g6ODD/vuDD7QIf5M45ahAn4jMdfnePksEvVs11t3Wz69LUXDZ1FAAMSxeTwDL+tQbkZ"
+    "7C5V+6T4is4dp9tdx313bvXkFdL9VpNbXryrxXxW25wI2VF/UTRSuz52iXU3Ec6uBUm9yG"
+    "wiUxwEIBTlGunpCWsjG5N/9AiwzvoOTCfj6gaal6wllizC/pBZ0C7+ikUD3B3NttHiw0OJ"
+    "sHBaOTZQqhilwCnKGPvssiLaNxLglKyz1PhiqCacCHPjab+/tHzd399x8OD46ODj/sxsQo"
+    "m1XEkE7an7M+Dcy3KwfRXDhTMjVDc0V2mTRdWRDd82AeRGrGKxiPWdnNobhbgwGpFI4sFt"
+    "gWLzJ+5Rb/xi/sKb+UpHKWEpushn7PgQdzFuOM2/Np7/yiYw6Yi7PlTqbsPqN9jVsnvT5P"
+    "AzeuRwIPwi27OGuvshfhfKS9yl5Ex0qOgvOOMnVIR2MRW4gO6bgSaDqkozp+BQEfdEjHlU"
+    "I66nCESuEIdTTM1aNhbvIM5+f/AdaeY64="
+)
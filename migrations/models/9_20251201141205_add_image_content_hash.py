@@ -0,0 +1,83 @@
+from tortoise import BaseDBAsyncClient
+
+# The unique index is built CONCURRENTLY so uploads keep running while it scans
+# the image table, which cannot happen in a transaction block; statements are
+# executed one by one. Existing images keep a NULL hash.
+RUN_IN_TRANSACTION = False
+
+UPGRADE_STATEMENTS = [
+    'ALTER TABLE "image" ADD "content_hash" VARCHAR(64)',
+    'CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "uid_image_dataset_ee1520" ON "image" ("dataset_id", "content_hash")',
+]
+
+DOWNGRADE_STATEMENTS = [
+    'DROP INDEX CONCURRENTLY IF EXISTS "uid_image_dataset_ee1520"',
+    'ALTER TABLE "image" DROP COLUMN "content_hash"',
+]
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    for statement in UPGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    for statement in DOWNGRADE_STATEMENTS:
+        await db.execute_script(statement)
+    return ""
+
+
+MODELS_STATE = (
+    "eJztXWlv27gW/SuGvkwL5BWJs7XB4AFOonb8JrEDx+ksTWEwEm1zKlMeic7Sov/9kdROUY"
+    "rpVUr4JYhJXko83O65vLz6YUxcGzr+uzMH+D4aIgsQ5GLjpPHDwGAC6T8FJXYaBphOk3yW"
+    "QMCdw0WsfNk7n3jAIjR3CBwf0iQb+paHpuHz8MxxWKJr0YIIj5KkGUb/zuCAuCNIxtCjGV"
+    "++0mSEbfgI/ejn9NtgiKBjZ14d2ezZPH1AnqY87eamff6Rl2SPuxtYrjOb4KT09ImMXRwX"
+    "n82Q/Y7JsLwRxNADBNqpZrC3DNsdJQVvTBOIN4Pxq9pJgg2HYOYwMIxfhzNsMQwa/Ensz8"
+    "F/DQV4LBczaBEmDIsfP4NWJW3mqQZ71Nlvrd6b/aO3vJWuT0Yez+SIGD+5ICAgEOW4CmNg"
+    "wH/lAD0bA08OaFZKAJa+9ByQhoDFiEZFEkiT4RRhGmG1GIDGBDwOHIhHZEx/7u3uliD6ud"
+    "XjoNJSHFWXDvFgBnTCrGaQx9BN0PQJIDNfjqSJZxOOZpu+FcAWzKGaSC+EaG6QzgOpMYXY"
+    "ZqjlcDWuzM55u/PppBEWucW9m06Hp3gzjHnKWffy6sLsm+cnDcudTB1I3+4Wf2y1L1jSEC"
+    "AHBqNHsXc+zNE3Hwp75oPYL5YHGW4DQPJ9c05zCJpA+UjPSgr9Yoei76J/1tVLSw582ga7"
+    "i52ncNqVYNtvX5rX/dblFWvJxPf/dThErb7Jcpo89UlIfXMkdERcSeOPdv+3BvvZ+LvbMc"
+    "XlKS7X/9tg7wRmxB1g92EA7NSSGqVGwGQ6dja1F+zYrKTu2K12bPjy+Ql79zRQ2+pzgqvc"
+    "9dffo8ts8gl6bLf3IVGELiu1BG6b39pXAxuagBFUBC0t80ogY0r58JtUm+Ro5OH76HoQjf"
+    "Dv8CmnAAmYhZSkHdVTVdiS1OQtPPAQM5XMuKDto62iqhEHt3V91jo3DdmEXQFy50lNtcUu"
+    "uxA9j16y5q8AwBsfrk3Z3gx8uS1QjiCbxnfA+vYAPHtQMJ/pxKdvLiE0p6Hgx9970IltAX"
+    "JEs/aFHq+yVuOTQ+U23RREGfDyWZPmREwBmC4Idvhs9qQydJ610iQozmur8RIJbbGps8WG"
+    "thA6KsaaWGBzVoXKG2roE4fIhuFOIGwZjgtIAbvIiAl4DplcNREtAfC8e3N6YTaueuZZ+7"
+    "rd7WSZIM9kSTQBBRtIz2xdCGhqI+JKx6Y2Vr0Em0beWJXdkFUNGzLhV8I4K0LSq7Vw14el"
+    "V5grqdH0/Onnkgjmj16rOmufZ52y9UmVea6TaEWWEQm3ShlNiulUykajGVStGZSqorqUir"
+    "p1/tQ8PJxDR6WlCnVUniecMKTeLIdkHz4W8CdBrCY6f5kKav7Zz2ifEWpvLlt/vs1ooBfd"
+    "zqeoeArls4vuqSYAr4MAuA8UbEXdNS2jddcADm3mFwbG4hb+rNq2Ukt/ldfyvI0/xzGXxK"
+    "KG5EjwrHFcYA98SHt06YFxwyu7Duqq17hYKyWB98iChoyRBDk7pYQkKaP5iOYjr5qPjCni"
+    "qjCmZVYD5fMjsvJAOm6RcavkgDElUxNKtwEkh8ib0C0CDu6h5ysiKpOtJbKH85yPHRYfjx"
+    "3mTseQP3Cxg7Bkqp+6rgMBLth/0nIClndUcF1Lp+qGPP+Oc9rtXmSI72lbNC7cXJ6avTd7"
+    "b7MnuO1OX5z1wCdU1YOSQVpucMgIrsDeUC3jToXMC1GzS+0LHhwhn0BvIdtRTlibjypgPs"
+    "qZQuYh9ZvkrxWiapq+bpa+BkNEwl7jsVNMXuMz6NVy1y/pYzqKBoGYDMbAHxtfNa1dZA9c"
+    "gtYOEVUDFTlZWkbT2wyUU0DrV4QykqknlId7zXnYw16zmD6wvJ+SjWHBK4MZUa0fVUA/Sn"
+    "ct3aecp+9Qsn6XMsO0mCaGOT/pZAtVWHxEuVoaL44O5lh+jg4KVx+WJbpNeOieKpv3Mu38"
+    "f9fdTpHbREZMAPMG01Z+sZFFdhoOpXBfKwltCZSs4ZnxmnOiEP0lhLWDVSA6URC6/SmBHA"
+    "toeOeAd8tXjGvlzpBdAdihnSpsaaFX6PMdK17K4QDykq9l0JX40GzjtnGF3Bx2lrxunBpT"
+    "K4Cw/o5I+Tk2x4X32Hdh2REYV1TVte/58Zde3bUn10rNwNu8wF6hKbtWM3APDinM4777DU"
+    "rjC2byd8qMwl5QckBYUX/11mHBBPzFgI9T9hQP3tMn2oGNWBuF12kU5l2rbE7ISmlnnRDM"
+    "cPiq2DBDkXraLmtiq5zrrB6p25+RtjtX0u4cbR95JaPM7JyS0lZnge/7ytdkUiKa4XM0ND"
+    "fNDosq3UXmwEpU5QjwYhWZNWg+zdhglTV4FY2h6zXoEjaGmIQspgGwzZNcD33nKe8MAfmF"
+    "KtD3CTYz+ct0bDgBSClCVCygNevUAqrqu5KWqSOQq/fVngLff3DpYqnK93KC9XRgWde9Ap"
+    "8oB9vKStUTztUPUO6+rgplRkgjGXIgynTkID7/3YNIdoNfPbhH8CFQtQSlqXV+2e6cNIA9"
+    "QfgW98xrk7XZ7J006P4LgWdRpeYWtzqti7+u+7Qc8x3yyS3+3Db/YKVSFSvHkpujT/bKIs"
+    "m96K9RtM767c8mRdxifjC3uN2JUhCO0q5vrtlHK9inJ/yZz+piX6MQv2OxSOes+HsUiD4K"
+    "kZnqRTtBrJZOVatfemw4BR6ZUGqigmVWSkMZKGwUBKW9MBaoJYDNeQBsFgPYlN1OvIceov"
+    "WpmgMFSW0SzAHrz6bQk1u2nkM2I6qh1eGmXsW5hP440ovo2JxTCyegjjtCi13XjiX1fe0t"
+    "nwHHZi7GLUng9rKQmUyQr6cytg5jmYAQfJwiT3YtoHzaFNeip9CWpxA/ugg15zD0sPI0Kq"
+    "tDTyUZ0gspFdIK9ATawgRaKKjEdv2LK+RjILsHtSQctbxHIb8UoWNnyvyYF8dC9J6uKSQ6"
+    "Hsv6HfFbdGu1xobEryjM2SnzLAJJmcqEE23jgkDyUu8fhHMraNjzW3Wy4DFy/tPcOzg+eL"
+    "9/dPCeFuFvEqccl+gTkbmu2NtngfCCy0YV3Pr59VoUXDY1FEAMi9cTwHV9VI9IT+GKL92n"
+    "RFZw7b5a7rsru3evoK6v1Wk1s+vKvFfFbbnEjZUX9VNFK7PnaJdTcRzqWF+b3Iai0DkcCw"
+    "U4Rbl6QrqWjcm9+wdaZPANSi7sFwOalaonnGsMoSa9oFPiHZ0WqieYe7vNeSJCsWIlo7OZ"
+    "iwpFXAKcgY++y2Jao1EhCcrKPU+GKoJpwIc+NJv7+8fN3f2j94cHx8eH73djYpTPKmNIp+"
+    "1PeZ8G5ttVgGghnBmZmqG5JLtMm64siO55MA8iNeOVjMe87OZQ3K3BgFQKRxYLbIsXGb9y"
+    "i3/jF/aUX9akcq4lNlkN/Z4DD+Y8xjm357Pu5dWF2WcuzpY7mbL7jPYtbp12ezwN3LkeCT"
+    "wIt+zirL3KXoTzkfYqexEdKzkKLjrK1CEdjXlsITqk41Kg6ZCO6viVBHzQIR2XCumowxEq"
+    "hSPU0TCXj4a5yTOcn/8HkwfY9w=="
+)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# ruff: noqa
+# mypy: ignore-errors
+"""Script to rebuild the hourly classification statistics rollups.
+
+Recomputes the rollups from stored classification results, e.g. to backfill
+them after the table was added or to repair drift. Results that arrive during
+the rebuild may be missed, so prefer running it with the consumers stopped.
+
+Usage:
+    python scripts/rebuild_statistics.py [--since ISO_DATETIME]
+
+Example:
+    python scripts/rebuild_statistics.py --since 2025-12-01T00:00:00Z
+"""
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bioscopeai_core.app.crud.classification import get_classification_stats_crud
+from bioscopeai_core.app.db import close_db, init_db
+
+
+async def rebuild_statistics(since: datetime | None) -> int:
+    """Rebuild the rollups and return the number of rows written."""
+    await init_db()
+    try:
+        return await get_classification_stats_crud().rebuild(since=since)
+    finally:
+        await close_db()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Rebuild hourly classification statistics from stored results"
+    )
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        default=None,
+        help="Only rebuild hours from this UTC datetime on (default: everything)",
+    )
+
+    args = parser.parse_args()
+
+    rows = asyncio.run(rebuild_statistics(args.since))
+
+    scope = f"since {args.since.isoformat()}" if args.since else "for all results"
+    print(f"Rebuilt {rows} hourly statistics rows {scope}")
+
+
+if __name__ == "__main__":
+    main()